@@ -11,7 +11,7 @@ from api.models import Carrier, Address, Airbase, Account, Contact, \
     BBECityAlias, Dispatch, BillOfLading, BBELane, MarkupHistory, MetricGoals, PackageType, MiddleLocation, \
     LocationDistance, LocationCityAlias, UbbeMlRegressors, RateLog, TransitTime, Webhook, CarrierPickupRestriction, \
     City, MetricAccount, CNInterline, ErrorCode, AccountTier, ApiPermissions, SavedBroker, PromoCode, Transaction, \
-    ShipmentDocument, UserTier, ExchangeRate, SavedPackage
+    ShipmentDocument, UserTier, ExchangeRate, SavedPackage, WebhookOutbox
 
 from api.models.carrier_markup_history import CarrierMarkupHistory
 
@@ -806,6 +806,12 @@ class PackageTypeAdmin(ModelAdmin):
     autocomplete_fields = ("account", )
     ordering = ("account", 'name')
 
+    def save_related(self, request, form, formsets, change) -> None:
+        from api.cache_lookups.reference_cache import ReferenceCache
+
+        super().save_related(request, form, formsets, change)
+        ReferenceCache.bump_version()
+
 
 @register(MiddleLocation)
 class MiddleLocationAdmin(ModelAdmin):
@@ -911,6 +917,15 @@ class WebhookAdmin(ModelAdmin):
     autocomplete_fields = ("sub_account",)
 
 
+@register(WebhookOutbox)
+class WebhookOutboxAdmin(ModelAdmin):
+    list_display = ("webhook", "size", "status", "attempts", "next_attempt", "creation_date", "delivered_date")
+    list_filter = ("status",)
+    search_fields = ("webhook__url", "last_error")
+    readonly_fields = ("claim",)
+    raw_id_fields = ("webhook",)
+
+
 @register(ErrorCode)
 class ErrorCodeAdmin(ModelAdmin):
     list_display = ("system", "source", "type", "code", "name", "location")
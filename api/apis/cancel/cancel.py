@@ -3,11 +3,13 @@
     Description: This file will contain functions related to Action Express Api.
     Created: June 8, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
 
+from api.background_tasks.metric_rollup import CeleryMetricRollup
 from api.exceptions.project import ViewException, CancelException
 from api.models import Shipment, Leg, CarrierAccount
 from api.utilities.carriers import CarrierUtility
@@ -141,6 +143,9 @@ class Cancel:
         leg.on_hold = False
         leg.save()
 
+        shipment_id = leg.shipment.shipment_id
+        transaction.on_commit(lambda: CeleryMetricRollup.refresh_shipment.delay(shipment_id=shipment_id))
+
         return ret
 
     def _cancel_shipment(self) -> dict:
@@ -224,6 +229,8 @@ class Cancel:
         shipment.is_cancel = True
         shipment.save()
 
+        transaction.on_commit(lambda: CeleryMetricRollup.refresh_shipment.delay(shipment_id=shipment.shipment_id))
+
         ret = {
             "shipment_id": shipment.shipment_id,
             "legs": legs,
@@ -44,7 +44,9 @@ class ActionExpressRate(ActionExpressApi):
             service_code, service_name = response["service"].split(":")
 
             try:
-                tax = Taxes(self._ubbe_request["destination"]).get_tax()
+                tax = Taxes(
+                    self._ubbe_request["destination"], reference=self._ubbe_request["objects"].get("reference")
+                ).get_tax()
                 tax_percent = tax.tax_rate
             except (RequestError, Exception):
                 tax_percent = Decimal("5")
@@ -12,7 +12,9 @@ from django.db import connection
 
 from api.background_tasks.emails import CeleryEmail
 from api.cache_lookups.api_cache import APICache
+from api.cache_lookups.rate_cache import RateCache
 from api.exceptions.project import ViewException
+from api.globals.project import RATE_CARRIER_TIMEOUT_SECONDS
 
 
 class BaseCarrierApi(ABC):
@@ -22,6 +24,8 @@ class BaseCarrierApi(ABC):
 
     _carrier_api_name = ""
     _carrier_ids = []
+    # Seconds the carrier gets to answer a rate request, capped by the request rate deadline.
+    _rate_timeout = RATE_CARRIER_TIMEOUT_SECONDS
 
     _default_pickup_error = {
         "pickup_id": "",
@@ -43,9 +47,14 @@ class BaseCarrierApi(ABC):
             connection.close()
             raise ViewException(f"class variable '_carrier_api_name' must be set.")
 
-        api = APICache().get_api_cache(api_name=self._carrier_api_name)
+        reference = self._ubbe_request.get("objects", {}).get("reference")
 
-        if not api.get("is_active", False):
+        if reference:
+            is_active = reference.is_active(api_name=self._carrier_api_name)
+        else:
+            is_active = APICache().get_api_cache(api_name=self._carrier_api_name).get("is_active", False)
+
+        if not is_active:
             connection.close()
             raise ViewException(f"{self._carrier_api_name} (L46): Api not active.")
 
@@ -94,6 +103,14 @@ class BaseCarrierApi(ABC):
         :return: list of dictionary rates
         """
 
+    def cached_rate(self) -> list:
+        """
+        Get Rates through the shared rate cache, identical requests within the carrier rate cache ttl are served from
+        cache instead of calling the carrier api again.
+        :return: list of dictionary rates
+        """
+        return RateCache(api_name=self._carrier_api_name, ubbe_request=self._ubbe_request).rate(rate=self.rate)
+
     @abstractmethod
     def ship(self, order_number: str = "") -> dict:
         """
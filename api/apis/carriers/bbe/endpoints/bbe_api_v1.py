@@ -32,6 +32,7 @@ class BBEAPI:
         self._origin = self._ubbe_request["origin"]
         self._destination = self._ubbe_request["destination"]
         self._carrier_id = self._ubbe_request["carrier_id"]
+        self._reference = self._ubbe_request.get("objects", {}).get("reference")
 
     def _get_freight_cost(self, sheet: BBELane, weight: Decimal) -> Decimal:
         """
@@ -65,9 +66,12 @@ class BBEAPI:
             fuel_type = "I"
 
         try:
-            fuel_surcharge = FuelSurcharge.objects.get(
-                carrier__code=BBE, fuel_type=fuel_type
-            )
+            if self._reference:
+                fuel_surcharge = self._reference.get_fuel_surcharge(carrier_id=BBE, fuel_type=fuel_type)
+            else:
+                fuel_surcharge = FuelSurcharge.objects.get(
+                    carrier__code=BBE, fuel_type=fuel_type
+                )
         except ObjectDoesNotExist:
             cost = {
                 "name": "Fuel Surcharge",
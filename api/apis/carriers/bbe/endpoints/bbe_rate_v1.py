@@ -75,7 +75,7 @@ class BBERate(BBEAPI):
 
         # Get Taxes
         try:
-            taxes = Taxes(self._destination).get_tax_rate(freight_cost + surcharges)
+            taxes = Taxes(self._destination, reference=self._reference).get_tax_rate(freight_cost + surcharges)
         except RequestError:
             return None
 
@@ -67,7 +67,7 @@ class CalmAirRate(CalmAirBase):
         Formant Calm Air rate response into ubbe json response.
         """
         try:
-            tax_rate = Taxes(self._destination).get_tax()
+            tax_rate = Taxes(self._destination, reference=self._ubbe_request["objects"].get("reference")).get_tax()
         except Exception:
             tax_rate = None
 
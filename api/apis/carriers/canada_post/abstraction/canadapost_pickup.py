@@ -43,7 +43,7 @@ class CanadaPostPickup(CanadaPostAPI):
             "account"
         ]
 
-        self.endpoints = Endpoints(self.carrier_account)
+        self.endpoints = Endpoints.get(carrier_account=self.carrier_account)
         self._world_request["_carrier_account"] = self.carrier_account
 
     @property
@@ -72,7 +72,7 @@ class CanadaPostRate(CanadaPostAPI):
             "account"
         ]
         self.carrier = world_request["objects"]["carrier_accounts"][CAN_POST]["carrier"]
-        self.endpoints = Endpoints(self.carrier_account)
+        self.endpoints = Endpoints.get(carrier_account=self.carrier_account)
 
     @staticmethod
     def _calc_total_surcharges(surcharges: list) -> Decimal:
@@ -266,7 +266,9 @@ class CanadaPostRate(CanadaPostAPI):
 
             # Ref: https://www.canadapost.ca/cpc/en/business/shipping/request-pickup.page#!navtabd2054e7
             if rate["service_code"] not in self._priority_worldwide_services:
-                pickup_tax = Taxes(self._world_request["origin"]).get_tax_rate(
+                pickup_tax = Taxes(
+                    self._world_request["origin"], reference=self._world_request["objects"].get("reference")
+                ).get_tax_rate(
                     self._flat_pickup_rate
                 )
                 rate["total"] += self._flat_pickup_rate + pickup_tax
@@ -83,7 +83,7 @@ class CanadaPostShip(CanadaPostAPI):
             "account"
         ]
 
-        self.endpoints = Endpoints(self.carrier_account)
+        self.endpoints = Endpoints.get(carrier_account=self.carrier_account)
         self._world_request["_carrier_account"] = self.carrier_account
 
     @staticmethod
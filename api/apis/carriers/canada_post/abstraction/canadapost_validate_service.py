@@ -23,7 +23,7 @@ class CanadaPostValidateRate(CanadaPostAPI):
             "account"
         ]
 
-        self.endpoints = Endpoints(carrier_account)
+        self.endpoints = Endpoints.get(carrier_account=carrier_account)
 
     def _clean(self):
         if len(self._world_request["service_code"]) > 13:
@@ -1,7 +1,18 @@
+"""
+    Title: Canada Post Endpoints
+    Description: This file will contain the Canada Post endpoints registry. Endpoints are shared per carrier account
+                 and environment, each service client is built on first use from the SOAP client pool, so a rate only
+                 loads the Rate WSDL.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import time
+
 import requests
-from zeep import CachingClient, wsse, Transport
-from zeep.cache import InMemoryCache
-from zeep.plugins import HistoryPlugin
+from gevent.lock import RLock
+from zeep import wsse
 
 from api.apis.carriers.canada_post.globals.globals import (
     SHIPMENT_WSDL,
@@ -11,6 +22,8 @@ from api.apis.carriers.canada_post.globals.globals import (
     PICKUP_WSDL,
     PICKUP_REQUEST_WSDL,
 )
+from api.apis.carriers.soap_client_pool import SoapClientPool
+from api.globals.carriers import CAN_POST
 from api.globals.project import LOGGER, DEFAULT_TIMEOUT_SECONDS
 from api.models import CarrierAccount
 from brain.settings import (
@@ -21,91 +34,151 @@ from brain.settings import (
 
 
 class Endpoints:
-    def __init__(self, carrier_account: CarrierAccount):
-        self.history_plugin = HistoryPlugin()
-        username = carrier_account.username.decrypt()
-        password = carrier_account.password.decrypt()
+    """
+        Canada Post Endpoints
 
-        self.SHIPMENT_CLIENT = CachingClient(
-            SHIPMENT_WSDL,
-            wsse=wsse.UsernameToken(username, password),
-            transport=Transport(cache=InMemoryCache(), timeout=DEFAULT_TIMEOUT_SECONDS),
-        )
+        Use Endpoints.get to share endpoints for a carrier account. Registry entries, and the decrypted credentials
+        they hold, expire after the credential ttl. The registry lock only guards the registry, each service client
+        is built under its own lock so a slow WSDL fetch does not block other accounts or services.
+    """
+
+    _credential_ttl = 900
 
-        self.SHIPMENT_SERVICE = self.SHIPMENT_CLIENT.create_service(
+    # Service: (wsdl, binding, address)
+    _services = {
+        "SHIPMENT": (
+            SHIPMENT_WSDL,
             "{http://www.canadapost.ca/ws/soap/shipment/v8}Shipment",
             CANADA_POST_BASE_URL + "/shipment/v8",
-        )
-
-        try:
-            self.RATE_CLIENT = CachingClient(
-                RATE_WSDL,
-                wsse=wsse.UsernameToken(username, password),
-                transport=Transport(
-                    cache=InMemoryCache(), timeout=DEFAULT_TIMEOUT_SECONDS
-                ),
-            )
-
-            self.MANIFEST_CLIENT = CachingClient(
-                MANIFEST_WSDL,
-                wsse=wsse.UsernameToken(username, password),
-                transport=Transport(
-                    cache=InMemoryCache(), timeout=DEFAULT_TIMEOUT_SECONDS
-                ),
-            )
-
-            self.ARTIFACT_CLIENT = CachingClient(
-                ARTIFACT_WSDL,
-                wsse=wsse.UsernameToken(username, password),
-                transport=Transport(
-                    cache=InMemoryCache(), timeout=DEFAULT_TIMEOUT_SECONDS
-                ),
-            )
-
-            self.PICKUP_CLIENT = CachingClient(
-                PICKUP_WSDL,
-                wsse=wsse.UsernameToken(username, password),
-                transport=Transport(
-                    cache=InMemoryCache(), timeout=DEFAULT_TIMEOUT_SECONDS
-                ),
-                plugins=[self.history_plugin],
-            )
-
-            self.REQUEST_PICKUP_CLIENT = CachingClient(
-                PICKUP_REQUEST_WSDL,
-                wsse=wsse.UsernameToken(username, password),
-                transport=Transport(
-                    cache=InMemoryCache(), timeout=DEFAULT_TIMEOUT_SECONDS
-                ),
-                plugins=[self.history_plugin],
-            )
-
-        except requests.exceptions.RequestException as e:
-            LOGGER.critical(
-                "Canada Post SOAP clients could not be instantiated.\n%s", e
-            )
-        else:
-            self.RATE_SERVICE = self.RATE_CLIENT.create_service(
-                "{http://www.canadapost.ca/ws/soap/ship/rate/v4}Rating",
-                CANADA_POST_BASE_URL + "/rating/v4",
-            )
-
-            self.MANIFEST_SERVICE = self.MANIFEST_CLIENT.create_service(
-                "{http://www.canadapost.ca/ws/soap/manifest/v8}Manifest",
-                CANADA_POST_BASE_URL + "/manifest/v8",
-            )
-
-            self.ARTIFACT_SERVICE = self.ARTIFACT_CLIENT.create_service(
-                "{http://www.canadapost.ca/ws/soap/artifact}Artifact",
-                CANADA_POST_BASE_URL + "/artifact",
-            )
-
-            self.PICKUP_SERVICE = self.PICKUP_CLIENT.create_service(
-                "{http://www.canadapost.ca/ws/soap/pickup/availability}PickupDomain",
-                CANADA_POST_PICKUP_BASE_URL + "/pickup/availability",
-            )
-
-            self.REQUEST_PICKUP_SERVICE = self.REQUEST_PICKUP_CLIENT.create_service(
-                "{http://www.canadapost.ca/ws/soap/pickuprequest}PickupRequest",
-                CANADA_POST_PICKUP_REQUEST_BASE_URL + "/pickuprequest",
-            )
+        ),
+        "RATE": (
+            RATE_WSDL,
+            "{http://www.canadapost.ca/ws/soap/ship/rate/v4}Rating",
+            CANADA_POST_BASE_URL + "/rating/v4",
+        ),
+        "MANIFEST": (
+            MANIFEST_WSDL,
+            "{http://www.canadapost.ca/ws/soap/manifest/v8}Manifest",
+            CANADA_POST_BASE_URL + "/manifest/v8",
+        ),
+        "ARTIFACT": (
+            ARTIFACT_WSDL,
+            "{http://www.canadapost.ca/ws/soap/artifact}Artifact",
+            CANADA_POST_BASE_URL + "/artifact",
+        ),
+        "PICKUP": (
+            PICKUP_WSDL,
+            "{http://www.canadapost.ca/ws/soap/pickup/availability}PickupDomain",
+            CANADA_POST_PICKUP_BASE_URL + "/pickup/availability",
+        ),
+        "REQUEST_PICKUP": (
+            PICKUP_REQUEST_WSDL,
+            "{http://www.canadapost.ca/ws/soap/pickuprequest}PickupRequest",
+            CANADA_POST_PICKUP_REQUEST_BASE_URL + "/pickuprequest",
+        ),
+    }
+
+    _lock = RLock()
+
+    # (carrier account, username, password, environment): (expiry, endpoints)
+    _registry = {}
+
+    def __init__(self, carrier_account: CarrierAccount):
+        self._username = carrier_account.username.decrypt()
+        self._password = carrier_account.password.decrypt()
+        self._service_proxies = {}
+        self._service_locks = {name: RLock() for name in self._services}
+
+    @classmethod
+    def get(cls, carrier_account: CarrierAccount) -> "Endpoints":
+        """
+            Get the shared endpoints for a carrier account, new credentials or an expired entry build new endpoints.
+            Expired entries are dropped on a miss so rotated credentials are not held.
+            :param carrier_account: Canada Post carrier account
+            :return: Endpoints
+        """
+        key = (carrier_account.pk, carrier_account.username_id, carrier_account.password_id, CANADA_POST_BASE_URL)
+        entry = cls._registry.get(key)
+
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        with cls._lock:
+            now = time.monotonic()
+            entry = cls._registry.get(key)
+
+            if not entry or entry[0] <= now:
+                cls._registry = {
+                    registered: value for registered, value in cls._registry.items() if value[0] > now
+                }
+                entry = (now + cls._credential_ttl, cls(carrier_account=carrier_account))
+                cls._registry[key] = entry
+
+        return entry[1]
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+            Drop every registered endpoint and the credentials it holds.
+        """
+
+        with cls._lock:
+            cls._registry = {}
+
+    def _get_service(self, name: str):
+        """
+            Get the service proxy, build the client from the pooled WSDL on first use.
+            :param name: service name, ex: RATE
+            :return: zeep service proxy
+        """
+        service = self._service_proxies.get(name)
+
+        if service is not None:
+            return service
+
+        wsdl, binding, address = self._services[name]
+
+        with self._service_locks[name]:
+            service = self._service_proxies.get(name)
+
+            if service is None:
+                try:
+                    client = SoapClientPool.get_client(
+                        carrier=CAN_POST,
+                        wsdl=wsdl,
+                        plugins=[],
+                        wsse=wsse.UsernameToken(self._username, self._password),
+                        timeout=DEFAULT_TIMEOUT_SECONDS,
+                    )
+                except requests.exceptions.RequestException as e:
+                    LOGGER.critical("Canada Post %s SOAP client could not be instantiated.\n%s", name, e)
+                    raise
+
+                service = client.create_service(binding, address)
+                self._service_proxies[name] = service
+
+        return service
+
+    @property
+    def SHIPMENT_SERVICE(self):
+        return self._get_service(name="SHIPMENT")
+
+    @property
+    def RATE_SERVICE(self):
+        return self._get_service(name="RATE")
+
+    @property
+    def MANIFEST_SERVICE(self):
+        return self._get_service(name="MANIFEST")
+
+    @property
+    def ARTIFACT_SERVICE(self):
+        return self._get_service(name="ARTIFACT")
+
+    @property
+    def PICKUP_SERVICE(self):
+        return self._get_service(name="PICKUP")
+
+    @property
+    def REQUEST_PICKUP_SERVICE(self):
+        return self._get_service(name="REQUEST_PICKUP")
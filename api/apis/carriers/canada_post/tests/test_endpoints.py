@@ -0,0 +1,116 @@
+from unittest import mock
+
+import gevent
+import requests
+from django.test import TestCase
+
+from api.apis.carriers.canada_post.globals.globals import SHIPMENT_WSDL, RATE_WSDL
+from api.apis.carriers.canada_post.globals.util import Endpoints
+from api.apis.carriers.soap_client_pool import SoapClientPool
+from api.globals.carriers import CAN_POST
+from api.models import CarrierAccount, Carrier, EncryptedMessage, SubAccount
+
+
+class EndpointsTests(TestCase):
+    fixtures = [
+        "carriers",
+        "user",
+        "group",
+        "countries",
+        "provinces",
+        "addresses",
+        "contact",
+        "markup",
+        "account",
+        "subaccount",
+    ]
+
+    def setUp(self):
+        Endpoints.clear()
+        SoapClientPool.clear()
+        self.carrier_account = CarrierAccount.objects.create(
+            carrier=Carrier.objects.get(code=CAN_POST),
+            subaccount=SubAccount.objects.get(pk=1),
+            username=self._encrypt(message="user"),
+            password=self._encrypt(message="password"),
+        )
+
+    def tearDown(self):
+        Endpoints.clear()
+        SoapClientPool.clear()
+
+    @staticmethod
+    def _encrypt(message: str) -> EncryptedMessage:
+        encrypted = EncryptedMessage.encrypt_message(message=message)
+        encrypted.save()
+        return encrypted
+
+    def test_get_shared(self):
+        endpoints = Endpoints.get(carrier_account=self.carrier_account)
+        self.assertIs(Endpoints.get(carrier_account=self.carrier_account), endpoints)
+        self.assertEqual(endpoints._username, "user")
+        self.assertEqual(endpoints._password, "password")
+
+    def test_get_new_credentials(self):
+        endpoints = Endpoints.get(carrier_account=self.carrier_account)
+        self.carrier_account.password = self._encrypt(message="new_password")
+        self.carrier_account.save()
+
+        new_endpoints = Endpoints.get(carrier_account=self.carrier_account)
+        self.assertIsNot(new_endpoints, endpoints)
+        self.assertEqual(new_endpoints._password, "new_password")
+
+    def test_get_expired(self):
+        endpoints = Endpoints.get(carrier_account=self.carrier_account)
+
+        for key, (_, value) in list(Endpoints._registry.items()):
+            Endpoints._registry[key] = (0, value)
+
+        self.assertIsNot(Endpoints.get(carrier_account=self.carrier_account), endpoints)
+
+    def test_get_drops_expired(self):
+        Endpoints.get(carrier_account=self.carrier_account)
+        self.carrier_account.password = self._encrypt(message="new_password")
+        self.carrier_account.save()
+
+        for key, (_, value) in list(Endpoints._registry.items()):
+            Endpoints._registry[key] = (0, value)
+
+        endpoints = Endpoints.get(carrier_account=self.carrier_account)
+
+        self.assertEqual([value for _, value in Endpoints._registry.values()], [endpoints])
+
+    def test_lazy_service(self):
+        endpoints = Endpoints.get(carrier_account=self.carrier_account)
+        self.assertEqual(endpoints._service_proxies, {})
+
+        service = endpoints.SHIPMENT_SERVICE
+
+        self.assertIs(endpoints.SHIPMENT_SERVICE, service)
+        self.assertEqual(list(endpoints._service_proxies.keys()), ["SHIPMENT"])
+        self.assertIn((CAN_POST, SHIPMENT_WSDL), SoapClientPool._documents)
+        self.assertNotIn((CAN_POST, RATE_WSDL), SoapClientPool._documents)
+        self.assertEqual(service._binding_options["address"], Endpoints._services["SHIPMENT"][2])
+
+    def test_service_built_outside_registry_lock(self):
+        endpoints = Endpoints.get(carrier_account=self.carrier_account)
+
+        def try_lock(lock) -> bool:
+            if not lock.acquire(blocking=False):
+                return False
+            lock.release()
+            return True
+
+        def get_client(**kwargs):
+            free.append(gevent.spawn(try_lock, Endpoints._lock).get())
+            free.append(gevent.spawn(try_lock, endpoints._service_locks["SHIPMENT"]).get())
+            raise requests.exceptions.ConnectionError("offline")
+
+        free = []
+
+        with mock.patch.object(SoapClientPool, "get_client", side_effect=get_client):
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                endpoints.RATE_SERVICE
+
+        self.assertEqual(free, [True, True])
+        self.assertEqual(endpoints._service_proxies, {})
@@ -3,14 +3,15 @@
     Description: This file will contain functions related to Cargojet Document Apis.
     Created: Sept 27, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 
 from django.db import connection
 
 from api.apis.carriers.cargojet.endpoints.cj_api import CargojetApi
 from api.documents.commercial_invoice import CommercialInvoice
+from api.documents.render_service import DocumentRenderService
 from api.documents.manual_documents import ManualDocuments
 from api.exceptions.project import ShipException
 from api.globals.carriers import CARGO_JET
@@ -59,10 +60,17 @@ class CargojetDocument(CargojetApi):
             documents.append(self._dg_service.generate_documents())
 
         if self._ubbe_request["is_international"]:
-            invoice = CommercialInvoice(
-                shipdata=self._ubbe_request,
-                order_number=self._ubbe_request["order_number"],
-            ).get_pdf()
+            invoice = DocumentRenderService().render(
+                documents=[
+                    (
+                        "commercial_invoice",
+                        CommercialInvoice.get_params(
+                            shipdata=self._ubbe_request,
+                            order_number=self._ubbe_request["order_number"],
+                        ),
+                    )
+                ]
+            )[0]
             documents.append(
                 {"document": invoice, "type": DOCUMENT_TYPE_COMMERCIAL_INVOICE}
             )
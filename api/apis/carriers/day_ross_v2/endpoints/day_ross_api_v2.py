@@ -3,10 +3,9 @@ from _decimal import Decimal, ROUND_HALF_UP
 
 import copy
 
-from zeep import CachingClient, Transport
-from zeep.cache import InMemoryCache
 from zeep.plugins import HistoryPlugin
 
+from api.apis.carriers.soap_client_pool import SoapClientPool
 from api.exceptions.project import ViewException
 from api.globals.carriers import DAY_N_ROSS, SAMEDAY
 from api.globals.project import DEFAULT_TIMEOUT_SECONDS
@@ -318,10 +317,8 @@ class DayRossAPI:
             wsdl = "api/apis/carriers/day_ross_v2/wsdl/production.wsdl"
 
         self._dr_history = HistoryPlugin()
-        self._dr_client = CachingClient(
-            wsdl,
-            transport=Transport(cache=InMemoryCache(), timeout=DEFAULT_TIMEOUT_SECONDS),
-            plugins=[self._dr_history],
+        self._dr_client = SoapClientPool.get_client(
+            carrier=DAY_N_ROSS, wsdl=wsdl, plugins=[self._dr_history], timeout=DEFAULT_TIMEOUT_SECONDS
         )
         self._dr_ns0 = self.dr_client.type_factory("ns0")
 
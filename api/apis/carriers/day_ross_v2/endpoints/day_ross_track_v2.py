@@ -15,11 +15,10 @@
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import connection
 from lxml import etree
-from zeep import CachingClient, Transport
-from zeep.cache import InMemoryCache
 from zeep.exceptions import Fault
 from zeep.plugins import HistoryPlugin
 
+from api.apis.carriers.soap_client_pool import SoapClientPool
 from api.background_tasks.logger import CeleryLogger
 from api.exceptions.project import TrackException, NoTrackingStatus
 from api.globals.carriers import DAY_N_ROSS, SAMEDAY
@@ -61,10 +60,8 @@ class DayRossTrack:
             wsdl = "api/apis/carriers/day_ross_v2/wsdl/production.wsdl"
 
         self._dr_history = HistoryPlugin()
-        self._dr_client = CachingClient(
-            wsdl,
-            transport=Transport(cache=InMemoryCache(), timeout=DEFAULT_TIMEOUT_SECONDS),
-            plugins=[self._dr_history],
+        self._dr_client = SoapClientPool.get_client(
+            carrier=DAY_N_ROSS, wsdl=wsdl, plugins=[self._dr_history], timeout=DEFAULT_TIMEOUT_SECONDS
         )
         self._dr_ns0 = self.dr_client.type_factory("ns0")
 
@@ -18,10 +18,12 @@ from api.models import CarrierAccount, Leg
 
 
 class FedExTrack:
+    # FedEx accepts up to 30 selection details in one track request.
+    _batch_size = 30
+
     @staticmethod
-    def track(leg: Leg) -> dict:
+    def _get_carrier_account(leg: Leg):
         sub_account = leg.shipment.subaccount
-        tracking_identifier = leg.tracking_identifier
 
         try:
             # Get account for sub account
@@ -34,8 +36,19 @@ class FedExTrack:
                 carrier__code=FEDEX, subaccount__is_default=True
             )
 
+        return carrier_account
+
+    @staticmethod
+    def _send(tracking_numbers: list, carrier_account) -> list:
+        """
+        Send one track request for the tracking numbers.
+        :param tracking_numbers: list of tracking numbers
+        :param carrier_account: FedEx carrier account
+        :return: list of track details, in request order
+        """
+
         track_data = TrackRequest(
-            tracking_number=tracking_identifier, carrier_account=carrier_account
+            tracking_number=tracking_numbers, carrier_account=carrier_account
         ).data
 
         try:
@@ -56,7 +69,69 @@ class FedExTrack:
             )
             raise TrackException({"fedex.track.error": "Unsuccessful track"})
 
-        track_detail = track_response["CompletedTrackDetails"][0]["TrackDetails"][0]
+        return [
+            completed["TrackDetails"][0]
+            for completed in track_response["CompletedTrackDetails"]
+        ]
+
+    def track(self, leg: Leg) -> dict:
+        carrier_account = self._get_carrier_account(leg=leg)
+        track_detail = self._send(
+            tracking_numbers=[leg.tracking_identifier], carrier_account=carrier_account
+        )[0]
+
+        return self._format_detail(leg=leg, track_detail=track_detail)
+
+    def track_many(self, legs: list, carrier_account) -> dict:
+        """
+        Track legs on one carrier account with batched track requests.
+        :param legs: list of legs
+        :param carrier_account: FedEx carrier account
+        :return: dict of leg id to tracking status dict or TrackException
+        """
+        ret = {}
+
+        for i in range(0, len(legs), self._batch_size):
+            batch = legs[i:i + self._batch_size]
+
+            try:
+                details = self._send(
+                    tracking_numbers=[leg.tracking_identifier for leg in batch],
+                    carrier_account=carrier_account,
+                )
+            except TrackException as e:
+                ret.update({leg.leg_id: e for leg in batch})
+                continue
+
+            by_number = {detail.get("TrackingNumber"): detail for detail in details}
+
+            for index, leg in enumerate(batch):
+                track_detail = by_number.get(leg.tracking_identifier)
+
+                if track_detail is None and index < len(details):
+                    track_detail = details[index]
+
+                try:
+                    if track_detail is None:
+                        raise TrackException({"fedex.track.error": f"No Tracking available."})
+
+                    ret[leg.leg_id] = self._format_detail(leg=leg, track_detail=track_detail)
+                except TrackException as e:
+                    ret[leg.leg_id] = e
+                except (KeyError, TypeError, IndexError) as e:
+                    ret[leg.leg_id] = TrackException({"fedex.track.error": str(e)})
+
+        return ret
+
+    @staticmethod
+    def _format_detail(leg: Leg, track_detail: dict) -> dict:
+        """
+        Format a FedEx track detail into ubbe format.
+        :param leg: leg
+        :param track_detail: FedEx track detail
+        :return: tracking status dict
+        """
+
 
         if not track_detail["StatusDetail"]:
             raise TrackException({"fedex.track.error": f"No Tracking available."})
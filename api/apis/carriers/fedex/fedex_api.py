@@ -136,3 +136,14 @@ class FedexApi(BaseCarrierApi):
             raise ViewException({"fedex_api.track": e.message}) from e
 
         return status
+
+    def track_many(self, legs: list, carrier_account) -> dict:
+        """
+        FedEx Batch Tracking Api
+        :param legs: list of legs on the carrier account
+        :param carrier_account: FedEx carrier account
+        :return: dict of leg id to tracking status in ubbe format or TrackException.
+        """
+        self._check_active()
+
+        return FedExTrack().track_many(legs=legs, carrier_account=carrier_account)
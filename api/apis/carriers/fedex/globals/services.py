@@ -1,66 +1,100 @@
-from zeep import CachingClient, Transport
-from zeep.cache import InMemoryCache
+"""
+    Title: FedEx Services
+    Description: This file will contain the FedEx SOAP service handles. A handle parses its WSDL through the SOAP
+                 client pool on first use, importing this module does not parse any WSDL.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from gevent.lock import RLock
 from zeep.plugins import HistoryPlugin
+
+from api.apis.carriers.soap_client_pool import SoapClientPool
+from api.globals.carriers import FEDEX
 from brain.settings import FEDEX_BASE_URL
 
 
-def _default_transport():
-    return Transport(cache=InMemoryCache())
+class LazyService:
+    """
+        FedEx Service Handle
 
+        Attribute access is passed to the zeep service proxy, which is built the first time it is needed.
+    """
 
-RATE_HISTORY = HistoryPlugin()
-RATE_CLIENT = CachingClient(
-    "api/apis/carriers/fedex/globals/wsdl/RateService_v24.wsdl",
-    transport=_default_transport(),
-    plugins=[RATE_HISTORY],
-)
+    _lock = RLock()
 
-RATE_SERVICE = RATE_CLIENT.create_service(
-    "{http://fedex.com/ws/rate/v24}RateServiceSoapBinding",
-    "{}/rate/v24".format(FEDEX_BASE_URL),
-)
+    def __init__(self, wsdl: str, binding: str, address: str, history: HistoryPlugin) -> None:
+        self.wsdl = wsdl
+        self._binding = binding
+        self._address = address
+        self._history = history
+        self._service = None
 
-SHIP_HISTORY = HistoryPlugin()
-SHIP_CLIENT = CachingClient(
-    "api/apis/carriers/fedex/globals/wsdl/ShipService_v23.wsdl",
-    transport=_default_transport(),
-    plugins=[SHIP_HISTORY],
+    @property
+    def is_loaded(self) -> bool:
+        return self._service is not None
+
+    def load(self):
+        """
+            Build the service proxy, parsing the WSDL when the pool has not seen it.
+            :return: zeep service proxy
+        """
+
+        if self._service is None:
+            with self._lock:
+                if self._service is None:
+                    client = SoapClientPool.get_client(carrier=FEDEX, wsdl=self.wsdl, plugins=[self._history])
+                    self._service = client.create_service(self._binding, self._address)
+
+        return self._service
+
+    def __getattr__(self, name: str):
+
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        return getattr(self.load(), name)
+
+
+RATE_HISTORY = HistoryPlugin()
+RATE_SERVICE = LazyService(
+    wsdl="api/apis/carriers/fedex/globals/wsdl/RateService_v24.wsdl",
+    binding="{http://fedex.com/ws/rate/v24}RateServiceSoapBinding",
+    address="{}/rate/v24".format(FEDEX_BASE_URL),
+    history=RATE_HISTORY,
 )
 
-SHIP_SERVICE = SHIP_CLIENT.create_service(
-    "{http://fedex.com/ws/ship/v23}ShipServiceSoapBinding",
-    "{}/ship/v23".format(FEDEX_BASE_URL),
+SHIP_HISTORY = HistoryPlugin()
+SHIP_SERVICE = LazyService(
+    wsdl="api/apis/carriers/fedex/globals/wsdl/ShipService_v23.wsdl",
+    binding="{http://fedex.com/ws/ship/v23}ShipServiceSoapBinding",
+    address="{}/ship/v23".format(FEDEX_BASE_URL),
+    history=SHIP_HISTORY,
 )
 
 PICKUP_HISTORY = HistoryPlugin()
-PICKUP_CLIENT = CachingClient(
-    "api/apis/carriers/fedex/globals/wsdl/PickupService_v17.wsdl",
-    transport=_default_transport(),
-    plugins=[PICKUP_HISTORY],
-)
-PICKUP_SERVICE = PICKUP_CLIENT.create_service(
-    "{http://fedex.com/ws/pickup/v17}PickupServiceSoapBinding",
-    "{}/pickup/v17".format(FEDEX_BASE_URL),
+PICKUP_SERVICE = LazyService(
+    wsdl="api/apis/carriers/fedex/globals/wsdl/PickupService_v17.wsdl",
+    binding="{http://fedex.com/ws/pickup/v17}PickupServiceSoapBinding",
+    address="{}/pickup/v17".format(FEDEX_BASE_URL),
+    history=PICKUP_HISTORY,
 )
 
 SERVICE_HISTORY = HistoryPlugin()
-SERVICE_CLIENT = CachingClient(
-    "api/apis/carriers/fedex/globals/wsdl/ValidationAvailabilityAndCommitmentService_v8.wsdl",
-    transport=_default_transport(),
-    plugins=[SERVICE_HISTORY],
-)
-SERVICE_SERVICE = SERVICE_CLIENT.create_service(
-    "{http://fedex.com/ws/vacs/v8}ValidationAvailabilityAndCommitmentServiceSoapBinding",
-    "{}/vacs/v8".format(FEDEX_BASE_URL),
+SERVICE_SERVICE = LazyService(
+    wsdl="api/apis/carriers/fedex/globals/wsdl/ValidationAvailabilityAndCommitmentService_v8.wsdl",
+    binding="{http://fedex.com/ws/vacs/v8}ValidationAvailabilityAndCommitmentServiceSoapBinding",
+    address="{}/vacs/v8".format(FEDEX_BASE_URL),
+    history=SERVICE_HISTORY,
 )
 
 TRACK_HISTORY = HistoryPlugin()
-TRACK_CLIENT = CachingClient(
-    "api/apis/carriers/fedex/globals/wsdl/TrackService_v16.wsdl",
-    transport=_default_transport(),
-    plugins=[TRACK_HISTORY],
-)
-TRACK_SERVICE = TRACK_CLIENT.create_service(
-    "{http://fedex.com/ws/track/v16}TrackServiceSoapBinding",
-    "{}/track/v16".format(FEDEX_BASE_URL),
+TRACK_SERVICE = LazyService(
+    wsdl="api/apis/carriers/fedex/globals/wsdl/TrackService_v16.wsdl",
+    binding="{http://fedex.com/ws/track/v16}TrackServiceSoapBinding",
+    address="{}/track/v16".format(FEDEX_BASE_URL),
+    history=TRACK_HISTORY,
 )
+
+SERVICES = [RATE_SERVICE, SHIP_SERVICE, PICKUP_SERVICE, SERVICE_SERVICE, TRACK_SERVICE]
@@ -1,3 +1,5 @@
+from typing import Union
+
 from api.apis.carriers.fedex.soap_objects.common.version_id import VersionId
 from api.apis.carriers.fedex.soap_objects.common.web_authentication_detail import (
     WebAuthenticationDetail,
@@ -21,7 +23,9 @@ class TrackRequest(FedExSoapObject):
         "ProcessingOptions",
     }
 
-    def __init__(self, tracking_number: str, carrier_account):
+    def __init__(self, tracking_number: Union[str, list], carrier_account):
+        tracking_numbers = [tracking_number] if isinstance(tracking_number, str) else tracking_number
+
         version = VersionId(
             {
                 "ServiceId": "trck",
@@ -47,7 +51,8 @@ class TrackRequest(FedExSoapObject):
                 "ClientDetail": client.data,
                 "Version": version.data,
                 "SelectionDetails": [
-                    TrackSelectionDetail(tracking_number=tracking_number).data
+                    TrackSelectionDetail(tracking_number=number).data
+                    for number in tracking_numbers
                 ],
             },
             required_keys=self._required_keys,
@@ -3,19 +3,16 @@
     Description: This file will contain functions related to Purolator base Apis.
     Created: December 7, 2020
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 
 import copy
 
 import zeep
-from requests import Session
-from requests.auth import HTTPBasicAuth
-from zeep import CachingClient, Transport
-from zeep.cache import InMemoryCache
 from zeep.plugins import HistoryPlugin
 
+from api.apis.carriers.soap_client_pool import SoapClientPool
 from api.globals.carriers import PUROLATOR
 from brain import settings
 
@@ -113,16 +110,6 @@ class PurolatorBaseApi:
             self._password = self.carrier_account.password.decrypt()
             self._key = self.carrier_account.api_key.decrypt()
 
-    @staticmethod
-    def _default_transport(user: str, password: str):
-        """
-        Create default transport and authenticate with user and password.
-        :return:
-        """
-        session = Session()
-        session.auth = HTTPBasicAuth(user, password)
-        return Transport(cache=InMemoryCache(), session=session)
-
     def _build_request_context(self, reference: str, version: str):
         """
         Create Request Context header for Purolator Soap call.
@@ -159,6 +146,21 @@ class PurolatorBaseApi:
             UserToken=self._key,
         )
 
+    @staticmethod
+    def get_ns_prefixes(version: str) -> dict:
+        """
+        Get the datatypes namespace prefix for a service version.
+        :param version: service version, ex: 2.2
+        :return: prefix: namespace
+        """
+
+        if version[:1] == "1":
+            version_url = "http://purolator.com/pws/datatypes/v1"
+        else:
+            version_url = "http://purolator.com/pws/datatypes/v2"
+
+        return {f"v{version[:1]}": version_url}
+
     def create_connection(self, wsdl_path: str, version: str):
         """
         Create SOAP Connect to puro web services.
@@ -171,15 +173,11 @@ class PurolatorBaseApi:
         else:
             wsdl = f"api/apis/carriers/purolator/courier/wsdl/production/{wsdl_path}"
 
-        if version[:1] == "1":
-            version_url = "http://purolator.com/pws/datatypes/v1"
-        else:
-            version_url = "http://purolator.com/pws/datatypes/v2"
-
         self._history = HistoryPlugin()
-        self._client = CachingClient(
-            wsdl,
-            transport=self._default_transport(user=self._key, password=self._password),
+        self._client = SoapClientPool.get_client(
+            carrier=PUROLATOR,
+            wsdl=wsdl,
             plugins=[self._history],
+            auth=(self._key, self._password),
+            ns_prefixes=self.get_ns_prefixes(version=version)
         )
-        self._client.set_ns_prefix(f"v{version[:1]}", version_url)
@@ -3,8 +3,8 @@
     Description: This file will contain functions related to Purolator Document Apis.
     Created: December 4, 2020
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 
 from django.db import connection
@@ -16,6 +16,7 @@ from api.apis.carriers.purolator.courier.endpoints.purolator_base import (
 )
 from api.background_tasks.logger import CeleryLogger
 from api.documents.commercial_invoice import CommercialInvoice
+from api.documents.render_service import DocumentRenderService
 from api.exceptions.project import ShipException
 from api.globals.project import (
     DOCUMENT_TYPE_SHIPPING_LABEL,
@@ -54,9 +55,12 @@ class PurolatorDocument(PurolatorBaseApi):
 
         self._response.append(
             {
-                "document": CommercialInvoice(
-                    self._ubbe_request, self._ubbe_request["order_number"]
-                ).get_base_64(),
+                "document": DocumentRenderService().render_base_64(
+                    "commercial_invoice",
+                    CommercialInvoice.get_params(
+                        self._ubbe_request, self._ubbe_request["order_number"]
+                    ),
+                ),
                 "type": DOCUMENT_TYPE_COMMERCIAL_INVOICE,
             }
         )
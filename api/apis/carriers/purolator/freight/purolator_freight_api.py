@@ -10,12 +10,9 @@
 import copy
 
 import zeep
-from requests import Session
-from requests.auth import HTTPBasicAuth
-from zeep import CachingClient, Transport
-from zeep.cache import InMemoryCache
 from zeep.plugins import HistoryPlugin
 
+from api.apis.carriers.soap_client_pool import SoapClientPool
 from api.globals.carriers import PUROLATOR_FREIGHT
 from brain import settings
 
@@ -51,16 +48,6 @@ class PurolatorFreightApi:
             self._password = self.carrier_account.password.decrypt()
             self._key = self.carrier_account.api_key.decrypt()
 
-    @staticmethod
-    def _default_transport(user: str, password: str):
-        """
-        Create default transport and authenticate with user and password.
-        :return:
-        """
-        session = Session()
-        session.auth = HTTPBasicAuth(user, password)
-        return Transport(cache=InMemoryCache(), session=session)
-
     def _build_request_context(self, reference: str, version: str):
         """
         Create Request Context header for Purolator Soap call.
@@ -117,8 +104,6 @@ class PurolatorFreightApi:
             wsdl = f"api/apis/carriers/purolator/freight/wsdl/production/{wsdl_path}"
 
         self._history = HistoryPlugin()
-        self._client = CachingClient(
-            wsdl,
-            transport=self._default_transport(user=self._key, password=self._password),
-            plugins=[self._history],
+        self._client = SoapClientPool.get_client(
+            carrier=PUROLATOR_FREIGHT, wsdl=wsdl, plugins=[self._history], auth=(self._key, self._password)
         )
@@ -120,7 +120,14 @@ class PurolatorFreightRate(PurolatorFreightApi):
         :return:
         """
 
-        if not API.objects.get(name="Purolator").active:
+        reference = self._ubbe_request["objects"].get("reference")
+
+        if reference:
+            is_active = reference.is_active(api_name="Purolator")
+        else:
+            is_active = API.objects.get(name="Purolator").active
+
+        if not is_active:
             connection.close()
             return []
 
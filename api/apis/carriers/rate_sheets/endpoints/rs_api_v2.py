@@ -3,8 +3,8 @@
     Description: This file will contain common functions between Rate and Ship.
     Created: February 12, 2020
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 
 import copy
@@ -19,10 +19,11 @@ from django.utils import timezone
 from api.apis.exchange_rate.exchange_rate import ExchangeRateUtility
 from api.apis.services.carrier_options.carrier_options import CarrierOptions
 from api.apis.services.carrier_options.mandatory import Mandatory
+from api.apis.services.carrier_options.option_applicability import OptionApplicability
 from api.exceptions.project import ViewException, RateException
 from api.exceptions.services import CarrierOptionException
 from api.globals.carriers import NEAS, NSSI, MTS
-from api.models import RateSheet, FuelSurcharge, CityNameAlias, City
+from api.models import API, RateSheet, FuelSurcharge, CityNameAlias, City, RateSheetLane
 
 
 class RateSheetAPI:
@@ -62,6 +63,8 @@ class RateSheetAPI:
         self._ubbe_request = copy.deepcopy(ubbe_request)
         self._error_world_request = copy.deepcopy(self._ubbe_request)
         self._sub_account = self._ubbe_request["objects"]["sub_account"]
+        self._reference = self._ubbe_request["objects"].get("reference")
+        self._applicability = None
 
         self._process_ubbe_data()
         self._clean_error_copy()
@@ -203,6 +206,17 @@ class RateSheetAPI:
 
         return carrier_options
 
+    def _get_lane(self, sheet: RateSheet, weight: Decimal) -> RateSheetLane:
+        """
+        Get the rate sheet lane for a weight.
+        :param sheet: ratesheet
+        :param weight: total weight
+        :return: RateSheetLane
+        """
+        return sheet.rate_sheet_lane_rate_sheet.get(
+            min_value__lte=weight, max_value__gte=weight
+        )
+
     def _get_freight_cost(self, sheet: RateSheet, weight: Decimal) -> Decimal:
         """
         Get freight cost for a shipment. Imperial Units
@@ -212,9 +226,7 @@ class RateSheetAPI:
         """
 
         try:
-            lane = sheet.rate_sheet_lane_rate_sheet.get(
-                min_value__lte=weight, max_value__gte=weight
-            )
+            lane = self._get_lane(sheet=sheet, weight=weight)
         except ObjectDoesNotExist:
             raise ViewException(
                 {
@@ -318,6 +330,31 @@ class RateSheetAPI:
             cost = weight * lane.cost
             return max(sheet.minimum_charge, cost)
 
+    def _is_api_active(self, api_name: str) -> bool:
+        """
+        Check if an api is active, from the request reference snapshot when rating.
+        :param api_name: api name
+        :return: api active flag
+        """
+
+        if self._reference:
+            return self._reference.is_active(api_name=api_name)
+
+        return API.objects.get(name=api_name).active
+
+    def _get_fuel_surcharge(self, carrier_id: int, fuel_type: str) -> FuelSurcharge:
+        """
+        Get Fuel Surcharge for carrier and fuel type.
+        :param carrier_id: Carrier ID
+        :param fuel_type: Domestic or International
+        :return: FuelSurcharge
+        """
+
+        if self._reference:
+            return self._reference.get_fuel_surcharge(carrier_id=carrier_id, fuel_type=fuel_type)
+
+        return FuelSurcharge.objects.get(carrier__code=carrier_id, fuel_type=fuel_type)
+
     def _get_fuel_surcharge_cost(
         self, carrier_id: int, final_weight: Decimal, freight_cost: Decimal
     ) -> dict:
@@ -335,8 +372,8 @@ class RateSheetAPI:
             fuel_type = "I"
 
         try:
-            fuel_surcharge = FuelSurcharge.objects.get(
-                carrier__code=carrier_id, fuel_type=fuel_type
+            fuel_surcharge = self._get_fuel_surcharge(
+                carrier_id=carrier_id, fuel_type=fuel_type
             )
         except ObjectDoesNotExist:
             return {
@@ -348,6 +385,33 @@ class RateSheetAPI:
 
         return fuel_surcharge.get_json(weight=final_weight, freight_cost=freight_cost)
 
+    def _get_mandatory_request(self, carrier_id: int) -> dict:
+        """
+        Get the request used by mandatory options and option applicability.
+        :param carrier_id: carrier code
+        :return: mandatory request
+        """
+        return {
+            "carrier_id": carrier_id,
+            "is_dg_shipment": self._ubbe_request.get("is_dangerous_shipment", False),
+            "origin": self._origin,
+            "destination": self._destination,
+            "packages": self._packages,
+            "reference": self._reference,
+        }
+
+    def _get_applicability(self, carrier_id: int) -> OptionApplicability:
+        """
+        Get the option applicability, it only depends on the request so it is checked once for every rate.
+        :param carrier_id: carrier code
+        :return: OptionApplicability
+        """
+
+        if self._applicability is None:
+            self._applicability = OptionApplicability(request=self._get_mandatory_request(carrier_id=carrier_id))
+
+        return self._applicability
+
     def _get_mandatory_options(
         self, sheet: RateSheet, freight_cost: Decimal, is_metric: bool
     ) -> list:
@@ -366,13 +430,7 @@ class RateSheetAPI:
             mass = self._total_mass_imperial
             volume = self._total_volume_imperial
 
-        mandatory_request = {
-            "carrier_id": sheet.carrier.code,
-            "is_dg_shipment": self._ubbe_request.get("is_dangerous_shipment", False),
-            "origin": self._origin,
-            "destination": self._destination,
-            "packages": self._packages,
-        }
+        mandatory_request = self._get_mandatory_request(carrier_id=sheet.carrier.code)
 
         try:
             mandatory_options = Mandatory().get_calculated_option_costs(
@@ -382,6 +440,7 @@ class RateSheetAPI:
                 cubic=volume,
                 freight=freight_cost,
                 date=self._date,
+                applicability=self._get_applicability(carrier_id=sheet.carrier.code),
             )
         except CarrierOptionException:
             mandatory_options = []
@@ -0,0 +1,199 @@
+"""
+    Title: RateSheet Index
+    Description: This file will contain the process local index of rate sheets, lanes and fuel surcharges for
+                 rate sheet rating. Each carrier is loaded once and reloaded only when the carrier rate
+                 data version changes, so rating a lane needs no database queries.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import datetime
+from bisect import bisect_right
+from decimal import Decimal
+from itertools import accumulate
+from typing import NamedTuple, Union
+
+from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from api.cache_lookups.rate_cache import RateCache
+from api.models import FuelSurcharge, RateSheet, RateSheetLane, SubAccount
+
+
+class LaneBreaks(NamedTuple):
+    """
+        Weight breaks of a rate sheet, sorted by min value for bisect lookup. running_max holds the largest max value
+        of the lanes up to each position, lanes that overlap do not have to be adjacent.
+    """
+    min_values: list
+    max_values: list
+    running_max: list
+    lanes: list
+
+
+class CarrierIndex(NamedTuple):
+    """
+        Rate data of a carrier at a rate data version.
+    """
+    version: int
+    sheets: dict
+    breaks: dict
+    fuel_surcharges: dict
+
+
+class RateSheetIndex:
+    """
+        Process local RateSheet Index
+
+        Sheets are keyed by (owner, origin city, origin province, origin country, destination city, destination
+        province, destination country), the owner is the sub account id or "default" for the default sub account.
+        Cities are matched case insensitive, the same as the database collation.
+    """
+
+    _default = "default"
+    _carriers = {}
+
+    @staticmethod
+    def _get_owner(sub_account: SubAccount) -> Union[int, str]:
+        """
+            Get the index owner key for a sub account.
+            :param sub_account: SubAccount
+            :return: sub account id or default
+        """
+        return RateSheetIndex._default if sub_account.is_default else sub_account.id
+
+    @classmethod
+    def _load_carrier(cls, carrier_id: int, version: int) -> CarrierIndex:
+        """
+            Load every non expired rate sheet with its lanes and fuel surcharges for a carrier.
+            :param carrier_id: carrier code
+            :param version: carrier rate data version
+            :return: CarrierIndex
+        """
+        today = datetime.datetime.now().replace(tzinfo=timezone.utc)
+        sheets = {}
+        breaks = {}
+
+        rate_sheets = RateSheet.objects.select_related(
+            "carrier", "sub_account", "origin_province__country", "destination_province__country"
+        ).prefetch_related(
+            Prefetch("rate_sheet_lane_rate_sheet", queryset=RateSheetLane.objects.order_by("min_value"))
+        ).filter(carrier__code=carrier_id, sub_account__isnull=False, expiry_date__gt=today)
+
+        for sheet in rate_sheets:
+            key = (
+                cls._get_owner(sub_account=sheet.sub_account),
+                sheet.origin_city.lower(),
+                sheet.origin_province.code,
+                sheet.origin_province.country.code,
+                sheet.destination_city.lower(),
+                sheet.destination_province.code,
+                sheet.destination_province.country.code,
+            )
+            sheets.setdefault(key, []).append(sheet)
+
+            lanes = list(sheet.rate_sheet_lane_rate_sheet.all())
+            max_values = [lane.max_value for lane in lanes]
+            breaks[sheet.id] = LaneBreaks(
+                min_values=[lane.min_value for lane in lanes],
+                max_values=max_values,
+                running_max=list(accumulate(max_values, max)),
+                lanes=lanes
+            )
+
+        fuel_surcharges = {
+            fuel.fuel_type: fuel for fuel in FuelSurcharge.objects.select_related("carrier").filter(
+                carrier__code=carrier_id
+            )
+        }
+
+        return CarrierIndex(version=version, sheets=sheets, breaks=breaks, fuel_surcharges=fuel_surcharges)
+
+    @classmethod
+    def get_carriers(cls, carrier_ids: list) -> dict:
+        """
+            Get the index of the carriers, carriers not loaded yet or with a new rate data version are (re)loaded.
+            :param carrier_ids: carrier codes
+            :return: carrier code to CarrierIndex
+        """
+        versions = RateCache.get_versions(carrier_ids=carrier_ids)
+        carriers = {}
+
+        for carrier_id, version in versions.items():
+            index = cls._carriers.get(carrier_id)
+
+            if index is None or index.version != version:
+                index = cls._load_carrier(carrier_id=carrier_id, version=version)
+                cls._carriers[carrier_id] = index
+
+            carriers[carrier_id] = index
+
+        return carriers
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+            Drop every loaded carrier from the index.
+        """
+        cls._carriers = {}
+
+    @classmethod
+    def get_sheets(cls, index: CarrierIndex, sub_account: SubAccount, origin: dict, destination: dict) -> list:
+        """
+            Get the rate sheets for a lane, the sub account sheets or the default sheets when the sub account has none.
+            :param index: CarrierIndex
+            :param sub_account: SubAccount
+            :param origin: origin address with the carrier city name
+            :param destination: destination address with the carrier city name
+            :return: list of RateSheets
+        """
+        lane = (
+            origin["city"].lower(),
+            origin["province"],
+            origin["country"],
+            destination["city"].lower(),
+            destination["province"],
+            destination["country"],
+        )
+
+        sheets = index.sheets.get((cls._get_owner(sub_account=sub_account), *lane), [])
+
+        if not sheets:
+            sheets = index.sheets.get((cls._default, *lane), [])
+
+        return sheets
+
+    @staticmethod
+    def get_lane(index: CarrierIndex, sheet: RateSheet, weight: Decimal) -> RateSheetLane:
+        """
+            Get the lane of a rate sheet for a weight, raises the same exceptions as a lane queryset get.
+            :param index: CarrierIndex
+            :param sheet: RateSheet
+            :param weight: weight
+            :return: RateSheetLane
+        """
+        breaks = index.breaks.get(sheet.id)
+
+        if not breaks:
+            raise ObjectDoesNotExist
+
+        position = bisect_right(breaks.min_values, weight) - 1
+        matches = []
+
+        # Every lane up to position starts at or below the weight, stop once no earlier lane reaches it.
+        while position >= 0 and breaks.running_max[position] >= weight:
+
+            if breaks.max_values[position] >= weight:
+                matches.append(breaks.lanes[position])
+
+                if len(matches) > 1:
+                    raise MultipleObjectsReturned
+
+            position -= 1
+
+        if not matches:
+            raise ObjectDoesNotExist
+
+        return matches[0]
@@ -8,6 +8,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.db import connection
 from pytz import UTC
 
+from api.cache_lookups.rate_cache import RateCache
 from api.exceptions.project import ViewException
 from api.models import RateSheet, SubAccount, Province, RateSheetLane, Carrier
 
@@ -360,3 +361,6 @@ class NewRateSheetManagement:
         # Bulk Create Lane Costs
         RateSheetLane.objects.bulk_create(lanes)
         connection.close()
+
+        # Bulk create skips RateSheet.save, invalidate the cached rates for the carrier here.
+        RateCache.invalidate(carrier_ids=[self._carrier.code])
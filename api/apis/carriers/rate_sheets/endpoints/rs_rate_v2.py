@@ -10,15 +10,18 @@ import copy
 import datetime
 from decimal import Decimal, ROUND_HALF_UP
 
+from django.core.exceptions import ObjectDoesNotExist
 from django.db import connection
 from django.utils import timezone
 
 from api.apis.carriers.rate_sheets.endpoints.rs_api_v2 import RateSheetAPI
+from api.apis.carriers.rate_sheets.endpoints.rs_index import RateSheetIndex
 from api.apis.services.taxes.taxes import Taxes
 from api.background_tasks.logger import CeleryLogger
+from api.cache_lookups.city_alias_cache import CityAliasCache
 from api.exceptions.project import ViewException, RequestError, RateException
 from api.globals.carriers import FATHOM
-from api.models import API, RateSheet, CityNameAlias
+from api.models import RateSheet, FuelSurcharge, RateSheetLane
 from api.utilities.date_utility import DateUtility
 
 
@@ -43,6 +46,7 @@ class RateSheetRate(RateSheetAPI):
         self._is_ftl = is_ftl
         self._is_sealift = is_sealift
         self._is_air = is_air
+        self._index = {}
 
     def _formant(
         self,
@@ -141,54 +145,68 @@ class RateSheetRate(RateSheetAPI):
 
     def _get_rate_sheets(self, carrier_ids: list) -> list:
         """
-        Get RateSheets for all carriers in ubbe request.
+        Get RateSheets for all carriers in ubbe request from the rate sheet index.
         :param carrier_ids:
         :return: list of ratesheets
         """
 
         all_rate_sheets = []
+        self._index.update(RateSheetIndex.get_carriers(carrier_ids=carrier_ids))
+
+        cities = CityAliasCache().resolve_many(
+            cities=[
+                (address["city"], address["province"], address["country"], code)
+                for code in carrier_ids
+                for address in (self._origin, self._destination)
+            ]
+        )
 
-        for code in carrier_ids:
-            o_city = CityNameAlias.check_alias(
-                alias=self._origin["city"],
-                province_code=self._origin["province"],
-                country_code=self._origin["country"],
-                carrier_id=code,
+        for position, code in enumerate(carrier_ids):
+            origin = dict(self._origin)
+            destination = dict(self._destination)
+            origin["city"], destination["city"] = cities[position * 2:position * 2 + 2]
+
+            all_rate_sheets.extend(
+                RateSheetIndex.get_sheets(
+                    index=self._index[code],
+                    sub_account=self._sub_account,
+                    origin=origin,
+                    destination=destination,
+                )
             )
 
-            d_city = CityNameAlias.check_alias(
-                alias=self._destination["city"],
-                province_code=self._destination["province"],
-                country_code=self._destination["country"],
-                carrier_id=code,
-            )
+        return all_rate_sheets
 
-            rate_sheets = RateSheet.objects.filter(
-                sub_account=self._sub_account,
-                origin_city=o_city,
-                destination_city=d_city,
-                origin_province__country__code=self._origin["country"],
-                destination_province__country__code=self._destination["country"],
-                origin_province__code=self._origin["province"],
-                destination_province__code=self._destination["province"],
-                carrier__code=code,
-            )
+    def _get_lane(self, sheet: RateSheet, weight: Decimal) -> RateSheetLane:
+        """
+        Get the rate sheet lane for a weight from the rate sheet index.
+        :param sheet: ratesheet
+        :param weight: total weight
+        :return: RateSheetLane
+        """
 
-            if not rate_sheets:
-                rate_sheets = RateSheet.objects.filter(
-                    sub_account__is_default=True,
-                    origin_city=o_city,
-                    destination_city=d_city,
-                    origin_province__country__code=self._origin["country"],
-                    destination_province__country__code=self._destination["country"],
-                    origin_province__code=self._origin["province"],
-                    destination_province__code=self._destination["province"],
-                    carrier__code=code,
-                )
+        if sheet.carrier.code not in self._index:
+            return super()._get_lane(sheet=sheet, weight=weight)
 
-            all_rate_sheets.extend(rate_sheets)
+        return RateSheetIndex.get_lane(
+            index=self._index[sheet.carrier.code], sheet=sheet, weight=weight
+        )
 
-        return all_rate_sheets
+    def _get_fuel_surcharge(self, carrier_id: int, fuel_type: str) -> FuelSurcharge:
+        """
+        Get Fuel Surcharge for carrier and fuel type from the rate sheet index.
+        :param carrier_id: Carrier ID
+        :param fuel_type: Domestic or International
+        :return: FuelSurcharge
+        """
+
+        if carrier_id not in self._index:
+            return super()._get_fuel_surcharge(carrier_id=carrier_id, fuel_type=fuel_type)
+
+        try:
+            return self._index[carrier_id].fuel_surcharges[fuel_type]
+        except KeyError:
+            raise ObjectDoesNotExist
 
     def _separate_carriers(self) -> None:
         """
@@ -270,7 +288,7 @@ class RateSheetRate(RateSheetAPI):
             surcharges += fuel_surcharge["cost"]
 
             try:
-                taxes = Taxes(self._destination).get_tax_rate(freight_cost + surcharges)
+                taxes = Taxes(self._destination, reference=self._reference).get_tax_rate(freight_cost + surcharges)
             except RequestError:
                 continue
 
@@ -330,7 +348,7 @@ class RateSheetRate(RateSheetAPI):
         surcharges += fuel_surcharge["cost"]
 
         try:
-            taxes = Taxes(self._destination).get_tax_rate(freight_cost + surcharges)
+            taxes = Taxes(self._destination, reference=self._reference).get_tax_rate(freight_cost + surcharges)
         except RequestError as e:
             raise RateException(e)
 
@@ -365,7 +383,7 @@ class RateSheetRate(RateSheetAPI):
         rates = []
 
         if self._is_sealift:
-            if not API.objects.get(name="Sealift").active:
+            if not self._is_api_active(api_name="Sealift"):
                 connection.close()
                 return []
 
@@ -3,8 +3,8 @@
     Description: This file will contain functions related to Shipping.
     Created: February 12, 2020
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 # TODO: Remove Email from this file.
 
@@ -21,6 +21,7 @@ from api.apis.carriers.rate_sheets.endpoints.rs_email_v2 import RateSheetEmail
 from api.apis.services.taxes.taxes import Taxes
 from api.background_tasks.logger import CeleryLogger
 from api.documents.commercial_invoice import CommercialInvoice
+from api.documents.render_service import DocumentRenderService
 from api.documents.manual_documents import ManualDocuments
 from api.exceptions.project import ShipException, RequestError
 from api.globals.carriers import (
@@ -151,11 +152,13 @@ class RateSheetShip(RateSheetAPI):
         threads = [bol_thread, piece_label_thread]
 
         if self._ubbe_request["is_international"]:
-            commercial = CommercialInvoice(
+            commercial = CommercialInvoice.get_params(
                 shipdata=self._ubbe_request,
                 order_number=self._ubbe_request["order_number"],
             )
-            commercial_invoice_thread = gevent.Greenlet.spawn(commercial.get_base_64)
+            commercial_invoice_thread = gevent.Greenlet.spawn(
+                DocumentRenderService().render_base_64, "commercial_invoice", commercial
+            )
             threads.append(commercial_invoice_thread)
 
         gevent.joinall(threads)
@@ -0,0 +1,114 @@
+from decimal import Decimal
+
+from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
+from django.test import TestCase
+
+from api.apis.carriers.rate_sheets.endpoints.rs_index import RateSheetIndex
+from api.models import RateSheet, RateSheetLane, SubAccount
+
+
+class RateSheetIndexTests(TestCase):
+    fixtures = [
+        "api",
+        "carriers",
+        "countries",
+        "provinces",
+        "addresses",
+        "contact",
+        "user",
+        "group",
+        "markup",
+        "account",
+        "subaccount",
+        "ratesheet",
+        "ratesheet_lane",
+    ]
+
+    def setUp(self):
+        RateSheetIndex.clear()
+        self._sheet = RateSheet.objects.get(pk=4)
+        self._code = self._sheet.carrier.code
+        self._sub_account = SubAccount.objects.get(pk=2)
+        self._origin = {"city": "test", "province": "AB", "country": "CA"}
+        self._destination = {"city": "TEST", "province": "AB", "country": "CA"}
+
+        for min_value, max_value, cost in (("0", "99", "5.00"), ("100", "499", "4.00"), ("500", "999", "3.00")):
+            RateSheetLane.objects.create(
+                rate_sheet=self._sheet, min_value=Decimal(min_value), max_value=Decimal(max_value), cost=Decimal(cost)
+            )
+
+    def _get_index(self):
+        return RateSheetIndex.get_carriers(carrier_ids=[self._code])[self._code]
+
+    def test_get_sheets_default(self):
+        sheets = RateSheetIndex.get_sheets(
+            index=self._get_index(), sub_account=self._sub_account, origin=self._origin, destination=self._destination
+        )
+        expected = RateSheet.objects.filter(sub_account__is_default=True, carrier__code=self._code)
+        self.assertCountEqual([sheet.pk for sheet in sheets], [sheet.pk for sheet in expected])
+
+    def test_get_sheets_no_lane(self):
+        destination = {"city": "Inuvik", "province": "NT", "country": "CA"}
+        sheets = RateSheetIndex.get_sheets(
+            index=self._get_index(), sub_account=self._sub_account, origin=self._origin, destination=destination
+        )
+        self.assertEqual(sheets, [])
+
+    def test_get_lane(self):
+        index = self._get_index()
+
+        for weight, cost in (("0", "5.00"), ("99", "5.00"), ("100", "4.00"), ("999", "3.00")):
+            lane = RateSheetIndex.get_lane(index=index, sheet=self._sheet, weight=Decimal(weight))
+            self.assertEqual(lane.cost, Decimal(cost))
+
+    def test_get_lane_no_break(self):
+        with self.assertRaises(ObjectDoesNotExist):
+            RateSheetIndex.get_lane(index=self._get_index(), sheet=self._sheet, weight=Decimal("1000"))
+
+    def test_get_lane_overlap(self):
+        RateSheetLane.objects.create(
+            rate_sheet=self._sheet, min_value=Decimal("50"), max_value=Decimal("150"), cost=Decimal("9.00")
+        )
+
+        with self.assertRaises(MultipleObjectsReturned):
+            RateSheetIndex.get_lane(index=self._get_index(), sheet=self._sheet, weight=Decimal("120"))
+
+    def test_get_lane_matches_queryset(self):
+        RateSheetLane.objects.filter(rate_sheet=self._sheet).delete()
+
+        for min_value, max_value in (("0", "1000"), ("100", "200"), ("300", "400")):
+            RateSheetLane.objects.create(
+                rate_sheet=self._sheet, min_value=Decimal(min_value), max_value=Decimal(max_value), cost=Decimal("1")
+            )
+
+        index = self._get_index()
+
+        for weight in ("0", "50", "150", "250", "350", "500", "1000", "1001"):
+            weight = Decimal(weight)
+
+            try:
+                expected = RateSheetLane.objects.get(rate_sheet=self._sheet, min_value__lte=weight, max_value__gte=weight)
+            except ObjectDoesNotExist:
+                with self.assertRaises(ObjectDoesNotExist):
+                    RateSheetIndex.get_lane(index=index, sheet=self._sheet, weight=weight)
+                continue
+            except MultipleObjectsReturned:
+                with self.assertRaises(MultipleObjectsReturned):
+                    RateSheetIndex.get_lane(index=index, sheet=self._sheet, weight=weight)
+                continue
+
+            self.assertEqual(RateSheetIndex.get_lane(index=index, sheet=self._sheet, weight=weight).pk, expected.pk)
+
+    def test_reload_on_lane_change(self):
+        first = self._get_index()
+        lane = RateSheetLane.objects.get(rate_sheet=self._sheet, min_value=Decimal("0"))
+        lane.cost = Decimal("6.00")
+        lane.save()
+        second = self._get_index()
+
+        self.assertIsNot(first, second)
+        lane = RateSheetIndex.get_lane(index=second, sheet=self._sheet, weight=Decimal("10"))
+        self.assertEqual(lane.cost, Decimal("6.00"))
+
+    def test_reuse_without_change(self):
+        self.assertIs(self._get_index(), self._get_index())
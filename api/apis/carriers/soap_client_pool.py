@@ -0,0 +1,277 @@
+"""
+    Title: SOAP Client Pool
+    Description: This file will contain the process wide pool for zeep based carriers. WSDL documents are parsed once
+                 per carrier, environment, service and namespace prefixes, and HTTP sessions with keep alive adapters are shared per
+                 carrier and credentials, so a SOAP quote only builds a light client around them. Remote WSDL and XSD
+                 files are kept in an on disk cache shared by the workers on a host.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from typing import Union
+
+from gevent.lock import RLock
+from requests import Session
+from requests.adapters import HTTPAdapter
+from zeep import Client, Transport
+from zeep.cache import InMemoryCache, SqliteCache
+from zeep.wsdl import Document
+
+from api.globals.carriers import CAN_POST, DAY_N_ROSS, FEDEX, PUROLATOR, PUROLATOR_FREIGHT, YRC
+from api.globals.project import LOGGER
+from brain import settings
+
+
+class SoapClientPool:
+    """
+        SOAP Client Pool
+
+        Clients are not pooled themselves: each carrier instance keeps its own HistoryPlugin, so a client is built per
+        instance around the pooled document and session. Building that client does not parse or connect.
+
+        Namespace prefixes are stored on the document types, so they are set once when the document is parsed and
+        never through Client.set_ns_prefix, which would change the prefixes of every client sharing the document.
+    """
+
+    _pool_connections = 4
+    _pool_maxsize = 20
+    _wsdl_cache_ttl = 7 * 24 * 60 * 60
+
+    _lock = RLock()
+    _cache = InMemoryCache()
+    _wsdl_cache = None
+
+    # (carrier, wsdl, *sorted ns prefixes): parsed document
+    _documents = {}
+
+    # (carrier, wsdl, *sorted ns prefixes): parse lock, so a remote fetch only blocks callers of the same document
+    _document_locks = {}
+
+    # (carrier, auth): keep alive session
+    _sessions = {}
+
+    @classmethod
+    def _get_wsdl_cache(cls) -> SqliteCache:
+        """
+            Get the on disk cache for remote WSDL and XSD files, local WSDL files are read directly.
+            :return: sqlite cache
+        """
+
+        if cls._wsdl_cache is None:
+            cls._wsdl_cache = SqliteCache(path=settings.SOAP_WSDL_CACHE, timeout=cls._wsdl_cache_ttl)
+
+        return cls._wsdl_cache
+
+    @staticmethod
+    def _get_warm_up_wsdls(remote: bool = False) -> list:
+        """
+            Get the WSDLs for the current environment.
+            :param remote: include the remote WSDLs, fetched into the on disk cache
+            :return: list of (carrier, wsdl) or (carrier, wsdl, ns prefixes)
+        """
+        from api.apis.carriers.canada_post.globals.globals import (
+            SHIPMENT_WSDL,
+            RATE_WSDL,
+            MANIFEST_WSDL,
+            ARTIFACT_WSDL,
+            PICKUP_WSDL,
+            PICKUP_REQUEST_WSDL,
+        )
+        from api.apis.carriers.fedex.globals.services import SERVICES
+        from api.apis.carriers.purolator.courier.endpoints.purolator_base import PurolatorBaseApi
+        from api.apis.carriers.yrc.endpoints.yrc_base import YRC_NS_PREFIXES, YRC_SOAP_WSDL
+
+        if settings.DEBUG:
+            day_ross = "api/apis/carriers/day_ross_v2/wsdl/staging.wsdl"
+            puro_env = "development"
+        else:
+            day_ross = "api/apis/carriers/day_ross_v2/wsdl/production.wsdl"
+            puro_env = "production"
+
+        # wsdl: service version
+        courier = {
+            "EstimatingService.wsdl": "2.2",
+            "PickUpService.wsdl": "1.2",
+            "ServiceAvailabilityService.wsdl": "2.0",
+            "ShippingDocumentsService.wsdl": "1.4",
+            "ShippingService.wsdl": "2.2",
+            "TrackingService.wsdl": "1.2",
+        }
+        freight = [
+            "FreightEstimatingService.wsdl",
+            "FreightPickUpService.wsdl",
+            "FreightShippingService.wsdl",
+            "FreightTrackingService.wsdl",
+        ]
+
+        wsdls = [(DAY_N_ROSS, day_ross), (CAN_POST, SHIPMENT_WSDL)]
+        wsdls.extend((FEDEX, service.wsdl) for service in SERVICES)
+        wsdls.extend(
+            (
+                PUROLATOR,
+                f"api/apis/carriers/purolator/courier/wsdl/{puro_env}/{wsdl}",
+                PurolatorBaseApi.get_ns_prefixes(version=version)
+            ) for wsdl, version in courier.items()
+        )
+        wsdls.extend(
+            (PUROLATOR_FREIGHT, f"api/apis/carriers/purolator/freight/wsdl/{puro_env}/{wsdl}") for wsdl in freight
+        )
+
+        if remote:
+            wsdls.extend(
+                (CAN_POST, wsdl) for wsdl in [RATE_WSDL, MANIFEST_WSDL, ARTIFACT_WSDL, PICKUP_WSDL, PICKUP_REQUEST_WSDL]
+            )
+            wsdls.append((YRC, YRC_SOAP_WSDL, YRC_NS_PREFIXES))
+
+        return wsdls
+
+    @classmethod
+    def get_document(cls, carrier: int, wsdl: str, ns_prefixes: Union[dict, None] = None) -> Document:
+        """
+            Get the parsed WSDL document, parse it on first use. Each set of namespace prefixes gets its own document.
+            :param carrier: carrier code
+            :param wsdl: WSDL path or url
+            :param ns_prefixes: prefix: namespace set on the document types, ex: {"v2": "http://..."}
+            :return: parsed document
+        """
+        ns_prefixes = ns_prefixes or {}
+        key = (carrier, wsdl) + tuple(sorted(ns_prefixes.items()))
+        document = cls._documents.get(key)
+
+        if document is not None:
+            return document
+
+        with cls._lock:
+            lock = cls._document_locks.setdefault(key, RLock())
+
+        with lock:
+            document = cls._documents.get(key)
+
+            if document is None:
+                document = Document(wsdl, Transport(cache=cls._get_wsdl_cache()))
+
+                for prefix, namespace in ns_prefixes.items():
+                    document.types.set_ns_prefix(prefix, namespace)
+
+                cls._documents[key] = document
+
+        return document
+
+    @classmethod
+    def get_session(cls, carrier: int, auth: Union[tuple, None] = None) -> Session:
+        """
+            Get the keep alive session for a carrier and credentials.
+            :param carrier: carrier code
+            :param auth: (user, password) for basic auth
+            :return: session
+        """
+        key = (carrier, auth)
+        session = cls._sessions.get(key)
+
+        if session is not None:
+            return session
+
+        with cls._lock:
+            session = cls._sessions.get(key)
+
+            if session is None:
+                adapter = HTTPAdapter(pool_connections=cls._pool_connections, pool_maxsize=cls._pool_maxsize)
+                session = Session()
+                session.auth = auth
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                cls._sessions[key] = session
+
+        return session
+
+    @classmethod
+    def get_client(cls, carrier: int, wsdl: str, plugins: list, auth: Union[tuple, None] = None, wsse=None,
+                   transport_class: type = Transport, ns_prefixes: Union[dict, None] = None,
+                   **transport_kwargs) -> Client:
+        """
+            Get a zeep client built on the pooled document and session.
+            :param carrier: carrier code
+            :param wsdl: WSDL path or url
+            :param plugins: client plugins, ex: the instance HistoryPlugin
+            :param auth: (user, password) for basic auth
+            :param wsse: zeep wsse signature, ex: UsernameToken
+            :param transport_class: zeep transport class
+            :param ns_prefixes: prefix: namespace set on the document types, do not call set_ns_prefix on the client
+            :param transport_kwargs: extra transport arguments, ex: timeout
+            :return: zeep client
+        """
+        transport = transport_class(
+            cache=cls._cache, session=cls.get_session(carrier=carrier, auth=auth), **transport_kwargs
+        )
+
+        document = cls.get_document(carrier=carrier, wsdl=wsdl, ns_prefixes=ns_prefixes)
+
+        return Client(document, wsse=wsse, transport=transport, plugins=plugins)
+
+    @classmethod
+    def warm_up(cls, wsdls: list = None, remote: bool = False) -> dict:
+        """
+            Parse WSDL documents ahead of the first quote. Sessions are left to the first request so forked workers
+            do not share sockets.
+            :param wsdls: list of (carrier, wsdl) or (carrier, wsdl, ns prefixes), defaults to the WSDLs for the
+                          environment
+            :param remote: include the remote WSDLs in the defaults
+            :return: dict of wsdl: error message for the WSDLs that failed
+        """
+        errors = {}
+
+        for carrier, wsdl, *ns_prefixes in wsdls or cls._get_warm_up_wsdls(remote=remote):
+            try:
+                cls.get_document(carrier=carrier, wsdl=wsdl, ns_prefixes=ns_prefixes[0] if ns_prefixes else None)
+            except Exception as e:
+                LOGGER.warning(f"SOAP Client Pool: {wsdl} failed to parse: {str(e)}")
+                errors[wsdl] = str(e)
+
+        return errors
+
+    @classmethod
+    def health_check(cls) -> dict:
+        """
+            Report the pooled documents and sessions. A document is healthy when it has at least one service.
+            :return: health dict
+        """
+        documents = []
+
+        for (carrier, wsdl, *ns_prefixes), document in list(cls._documents.items()):
+            documents.append({
+                "carrier": carrier,
+                "wsdl": wsdl,
+                "ns_prefixes": dict(ns_prefixes),
+                "services": list(document.services.keys()),
+            })
+
+        sessions = []
+
+        for (carrier, _), session in list(cls._sessions.items()):
+            adapters = {adapter for adapter in session.adapters.values() if isinstance(adapter, HTTPAdapter)}
+            sessions.append({
+                "carrier": carrier,
+                "host_pools": sum(len(adapter.poolmanager.pools.keys()) for adapter in adapters),
+            })
+
+        return {
+            "is_healthy": all(document["services"] for document in documents),
+            "documents": documents,
+            "sessions": sessions,
+        }
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+            Close every pooled session and drop the pooled documents.
+        """
+
+        with cls._lock:
+            for session in cls._sessions.values():
+                session.close()
+
+            cls._documents = {}
+            cls._document_locks = {}
+            cls._sessions = {}
+
@@ -0,0 +1,117 @@
+from django.test import TestCase
+from zeep.plugins import HistoryPlugin
+
+from api.apis.carriers.fedex.globals.services import LazyService
+from api.apis.carriers.purolator.courier.endpoints.purolator_base import PurolatorBaseApi
+from api.apis.carriers.soap_client_pool import SoapClientPool
+from api.apis.carriers.yrc.endpoints.yrc_base import TransportSoapenv
+from api.globals.carriers import DAY_N_ROSS, FEDEX, PUROLATOR, YRC
+from api.globals.project import DEFAULT_TIMEOUT_SECONDS
+
+
+class SoapClientPoolTests(TestCase):
+
+    def setUp(self):
+        SoapClientPool.clear()
+        self.day_ross = "api/apis/carriers/day_ross_v2/wsdl/staging.wsdl"
+        self.puro = "api/apis/carriers/purolator/courier/wsdl/development/EstimatingService.wsdl"
+
+    def tearDown(self):
+        SoapClientPool.clear()
+
+    def test_get_document_parsed_once(self):
+        document = SoapClientPool.get_document(carrier=DAY_N_ROSS, wsdl=self.day_ross)
+        self.assertIs(SoapClientPool.get_document(carrier=DAY_N_ROSS, wsdl=self.day_ross), document)
+
+    def test_get_client(self):
+        history_one = HistoryPlugin()
+        history_two = HistoryPlugin()
+        one = SoapClientPool.get_client(
+            carrier=DAY_N_ROSS, wsdl=self.day_ross, plugins=[history_one], timeout=DEFAULT_TIMEOUT_SECONDS
+        )
+        two = SoapClientPool.get_client(carrier=DAY_N_ROSS, wsdl=self.day_ross, plugins=[history_two])
+
+        self.assertIsNot(one, two)
+        self.assertIs(one.wsdl, two.wsdl)
+        self.assertIs(one.transport.session, two.transport.session)
+        self.assertEqual(one.plugins, [history_one])
+        self.assertEqual(one.transport.load_timeout, DEFAULT_TIMEOUT_SECONDS)
+        self.assertIsNotNone(one.type_factory("ns0"))
+
+    def test_get_client_ns_prefixes(self):
+        v1 = PurolatorBaseApi.get_ns_prefixes(version="1.2")
+        v2 = PurolatorBaseApi.get_ns_prefixes(version="2.2")
+        one = SoapClientPool.get_client(carrier=PUROLATOR, wsdl=self.puro, plugins=[], ns_prefixes=v1)
+        two = SoapClientPool.get_client(carrier=PUROLATOR, wsdl=self.puro, plugins=[], ns_prefixes=v2)
+        plain = SoapClientPool.get_client(carrier=PUROLATOR, wsdl=self.puro, plugins=[])
+
+        self.assertIsNot(one.wsdl, two.wsdl)
+        self.assertIs(SoapClientPool.get_document(carrier=PUROLATOR, wsdl=self.puro, ns_prefixes=v1), one.wsdl)
+        self.assertEqual(one.wsdl.types.prefix_map["v1"], v1["v1"])
+        self.assertNotIn("v1", two.wsdl.types.prefix_map)
+        self.assertNotIn("v1", plain.wsdl.types.prefix_map)
+        self.assertNotIn("v2", plain.wsdl.types.prefix_map)
+
+    def test_get_session_per_auth(self):
+        one = SoapClientPool.get_session(carrier=PUROLATOR, auth=("key", "password"))
+        two = SoapClientPool.get_session(carrier=PUROLATOR, auth=("key_two", "password"))
+
+        self.assertIsNot(one, two)
+        self.assertIs(SoapClientPool.get_session(carrier=PUROLATOR, auth=("key", "password")), one)
+        self.assertEqual(one.auth, ("key", "password"))
+        self.assertEqual(one.get_adapter("https://webservices.purolator.com")._pool_maxsize, 20)
+
+    def test_transport_class(self):
+        client = SoapClientPool.get_client(
+            carrier=YRC, wsdl=self.day_ross, plugins=[], transport_class=TransportSoapenv
+        )
+        self.assertIsInstance(client.transport, TransportSoapenv)
+
+    def test_warm_up(self):
+        errors = SoapClientPool.warm_up(wsdls=[(DAY_N_ROSS, self.day_ross), (PUROLATOR, "not/a/file.wsdl")])
+
+        self.assertEqual(list(errors.keys()), ["not/a/file.wsdl"])
+        self.assertIn((DAY_N_ROSS, self.day_ross), SoapClientPool._documents)
+
+    def test_health_check(self):
+        SoapClientPool.get_client(carrier=PUROLATOR, wsdl=self.puro, plugins=[], auth=("key", "password"))
+        health = SoapClientPool.health_check()
+
+        self.assertTrue(health["is_healthy"])
+        self.assertEqual(health["documents"][0]["services"], ["EstimatingService"])
+        self.assertEqual(health["sessions"], [{"carrier": PUROLATOR, "host_pools": 0}])
+
+
+class LazyServiceTests(TestCase):
+
+    def setUp(self):
+        SoapClientPool.clear()
+        self.history = HistoryPlugin()
+        self.service = LazyService(
+            wsdl="api/apis/carriers/fedex/globals/wsdl/RateService_v24.wsdl",
+            binding="{http://fedex.com/ws/rate/v24}RateServiceSoapBinding",
+            address="https://wsbeta.fedex.com/web-services/rate/v24",
+            history=self.history,
+        )
+
+    def tearDown(self):
+        SoapClientPool.clear()
+
+    def test_not_loaded(self):
+        self.assertFalse(self.service.is_loaded)
+        self.assertEqual(SoapClientPool._documents, {})
+
+    def test_load_on_use(self):
+        get_rates = self.service.getRates
+
+        self.assertTrue(self.service.is_loaded)
+        self.assertIn((FEDEX, self.service.wsdl), SoapClientPool._documents)
+        self.assertEqual(self.service.load()._binding_options["address"], "https://wsbeta.fedex.com/web-services/rate/v24")
+        self.assertIsNotNone(get_rates)
+        self.assertIs(self.service.load(), self.service.load())
+
+    def test_private_attribute(self):
+        with self.assertRaises(AttributeError):
+            getattr(self.service, "_missing")
+
+        self.assertFalse(self.service.is_loaded)
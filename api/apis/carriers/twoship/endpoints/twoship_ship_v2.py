@@ -3,8 +3,8 @@
     Description: This file will contain functions related to 2Ship ship Api.
     Created: January 10, 2023
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 import copy
 from decimal import Decimal
@@ -13,6 +13,7 @@ from django.db import connection
 
 from api.apis.carriers.twoship.endpoints.twoship_base_v2 import TwoShipBase
 from api.documents.commercial_invoice import CommercialInvoice
+from api.documents.render_service import DocumentRenderService
 from api.exceptions.project import RequestError, ShipException, ViewException
 from api.globals.carriers import DHL
 from api.globals.project import (
@@ -200,9 +201,10 @@ class TwoShipShip(TwoShipBase):
                 continue
 
             if document_type == DOCUMENT_TYPE_COMMERCIAL_INVOICE:
-                doc = CommercialInvoice(
-                    self._ubbe_request, self._ubbe_request["order"]
-                ).get_base_64()
+                doc = DocumentRenderService().render_base_64(
+                    "commercial_invoice",
+                    CommercialInvoice.get_params(self._ubbe_request, self._ubbe_request["order"]),
+                )
             else:
                 doc = document["DocumentBase64String"]
 
@@ -3,8 +3,8 @@
     Description: TThis file will contain functions related to ubbe ML Base Api.
     Created: Jan 6, 2023
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 
 import copy
@@ -16,6 +16,7 @@ from django.utils import timezone
 
 from api.apis.services.carrier_options.carrier_options import CarrierOptions
 from api.apis.services.carrier_options.mandatory import Mandatory
+from api.apis.services.carrier_options.option_applicability import OptionApplicability
 from api.apis.google.route_apis.distance_api import GoogleDistanceApi
 from api.apis.services.taxes.taxes import Taxes
 from api.background_tasks.logger import CeleryLogger
@@ -56,6 +57,8 @@ class MLCarrierBase:
         # self._carrier_id = self._ubbe_request["carrier_id"]
         self._origin = self._ubbe_request["origin"]
         self._destination = self._ubbe_request["destination"]
+        self._reference = self._ubbe_request.get("objects", {}).get("reference")
+        self._applicability = None
         self._packages = self._ubbe_request["packages"]
         self._total_quantity = self._ubbe_request.get("total_quantity", 1)
 
@@ -100,9 +103,12 @@ class MLCarrierBase:
             fuel_type = "I"
 
         try:
-            fuel_surcharge = FuelSurcharge.objects.get(
-                carrier__code=carrier_id, fuel_type=fuel_type
-            )
+            if self._reference:
+                fuel_surcharge = self._reference.get_fuel_surcharge(carrier_id=carrier_id, fuel_type=fuel_type)
+            else:
+                fuel_surcharge = FuelSurcharge.objects.get(
+                    carrier__code=carrier_id, fuel_type=fuel_type
+                )
         except ObjectDoesNotExist:
             return {
                 "carrier_id": carrier_id,
@@ -146,28 +152,47 @@ class MLCarrierBase:
         :return: Tax amount
         """
         try:
-            return Taxes(self._destination).get_tax_rate(
+            return Taxes(self._destination, reference=self._reference).get_tax_rate(
                 Decimal(freight) + surcharges_cost
             )
         except Exception:
             # raise ShipException({"api.error.ubbe_ml.api": "Error fetching tax: {}".format(str(e))})
             return Decimal("0.00")
 
-    def _get_mandatory_options(self, carrier, freight_cost) -> list:
+    def _get_mandatory_request(self) -> dict:
         """
-        Get the mandatory options for the carrier, freight cost may be required for additional costs..
-        :param carrier: Carrier object
-        :param freight_cost: cost of freight
-        :return: List of mandatory options
+        Get the request used by mandatory options and option applicability.
+        :return: mandatory request
         """
-        mandatory_request = {
+        return {
             "carrier_id": self._carrier_id,
             "is_dg_shipment": self._ubbe_request.get("is_dangerous_shipment", False),
             "origin": self._origin,
             "destination": self._destination,
             "packages": self._packages,
+            "reference": self._reference,
         }
 
+    def _get_applicability(self) -> OptionApplicability:
+        """
+        Get the option applicability, it only depends on the request so it is checked once for every rate.
+        :return: OptionApplicability
+        """
+
+        if self._applicability is None:
+            self._applicability = OptionApplicability(request=self._get_mandatory_request())
+
+        return self._applicability
+
+    def _get_mandatory_options(self, carrier, freight_cost) -> list:
+        """
+        Get the mandatory options for the carrier, freight cost may be required for additional costs..
+        :param carrier: Carrier object
+        :param freight_cost: cost of freight
+        :return: List of mandatory options
+        """
+        mandatory_request = self._get_mandatory_request()
+
         if self._is_metric:
             mass = self._total_mass_metric
             volume = self._total_volume_metric
@@ -183,6 +208,7 @@ class MLCarrierBase:
                 cubic=volume,
                 freight=freight_cost,
                 date=self._date,
+                applicability=self._get_applicability(),
             )
         except CarrierOptionException as e:
             mandatory_options = []
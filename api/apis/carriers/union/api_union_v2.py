@@ -1,4 +1,4 @@
-import copy
+from typing import Callable
 
 import gevent
 from django.db import connection
@@ -18,6 +18,7 @@ from api.apis.carriers.rate_sheets.rate_sheet_api import RateSheetApi
 from api.apis.carriers.skyline.skyline_api_v3 import SkylineApi
 from api.apis.carriers.tst_cf_express.tst_cf_express_api import TSTCFExpressApi
 from api.apis.carriers.twoship.twoship_api import TwoShipApi
+from api.apis.carriers.union.request_view import RequestView
 from api.apis.carriers.ubbe_ml.ubbe_ml_api import UbbeMLApi
 from api.apis.carriers.yrc.yrc_api import YRCFreight
 from api.exceptions.project import ViewException
@@ -44,187 +45,88 @@ from api.globals.carriers import (
 
 
 class Union:
-    def __init__(self, gobox_request: dict) -> None:
+    # Carrier groups in rating order: group name, carrier ids in the group and the api used to rate the group.
+    _carrier_groups = (
+        ("two_ship", TWO_SHIP_CARRIERS, lambda request: TwoShipApi(ubbe_request=request)),
+        ("skyline", SKYLINE_CARRIERS, lambda request: SkylineApi(ubbe_request=request)),
+        ("rate_sheet", RATE_SHEET_CARRIERS, lambda request: RateSheetApi(ubbe_request=request, is_sealift=False)),
+        ("sealift", SEALIFT_CARRIERS, lambda request: RateSheetApi(ubbe_request=request, is_sealift=True)),
+        ("canadapost", (CAN_POST,), lambda request: CanadaPostApi(request)),
+        (
+            "day_ross", (DAY_N_ROSS,),
+            lambda request: DayRossApi(ubbe_request=RequestView(request, carrier_id=DAY_N_ROSS))
+        ),
+        (
+            "sameday", (SAMEDAY,),
+            lambda request: DayRossApi(ubbe_request=RequestView(request, carrier_id=SAMEDAY))
+        ),
+        ("bbe", (BBE,), lambda request: BBEApi(ubbe_request=request)),
+        ("fedex", (FEDEX,), lambda request: FedexApi(ubbe_request=request)),
+        ("tst", (TST,), lambda request: TSTCFExpressApi(ubbe_request=request)),
+        ("calm_air", (CALM_AIR,), lambda request: CalmAirApi(ubbe_request=request)),
+        ("puro", (PUROLATOR,), lambda request: PurolatorApi(ubbe_request=request)),
+        ("ml_carrier", (UBBE_ML,), lambda request: UbbeMLApi(ubbe_request=request)),
+        ("action", (ACTION_EXPRESS,), lambda request: ActionExpress(ubbe_request=request)),
+        ("cargojet", (CARGO_JET,), lambda request: Cargojet(ubbe_request=request)),
+        ("yrc", (YRC,), lambda request: YRCFreight(ubbe_request=request)),
+        ("abf", (ABF_FREIGHT,), lambda request: ABFFreight(ubbe_request=request)),
+        ("man", (MANITOULIN,), lambda request: ManitoulinApi(ubbe_request=request)),
+    )
+
+    def __init__(self, gobox_request: dict, on_rates: Callable[[list], None] = None) -> None:
         self.gobox_request = gobox_request
+        self._on_rates = on_rates
+
+    def _send_rates(self, greenlet: gevent.Greenlet) -> None:
+        """
+            Send a carrier group's rates to the rates callback as soon as the carrier answers.
+            :param greenlet: finished carrier greenlet
+        """
+
+        if greenlet.value and not isinstance(greenlet.value, gevent.GreenletExit):
+            self._on_rates(greenlet.value)
 
     def _rate_call(self) -> list:
-        (
-            two_ship,
-            skyline,
-            rate_sheet,
-            sealift,
-            canadapost,
-            day_ross,
-            sameday,
-            bbe,
-            tst,
-            calm_air,
-            puro,
-            fedex,
-            ml_carrier,
-            action,
-            cargojet,
-            yrc,
-            abf,
-            man,
-        ) = self._split()
-        apis = []
-
-        if two_ship["carrier_id"]:
-            apis.append(TwoShipApi(ubbe_request=two_ship))
-        if skyline["carrier_id"]:
-            apis.append(SkylineApi(ubbe_request=skyline))
-        if rate_sheet["carrier_id"]:
-            apis.append(RateSheetApi(ubbe_request=rate_sheet, is_sealift=False))
-        if sealift["carrier_id"]:
-            apis.append(RateSheetApi(ubbe_request=sealift, is_sealift=True))
-        if canadapost["carrier_id"]:
-            apis.append(CanadaPostApi(canadapost))
-        if day_ross["carrier_id"] == [DAY_N_ROSS]:
-            day_ross["carrier_id"] = DAY_N_ROSS
-            apis.append(DayRossApi(ubbe_request=day_ross))
-        if sameday["carrier_id"] == [SAMEDAY]:
-            sameday["carrier_id"] = SAMEDAY
-            apis.append(DayRossApi(ubbe_request=sameday))
-        if bbe["carrier_id"] == [BBE]:
-            apis.append(BBEApi(ubbe_request=bbe))
-        if fedex["carrier_id"] == [FEDEX]:
-            apis.append(FedexApi(ubbe_request=fedex))
-        if tst["carrier_id"] == [TST]:
-            apis.append(TSTCFExpressApi(ubbe_request=tst))
-        if calm_air["carrier_id"]:
-            apis.append(CalmAirApi(ubbe_request=calm_air))
-        if puro["carrier_id"]:
-            apis.append(PurolatorApi(ubbe_request=puro))
-        if ml_carrier["carrier_id"]:
-            apis.append(UbbeMLApi(ubbe_request=ml_carrier))
-        if action["carrier_id"]:
-            apis.append(ActionExpress(ubbe_request=action))
-        if cargojet["carrier_id"]:
-            apis.append(Cargojet(ubbe_request=cargojet))
-        if yrc["carrier_id"]:
-            apis.append(YRCFreight(ubbe_request=yrc))
-        if abf["carrier_id"]:
-            apis.append(ABFFreight(ubbe_request=abf))
-        if man["carrier_id"]:
-            apis.append(ManitoulinApi(ubbe_request=man))
-
-        greenlets = [gevent.Greenlet.spawn(api.rate) for api in apis]
-        gevent.joinall(greenlets)
-        responses = [greenlet.get() for greenlet in greenlets]
-
-        return responses
-
-    def _split(self) -> tuple:
-        two_ship = copy.deepcopy(self.gobox_request)
-        two_ship["carrier_id"] = [
-            carrier
-            for carrier in two_ship["carrier_id"]
-            if carrier in TWO_SHIP_CARRIERS
-        ]
-
-        skyline = copy.deepcopy(self.gobox_request)
-        skyline["carrier_id"] = [
-            carrier for carrier in skyline["carrier_id"] if carrier in SKYLINE_CARRIERS
-        ]
-
-        rate_sheet = copy.deepcopy(self.gobox_request)
-        rate_sheet["carrier_id"] = [
-            carrier
-            for carrier in rate_sheet["carrier_id"]
-            if carrier in RATE_SHEET_CARRIERS
-        ]
-
-        sealift = copy.deepcopy(self.gobox_request)
-        sealift["carrier_id"] = [
-            carrier for carrier in sealift["carrier_id"] if carrier in SEALIFT_CARRIERS
-        ]
-
-        canadapost = copy.deepcopy(self.gobox_request)
-        canadapost["carrier_id"] = [
-            carrier for carrier in canadapost["carrier_id"] if carrier == CAN_POST
-        ]
-
-        day_ross = copy.deepcopy(self.gobox_request)
-        day_ross["carrier_id"] = [
-            carrier for carrier in day_ross["carrier_id"] if carrier == DAY_N_ROSS
-        ]
-
-        sameday = copy.deepcopy(self.gobox_request)
-        sameday["carrier_id"] = [
-            carrier for carrier in sameday["carrier_id"] if carrier == SAMEDAY
-        ]
-
-        bbe = copy.deepcopy(self.gobox_request)
-        bbe["carrier_id"] = [carrier for carrier in bbe["carrier_id"] if carrier == BBE]
-
-        fedex = copy.deepcopy(self.gobox_request)
-        fedex["carrier_id"] = [
-            carrier for carrier in fedex["carrier_id"] if carrier == FEDEX
-        ]
-
-        tst = copy.deepcopy(self.gobox_request)
-        tst["carrier_id"] = [carrier for carrier in tst["carrier_id"] if carrier == TST]
-
-        calm_air = copy.deepcopy(self.gobox_request)
-        calm_air["carrier_id"] = [
-            carrier for carrier in calm_air["carrier_id"] if carrier == CALM_AIR
-        ]
-
-        puro = copy.deepcopy(self.gobox_request)
-        puro["carrier_id"] = [
-            carrier for carrier in puro["carrier_id"] if carrier == PUROLATOR
-        ]
-
-        ml_carrier = copy.deepcopy(self.gobox_request)
-        ml_carrier["carrier_id"] = [
-            carrier for carrier in ml_carrier["carrier_id"] if carrier == UBBE_ML
-        ]
-
-        action = copy.deepcopy(self.gobox_request)
-        action["carrier_id"] = [
-            carrier for carrier in action["carrier_id"] if carrier == ACTION_EXPRESS
-        ]
-
-        cargojet = copy.deepcopy(self.gobox_request)
-        cargojet["carrier_id"] = [
-            carrier for carrier in cargojet["carrier_id"] if carrier == CARGO_JET
-        ]
-
-        yrc = copy.deepcopy(self.gobox_request)
-        yrc["carrier_id"] = [carrier for carrier in yrc["carrier_id"] if carrier == YRC]
-
-        abf = copy.deepcopy(self.gobox_request)
-        abf["carrier_id"] = [
-            carrier for carrier in abf["carrier_id"] if carrier == ABF_FREIGHT
-        ]
-
-        man = copy.deepcopy(self.gobox_request)
-        man["carrier_id"] = [
-            carrier for carrier in man["carrier_id"] if carrier == MANITOULIN
-        ]
-
-        return (
-            two_ship,
-            skyline,
-            rate_sheet,
-            sealift,
-            canadapost,
-            day_ross,
-            sameday,
-            bbe,
-            tst,
-            calm_air,
-            puro,
-            fedex,
-            ml_carrier,
-            action,
-            cargojet,
-            yrc,
-            abf,
-            man,
+        views = self._split()
+        apis = [api(views[name]) for name, _, api in self._carrier_groups if name in views]
+
+        greenlets = [gevent.Greenlet.spawn(api.cached_rate) for api in apis]
+
+        if self._on_rates:
+            for greenlet in greenlets:
+                greenlet.link_value(self._send_rates)
+
+        deadline = self.gobox_request.get("objects", {}).get("rate_deadline")
+
+        if not deadline:
+            gevent.joinall(greenlets)
+            return [greenlet.get() for greenlet in greenlets]
+
+        finished = deadline.join(
+            greenlets=greenlets,
+            names=[api._carrier_api_name for api in apis],
+            budgets=[api._rate_timeout for api in apis]
         )
 
+        return [greenlet.get() for greenlet in finished]
+
+    def _split(self) -> dict:
+        """
+            Split the request into a request view per carrier group. Only carrier groups with a requested carrier get
+            a view, the views share the base request and only override the carrier ids.
+            :return: dict of carrier group name to request view
+        """
+        carrier_ids = self.gobox_request["carrier_id"]
+        views = {}
+
+        for name, carriers, _ in self._carrier_groups:
+            group_ids = [carrier for carrier in carrier_ids if carrier in carriers]
+
+            if group_ids:
+                views[name] = RequestView(self.gobox_request, carrier_id=group_ids)
+
+        return views
+
     def rate(self) -> list:
         try:
             rates = self._rate_call()
@@ -0,0 +1,93 @@
+"""
+    Title: Request View
+    Description: This file will contain a lightweight copy on write view of a rate request. Views are used to split a
+                 request per carrier group or per multi modal leg without deep copying the shared request objects.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import copy
+from decimal import Decimal
+
+
+class RequestView(dict):
+    """
+        Copy on write view of a ubbe rate request.
+
+        Only the top level of the base request is copied, every other value is shared by reference with the base
+        request. The address sections are copied one level deep so carrier id and leg address overrides never leak
+        back into the base request. The "objects" section (SubAccount, User, CarrierAccounts) is never copied, even
+        when the view itself is deep copied by a carrier api.
+    """
+
+    _address_keys = ("origin", "destination")
+    _shared_keys = ("objects",)
+    _key_excluded = ("objects", "carrier_id")
+
+    def __init__(self, base: dict, **overrides) -> None:
+        super().__init__(base)
+
+        for key in self._address_keys:
+            address = self.get(key)
+
+            if isinstance(address, dict):
+                self[key] = dict(address)
+
+        self.update(overrides)
+
+    def __deepcopy__(self, memo: dict) -> "RequestView":
+        """
+            Deep copy the request data while keeping the shared objects shared.
+            :param memo: deepcopy memo
+            :return: RequestView
+        """
+
+        for key in self._shared_keys:
+            if key in self:
+                memo[id(self[key])] = self[key]
+
+        return RequestView(base={key: copy.deepcopy(value, memo) for key, value in self.items()})
+
+    @classmethod
+    def normalize(cls, value):
+        """
+            Convert a request value into a hashable, order independent value.
+            :param value: request value
+            :return: hashable value
+        """
+
+        if isinstance(value, dict):
+            return tuple(sorted((key, cls.normalize(item)) for key, item in value.items()))
+
+        if isinstance(value, (list, tuple)):
+            return tuple(cls.normalize(item) for item in value)
+
+        # Decimal("10") and Decimal("10.00") are the same request value, drop the exponent so they share a key.
+        if isinstance(value, Decimal):
+            return value.normalize() if value else Decimal(0)
+
+        try:
+            hash(value)
+        except TypeError:
+            return repr(value)
+
+        return value
+
+    @classmethod
+    def get_key(cls, request: dict) -> tuple:
+        """
+            Get the canonical key of a rate request: the sorted carrier set and every carrier relevant request field,
+            the request objects are left out.
+            :param request: rate request
+            :return: request key
+        """
+        carrier_ids = request.get("carrier_id", [])
+
+        if not isinstance(carrier_ids, (list, tuple)):
+            carrier_ids = [carrier_ids]
+
+        return (
+            tuple(sorted(set(carrier_ids))),
+            tuple(sorted((key, cls.normalize(value)) for key, value in request.items() if key not in cls._key_excluded))
+        )
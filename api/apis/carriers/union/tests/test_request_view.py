@@ -0,0 +1,67 @@
+import copy
+from decimal import Decimal
+
+from django.test import TestCase
+
+from api.apis.carriers.union.request_view import RequestView
+from api.models import SubAccount
+
+
+class RequestViewTests(TestCase):
+    fixtures = [
+        "api",
+        "carriers",
+        "countries",
+        "provinces",
+        "addresses",
+        "contact",
+        "user",
+        "group",
+        "markup",
+        "account",
+        "subaccount",
+    ]
+
+    def setUp(self):
+        self._sub_account = SubAccount.objects.get(id=1)
+        self.base = {
+            "carrier_id": [708, 650],
+            "origin": {"city": "Edmonton", "province": "AB", "country": "CA"},
+            "destination": {"city": "Inuvik", "province": "NT", "country": "CA"},
+            "packages": [{"weight": Decimal("10.00"), "quantity": 1}],
+            "objects": {"sub_account": self._sub_account},
+        }
+
+    def test_view_overrides_carrier_id(self):
+        view = RequestView(self.base, carrier_id=[708])
+        self.assertEqual(view["carrier_id"], [708])
+        self.assertEqual(self.base["carrier_id"], [708, 650])
+
+    def test_view_shares_base_values(self):
+        view = RequestView(self.base)
+        self.assertIs(view["packages"], self.base["packages"])
+        self.assertIs(view["objects"], self.base["objects"])
+
+    def test_view_address_update_does_not_leak(self):
+        view = RequestView(self.base)
+        view["destination"]["city"] = "Yellowknife"
+        self.assertEqual(view["destination"]["city"], "Yellowknife")
+        self.assertEqual(self.base["destination"]["city"], "Inuvik")
+
+    def test_view_of_view(self):
+        view = RequestView(RequestView(self.base), carrier_id=[650])
+        view["origin"]["city"] = "Calgary"
+        self.assertEqual(view["carrier_id"], [650])
+        self.assertEqual(self.base["origin"]["city"], "Edmonton")
+
+    def test_deepcopy_keeps_objects_shared(self):
+        view = RequestView(self.base)
+        copied = copy.deepcopy(view)
+        self.assertIsInstance(copied, RequestView)
+        self.assertEqual(copied, view)
+        self.assertIs(copied["objects"], self.base["objects"])
+        self.assertIsNot(copied["packages"], self.base["packages"])
+
+    def test_view_equals_dict(self):
+        view = RequestView(self.base)
+        self.assertEqual(view, self.base)
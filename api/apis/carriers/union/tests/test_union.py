@@ -1,9 +1,11 @@
 from decimal import Decimal
 from unittest.mock import patch
 
+import gevent
 from django.test import TestCase
 
 from api.apis.carriers.union.api_union_v2 import Union
+from api.apis.rate_v3.rate_deadline import RateDeadline
 from api.models import SubAccount
 
 
@@ -80,29 +82,10 @@ class APIUnionTests(TestCase):
                 "total_volume_imperial": Decimal(12),
             }
         )
-        (
-            two_ship,
-            skyline,
-            rate_sheet,
-            sealift,
-            canadapost,
-            day_ross,
-            sameday,
-            bbe,
-            tst,
-            calm,
-            puro,
-            fedex,
-            ubbeml,
-            action,
-            cargo,
-            yrc,
-            abf,
-            man,
-        ) = union._split()
+        views = union._split()
         # self.assertEqual(two_ship, {"carrier_id": [2], "origin": {"country": "CA"}, "destination": {"country": "CA"}, "sub_account": self._subaccount,"total_weight_imperial": Decimal(12), "total_volume_imperial": Decimal(12)})
         self.assertEqual(
-            skyline,
+            views["skyline"],
             {
                 "carrier_id": [708],
                 "origin": {"country": "CA"},
@@ -113,7 +96,7 @@ class APIUnionTests(TestCase):
             },
         )
         self.assertEqual(
-            rate_sheet,
+            views["rate_sheet"],
             {
                 "carrier_id": [650],
                 "origin": {"country": "CA"},
@@ -124,7 +107,7 @@ class APIUnionTests(TestCase):
             },
         )
         self.assertEqual(
-            canadapost,
+            views["canadapost"],
             {
                 "carrier_id": [20],
                 "origin": {"country": "CA"},
@@ -136,7 +119,7 @@ class APIUnionTests(TestCase):
         )
         # self.assertEqual(day_ross, {"carrier_id": [123], "origin": {"country": "CA"}, "destination": {"country": "CA"}, "sub_account": self._subaccount,"total_weight_imperial": Decimal(12), "total_volume_imperial": Decimal(12)})
         self.assertEqual(
-            sameday,
+            views["sameday"],
             {
                 "carrier_id": [123],
                 "origin": {"country": "CA"},
@@ -146,20 +129,10 @@ class APIUnionTests(TestCase):
                 "total_volume_imperial": Decimal(12),
             },
         )
-        self.assertEqual(
-            bbe,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
+        self.assertNotIn("bbe", views)
         # self.assertEqual(manitoulin, {"carrier_id": [535], "origin": {"country": "CA"}, "destination": {"country": "CA"}, "sub_account": self._subaccount})
         self.assertEqual(
-            ubbeml,
+            views["ml_carrier"],
             {
                 "carrier_id": [904],
                 "origin": {"country": "CA"},
@@ -181,39 +154,10 @@ class APIUnionTests(TestCase):
                 "total_volume_imperial": Decimal(12),
             }
         )
-        (
-            two_ship,
-            skyline,
-            rate_sheet,
-            sealift,
-            canadapost,
-            day_ross,
-            sameday,
-            bbe,
-            tst,
-            calm,
-            puro,
-            fedex,
-            ubbeml,
-            action,
-            cargo,
-            yrc,
-            abf,
-            man,
-        ) = union._split()
-        self.assertEqual(
-            two_ship,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
+        views = union._split()
+        self.assertNotIn("two_ship", views)
         self.assertEqual(
-            skyline,
+            views["skyline"],
             {
                 "carrier_id": [708],
                 "origin": {"country": "CA"},
@@ -223,63 +167,13 @@ class APIUnionTests(TestCase):
                 "total_volume_imperial": Decimal(12),
             },
         )
-        self.assertEqual(
-            rate_sheet,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            canadapost,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
+        self.assertNotIn("rate_sheet", views)
+        self.assertNotIn("canadapost", views)
         # self.assertEqual(day_ross, {"carrier_id": [], "origin": {"country": "CA"}, "destination": {"country": "CA"}, "sub_account": self._subaccount,"total_weight_imperial": Decimal(12), "total_volume_imperial": Decimal(12)})
-        self.assertEqual(
-            sameday,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            bbe,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
+        self.assertNotIn("sameday", views)
+        self.assertNotIn("bbe", views)
         # self.assertEqual(manitoulin, {"carrier_id": [], "origin": {"country": "CA"}, "destination": {"country": "CA"}, "sub_account": self._subaccount})
-        self.assertEqual(
-            ubbeml,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal("12"),
-                "total_volume_imperial": Decimal("12"),
-            },
-        )
+        self.assertNotIn("ml_carrier", views)
 
     def test_union_split_only_day_and_ross(self):
         union = Union(
@@ -292,72 +186,13 @@ class APIUnionTests(TestCase):
                 "total_volume_imperial": Decimal(12),
             }
         )
-        (
-            two_ship,
-            skyline,
-            rate_sheet,
-            sealift,
-            canadapost,
-            day_ross,
-            sameday,
-            bbe,
-            tst,
-            calm,
-            puro,
-            fedex,
-            ubbeml,
-            action,
-            cargo,
-            yrc,
-            abf,
-            man,
-        ) = union._split()
-        self.assertEqual(
-            two_ship,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            skyline,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            rate_sheet,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            canadapost,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
+        views = union._split()
+        self.assertNotIn("two_ship", views)
+        self.assertNotIn("skyline", views)
+        self.assertNotIn("rate_sheet", views)
+        self.assertNotIn("canadapost", views)
         self.assertEqual(
-            day_ross,
+            views["day_ross"],
             {
                 "carrier_id": [122],
                 "origin": {"country": "CA"},
@@ -367,40 +202,10 @@ class APIUnionTests(TestCase):
                 "total_volume_imperial": Decimal(12),
             },
         )
-        self.assertEqual(
-            sameday,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            bbe,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
+        self.assertNotIn("sameday", views)
+        self.assertNotIn("bbe", views)
         # self.assertEqual(manitoulin, {"carrier_id": [], "origin": {"country": "CA"}, "destination": {"country": "CA"}, "sub_account": self._subaccount})
-        self.assertEqual(
-            ubbeml,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal("12"),
-                "total_volume_imperial": Decimal("12"),
-            },
-        )
+        self.assertNotIn("ml_carrier", views)
 
     def test_union_split_only_canadapost(self):
         union = Union(
@@ -413,61 +218,12 @@ class APIUnionTests(TestCase):
                 "total_volume_imperial": Decimal(12),
             }
         )
-        (
-            two_ship,
-            skyline,
-            rate_sheet,
-            sealift,
-            canadapost,
-            day_ross,
-            sameday,
-            bbe,
-            tst,
-            calm,
-            puro,
-            fedex,
-            ubbeml,
-            action,
-            cargo,
-            yrc,
-            abf,
-            man,
-        ) = union._split()
+        views = union._split()
+        self.assertNotIn("two_ship", views)
+        self.assertNotIn("skyline", views)
+        self.assertNotIn("rate_sheet", views)
         self.assertEqual(
-            two_ship,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            skyline,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            rate_sheet,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            canadapost,
+            views["canadapost"],
             {
                 "carrier_id": [20],
                 "origin": {"country": "CA"},
@@ -478,28 +234,8 @@ class APIUnionTests(TestCase):
             },
         )
         # self.assertEqual(day_ross, {"carrier_id": [], "origin": {"country": "CA"}, "destination": {"country": "CA"}, "sub_account": self._subaccount,"total_weight_imperial": Decimal(12), "total_volume_imperial": Decimal(12)})
-        self.assertEqual(
-            sameday,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            bbe,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
+        self.assertNotIn("sameday", views)
+        self.assertNotIn("bbe", views)
         # self.assertEqual(manitoulin, {"carrier_id": [], "origin": {"country": "CA"}, "destination": {"country": "CA"}, "sub_account": self._subaccount})
 
     def test_union_split_only_manitoulin(self):
@@ -513,50 +249,11 @@ class APIUnionTests(TestCase):
                 "total_volume_imperial": Decimal(12),
             }
         )
-        (
-            two_ship,
-            skyline,
-            rate_sheet,
-            sealift,
-            canadapost,
-            day_ross,
-            sameday,
-            bbe,
-            tst,
-            calm,
-            puro,
-            fedex,
-            ubbeml,
-            action,
-            cargo,
-            yrc,
-            abf,
-            man,
-        ) = union._split()
+        views = union._split()
+        self.assertNotIn("two_ship", views)
+        self.assertNotIn("skyline", views)
         self.assertEqual(
-            two_ship,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            skyline,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            rate_sheet,
+            views["rate_sheet"],
             {
                 "carrier_id": [670],
                 "origin": {"country": "CA"},
@@ -566,52 +263,12 @@ class APIUnionTests(TestCase):
                 "total_volume_imperial": Decimal(12),
             },
         )
-        self.assertEqual(
-            canadapost,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
+        self.assertNotIn("canadapost", views)
         # self.assertEqual(day_ross, {"carrier_id": [], "origin": {"country": "CA"}, "destination": {"country": "CA"}, "sub_account": self._subaccount,"total_weight_imperial": Decimal(12), "total_volume_imperial": Decimal(12)})
-        self.assertEqual(
-            sameday,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            bbe,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
+        self.assertNotIn("sameday", views)
+        self.assertNotIn("bbe", views)
         # self.assertEqual(manitoulin, {"carrier_id": [535], "origin": {"country": "CA"}, "destination": {"country": "CA"}, "sub_account": self._subaccount})
-        self.assertEqual(
-            ubbeml,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal("12"),
-                "total_volume_imperial": Decimal("12"),
-            },
-        )
+        self.assertNotIn("ml_carrier", views)
 
     def test_union_split_only_2ship(self):
         union = Union(
@@ -624,40 +281,11 @@ class APIUnionTests(TestCase):
                 "total_volume_imperial": Decimal(12),
             }
         )
-        (
-            two_ship,
-            skyline,
-            rate_sheet,
-            sealift,
-            canadapost,
-            day_ross,
-            sameday,
-            bbe,
-            tst,
-            calm,
-            puro,
-            fedex,
-            ubbeml,
-            action,
-            cargo,
-            yrc,
-            abf,
-            man,
-        ) = union._split()
+        views = union._split()
         # self.assertEqual(two_ship, {"carrier_id": [2], "origin": {"country": "CA"}, "destination": {"country": "CA"}, "sub_account": self._subaccount,"total_weight_imperial": Decimal(12), "total_volume_imperial": Decimal(12)})
+        self.assertNotIn("skyline", views)
         self.assertEqual(
-            skyline,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            rate_sheet,
+            views["rate_sheet"],
             {
                 "carrier_id": [650],
                 "origin": {"country": "CA"},
@@ -667,52 +295,12 @@ class APIUnionTests(TestCase):
                 "total_volume_imperial": Decimal(12),
             },
         )
-        self.assertEqual(
-            canadapost,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
+        self.assertNotIn("canadapost", views)
         # self.assertEqual(day_ross, {"carrier_id": [], "origin": {"country": "CA"}, "destination": {"country": "CA"}, "sub_account": self._subaccount,"total_weight_imperial": Decimal(12), "total_volume_imperial": Decimal(12)})
-        self.assertEqual(
-            sameday,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            bbe,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
+        self.assertNotIn("sameday", views)
+        self.assertNotIn("bbe", views)
         # self.assertEqual(manitoulin, {"carrier_id": [], "origin": {"country": "CA"}, "destination": {"country": "CA"}, "sub_account": self._subaccount})
-        self.assertEqual(
-            ubbeml,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal("12"),
-                "total_volume_imperial": Decimal("12"),
-            },
-        )
+        self.assertNotIn("ml_carrier", views)
 
     def test_union_split_none(self):
         union = Union(
@@ -725,105 +313,16 @@ class APIUnionTests(TestCase):
                 "total_volume_imperial": Decimal(12),
             }
         )
-        (
-            two_ship,
-            skyline,
-            rate_sheet,
-            sealift,
-            canadapost,
-            day_ross,
-            sameday,
-            bbe,
-            tst,
-            calm,
-            puro,
-            fedex,
-            ubbeml,
-            action,
-            cargo,
-            yrc,
-            abf,
-            man,
-        ) = union._split()
-        self.assertEqual(
-            two_ship,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            skyline,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            rate_sheet,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            canadapost,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
+        views = union._split()
+        self.assertNotIn("two_ship", views)
+        self.assertNotIn("skyline", views)
+        self.assertNotIn("rate_sheet", views)
+        self.assertNotIn("canadapost", views)
         # self.assertEqual(day_ross, {"carrier_id": [], "origin": {"country": "CA"}, "destination": {"country": "CA"}, "sub_account": self._subaccount,"total_weight_imperial": Decimal(12), "total_volume_imperial": Decimal(12)})
-        self.assertEqual(
-            sameday,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
-        self.assertEqual(
-            bbe,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal(12),
-                "total_volume_imperial": Decimal(12),
-            },
-        )
+        self.assertNotIn("sameday", views)
+        self.assertNotIn("bbe", views)
         # self.assertEqual(manitoulin, {"carrier_id": [], "origin": {"country": "CA"}, "destination": {"country": "CA"}, "sub_account": self._subaccount})
-        self.assertEqual(
-            ubbeml,
-            {
-                "carrier_id": [],
-                "origin": {"country": "CA"},
-                "destination": {"country": "CA"},
-                "sub_account": self._subaccount,
-                "total_weight_imperial": Decimal("12"),
-                "total_volume_imperial": Decimal("12"),
-            },
-        )
+        self.assertNotIn("ml_carrier", views)
 
     @staticmethod
     def mock_ship_call():
@@ -991,3 +490,29 @@ class APIUnionTests(TestCase):
         )
         rate = union.rate()
         self.assertEqual(rate, [])
+
+    @patch("api.apis.carriers.skyline.skyline_api_v3.SkylineApi.rate", side_effect=lambda: gevent.sleep(5) or [])
+    @patch("api.apis.carriers.rate_sheets.rate_sheet_api.RateSheetApi.rate", return_value=[{"carrier_id": 670}])
+    def test_union_deadline_returns_partial(self, rate_sheet, ship_skyline):
+        deadline = RateDeadline(seconds=0.2)
+        union = Union(
+            {
+                "carrier_id": [708, 670],
+                "packages": [],
+                "objects": {"sub_account": self._subaccount, "rate_deadline": deadline},
+            }
+        )
+        self.assertEqual(union.rate(), [{"carrier_id": 670}])
+        self.assertEqual(deadline.late, {"Skyline"})
+
+    @patch("api.apis.carriers.skyline.skyline_api_v3.SkylineApi.rate", return_value=[{"carrier_id": 708}])
+    @patch("api.apis.carriers.rate_sheets.rate_sheet_api.RateSheetApi.rate", return_value=[{"carrier_id": 670}])
+    def test_union_on_rates(self, rate_sheet, ship_skyline):
+        streamed = []
+        union = Union(
+            {"carrier_id": [708, 670], "packages": [], "objects": {"sub_account": self._subaccount}},
+            on_rates=streamed.append
+        )
+        union.rate()
+        gevent.sleep(0)
+        self.assertCountEqual(streamed, [[{"carrier_id": 708}], [{"carrier_id": 670}]])
@@ -3,8 +3,8 @@
     Description: This file will contain all functions to get yrc common functionality between the endpoints.
     Created: November 26, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 import copy
 import re
@@ -14,17 +14,28 @@ from decimal import Decimal
 import requests
 from django.db import connection
 from lxml import etree
-from requests import Session
-from zeep import Transport, CachingClient
-from zeep.cache import InMemoryCache
+from zeep import Transport
 from zeep.plugins import HistoryPlugin
 
+from api.apis.carriers.soap_client_pool import SoapClientPool
 from api.background_tasks.logger import CeleryLogger
 from api.exceptions.project import RequestError
 from api.globals.carriers import YRC
 from api.globals.project import DEFAULT_TIMEOUT_SECONDS
 from brain.settings import YRC_REST_BASE_URL, DEBUG
 
+if DEBUG:
+    YRC_SOAP_WSDL = "http://mytest.yrc.com/myyrc-api/national/WebServices/YRCSecureBOL.wsdl"
+else:
+    YRC_SOAP_WSDL = "http://my.yrc.com/myyrc-api/national/WebServices/YRCSecureBOL.wsdl"
+
+YRC_NS_PREFIXES = {
+    "xsi": "http://www.w3.org/2001/XMLSchema-instance",
+    "xsd": "http://www.w3.org/2001/XMLSchema",
+    "yrc": "http://my.yrc.com/national/WebServices/2009/01/31/YRCSecureBOL.wsdl",
+    "soap": "http://schemas.xmlsoap.org/soap/encoding/",
+}
+
 
 class YRCBaseApi:
     """
@@ -166,15 +177,6 @@ class YRCBaseApi:
         else:
             self._dg_service = None
 
-    @staticmethod
-    def _default_transport():
-        """
-        Create default transport and authenticate with user and password.
-        :return:
-        """
-        session = Session()
-        return TransportSoapenv(cache=InMemoryCache(), session=session)
-
     def _build_json_auth(self) -> dict:
         return {
             "username": self._carrier_account.username.decrypt(),
@@ -197,25 +199,14 @@ class YRCBaseApi:
         :return:
         """
 
-        if DEBUG:
-            wsdl = (
-                "http://mytest.yrc.com/myyrc-api/national/WebServices/YRCSecureBOL.wsdl"
-            )
-        else:
-            wsdl = "http://my.yrc.com/myyrc-api/national/WebServices/YRCSecureBOL.wsdl"
-
         self._history = HistoryPlugin()
-        self._client = CachingClient(
-            wsdl, transport=self._default_transport(), plugins=[self._history]
-        )
-
-        self._client.set_ns_prefix("xsi", "http://www.w3.org/2001/XMLSchema-instance")
-        self._client.set_ns_prefix("xsd", "http://www.w3.org/2001/XMLSchema")
-        self._client.set_ns_prefix(
-            "yrc",
-            "http://my.yrc.com/national/WebServices/2009/01/31/YRCSecureBOL.wsdl",
+        self._client = SoapClientPool.get_client(
+            carrier=YRC,
+            wsdl=YRC_SOAP_WSDL,
+            plugins=[self._history],
+            transport_class=TransportSoapenv,
+            ns_prefixes=YRC_NS_PREFIXES
         )
-        self._client.set_ns_prefix("soap", "http://schemas.xmlsoap.org/soap/encoding/")
 
     def _post(self, url: str, request: dict):
         """
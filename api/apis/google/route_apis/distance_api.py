@@ -14,8 +14,9 @@ from django.db import connection
 from googlemaps import distance_matrix
 
 from api.apis.google.google_api import GoogleApi
+from api.cache_lookups.city_alias_cache import CityAliasCache
 from api.exceptions.project import ViewException
-from api.models import API, LocationCityAlias, LocationDistance, Province
+from api.models import API, LocationDistance, Province
 
 
 class GoogleDistanceApi(GoogleApi):
@@ -38,16 +39,11 @@ class GoogleDistanceApi(GoogleApi):
         """
             Check Location City Alias Lookup for alias, so that we can reduce api calls
         """
-        self._o_city = LocationCityAlias.check_alias(
-            alias=self._o_city.lower(),
-            province_code=self._o_province,
-            country_code=self._o_country
-        )
-
-        self._d_city = LocationCityAlias.check_alias(
-            alias=self._d_city.lower(),
-            province_code=self._d_province,
-            country_code=self._d_country
+        self._o_city, self._d_city = CityAliasCache().resolve_many(
+            cities=[
+                (self._o_city.lower(), self._o_province, self._o_country, None),
+                (self._d_city.lower(), self._d_province, self._d_country, None),
+            ]
         )
 
     def _get_location_distance(self) -> Union[LocationDistance, None]:
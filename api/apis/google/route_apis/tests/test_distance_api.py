@@ -3,6 +3,7 @@ from decimal import Decimal
 from django.test import TestCase
 
 from api.apis.google.route_apis.distance_api import GoogleDistanceApi
+from api.cache_lookups.city_alias_cache import CityAliasCache
 from api.exceptions.project import ViewException
 from api.models import LocationDistance
 
@@ -18,6 +19,8 @@ class GoogleDistanceApiTests(TestCase):
     ]
 
     def setUp(self):
+        # Fixture aliases are loaded without save, rebuild the alias map for them.
+        CityAliasCache.bump_version()
         self.distance_api = GoogleDistanceApi()
 
         self.distance_api._o_city = "calgary"
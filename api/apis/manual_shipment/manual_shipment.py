@@ -15,6 +15,7 @@ from django.db.utils import IntegrityError
 
 from api.apis.business_central.business_central import BusinessCentral
 from api.background_tasks.business_central import CeleryBusinessCentral
+from api.background_tasks.metric_rollup import CeleryMetricRollup
 from api.exceptions.project import ViewException
 from api.globals.project import UPDATE_FILE, NEW_FILE
 from api.models import Shipment, SubAccount, Address, Contact, Leg, Carrier, TrackingStatus, Package, API
@@ -239,5 +240,6 @@ class ManualShipment:
         shipment.save()
 
         self._create_business_central(shipment=shipment)
+        transaction.on_commit(lambda: CeleryMetricRollup.refresh_shipment.delay(shipment_id=shipment.shipment_id))
 
         return shipment
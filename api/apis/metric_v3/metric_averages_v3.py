@@ -6,14 +6,14 @@
         - Account
     Created: Sept 24, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 import numpy
 
 from django.db import connection
-from django.db.models import QuerySet
-from scipy import stats
+from django.db.models import F, FloatField, QuerySet
+from django.db.models.functions import Cast
 
 from api.apis.metric_v3.metric_base_v3 import MetricBase
 from api.exceptions.project import ViewException
@@ -25,35 +25,39 @@ class GetMetricAverages(MetricBase):
         Metric Averages
     """
 
+    # Decimal places kept from the database costs, so equal costs compare equal for the mode.
+    _float_precision = 6
+
     @staticmethod
-    def _get_mode_value(mode_count) -> str:
+    def _get_stats(values: numpy.ndarray) -> tuple:
         """
-            Get Mode value and ensure its in correct format for json.
-            :param mode_count:
-            :return: str
+            Get the mode count, mean and median of sorted values in one pass and ensure they are in correct format for
+            json.
+            :param values: sorted float array
+            :return: tuple of str (mode count, mean, median), "-" when there are no values
         """
+        size = values.size
 
-        if mode_count:
-            str_mode_count = str(mode_count[0])
-        else:
-            str_mode_count = "-"
+        if not size:
+            return "-", "-", "-"
+
+        # Runs of equal values in sorted data, the longest run is the mode count.
+        run_starts = numpy.flatnonzero(numpy.diff(values, prepend=numpy.nan))
+        mode_count = int(numpy.diff(run_starts, append=size).max())
 
-        return str_mode_count
+        middle = size // 2
+        median = values[middle] if size % 2 else (values[middle - 1] + values[middle]) / 2
 
-    def _get_average_data(self, data: list, is_shipment: bool) -> dict:
+        return str(mode_count), str(round(numpy.mean(values), 2)), str(round(median, 2))
+
+    def _get_average_data(self, data: numpy.ndarray, is_shipment: bool) -> dict:
         """
             Get Average date for cost list.
-            :param data: list of costs
+            :param data: sorted array of costs
             :return: dict of averages
         """
 
-        mode = stats.mode(data)
-        mode_count = mode.count
-
-        mode_count = self._get_mode_value(mode_count=mode_count)
-
-        mean = str(round(numpy.mean(data), 2))
-        median_cost = str(round(numpy.median(data), 2))
+        mode_count, mean, median_cost = self._get_stats(values=data)
 
         if is_shipment:
             note = "The averages are based on the sum of all shipment legs."
@@ -62,8 +66,8 @@ class GetMetricAverages(MetricBase):
 
         return {
             "mode_count": mode_count,
-            "mean_cost": mean if mean != "nan" else "-",
-            "median_cost": median_cost if median_cost != "nan" else "-",
+            "mean_cost": mean,
+            "median_cost": median_cost,
             "note": note
         }
 
@@ -75,49 +79,49 @@ class GetMetricAverages(MetricBase):
         """
 
         data = legs.exclude(transit_days__in=[-1]).values_list("transit_days", flat=True)
-
-        mode = stats.mode(data)
-        mode_count = mode.count
-
-        mode_count = self._get_mode_value(mode_count=mode_count)
-
-        mean = str(round(numpy.mean(data), 2))
-        median_cost = str(round(numpy.median(data), 2))
+        mode_count, mean, median_cost = self._get_stats(values=numpy.sort(numpy.fromiter(data, dtype=float)))
 
         return {
             "transit_averages": {
                 "mode_count": mode_count,
-                "mean_transit": mean if mean != "nan" else "-",
-                "median_transit": median_cost if median_cost != "nan" else "-",
+                "mean_transit": mean,
+                "median_transit": median_cost,
                 "note": "Average Transit Time for leg to arrived at destination. (All 0's excluded)"
             }
         }
 
-    def _get_averages(self, data: QuerySet, is_shipment: bool) -> dict:
+    def _get_cost_arrays(self, data: QuerySet) -> tuple:
         """
-            Get metrics about shipment or leg cost. IE: Mode, Mean, Median, and Note.
+            Get the costs with markup of shipments or legs, computed in the database, as a sorted array with dangerous
+            good and delivered masks.
             :param data: QuerySet of Shipments or Legs
-            :return: dictionary of Average Metrics
+            :return: tuple of (sorted costs, dangerous good mask, delivered mask)
         """
 
-        cost_list = []
-        dg_list = []
-        delivered_list = []
+        rows = data.annotate(
+            average_cost=Cast(F("cost") - F("tax"), FloatField()) * (
+                Cast(F("markup"), FloatField()) / self._hundred + self._one
+            )
+        ).values_list("average_cost", "is_dangerous_good", "is_delivered")
 
-        for item in data:
-            cost_list.append(float((item.cost - item.tax) * ((item.markup / self._hundred) + self._one)))
+        values = numpy.array(list(rows), dtype=float).reshape(-1, 3)
+        costs = numpy.round(values[:, 0], self._float_precision)
+        order = numpy.argsort(costs, kind="stable")
 
-            if item.is_dangerous_good:
-                dg_list.append(float((item.cost - item.tax) * ((item.markup / self._hundred) + self._one)))
+        return costs[order], values[order, 1] > 0, values[order, 2] > 0
 
-            if item.is_delivered:
-                delivered_list.append(
-                    float((item.cost - item.tax) * ((item.markup / self._hundred) + self._one))
-                )
+    def _get_averages(self, data: QuerySet, is_shipment: bool) -> dict:
+        """
+            Get metrics about shipment or leg cost. IE: Mode, Mean, Median, and Note.
+            :param data: QuerySet of Shipments or Legs
+            :return: dictionary of Average Metrics
+        """
+
+        costs, is_dangerous_good, is_delivered = self._get_cost_arrays(data=data)
 
-        shipment_averages = self._get_average_data(data=cost_list, is_shipment=is_shipment)
-        dg_averages = self._get_average_data(data=dg_list, is_shipment=is_shipment)
-        delivered_averages = self._get_average_data(data=delivered_list, is_shipment=is_shipment)
+        shipment_averages = self._get_average_data(data=costs, is_shipment=is_shipment)
+        dg_averages = self._get_average_data(data=costs[is_dangerous_good], is_shipment=is_shipment)
+        delivered_averages = self._get_average_data(data=costs[is_delivered], is_shipment=is_shipment)
 
         return {
             "shipment_averages": shipment_averages,
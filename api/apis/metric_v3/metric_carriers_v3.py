@@ -6,16 +6,18 @@
         - Account
     Created: Sept 28, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
+import math
 
 from django.db import connection
-from django.db.models import F, Count, QuerySet
+from django.db.models import F, QuerySet
 
 from api.apis.metric_v3.metric_base_v3 import MetricBase
+from api.apis.metric_v3.metric_rollup import MetricRollup
 from api.exceptions.project import ViewException
-from api.models import API, SubAccount, Leg
+from api.models import API, SubAccount
 
 
 class GetMetricCarriers(MetricBase):
@@ -24,149 +26,35 @@ class GetMetricCarriers(MetricBase):
     """
 
     @staticmethod
-    def _get_data(legs: QuerySet):
+    def _get_data(rollups: QuerySet):
         """
-
-            :return:
+            Get the top carriers and services, and the leg revenue quantiles.
+            :param rollups: MetricLegRollup QuerySet
+            :return: dict of top carriers, top services and revenue quantiles
         """
 
-        carriers = legs.values(
-            carrier_name=F('carrier__name'), carrier_code=F('carrier__code')
-        ).annotate(count=Count(F('carrier_code'))).order_by("-count")[:10]
+        carriers = MetricRollup.top(rollups, carrier_name=F('carrier__name'), carrier_code=F('carrier__code'))
+
+        carrier_services = MetricRollup.top(
+            rollups, "service_name", "service_code", carrier_name=F('carrier__name'), carrier_code=F('carrier__code')
+        )
 
-        carrier_services = legs.values(
-            "service_name", "service_code", carrier_name=F('carrier__name'), carrier_code=F('carrier__code')
-        ).annotate(count=Count(F('service_code'))).order_by("-count")[:10]
+        quantiles = MetricRollup().get_revenue_quantiles(rollups=rollups)
 
         ret = {
-            "top_carriers": list(carriers),
-            "top_services": list(carrier_services)
+            "top_carriers": carriers,
+            "top_services": carrier_services,
+            "revenue_quantiles": {
+                **{
+                    f"p{round(q * 100)}": "-" if math.isnan(value) else str(round(value, 2))
+                    for q, value in quantiles.items()
+                },
+                "note": "Leg revenue quantiles, within 1% of the exact leg revenue."
+            }
         }
 
         return ret
 
-    def _get_account_data(self, sub_account: SubAccount, start_date: str, end_date: str, query_type: str):
-        """
-
-            :param sub_account:
-            :param start_date:
-            :param end_date:
-            :return:
-        """
-
-        if start_date and end_date:
-            start_date, end_date = self._get_dates(start_date=start_date, end_date=end_date)
-
-            if query_type == "COM":
-
-                if sub_account.is_bbe:
-                    legs = Leg.objects.filter(
-                        shipment__subaccount=sub_account,
-                        shipment__creation_date__range=[start_date, end_date],
-                        is_shipped=True
-                    )
-                else:
-                    legs = Leg.objects.filter(
-                        shipment__subaccount=sub_account,
-                        shipment__creation_date__range=[start_date, end_date],
-                        is_shipped=True
-                    ).exclude(shipment__username__in=self._bbe_users)
-
-                man_legs = Leg.objects.filter(
-                    shipment__bc_customer_code=sub_account.bc_customer_code,
-                    shipment__username__in=self._bbe_users,
-                    shipment__creation_date__range=[start_date, end_date],
-                    is_shipped=True
-                )
-
-                # Combine Query Sets
-                legs = legs | man_legs
-
-            elif query_type == "MAN":
-                legs = Leg.objects.filter(
-                    shipment__bc_customer_code=sub_account.bc_customer_code,
-                    shipment__username__in=self._bbe_users,
-                    shipment__creation_date__range=[start_date, end_date],
-                    is_shipped=True
-                )
-            else:
-                if sub_account.is_bbe:
-                    legs = Leg.objects.filter(
-                        shipment__subaccount=sub_account,
-                        shipment__creation_date__range=[start_date, end_date],
-                        is_shipped=True
-                    )
-                else:
-                    legs = Leg.objects.filter(
-                        shipment__subaccount=sub_account,
-                        shipment__creation_date__range=[start_date, end_date],
-                        is_shipped=True
-                    ).exclude(shipment__username__in=self._bbe_users)
-        else:
-
-            if query_type == "COM":
-
-                if sub_account.is_bbe:
-                    legs = Leg.objects.filter(shipment__subaccount=sub_account, is_shipped=True)
-                else:
-                    legs = Leg.objects.filter(
-                        shipment__subaccount=sub_account, is_shipped=True
-                    ).exclude(shipment__username__in=self._bbe_users)
-
-                man_legs = Leg.objects.filter(
-                    shipment__bc_customer_code=sub_account.bc_customer_code,
-                    shipment__username__in=self._bbe_users,
-                    is_shipped=True
-                )
-
-                # Combine Query Sets
-                legs = legs | man_legs
-
-            elif query_type == "MAN":
-                legs = Leg.objects.filter(
-                    shipment__bc_customer_code=sub_account.bc_customer_code,
-                    shipment__username__in=self._bbe_users,
-                    is_shipped=True
-                )
-            else:
-
-                if sub_account.is_bbe:
-                    legs = Leg.objects.filter(shipment__subaccount=sub_account, is_shipped=True)
-                else:
-                    legs = Leg.objects.filter(
-                        shipment__subaccount=sub_account, is_shipped=True
-                    ).exclude(shipment__username__in=self._bbe_users)
-
-        return self._get_data(legs=legs)
-
-    def _get_bbe_data(self, sub_account: SubAccount, start_date: str, end_date: str, params: dict):
-        """
-
-            :param sub_account:
-            :param start_date:
-            :param end_date:
-            :return:
-        """
-        accounts = params.get("accounts", [])
-
-        if accounts and start_date and end_date:
-            start_date, end_date = self._get_dates(start_date=start_date, end_date=end_date)
-            legs = Leg.objects.filter(
-                shipment__creation_date__range=[start_date, end_date],
-                shipment__subaccount__subaccount_number__in=accounts,
-                is_shipped=True
-            )
-
-            return self._get_data(legs=legs)
-        elif accounts:
-            legs = Leg.objects.filter(shipment__subaccount__subaccount_number__in=accounts, is_shipped=True)
-
-            return self._get_data(legs=legs)
-
-        return self._get_account_data(
-            sub_account=sub_account, start_date=start_date, end_date=end_date, query_type=params["query_type"]
-        )
-
     def get_metrics(self, sub_account: SubAccount, params: dict) -> dict:
         """
             Get Metric Routes. IE: City Count and Province Count.
@@ -181,7 +69,6 @@ class GetMetricCarriers(MetricBase):
 
         start_date = params['start_date']
         end_date = params['end_date']
-        query_type = params['query_type']
 
         if (start_date and not end_date) or (not start_date and end_date):
             connection.close()
@@ -190,12 +77,10 @@ class GetMetricCarriers(MetricBase):
             errors.append({"end_date": "Must be in '%Y-%m-%d'"})
             raise ViewException(code="6804", message="Metric Carriers: Invalid dates.", errors=errors)
 
-        if sub_account.is_bbe:
-            ret = self._get_bbe_data(sub_account=sub_account, start_date=start_date, end_date=end_date, params=params)
-        else:
-            ret = self._get_account_data(
-                sub_account=sub_account, start_date=start_date, end_date=end_date, query_type=query_type
-            )
+        rollups = MetricRollup().get_rollups(
+            sub_account=sub_account, start_date=start_date, end_date=end_date, params=params
+        )
+        ret = self._get_data(rollups=rollups)
 
         ret.update({
             "last_updated": self._get_date(),
@@ -0,0 +1,296 @@
+"""
+    Title: Metric Rollup
+    Description: This file will contain the daily leg rollup maintenance and selection for the metric apis. Rollups
+                 are rebuilt per sub account and day, which keeps a refresh idempotent when a shipment is shipped,
+                 canceled or re-costed. Revenue quantiles use a mergeable log bucket sketch with about 1% relative
+                 error.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import datetime
+import math
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Q, QuerySet, Sum
+from django.utils import timezone
+
+from api.apis.metric_v3.metric_base_v3 import MetricBase
+from api.models import Leg, MetricLegRollup, SubAccount
+
+
+class RevenueSketch:
+    """
+        Log bucket quantile sketch. A value is counted in bucket ceil(log(value) / log(gamma)), so any bucket value
+        is within the relative accuracy of the values in it. Values at or below zero are counted in bucket "0".
+    """
+
+    _relative_accuracy = 0.01
+    _gamma = (1 + _relative_accuracy) / (1 - _relative_accuracy)
+    _log_gamma = math.log(_gamma)
+    _zero = "0"
+
+    def add(self, sketch: dict, value: float) -> None:
+        """
+            Count a value in a sketch.
+            :param sketch: sketch dict of bucket to count
+            :param value: value to add
+        """
+        key = self._zero if value <= 0 else str(math.ceil(math.log(value) / self._log_gamma))
+        sketch[key] = sketch.get(key, 0) + 1
+
+    @staticmethod
+    def merge(sketches: list) -> dict:
+        """
+            Merge sketches.
+            :param sketches: list of sketch dicts
+            :return: sketch dict
+        """
+        merged = defaultdict(int)
+
+        for sketch in sketches:
+            for key, count in sketch.items():
+                merged[key] += count
+
+        return dict(merged)
+
+    def quantile(self, sketch: dict, q: float) -> float:
+        """
+            Get a quantile from a sketch.
+            :param sketch: sketch dict
+            :param q: quantile between 0 and 1, ex: 0.5 for the median
+            :return: quantile value, nan for an empty sketch
+        """
+        total = sum(sketch.values())
+
+        if not total:
+            return float("nan")
+
+        rank = q * (total - 1)
+        seen = 0
+
+        for key in sorted(sketch, key=lambda k: -math.inf if k == self._zero else int(k)):
+            seen += sketch[key]
+
+            if seen > rank:
+                if key == self._zero:
+                    return 0.0
+
+                return 2 * self._gamma ** int(key) / (self._gamma + 1)
+
+        return float("nan")
+
+
+class MetricRollup(MetricBase):
+    """
+        Metric Leg Rollup maintenance and selection.
+    """
+
+    _sketch = RevenueSketch()
+
+    @staticmethod
+    def get_day(value: datetime.datetime) -> datetime.date:
+        """
+            Get the rollup day of a shipment creation date.
+            :param value: shipment creation datetime
+            :return: date
+        """
+        return value.astimezone(timezone.utc).date()
+
+    def _build(self, legs: QuerySet, keys: set) -> list:
+        """
+            Build rollup rows from legs.
+            :param legs: Leg QuerySet
+            :param keys: set of (sub account id, day) to build, other legs in the query are skipped
+            :return: list of unsaved rollups
+        """
+        rows = {}
+        values = legs.values_list(
+            "shipment__subaccount_id",
+            "shipment__creation_date",
+            "shipment__bc_customer_code",
+            "shipment__username",
+            "carrier_id",
+            "service_code",
+            "service_name",
+            "origin__province__code",
+            "origin__city",
+            "destination__province__code",
+            "destination__city",
+            "base_cost",
+            "base_tax",
+            "markup",
+            "is_dangerous_good",
+            "is_delivered",
+            "transit_days",
+        )
+        bbe_users = set(self._bbe_users)
+
+        for sub_account_id, creation_date, bc_code, username, *route, cost, tax, markup, is_dg, is_delivered, \
+                transit in values:
+            day = self.get_day(creation_date)
+
+            if (sub_account_id, day) not in keys:
+                continue
+
+            key = (sub_account_id, day, bc_code, username in bbe_users, *route)
+            rollup = rows.get(key)
+
+            if rollup is None:
+                rollup = MetricLegRollup(
+                    sub_account_id=sub_account_id,
+                    day=day,
+                    bc_customer_code=bc_code,
+                    is_managed=key[3],
+                    carrier_id=route[0],
+                    service_code=route[1],
+                    service_name=route[2],
+                    origin_province=route[3],
+                    origin_city=route[4],
+                    destination_province=route[5],
+                    destination_city=route[6],
+                    revenue_sketch={},
+                )
+                rows[key] = rollup
+
+            expense = cost - tax
+            revenue = expense * (markup / self._hundred + self._one)
+
+            rollup.legs += 1
+            rollup.dg_legs += int(is_dg)
+            rollup.delivered_legs += int(is_delivered)
+            rollup.expense += expense
+            rollup.revenue += revenue
+
+            if transit != -1:
+                rollup.transit_days += transit
+                rollup.transit_legs += 1
+
+            self._sketch.add(sketch=rollup.revenue_sketch, value=float(revenue))
+
+        for rollup in rows.values():
+            rollup.revenue = Decimal(rollup.revenue).quantize(self._sig_fig)
+            rollup.expense = Decimal(rollup.expense).quantize(self._sig_fig)
+
+        return list(rows.values())
+
+    def refresh(self, keys: list) -> int:
+        """
+            Rebuild the rollups of sub account days.
+            :param keys: list of (sub account id, date)
+            :return: number of rollup rows written
+        """
+        keys = set(keys)
+
+        if not keys:
+            return 0
+
+        days = sorted({day for _, day in keys})
+        start = datetime.datetime.combine(days[0], datetime.time.min, tzinfo=timezone.utc)
+        end = datetime.datetime.combine(days[-1] + datetime.timedelta(days=1), datetime.time.min, tzinfo=timezone.utc)
+
+        legs = Leg.objects.filter(
+            shipment__subaccount_id__in={sub_account_id for sub_account_id, _ in keys},
+            shipment__creation_date__gte=start,
+            shipment__creation_date__lt=end,
+            is_shipped=True
+        )
+        rollups = self._build(legs=legs, keys=keys)
+        by_day = defaultdict(list)
+        stale = Q()
+
+        for sub_account_id, day in keys:
+            by_day[day].append(sub_account_id)
+
+        for day, sub_account_ids in by_day.items():
+            stale |= Q(day=day, sub_account_id__in=sub_account_ids)
+
+        with transaction.atomic():
+            MetricLegRollup.objects.filter(stale).delete()
+            MetricLegRollup.objects.bulk_create(rollups, batch_size=500)
+
+        return len(rollups)
+
+    def refresh_days(self, start: datetime.date, end: datetime.date) -> int:
+        """
+            Rebuild the rollups of every sub account for a date range, one day at a time.
+            :param start: first day
+            :param end: last day, inclusive
+            :return: number of rollup rows written
+        """
+        count = 0
+        sub_accounts = list(SubAccount.objects.values_list("pk", flat=True))
+        day = start
+
+        while day <= end:
+            count += self.refresh(keys=[(sub_account_id, day) for sub_account_id in sub_accounts])
+            day += datetime.timedelta(days=1)
+
+        return count
+
+    def refresh_shipment(self, shipment) -> int:
+        """
+            Rebuild the rollups of a shipment's sub account and day, used after ship and cancel.
+            :param shipment: Shipment
+            :return: number of rollup rows written
+        """
+        return self.refresh(keys=[(shipment.subaccount_id, self.get_day(shipment.creation_date))])
+
+    def get_rollups(self, sub_account: SubAccount, start_date: str, end_date: str, params: dict) -> QuerySet:
+        """
+            Get the rollups for a metric request, the same selection the metric apis make over legs.
+            :param sub_account: requesting sub account
+            :param start_date: start date '%Y-%m-%d' or empty
+            :param end_date: end date '%Y-%m-%d' or empty
+            :param params: metric params with query_type and, for BBE, accounts
+            :return: MetricLegRollup QuerySet
+        """
+        accounts = params.get("accounts", []) if sub_account.is_bbe else []
+        query_type = params.get("query_type")
+
+        own = Q(sub_account=sub_account)
+
+        if not sub_account.is_bbe:
+            own &= Q(is_managed=False)
+
+        managed = Q(bc_customer_code=sub_account.bc_customer_code, is_managed=True)
+
+        if accounts:
+            selection = Q(sub_account__subaccount_number__in=accounts)
+        elif query_type == "COM":
+            selection = own | managed
+        elif query_type == "MAN":
+            selection = managed
+        else:
+            selection = own
+
+        rollups = MetricLegRollup.objects.filter(selection)
+
+        if start_date and end_date:
+            start_date, end_date = self._get_dates(start_date=start_date, end_date=end_date)
+            rollups = rollups.filter(day__gte=start_date.date(), day__lt=end_date.date())
+
+        return rollups
+
+    @staticmethod
+    def top(rollups: QuerySet, *fields, **expressions) -> list:
+        """
+            Get the ten largest leg counts grouped by fields.
+            :param rollups: MetricLegRollup QuerySet
+            :return: list of dicts with count
+        """
+        return list(rollups.values(*fields, **expressions).annotate(count=Sum("legs")).order_by("-count")[:10])
+
+    def get_revenue_quantiles(self, rollups: QuerySet, quantiles: tuple = (0.25, 0.5, 0.75, 0.95)) -> dict:
+        """
+            Get leg revenue quantiles from the rollup sketches, served by the metric carriers api.
+            :param rollups: MetricLegRollup QuerySet
+            :param quantiles: quantiles to get
+            :return: dict of quantile to revenue
+        """
+        sketch = self._sketch.merge(sketches=list(rollups.values_list("revenue_sketch", flat=True)))
+
+        return {q: self._sketch.quantile(sketch=sketch, q=q) for q in quantiles}
@@ -6,16 +6,17 @@
         - Account
     Created: Sept 28, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 
 from django.db import connection
-from django.db.models import F, Count, QuerySet
+from django.db.models import F, QuerySet
 
 from api.apis.metric_v3.metric_base_v3 import MetricBase
+from api.apis.metric_v3.metric_rollup import MetricRollup
 from api.exceptions.project import ViewException
-from api.models import API, SubAccount, Address, Leg
+from api.models import API, SubAccount
 
 
 class GetMetricRoutes(MetricBase):
@@ -24,166 +25,33 @@ class GetMetricRoutes(MetricBase):
     """
 
     @staticmethod
-    def _get_data(legs: QuerySet):
+    def _get_data(rollups: QuerySet):
         """
-
-            :return:
+            Get the top origin and destination cities and provinces.
+            :param rollups: MetricLegRollup QuerySet
+            :return: dict of top routes
         """
 
-        origin_cities = Address.objects.filter(
-            leg_origin__in=legs
-        ).values('city', province_code=F('province__code')).annotate(count=Count(F('city'))).order_by("-count")[:10]
+        origin_cities = MetricRollup.top(rollups, city=F('origin_city'), province_code=F('origin_province'))
 
-        destination_cities = Address.objects.filter(
-            leg_destination__in=legs
-        ).values('city', province_code=F('province__code')).annotate(count=Count(F('city'))).order_by("-count")[:10]
+        destination_cities = MetricRollup.top(
+            rollups, city=F('destination_city'), province_code=F('destination_province')
+        )
 
-        origin_provinces = Address.objects.filter(
-            leg_origin__in=legs
-        ).values(province_code=F('province__code')).annotate(count=Count(F('province_code'))).order_by("-count")[:10]
+        origin_provinces = MetricRollup.top(rollups, province_code=F('origin_province'))
 
-        destination_provinces = Address.objects.filter(
-            leg_destination__in=legs
-        ).values(province_code=F('province__code')).annotate(count=Count(F('province_code'))).order_by("-count")[:10]
+        destination_provinces = MetricRollup.top(rollups, province_code=F('destination_province'))
 
         ret = {
-            "top_origin_cities": list(origin_cities),
-            "top_destinations_cities": list(destination_cities),
-            "top_origin_provinces": list(origin_provinces),
-            "top_destinations_provinces": list(destination_provinces),
+            "top_origin_cities": origin_cities,
+            "top_destinations_cities": destination_cities,
+            "top_origin_provinces": origin_provinces,
+            "top_destinations_provinces": destination_provinces,
             "note": "Data is based on individual shipment legs."
         }
 
         return ret
 
-    def _get_account_data(self, sub_account: SubAccount, start_date: str, end_date: str, query_type: str):
-        """
-
-            :param sub_account:
-            :param start_date:
-            :param end_date:
-            :return:
-        """
-
-        if start_date and end_date:
-            start_date, end_date = self._get_dates(start_date=start_date, end_date=end_date)
-
-            if query_type == "COM":
-
-                if sub_account.is_bbe:
-                    legs = Leg.objects.filter(
-                        shipment__subaccount=sub_account,
-                        shipment__creation_date__range=[start_date, end_date],
-                        is_shipped=True
-                    )
-                else:
-                    legs = Leg.objects.filter(
-                        shipment__subaccount=sub_account,
-                        shipment__creation_date__range=[start_date, end_date],
-                        is_shipped=True
-                    ).exclude(shipment__username__in=self._bbe_users)
-
-                man_legs = Leg.objects.filter(
-                    shipment__bc_customer_code=sub_account.bc_customer_code,
-                    shipment__username__in=self._bbe_users,
-                    shipment__creation_date__range=[start_date, end_date],
-                    is_shipped=True
-                )
-
-                # Combine Query Sets
-                legs = legs | man_legs
-
-            elif query_type == "MAN":
-
-                legs = Leg.objects.filter(
-                    shipment__bc_customer_code=sub_account.bc_customer_code,
-                    shipment__username__in=self._bbe_users,
-                    shipment__creation_date__range=[start_date, end_date],
-                    is_shipped=True
-                )
-            else:
-                if sub_account.is_bbe:
-                    legs = Leg.objects.filter(
-                        shipment__subaccount=sub_account,
-                        shipment__creation_date__range=[start_date, end_date],
-                        is_shipped=True
-                    )
-                else:
-                    legs = Leg.objects.filter(
-                        shipment__subaccount=sub_account,
-                        shipment__creation_date__range=[start_date, end_date],
-                        is_shipped=True
-                    ).exclude(shipment__username__in=self._bbe_users)
-
-        else:
-
-            if query_type == "COM":
-
-                if sub_account.is_bbe:
-                    legs = Leg.objects.filter(
-                        shipment__subaccount=sub_account, is_shipped=True
-                    )
-                else:
-                    legs = Leg.objects.filter(
-                        shipment__subaccount=sub_account, is_shipped=True
-                    ).exclude(shipment__username__in=self._bbe_users)
-
-                man_legs = Leg.objects.filter(
-                    shipment__bc_customer_code=sub_account.bc_customer_code,
-                    shipment__username__in=self._bbe_users,
-                    is_shipped=True
-                )
-
-                # Combine Query Sets
-                legs = legs | man_legs
-
-            elif query_type == "MAN":
-
-                legs = Leg.objects.filter(
-                    shipment__bc_customer_code=sub_account.bc_customer_code,
-                    shipment__username__in=self._bbe_users,
-                    is_shipped=True
-                )
-            else:
-                if sub_account.is_bbe:
-                    legs = Leg.objects.filter(
-                        shipment__subaccount=sub_account, is_shipped=True
-                    )
-                else:
-                    legs = Leg.objects.filter(
-                        shipment__subaccount=sub_account, is_shipped=True
-                    ).exclude(shipment__username__in=self._bbe_users)
-
-        return self._get_data(legs=legs)
-
-    def _get_bbe_data(self, sub_account: SubAccount, start_date: str, end_date: str, query_type: str, params: dict):
-        """
-
-            :param sub_account:
-            :param start_date:
-            :param end_date:
-            :return:
-        """
-        accounts = params.get("accounts", [])
-
-        if accounts and start_date and end_date:
-            start_date, end_date = self._get_dates(start_date=start_date, end_date=end_date)
-            legs = Leg.objects.filter(
-                shipment__creation_date__range=[start_date, end_date],
-                shipment__subaccount__subaccount_number__in=accounts,
-                is_shipped=True
-            )
-
-            return self._get_data(legs=legs)
-        elif accounts:
-            legs = Leg.objects.filter(shipment__subaccount__subaccount_number__in=accounts, is_shipped=True)
-
-            return self._get_data(legs=legs)
-
-        return self._get_account_data(
-            sub_account=sub_account, start_date=start_date, end_date=end_date, query_type=query_type
-        )
-
     def get_metrics(self, sub_account: SubAccount, params: dict) -> dict:
         """
             Get Metric Routes. IE: City Count and Province Count.
@@ -198,7 +66,6 @@ class GetMetricRoutes(MetricBase):
 
         start_date = params['start_date']
         end_date = params['end_date']
-        query_type = params['query_type']
 
         if (start_date and not end_date) or (not start_date and end_date):
             connection.close()
@@ -207,14 +74,10 @@ class GetMetricRoutes(MetricBase):
             errors.append({"end_date": "Must be in '%Y-%m-%d'"})
             raise ViewException(code="7204", message="MetricRoutes: Invalid dates.", errors=errors)
 
-        if sub_account.is_bbe:
-            ret = self._get_bbe_data(
-                sub_account=sub_account, start_date=start_date, end_date=end_date, query_type=query_type, params=params
-            )
-        else:
-            ret = self._get_account_data(
-                sub_account=sub_account, start_date=start_date, end_date=end_date, query_type=query_type
-            )
+        rollups = MetricRollup().get_rollups(
+            sub_account=sub_account, start_date=start_date, end_date=end_date, params=params
+        )
+        ret = self._get_data(rollups=rollups)
 
         ret.update({
             "last_updated": self._get_date(),
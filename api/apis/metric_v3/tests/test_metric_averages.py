@@ -0,0 +1,49 @@
+from decimal import Decimal
+
+import numpy
+from django.test import TestCase
+
+from api.apis.metric_v3.metric_averages_v3 import GetMetricAverages
+from api.models import Leg
+
+
+class MetricAveragesTests(TestCase):
+    fixtures = [
+        "carriers",
+        "countries",
+        "provinces",
+        "user",
+        "group",
+        "contact",
+        "addresses",
+        "markup",
+        "account",
+        "subaccount",
+        "shipments",
+        "legs",
+    ]
+
+    def setUp(self):
+        self.metric = GetMetricAverages()
+        Leg.objects.update(cost=Decimal("110.00"), tax=Decimal("10.00"), markup=Decimal("10.00"))
+        Leg.objects.filter(pk=1).update(cost=Decimal("210.00"), is_dangerous_good=True, is_delivered=True)
+
+    def test_get_stats(self):
+        values = numpy.sort(numpy.array([3.0, 1.5, 3.0, 9.0]))
+        self.assertEqual(self.metric._get_stats(values=values), ("2", "4.12", "3.0"))
+        self.assertEqual(self.metric._get_stats(values=numpy.array([])), ("-", "-", "-"))
+
+    def test_get_averages(self):
+        averages = self.metric._get_averages(data=Leg.objects.all(), is_shipment=False)
+
+        self.assertEqual(averages["shipment_averages"]["mode_count"], "3")
+        self.assertEqual(averages["shipment_averages"]["mean_cost"], "137.5")
+        self.assertEqual(averages["shipment_averages"]["median_cost"], "110.0")
+        self.assertEqual(averages["dg_averages"]["mean_cost"], "220.0")
+        self.assertEqual(averages["delivered_averages"]["mode_count"], "1")
+
+    def test_get_averages_empty(self):
+        averages = self.metric._get_averages(data=Leg.objects.none(), is_shipment=True)
+
+        self.assertEqual(averages["dg_averages"]["mean_cost"], "-")
+        self.assertEqual(averages["shipment_averages"]["note"], "The averages are based on the sum of all shipment legs.")
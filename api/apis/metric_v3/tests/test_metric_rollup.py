@@ -0,0 +1,104 @@
+import datetime
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from api.apis.metric_v3.metric_carriers_v3 import GetMetricCarriers
+from api.apis.metric_v3.metric_rollup import MetricRollup, RevenueSketch
+from api.apis.metric_v3.metric_routes_v3 import GetMetricRoutes
+from api.models import Leg, MetricLegRollup, Shipment, SubAccount
+
+
+class RevenueSketchTests(TestCase):
+
+    def test_quantile_relative_accuracy(self):
+        sketch_api = RevenueSketch()
+        first = {}
+        second = {}
+
+        for value in range(1, 501):
+            sketch_api.add(sketch=first, value=float(value))
+            sketch_api.add(sketch=second, value=float(value + 500))
+
+        sketch = sketch_api.merge(sketches=[first, second])
+
+        self.assertEqual(sum(sketch.values()), 1000)
+        self.assertAlmostEqual(sketch_api.quantile(sketch=sketch, q=0.5), 500, delta=500 * 0.01)
+        self.assertAlmostEqual(sketch_api.quantile(sketch=sketch, q=0.9), 900, delta=900 * 0.01)
+
+    def test_quantile_zero_and_empty(self):
+        sketch_api = RevenueSketch()
+        sketch = {}
+        sketch_api.add(sketch=sketch, value=0.0)
+
+        self.assertEqual(sketch_api.quantile(sketch=sketch, q=0.5), 0.0)
+        self.assertTrue(sketch_api.quantile(sketch={}, q=0.5) != sketch_api.quantile(sketch={}, q=0.5))
+
+
+class MetricRollupTests(TestCase):
+    fixtures = [
+        "carriers",
+        "countries",
+        "provinces",
+        "user",
+        "group",
+        "contact",
+        "addresses",
+        "markup",
+        "account",
+        "subaccount",
+        "shipments",
+        "legs",
+    ]
+
+    def setUp(self):
+        self.day = datetime.date(2026, 10, 1)
+        self.sub_account = SubAccount.objects.get(pk=1)
+        Shipment.objects.update(creation_date=datetime.datetime(2026, 10, 1, 15, tzinfo=timezone.utc))
+        Leg.objects.update(base_cost=Decimal("110.00"), base_tax=Decimal("10.00"), markup=Decimal("10.00"))
+
+    def test_refresh_builds_rollups(self):
+        count = MetricRollup().refresh(keys=[(self.sub_account.pk, self.day)])
+        rollups = MetricLegRollup.objects.filter(sub_account=self.sub_account, day=self.day)
+        legs = Leg.objects.filter(shipment__subaccount=self.sub_account, is_shipped=True).count()
+
+        self.assertEqual(count, rollups.count())
+        self.assertEqual(sum(rollups.values_list("legs", flat=True)), legs)
+        self.assertEqual(rollups.first().expense, Decimal("100.00") * rollups.first().legs)
+        self.assertEqual(rollups.first().revenue, Decimal("110.00") * rollups.first().legs)
+
+    def test_refresh_is_idempotent_after_cancel(self):
+        rollup = MetricRollup()
+        rollup.refresh(keys=[(self.sub_account.pk, self.day)])
+        before = sum(MetricLegRollup.objects.values_list("legs", flat=True))
+
+        Leg.objects.filter(pk=1).update(is_shipped=False)
+        rollup.refresh_shipment(shipment=Shipment.objects.get(pk=1))
+
+        self.assertEqual(sum(MetricLegRollup.objects.values_list("legs", flat=True)), before - 1)
+
+    def test_metric_apis_read_rollups(self):
+        MetricRollup().refresh(keys=[(self.sub_account.pk, self.day)])
+        params = {"query_type": "ACC"}
+        rollups = MetricRollup().get_rollups(
+            sub_account=self.sub_account, start_date="2026-10-01", end_date="2026-10-01", params=params
+        )
+        legs = Leg.objects.filter(shipment__subaccount=self.sub_account, is_shipped=True)
+
+        carriers = GetMetricCarriers._get_data(rollups=rollups)
+        routes = GetMetricRoutes._get_data(rollups=rollups)
+
+        self.assertEqual(sum(carrier["count"] for carrier in carriers["top_carriers"]), legs.count())
+        self.assertEqual(
+            {carrier["carrier_code"] for carrier in carriers["top_carriers"]},
+            set(legs.values_list("carrier__code", flat=True))
+        )
+        self.assertEqual(routes["top_origin_cities"][0]["city"], legs.first().origin.city)
+        self.assertAlmostEqual(float(carriers["revenue_quantiles"]["p50"]), 110.00, delta=110.00 * 0.01)
+
+        empty = MetricRollup().get_rollups(
+            sub_account=self.sub_account, start_date="2026-10-02", end_date="2026-10-03", params=params
+        )
+        self.assertEqual(GetMetricCarriers._get_data(rollups=empty)["top_carriers"], [])
+        self.assertEqual(GetMetricCarriers._get_data(rollups=empty)["revenue_quantiles"]["p95"], "-")
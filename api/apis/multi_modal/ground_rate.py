@@ -9,7 +9,8 @@ class GroundRate(RateAPI):
 
     def _make_requests(self) -> None:
         self._responses = []
-        union = Union(self._gobox_request)
+        deadline = self._gobox_request["objects"].get("rate_deadline")
+        union = Union(self._gobox_request, on_rates=deadline.stream if deadline else None)
         rating_thread = Greenlet.spawn(union.rate)
 
         rating_thread.join()
@@ -5,7 +5,7 @@ import gevent
 from django.db import connection
 
 from api.apis.carriers.bbe.endpoints.bbe_rate_v1 import BBERate
-from api.apis.carriers.union.api_union_v2 import Union
+from api.apis.carriers.union.request_view import RequestView
 from api.apis.multi_modal.rate_api import RateAPI
 from api.apis.services.middle_location.middle_location import FindMiddleLocation
 from api.exceptions.project import ViewException
@@ -60,8 +60,8 @@ class MultiCarrierGroundRate(RateAPI):
             )
 
         # Configure two requests
-        self._first_request = copy.deepcopy(self._gobox_request)
-        self._last_request = copy.deepcopy(self._gobox_request)
+        self._first_request = RequestView(self._gobox_request)
+        self._last_request = RequestView(self._gobox_request)
         self._set_address(request=self._first_request, key="destination")
         self._set_address(request=self._last_request, key="origin")
 
@@ -112,16 +112,13 @@ class MultiCarrierGroundRate(RateAPI):
             :return:
         """
         bbe_rate = BBERate(ubbe_request=self._gobox_request).rate(is_quote=True)
-        first_request = Union(gobox_request=self._first_request)
-        last_request = Union(gobox_request=self._last_request)
-
-        first_gevent = gevent.Greenlet.spawn(first_request.rate)
-        last_gevent = gevent.Greenlet.spawn(last_request.rate)
+        first_gevent = self._rate_memo.rate(request=self._first_request)
+        last_gevent = self._rate_memo.rate(request=self._last_request)
 
         gevent.joinall([first_gevent, last_gevent])
 
-        first_rate = first_gevent.get()
-        last_rate = last_gevent.get()
+        first_rate = self._rate_memo.get_rates(greenlet=first_gevent)
+        last_rate = self._rate_memo.get_rates(greenlet=last_gevent)
 
         if not first_rate:
             first_rate = bbe_rate
@@ -3,7 +3,7 @@ import copy
 import gevent
 
 from api.apis.carriers.bbe.endpoints.bbe_rate_v1 import BBERate
-from api.apis.carriers.union.api_union_v2 import Union
+from api.apis.carriers.union.request_view import RequestView
 from api.apis.multi_modal.rate_api import RateAPI
 from api.apis.services.airbase.airbase import FindAirbase
 from api.apis.services.airbase.carrier_airbases.buffalo import BuffaloAirbase
@@ -61,9 +61,9 @@ class MultiModalAirRate(RateAPI):
             :param delivery: Delivery Request for YEG CN
             :return: None
         """
-        pickup_leg = copy.deepcopy(pickup)
-        main_leg = copy.deepcopy(main)
-        delivery_leg = copy.deepcopy(delivery)
+        pickup_leg = RequestView(pickup)
+        main_leg = RequestView(main)
+        delivery_leg = RequestView(delivery)
 
         main_leg["mid_o"] = first
         main_leg["mid_d"] = last
@@ -273,9 +273,9 @@ class MultiModalAirRate(RateAPI):
         for air in self._air_carriers:
 
             # Split request into the three legs
-            pickup_leg = copy.deepcopy(self._gobox_request)
-            main_leg = copy.deepcopy(self._gobox_request)
-            delivery_leg = copy.deepcopy(self._gobox_request)
+            pickup_leg = RequestView(self._gobox_request)
+            main_leg = RequestView(self._gobox_request)
+            delivery_leg = RequestView(self._gobox_request)
 
             # Get airbases
             mid_origin, mid_destination = FindAirbase().get_airbase(
@@ -340,31 +340,25 @@ class MultiModalAirRate(RateAPI):
         delivery_threads = []
         bbe_rate = BBERate(ubbe_request=self._gobox_request).rate(is_quote=True)
 
-        # TODO: DECIDE HOW TO REDUCE DUPLICATE GROUND CALLS
+        # Airbase combinations share pickup and delivery legs, identical legs are rated once by the memo.
         for pickup_leg, main_leg, delivery_leg in self._requests:
 
             if not pickup_leg or not main_leg or not delivery_leg:
                 # LOGGER.info("Incorrect build request")
                 continue
 
-            pickup_request = Union(pickup_leg)
-            main_request = Union(main_leg)
-            delivery_request = Union(delivery_leg)
+            pickup_threads.append(self._rate_memo.rate(request=pickup_leg))
+            main_threads.append(self._rate_memo.rate(request=main_leg))
+            delivery_threads.append(self._rate_memo.rate(request=delivery_leg))
 
-            pickup_threads.append(gevent.Greenlet.spawn(pickup_request.rate))
-            main_threads.append(gevent.Greenlet.spawn(main_request.rate))
-            delivery_threads.append(gevent.Greenlet.spawn(delivery_request.rate))
-
-        gevent.joinall(pickup_threads)
-        gevent.joinall(main_threads)
-        gevent.joinall(delivery_threads)
+        gevent.joinall(set(pickup_threads + main_threads + delivery_threads))
 
         max_length = max(len(pickup_threads), len(main_threads), len(delivery_threads))
 
         for i in range(0, max_length):
-            p_rates = pickup_threads[i].get()
-            m_rates = main_threads[i].get()
-            d_rates = delivery_threads[i].get()
+            p_rates = self._rate_memo.get_rates(greenlet=pickup_threads[i])
+            m_rates = self._rate_memo.get_rates(greenlet=main_threads[i])
+            d_rates = self._rate_memo.get_rates(greenlet=delivery_threads[i])
 
             if not m_rates:
                 continue
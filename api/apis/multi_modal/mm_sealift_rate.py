@@ -6,7 +6,7 @@ from django.db import connection
 from django.db.models import Prefetch
 
 from api.apis.carriers.bbe.endpoints.bbe_rate_v1 import BBERate
-from api.apis.carriers.union.api_union_v2 import Union
+from api.apis.carriers.union.request_view import RequestView
 from api.apis.multi_modal.rate_api import RateAPI
 from api.exceptions.project import ViewException
 from api.globals.carriers import NEAS, NSSI, MTS
@@ -127,15 +127,16 @@ class MultiModalSealiftRate(RateAPI):
                 port = port_dict[port_str]["port"]
                 sailings = port_dict[port_str]["sailings"]
 
-                leg_one = copy.deepcopy(self._gobox_request)
-                leg_two = copy.deepcopy(self._gobox_request)
+                leg_one = RequestView(self._gobox_request)
+                leg_two = RequestView(self._gobox_request)
 
                 leg_one["carrier_id"] = ground
                 leg_two["carrier_id"] = [carrier]
 
                 if 'carrier_options' in leg_one:
                     if self._appointment_delivery not in leg_one["carrier_options"]:
-                        leg_one["carrier_options"].append(self._appointment_delivery)
+                        # Carrier options are shared with the base request, replace instead of append.
+                        leg_one["carrier_options"] = leg_one["carrier_options"] + [self._appointment_delivery]
 
                 if self._gobox_request.get("is_packing", False):
                     cargo = self._get_cargo_packing_station(carrier_id=carrier, port_code=port.code)
@@ -231,20 +232,16 @@ class MultiModalSealiftRate(RateAPI):
                 LOGGER.critical("Incorrect build request")
                 continue
 
-            leg_one_request = Union(leg_one)
-            leg_two_request = Union(leg_two)
+            pickup_threads.append(self._rate_memo.rate(request=leg_one))
+            main_threads.append(self._rate_memo.rate(request=leg_two))
 
-            pickup_threads.append(gevent.Greenlet.spawn(leg_one_request.rate))
-            main_threads.append(gevent.Greenlet.spawn(leg_two_request.rate))
-
-        gevent.joinall(pickup_threads)
-        gevent.joinall(main_threads)
+        gevent.joinall(set(pickup_threads + main_threads))
 
         max_length = max(len(pickup_threads), len(main_threads))
 
         for i in range(0, max_length):
-            p_rates = pickup_threads[i].get()
-            m_rates = main_threads[i].get()
+            p_rates = self._rate_memo.get_rates(greenlet=pickup_threads[i])
+            m_rates = self._rate_memo.get_rates(greenlet=main_threads[i])
 
             if not m_rates:
                 continue
@@ -1,12 +1,15 @@
 import copy
 from decimal import Decimal
 
+from api.apis.carriers.union.request_view import RequestView
+from api.apis.multi_modal.rate_memo import RateMemo
+
 
 class RateAPI:
     _sig_fig = Decimal("0.01")
 
     def __init__(self, gobox_request: dict) -> None:
-        self._gobox_request = copy.deepcopy(gobox_request)
+        self._gobox_request = copy.deepcopy(RequestView(gobox_request))
         self._user = copy.deepcopy(gobox_request["objects"]["user"])
         self.sub_account = copy.deepcopy(gobox_request["objects"]["sub_account"])
         self._air_list = copy.deepcopy(gobox_request["objects"]["air_list"])
@@ -14,6 +17,8 @@ class RateAPI:
         self._ftl_list = copy.deepcopy(gobox_request["objects"]["ftl_list"])
         self._courier_list = copy.deepcopy(gobox_request["objects"]["courier_list"])
         self._sealift_list = copy.deepcopy(gobox_request["objects"]["sealift_list"])
+        # Leg rate memo shared by all rating modes of the quote.
+        self._rate_memo = gobox_request["objects"].get("rate_memo") or RateMemo()
 
         self._origin = self._gobox_request["origin"]
         self._destination = self._gobox_request["destination"]
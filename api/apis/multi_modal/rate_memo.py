@@ -0,0 +1,69 @@
+"""
+    Title: Leg Rate Memo
+    Description: This file will contain the per quote memo of leg rate calls. Multi modal rating builds the same
+                 ground leg (Origin -> Airbase, Port -> Destination) for several airbase or port combinations, the
+                 memo rates each distinct leg once and shares the rating greenlet between the combinations.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import copy
+
+import gevent
+
+from api.apis.carriers.union.api_union_v2 import Union
+from api.apis.carriers.union.request_view import RequestView
+
+
+class RateMemo:
+    """
+        Per quote memo of Union rate calls keyed by the normalized leg request.
+
+        The key is built from every request field that reaches the carriers (origin, destination, packages, carrier
+        set, leg flags and options), the request objects are left out. Each caller gets its own copy of the rates
+        as the multi modal apis modify the rates they receive.
+    """
+
+    def __init__(self) -> None:
+        self._greenlets = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_key(request: dict) -> tuple:
+        """
+            Get the memo key for a leg request.
+            :param request: leg rate request
+            :return: memo key
+        """
+        return RequestView.get_key(request=request)
+
+    def rate(self, request: dict) -> gevent.Greenlet:
+        """
+            Get the rating greenlet for a leg request, spawn a Union rate call for the first request of a leg and
+            reuse it for every identical leg after.
+            :param request: leg rate request
+            :return: rating greenlet
+        """
+        key = self.get_key(request=request)
+        greenlet = self._greenlets.get(key)
+
+        if greenlet is not None:
+            self.hits += 1
+            return greenlet
+
+        self.misses += 1
+        greenlet = gevent.Greenlet.spawn(Union(request).rate)
+        self._greenlets[key] = greenlet
+
+        return greenlet
+
+    @staticmethod
+    def get_rates(greenlet: gevent.Greenlet) -> list:
+        """
+            Get a copy of the rates from a rating greenlet, raises the exception from the rate call if it failed.
+            :param greenlet: rating greenlet
+            :return: list of rates
+        """
+        return copy.deepcopy(greenlet.get())
@@ -1,10 +1,12 @@
 import copy
 
+from django.db import transaction
 
 from api.apis.multi_modal.ship.air_ahip import AirShip
 from api.apis.multi_modal.ship.ground_ship import GroundShip
 from api.apis.multi_modal.ship.mc_ground_ship import MultiCarrierGroundShip
 from api.apis.multi_modal.ship.sealift_ship import SealiftShip
+from api.background_tasks.metric_rollup import CeleryMetricRollup
 from api.globals.carriers import UBBE_INTERLINE
 
 
@@ -47,4 +49,7 @@ class MultiModelShip:
             self._response["account_id"] = self.shipment.account_id
             self._response["packages"] = list(self.shipment.package_shipment.values("package_id", "package_account_id"))
 
+        shipment_id = self.shipment.shipment_id
+        transaction.on_commit(lambda: CeleryMetricRollup.refresh_shipment.delay(shipment_id=shipment_id))
+
         return self._response, self.shipment
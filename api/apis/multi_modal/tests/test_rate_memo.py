@@ -0,0 +1,65 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+import gevent
+from django.test import TestCase
+
+from api.apis.multi_modal.rate_memo import RateMemo
+
+
+class RateMemoTests(TestCase):
+
+    def setUp(self):
+        self.request = {
+            "carrier_id": [670, 708],
+            "origin": {"city": "Edmonton", "province": "AB", "country": "CA", "postal_code": "T9E0V6"},
+            "destination": {"city": "Yellowknife", "province": "NT", "country": "CA", "postal_code": "X1A2R3"},
+            "packages": [{"weight": Decimal("10.00"), "quantity": 1}],
+            "is_pickup": True,
+            "objects": {"user": "one"},
+        }
+        self.memo = RateMemo()
+
+    def test_key_ignores_order_and_objects(self):
+        other = {
+            "objects": {"user": "two"},
+            "is_pickup": True,
+            "packages": [{"quantity": 1, "weight": Decimal("10")}],
+            "destination": {"postal_code": "X1A2R3", "country": "CA", "province": "NT", "city": "Yellowknife"},
+            "origin": {"postal_code": "T9E0V6", "country": "CA", "province": "AB", "city": "Edmonton"},
+            "carrier_id": [708, 670],
+        }
+        self.assertEqual(self.memo.get_key(self.request), self.memo.get_key(other))
+
+    def test_key_different_leg(self):
+        other = dict(self.request)
+        other["destination"] = {"city": "Inuvik", "province": "NT", "country": "CA", "postal_code": "X0E0T0"}
+        self.assertNotEqual(self.memo.get_key(self.request), self.memo.get_key(other))
+
+    def test_key_different_flags(self):
+        other = dict(self.request)
+        other["is_pickup"] = False
+        self.assertNotEqual(self.memo.get_key(self.request), self.memo.get_key(other))
+
+    def test_key_scalar_carrier_id(self):
+        other = dict(self.request)
+        other["carrier_id"] = 670
+        self.assertEqual(self.memo.get_key(other)[0], (670,))
+
+    @patch("api.apis.carriers.union.api_union_v2.Union.rate", return_value=[{"total": Decimal("10.00")}])
+    def test_rate_shared_greenlet(self, union_rate):
+        first = self.memo.rate(request=self.request)
+        second = self.memo.rate(request=dict(self.request))
+        gevent.joinall([first, second])
+        self.assertIs(first, second)
+        self.assertEqual(union_rate.call_count, 1)
+        self.assertEqual(self.memo.hits, 1)
+        self.assertEqual(self.memo.misses, 1)
+
+    @patch("api.apis.carriers.union.api_union_v2.Union.rate", return_value=[{"total": Decimal("10.00")}])
+    def test_get_rates_copies(self, union_rate):
+        greenlet = self.memo.rate(request=self.request)
+        greenlet.join()
+        rates = self.memo.get_rates(greenlet=greenlet)
+        rates[0]["total"] += Decimal("100.00")
+        self.assertEqual(self.memo.get_rates(greenlet=greenlet), [{"total": Decimal("10.00")}])
@@ -6,17 +6,27 @@
     Edited By:
     Edited Date:
 """
+import copy
+import json
+from typing import Iterator
+
 import gevent
 from django.contrib.auth.models import User
+from django.core.serializers.json import DjangoJSONEncoder
+from gevent.queue import Queue
 
 from api.apis.multi_modal.ground_rate import GroundRate
 from api.apis.multi_modal.mc_ground_rate import MultiCarrierGroundRate
 from api.apis.multi_modal.mm_air_rate import MultiModalAirRate
 from api.apis.multi_modal.mm_sealift_rate import MultiModalSealiftRate
+from api.apis.multi_modal.rate_memo import RateMemo
 from api.apis.rate_v3.join_rates_v2 import JoinRateV2
+from api.apis.rate_v3.rate_deadline import RateDeadline
+from api.apis.rate_v3.reference_snapshot import ReferenceSnapshot
 from api.background_tasks.logger import CeleryLogger
-from api.background_tasks.rate_logging import CeleryRateLog
+from api.background_tasks.rate_log_writer import RATE_LOG_WRITER
 from api.exceptions.project import ViewException
+from api.globals.project import RATE_DEADLINE_SECONDS, RATE_DEADLINE_GRACE_SECONDS
 from api.models import RateLog, SubAccount
 from api.parse_requests.parse_rate_request import ParseRateRequest
 from api.utilities.carriers import CarrierUtility
@@ -32,6 +42,7 @@ class RateV3:
             - pickup_rates - List of Lists of Pickup Rates
             - delivery_rates - List of Lists of Delivery Rates
             - carrier_service - Carrier Service Information
+            - late_carriers - Carrier apis (or rate modes) that did not answer before the deadline
 
         Steps:
             - Step 1 - Create Rate Log
@@ -42,14 +53,21 @@ class RateV3:
             - Step 6 - Get Carrier Service Information
             - Step 7 - Update Rate Log With Response
             - Step 8 - Return Response
+
+        Carriers get a sub budget of the request deadline, carriers that have not answered by then are killed and the
+        rates gathered so far are returned. Stream mode sends each carrier's rates as they arrive as json lines.
     """
 
-    def __init__(self, ubbe_request: dict, log_data: dict, sub_account: SubAccount, user: User):
+    def __init__(
+        self, ubbe_request: dict, log_data: dict, sub_account: SubAccount, user: User,
+        deadline: float = RATE_DEADLINE_SECONDS
+    ):
 
         self._ubbe_request = ubbe_request
         self._log_data = log_data
         self._sub_account = sub_account
         self._user = user
+        self._deadline = RateDeadline(seconds=deadline)
 
     @staticmethod
     def _get_tread_rate(thread, rate_type: str):
@@ -77,10 +95,21 @@ class RateV3:
             "response_data": '{}',
             "is_no_rate": True
         })
-        rate_log.save()
+        RATE_LOG_WRITER.add(rate_log=rate_log)
 
         return rate_log
 
+    @staticmethod
+    def _log_rate_response(rate_log: RateLog, response: dict) -> None:
+        """
+            Queue the rate response on the rate log.
+            :param rate_log: rate log
+            :param response: rate response, before the rate id is added
+        """
+        rate_log.response_data = dict(response)
+        rate_log.is_no_rate = False
+        RATE_LOG_WRITER.update(rate_log=rate_log, fields=["response_data", "is_no_rate"])
+
     def _get_carrier_information(self):
         """
 
@@ -101,39 +130,75 @@ class RateV3:
             "ltl_list": CarrierUtility().get_ltl(),
             "ftl_list": CarrierUtility().get_ftl(),
             "courier_list": CarrierUtility().get_courier(),
-            "sealift_list": CarrierUtility().get_sealift()
+            "sealift_list": CarrierUtility().get_sealift(),
+            "rate_memo": RateMemo(),
+            "rate_deadline": self._deadline,
+            "reference": ReferenceSnapshot(
+                carrier_ids=self._ubbe_request["carrier_id"],
+                locations=[self._ubbe_request["origin"], self._ubbe_request["destination"]]
+            )
+        }
+
+    def _spawn_rates(self) -> dict:
+        """
+            Spawn the rate modes for the request.
+            :return: dictionary of rate type to greenlet
+        """
+
+        greenlets = {
+            "Ground": gevent.Greenlet.spawn(GroundRate(gobox_request=self._ubbe_request).rate),
+            "Air": gevent.Greenlet.spawn(MultiModalAirRate(gobox_request=self._ubbe_request).rate),
+            "Sea": gevent.Greenlet.spawn(MultiModalSealiftRate(gobox_request=self._ubbe_request).rate),
+            "Interline": gevent.Greenlet.spawn(MultiCarrierGroundRate(gobox_request=self._ubbe_request).rate),
         }
 
+        if self._deadline.stream:
+            # Ground rates are streamed per carrier by Union, multi modal rates once the mode is complete.
+            greenlets["Air"].link_value(self._stream_mode)
+            greenlets["Sea"].link_value(self._stream_mode)
+
+        return greenlets
+
+    def _stream_mode(self, greenlet: gevent.Greenlet) -> None:
+        """
+            Stream the rates of a completed multi modal rate mode.
+            :param greenlet: finished rate mode greenlet
+        """
+
+        if greenlet.value and not isinstance(greenlet.value, gevent.GreenletExit):
+            self._deadline.stream(greenlet.value)
+
     def _get_rates(self) -> dict:
         """
             Get Rates for parse ubbe request.
             :return: dictionary of rates
         """
 
-        gevent_ground = gevent.Greenlet.spawn(GroundRate(gobox_request=self._ubbe_request).rate)
-        gevent_air = gevent.Greenlet.spawn(MultiModalAirRate(gobox_request=self._ubbe_request).rate)
-        gevent_sealift = gevent.Greenlet.spawn(MultiModalSealiftRate(gobox_request=self._ubbe_request).rate)
-        gevent_interline = gevent.Greenlet.spawn(MultiCarrierGroundRate(gobox_request=self._ubbe_request).rate)
-
-        gevent.joinall([gevent_air, gevent_ground, gevent_sealift])
-
-        ground_rates = self._get_tread_rate(thread=gevent_ground, rate_type="Ground")
-        air_rates = self._get_tread_rate(thread=gevent_air, rate_type="Air")
-        sealift_rates = self._get_tread_rate(thread=gevent_sealift, rate_type="Sea")
-        interline_rates = self._get_tread_rate(thread=gevent_interline, rate_type="Interline")
+        greenlets = self._spawn_rates()
+        finished = self._deadline.join(
+            greenlets=list(greenlets.values()),
+            names=list(greenlets.keys()),
+            budgets=[self._deadline.remaining() + RATE_DEADLINE_GRACE_SECONDS] * len(greenlets),
+            grace=RATE_DEADLINE_GRACE_SECONDS
+        )
+        rates = {
+            rate_type: self._get_tread_rate(thread=greenlet, rate_type=rate_type) if greenlet in finished else None
+            for rate_type, greenlet in greenlets.items()
+        }
 
         all_rates = JoinRateV2(
-            rates=[air_rates, sealift_rates, ground_rates],
+            rates=[rates["Air"], rates["Sea"], rates["Ground"]],
             sub_account=self._sub_account,
             carrier_accounts=self._ubbe_request["objects"]["carrier_accounts"]
         ).join_rates()
+        all_rates["late_carriers"] = sorted(self._deadline.late)
 
         return all_rates
 
-    def rate(self) -> dict:
+    def _prepare(self) -> RateLog:
         """
-
-            :return:
+            Create the rate log, parse the request and get the carrier information.
+            :return: rate log
         """
 
         rate_log = self._create_rate_log()
@@ -146,10 +211,74 @@ class RateV3:
 
         self._get_carrier_information()
 
+        return rate_log
+
+    @staticmethod
+    def _stream_line(line_type: str, data: dict) -> str:
+        """
+            Format a json line for the rate stream.
+            :param line_type: line type, rates or complete
+            :param data: line data
+            :return: json line
+        """
+        return json.dumps({"type": line_type, **data}, cls=DjangoJSONEncoder) + "\n"
+
+    def _stream_rates(self, rate_log: RateLog) -> Iterator[str]:
+        """
+            Stream marked up rates as each carrier answers, followed by the complete response.
+            :param rate_log: rate log
+            :return: json lines
+        """
+        queue = Queue()
+        self._deadline.stream = lambda rates: queue.put(rates)
+
+        rating = gevent.Greenlet.spawn(self._get_rates)
+        rating.link(lambda _: queue.put(StopIteration))
+
+        for rates in queue:
+
+            # Ground carriers stream a flat list of rates, multi modal modes stream (pickup, main, delivery) tuples.
+            if rates and not isinstance(rates[0], tuple):
+                rates = [(None, rates, None)]
+
+            # Markups are applied in place, the complete response needs the original rates.
+            streamed = JoinRateV2(
+                rates=[copy.deepcopy(rates)],
+                sub_account=self._sub_account,
+                carrier_accounts=self._ubbe_request["objects"]["carrier_accounts"]
+            ).join_rates()
+
+            yield self._stream_line(line_type="rates", data=streamed)
+
+        response = rating.get()
+        self._log_rate_response(rate_log=rate_log, response=response)
+        response["rate_id"] = rate_log.rate_log_id
+
+        yield self._stream_line(line_type="complete", data=response)
+
+    def rate(self) -> dict:
+        """
+
+            :return:
+        """
+
+        rate_log = self._prepare()
+
         response = self._get_rates()
 
-        CeleryRateLog.log_rate_response.delay(rate_log_id=rate_log.rate_log_id, rate_response=response)
+        self._log_rate_response(rate_log=rate_log, response=response)
 
         response["rate_id"] = rate_log.rate_log_id
 
         return response
+
+    def stream(self) -> Iterator[str]:
+        """
+            Get rates as a stream of json lines, one line of marked up rates per carrier as they arrive and a final
+            line with the complete response. The request is parsed before streaming so errors are raised up front.
+            :return: json lines
+        """
+
+        rate_log = self._prepare()
+
+        return self._stream_rates(rate_log=rate_log)
@@ -0,0 +1,67 @@
+"""
+    Title: Rate Deadline
+    Description: This file will contain the request level deadline for rating. Every carrier rate call gets a sub
+                 budget capped by the time left in the request, carriers that have not answered in time are killed
+                 and reported as late so the rates gathered so far can be returned.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import time
+from typing import Callable
+
+import gevent
+
+from api.globals.project import RATE_DEADLINE_SECONDS
+
+
+class RateDeadline:
+    """
+        Request level rate deadline, shared by every leg of the request through the request objects.
+
+        Optional stream callback receives each carrier group's rates as soon as they arrive.
+    """
+
+    def __init__(self, seconds: float = RATE_DEADLINE_SECONDS, stream: Callable[[list], None] = None) -> None:
+        self._expires = time.monotonic() + seconds
+        self.stream = stream
+        self.late = set()
+
+    def remaining(self) -> float:
+        """
+            Get the seconds left before the deadline.
+            :return: seconds left, never negative.
+        """
+        return max(self._expires - time.monotonic(), 0)
+
+    def join(self, greenlets: list, names: list, budgets: list, grace: float = 0) -> list:
+        """
+            Join rate greenlets, each greenlet gets its own budget in seconds capped by the deadline. Greenlets still
+            running after their budget are killed and their names are added to the late list.
+            :param greenlets: rate greenlets
+            :param names: name of each greenlet, reported when late
+            :param budgets: budget of each greenlet in seconds
+            :param grace: seconds allowed past the deadline, lets the legs return what they gathered by the deadline
+            :return: list of greenlets that finished in time
+        """
+        start = time.monotonic()
+
+        for budget in sorted(set(budgets)):
+            group = [greenlet for greenlet, limit in zip(greenlets, budgets) if limit == budget]
+            timeout = min(budget - (time.monotonic() - start), self.remaining() + grace)
+            gevent.joinall(group, timeout=max(timeout, 0))
+
+            # Kill every greenlet over its budget before joining the longer budgets.
+            gevent.killall([greenlet for greenlet in group if not greenlet.ready()], block=False)
+
+        finished = []
+
+        for greenlet, name in zip(greenlets, names):
+
+            if greenlet.ready() and not isinstance(greenlet.value, gevent.GreenletExit):
+                finished.append(greenlet)
+            else:
+                self.late.add(name)
+
+        return finished
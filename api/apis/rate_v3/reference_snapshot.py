@@ -0,0 +1,121 @@
+"""
+    Title: Reference Snapshot
+    Description: This file will contain the request level snapshot of the reference data read while rating: api active
+                 flags, fuel surcharges and tax rates. The snapshot is built once per rate request and shared by every
+                 carrier through the request objects, so carriers read from memory instead of querying per rate.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from datetime import timedelta
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.utils import timezone
+
+from api.models import API, FuelSurcharge, Province, Tax
+
+
+class ReferenceSnapshot:
+    """
+        Request level reference data snapshot.
+
+        Api flags and the fuel surcharges of the request carriers are loaded up front, tax rates for the request
+        origin and destination provinces are loaded up front and any other province (multi modal mid points) is
+        loaded on first use and kept for the rest of the request.
+    """
+
+    def __init__(self, carrier_ids: list, locations: list) -> None:
+        self._apis = dict(API.objects.values_list("name", "active"))
+        self._fuel_surcharges = {}
+        self._fuel_carriers = set()
+        self._taxes = {}
+
+        self._load_fuel_surcharges(carrier_ids=carrier_ids)
+        self._load_taxes(locations=locations)
+
+    def _load_fuel_surcharges(self, carrier_ids: list) -> None:
+        """
+            Load the fuel surcharges for the carriers.
+            :param carrier_ids: carrier codes
+        """
+        carrier_ids = set(carrier_ids) - self._fuel_carriers
+
+        if not carrier_ids:
+            return
+
+        fuel_surcharges = FuelSurcharge.objects.select_related("carrier").filter(carrier__code__in=carrier_ids)
+
+        for fuel in fuel_surcharges:
+            self._fuel_surcharges[(fuel.carrier.code, fuel.fuel_type)] = fuel
+
+        self._fuel_carriers.update(carrier_ids)
+
+    def _load_taxes(self, locations: list) -> None:
+        """
+            Load the tax rates for the provinces of the locations with one query, provinces without a tax rate are
+            left to get_tax.
+            :param locations: list of address dictionaries
+        """
+        keys = {(location["province"], location["country"]) for location in locations}
+
+        taxes = Tax.objects.select_related("province__country").filter(
+            province__code__in={province for province, _ in keys},
+            province__country__code__in={country for _, country in keys}
+        )
+
+        for tax in taxes:
+            key = (tax.province.code, tax.province.country.code)
+
+            if key in keys:
+                self._taxes[key] = tax
+
+    def is_active(self, api_name: str) -> bool:
+        """
+            Check if an api is active.
+            :param api_name: api name
+            :return: api active flag
+        """
+
+        try:
+            return self._apis[api_name]
+        except KeyError:
+            raise API.DoesNotExist(f"API {api_name} does not exist.")
+
+    def get_fuel_surcharge(self, carrier_id: int, fuel_type: str) -> FuelSurcharge:
+        """
+            Get the fuel surcharge for a carrier and fuel type, raises the same exceptions as a queryset get.
+            :param carrier_id: carrier code
+            :param fuel_type: fuel type, D or I
+            :return: FuelSurcharge
+        """
+        self._load_fuel_surcharges(carrier_ids=[carrier_id])
+
+        try:
+            return self._fuel_surcharges[(carrier_id, fuel_type)]
+        except KeyError:
+            raise FuelSurcharge.DoesNotExist
+
+    def get_tax(self, province: str, country: str) -> Tax:
+        """
+            Get the tax rate for a province, a province without a tax rate gets a new expired tax to be updated.
+            Raises ObjectDoesNotExist when the province does not exist.
+            :param province: province code
+            :param country: country code
+            :return: Tax
+        """
+        key = (province, country)
+
+        if key in self._taxes:
+            return self._taxes[key]
+
+        tax_province = Province.objects.get(code=province, country__code=country)
+
+        try:
+            tax = Tax.objects.get(province=tax_province)
+        except ObjectDoesNotExist:
+            tax = Tax(province=tax_province, expiry=timezone.now() - timedelta(days=1))
+
+        self._taxes[key] = tax
+
+        return tax
@@ -0,0 +1,46 @@
+import gevent
+from django.test import TestCase
+
+from api.apis.rate_v3.rate_deadline import RateDeadline
+
+
+class RateDeadlineTests(TestCase):
+
+    @staticmethod
+    def _rate(seconds: float, rates: list):
+        gevent.sleep(seconds)
+        return rates
+
+    def test_join_all_in_time(self):
+        deadline = RateDeadline(seconds=1)
+        greenlets = [gevent.spawn(self._rate, 0, [1]), gevent.spawn(self._rate, 0.01, [2])]
+        finished = deadline.join(greenlets=greenlets, names=["One", "Two"], budgets=[1, 1])
+        self.assertEqual([greenlet.get() for greenlet in finished], [[1], [2]])
+        self.assertEqual(deadline.late, set())
+
+    def test_join_carrier_budget(self):
+        deadline = RateDeadline(seconds=1)
+        greenlets = [gevent.spawn(self._rate, 0.3, [1]), gevent.spawn(self._rate, 0.3, [2])]
+        finished = deadline.join(greenlets=greenlets, names=["Fast", "Slow"], budgets=[0.05, 1])
+        self.assertEqual([greenlet.get() for greenlet in finished], [[2]])
+        self.assertEqual(deadline.late, {"Fast"})
+
+    def test_join_deadline_caps_budget(self):
+        deadline = RateDeadline(seconds=0.05)
+        greenlet = gevent.spawn(self._rate, 5, [1])
+        finished = deadline.join(greenlets=[greenlet], names=["Slow"], budgets=[20])
+        self.assertEqual(finished, [])
+        self.assertEqual(deadline.late, {"Slow"})
+        gevent.sleep(0)
+        self.assertTrue(greenlet.dead)
+
+    def test_join_failed_greenlet_is_finished(self):
+        deadline = RateDeadline(seconds=1)
+        greenlet = gevent.spawn(lambda: 1 / 0)
+        finished = deadline.join(greenlets=[greenlet], names=["Error"], budgets=[1])
+        self.assertEqual(finished, [greenlet])
+        self.assertEqual(deadline.late, set())
+
+    def test_remaining(self):
+        self.assertEqual(RateDeadline(seconds=0).remaining(), 0)
+        self.assertGreater(RateDeadline(seconds=5).remaining(), 4)
@@ -0,0 +1,68 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.test import TestCase
+from django.utils import timezone
+
+from api.apis.rate_v3.reference_snapshot import ReferenceSnapshot
+from api.apis.services.taxes.taxes import Taxes
+from api.models import API, Tax
+
+
+class ReferenceSnapshotTests(TestCase):
+    fixtures = [
+        "api",
+        "carriers",
+        "countries",
+        "provinces",
+        "fuel_surcharge",
+        "taxes",
+    ]
+
+    def setUp(self):
+        Tax.objects.filter(province__code="AB").update(expiry=timezone.now() + timedelta(days=30))
+        self.edmonton = {"city": "Edmonton", "province": "AB", "country": "CA", "postal_code": "T9E0V6"}
+        self.vancouver = {"city": "Vancouver", "province": "BC", "country": "CA", "postal_code": "V6B1A1"}
+        self.snapshot = ReferenceSnapshot(carrier_ids=[535, 646], locations=[self.vancouver, self.edmonton])
+
+    def test_is_active(self):
+        with self.assertNumQueries(0):
+            self.assertTrue(self.snapshot.is_active(api_name="TaxJar"))
+
+    def test_is_active_missing(self):
+        with self.assertRaises(API.DoesNotExist):
+            self.snapshot.is_active(api_name="NotAnApi")
+
+    def test_get_fuel_surcharge(self):
+        with self.assertNumQueries(0):
+            fuel = self.snapshot.get_fuel_surcharge(carrier_id=535, fuel_type="D")
+        self.assertEqual(fuel.ten_thou_under, Decimal("17.30"))
+
+    def test_get_fuel_surcharge_missing(self):
+        with self.assertRaises(ObjectDoesNotExist):
+            self.snapshot.get_fuel_surcharge(carrier_id=535, fuel_type="I")
+
+    def test_get_fuel_surcharge_other_carrier(self):
+        with self.assertNumQueries(1):
+            self.snapshot.get_fuel_surcharge(carrier_id=650, fuel_type="D")
+            self.snapshot.get_fuel_surcharge(carrier_id=650, fuel_type="D")
+
+    def test_get_tax(self):
+        with self.assertNumQueries(0):
+            tax = self.snapshot.get_tax(province="AB", country="CA")
+        self.assertEqual(tax.tax_rate, Decimal("5.00"))
+
+    def test_get_tax_without_rate(self):
+        tax = self.snapshot.get_tax(province="BC", country="CA")
+        self.assertIsNone(tax.pk)
+        self.assertLess(tax.expiry, timezone.now())
+
+    def test_get_tax_missing_province(self):
+        with self.assertRaises(ObjectDoesNotExist):
+            self.snapshot.get_tax(province="ZZ", country="CA")
+
+    def test_taxes_from_snapshot(self):
+        with self.assertNumQueries(0):
+            tax = Taxes(self.edmonton, reference=self.snapshot).get_tax_rate(Decimal("100.00"))
+        self.assertEqual(tax, Decimal("5.00"))
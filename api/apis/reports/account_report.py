@@ -5,16 +5,19 @@
         - End Date
     Created: August 19, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 import copy
+from datetime import datetime
 from decimal import Decimal
 
 from django.db.models import QuerySet
+from django.utils.timezone import utc
 
 from api.apis.reports.report_types.excel_report import ExcelReport
 from api.globals.carriers import AIR_CARRIERS, COURIERS_CARRIERS, LTL_CARRIERS, FTL_CARRIERS, SEALIFT_CARRIERS
+from api.models import SubAccount
 
 
 class AccountReport:
@@ -53,6 +56,24 @@ class AccountReport:
         "BBE Account"
     ]
 
+    @staticmethod
+    def get_queryset(sub_account: SubAccount, params) -> QuerySet:
+        """
+            Get the accounts created in the report date range.
+            :param sub_account: requesting sub account
+            :param params: report params: start_date and end_date
+            :return: SubAccount QuerySet
+        """
+        start_date = datetime.strptime(params["start_date"], "%Y-%m-%d").replace(tzinfo=utc)
+        end_date = datetime.strptime(params["end_date"], "%Y-%m-%d").replace(tzinfo=utc)
+
+        return SubAccount.objects.select_related(
+            "contact",
+            "address__province__country",
+            "tier",
+            "markup"
+        ).filter(creation_date__range=[start_date, end_date])
+
     @staticmethod
     def _get_account_data(accounts: QuerySet) -> list:
         ret = []
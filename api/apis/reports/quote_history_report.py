@@ -5,16 +5,19 @@
         - End Date
     Created: August 19, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 import copy
+from datetime import datetime, timedelta
 from decimal import Decimal
 
 from django.db.models import QuerySet
+from django.utils.timezone import utc
 
 from api.apis.reports.report_types.excel_report import ExcelReport
 from api.globals.carriers import AIR_CARRIERS, COURIERS_CARRIERS, LTL_CARRIERS, FTL_CARRIERS, SEALIFT_CARRIERS
+from api.models import RateLog, SubAccount
 
 
 class QuoteHistoryReport:
@@ -22,6 +25,7 @@ class QuoteHistoryReport:
         Quote History Report for all modes of transportation
     """
     _zero = Decimal("0.00")
+    _thirty_days = 30
 
     headings = [
         "id",
@@ -43,6 +47,37 @@ class QuoteHistoryReport:
         "Total",
     ]
 
+    @classmethod
+    def get_queryset(cls, sub_account: SubAccount, params) -> QuerySet:
+        """
+            Get the rate logs for the report filters, shared by the quote history by leg report.
+            :param sub_account: requesting sub account
+            :param params: report params: start_date, end_date, is_no_rate and, for BBE, account
+            :return: RateLog QuerySet
+        """
+
+        if 'end_date' in params:
+            end_date = datetime.strptime(params["end_date"], "%Y-%m-%d").replace(tzinfo=utc)
+        else:
+            end_date = datetime.now().replace(tzinfo=utc)
+
+        if 'start_date' in params:
+            start_date = datetime.strptime(params["start_date"], "%Y-%m-%d").replace(tzinfo=utc)
+        else:
+            start_date = end_date - timedelta(days=cls._thirty_days)
+
+        logs = RateLog.objects.select_related("sub_account__contact").filter(rate_date__range=[start_date, end_date])
+
+        if not sub_account.is_bbe:
+            logs = logs.filter(sub_account=sub_account)
+        elif 'account' in params:
+            logs = logs.filter(sub_account__subaccount_number=params["account"])
+
+        if 'is_no_rate' in params:
+            logs = logs.filter(is_no_rate=params["is_no_rate"])
+
+        return logs.order_by('-rate_date')
+
     @staticmethod
     def _process_data(response_data: dict, skip_carriers: list) -> list:
         rates = []
@@ -0,0 +1,407 @@
+"""
+    Title: Report Jobs
+    Description: This file will contain the background report jobs. A submit stores the report params on a job and
+                 queues the worker, the worker rebuilds the report queryset, records progress as rows are read and
+                 stores the report file on the job. An identical request reuses the pending or running job, or the
+                 completed job while its data is unchanged. A running job that has not saved progress within the stale
+                 timeout is queued again. The worker reads a data watermark (row count, last id, last modified date
+                 and, for shipments, last leg change and tracking update) before it builds the file, and reuses the
+                 file of a completed job with the same data until that job expires.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import base64
+import datetime
+import hashlib
+import json
+
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.db.models import Count, Max, QuerySet
+from django.utils import timezone
+
+from api.apis.reports.account_report import AccountReport
+from api.apis.reports.admin_shipment_overview_report import AdminShipmentOverviewReport
+from api.apis.reports.quote_history_by_leg_report import QuoteHistoryByLegReport
+from api.apis.reports.quote_history_report import QuoteHistoryReport
+from api.apis.reports.shipment_overview_report import ShipmentOverviewReportData
+from api.apis.reports.tracking_report import TrackingReportData
+from api.exceptions.project import ViewException
+from api.globals.project import LOGGER, MAX_CHAR_LEN
+from api.models import API, ReportJob, SubAccount
+
+
+class ReportProgress:
+    """
+        Queryset proxy that records on the job how many rows the report has read. Queryset methods return a proxy of
+        the new queryset, iterating reads the rows in chunks so prefetches are applied per chunk.
+    """
+
+    def __init__(self, job: ReportJob, queryset: QuerySet, step: int) -> None:
+        self._job = job
+        self._queryset = queryset
+        self._step = step
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._queryset, name)
+
+        if not callable(attr):
+            return attr
+
+        def proxy(*args, **kwargs):
+            ret = attr(*args, **kwargs)
+
+            if isinstance(ret, QuerySet):
+                return ReportProgress(job=self._job, queryset=ret, step=self._step)
+
+            return ret
+
+        return proxy
+
+    def __iter__(self):
+        return self.iterator()
+
+    def _save(self, rows: int) -> None:
+        self._job.rows = rows
+        ReportJob.objects.filter(pk=self._job.pk).update(rows=rows, modified_date=timezone.now())
+
+    def iterator(self, chunk_size: int = None):
+        """
+            Iterate the queryset in chunks and save the rows read every step.
+            :param chunk_size: rows per database fetch, defaults to the step
+            :return: generator of model objects
+        """
+        rows = 0
+
+        for obj in self._queryset.iterator(chunk_size=chunk_size or self._step):
+            rows += 1
+
+            if rows % self._step == 0:
+                self._save(rows=rows)
+
+            yield obj
+
+        self._save(rows=rows)
+
+
+class ReportJobs:
+    """
+        Submit, run and look up background report jobs.
+    """
+
+    _chunk_size = 500
+    _ttl = datetime.timedelta(days=1)
+    _stale = datetime.timedelta(minutes=30)
+
+    _shipment_watermark = {
+        "rows": Count("pk", distinct=True),
+        "last": Max("pk"),
+        "modified": Max("modified_date"),
+        "leg_modified": Max("leg_shipment__modified_date"),
+        "tracked": Max("leg_shipment__latest_status_datetime")
+    }
+    _row_watermark = {
+        "rows": Count("pk"),
+        "last": Max("pk"),
+        "modified": Max("modified_date")
+    }
+
+    # Report file functions: (queryset, params) to a file for the job, base64 reports are decoded.
+
+    @staticmethod
+    def _create_tracking(queryset, params: dict) -> File:
+        report = TrackingReportData().get_tracking(shipments=queryset, file_name="")
+        return ContentFile(base64.b64decode(report["file"]))
+
+    @staticmethod
+    def _create_quote_history(queryset, params: dict) -> File:
+        report = QuoteHistoryReport().get_rate_log(rate_logs=queryset, file_name="", mode=params.get("mode", "NA"))
+        return ContentFile(base64.b64decode(report["file"]))
+
+    @staticmethod
+    def _create_quote_history_by_leg(queryset, params: dict) -> File:
+        report = QuoteHistoryByLegReport().get_rate_log(rate_logs=queryset, file_name="")
+        return ContentFile(base64.b64decode(report["file"]))
+
+    @staticmethod
+    def _create_account(queryset, params: dict) -> File:
+        report = AccountReport().get_rate_log(accounts=queryset, file_name="")
+        return ContentFile(base64.b64decode(report["file"]))
+
+    @staticmethod
+    def _create_shipment_overview(queryset, params: dict) -> File:
+        return File(ShipmentOverviewReportData().get_shipment_overview_file(shipments=queryset))
+
+    @staticmethod
+    def _create_admin_shipment_overview(queryset, params: dict) -> File:
+        report = AdminShipmentOverviewReport().get_shipment_overview(shipments=queryset, file_name="")
+        return ContentFile(base64.b64decode(report["file"]))
+
+    # Report name: the api switch, BBE only, filter params, download name, queryset, watermark and file functions.
+    _reports = {
+        "tracking": {
+            "api": "TrackingReport",
+            "is_admin": False,
+            "params": ["start_date", "end_date", "account"],
+            "file_name": "tracking_{start_date}-{end_date}.xlsx",
+            "queryset": TrackingReportData.get_queryset,
+            "watermark": _shipment_watermark,
+            "create": _create_tracking,
+        },
+        "quote_history": {
+            "api": "QuoteHistoryAllReport",
+            "is_admin": False,
+            "params": ["start_date", "end_date", "account", "is_no_rate", "mode"],
+            "file_name": "quote_history_{start_date}-{end_date}.xlsx",
+            "queryset": QuoteHistoryReport.get_queryset,
+            "watermark": _row_watermark,
+            "create": _create_quote_history,
+        },
+        "quote_history_by_leg": {
+            "api": "QuoteHistoryByLegReport",
+            "is_admin": False,
+            "params": ["start_date", "end_date", "account", "is_no_rate"],
+            "file_name": "quote_history_by_leg_{start_date}-{end_date}.xlsx",
+            "queryset": QuoteHistoryReport.get_queryset,
+            "watermark": _row_watermark,
+            "create": _create_quote_history_by_leg,
+        },
+        "account": {
+            "api": "AccountReportApi",
+            "is_admin": True,
+            "params": ["start_date", "end_date"],
+            "file_name": "accounts_{start_date}-{end_date}.xlsx",
+            "queryset": AccountReport.get_queryset,
+            "watermark": _row_watermark,
+            "create": _create_account,
+        },
+        "shipment_overview": {
+            "api": "ShipmentOverviewReportApi",
+            "is_admin": False,
+            "params": ["start_date", "end_date", "account", "username"],
+            "file_name": "shipment_overview_{start_date}-{end_date}.xlsx",
+            "queryset": ShipmentOverviewReportData.get_queryset,
+            "watermark": _shipment_watermark,
+            "create": _create_shipment_overview,
+        },
+        "admin_shipment_overview": {
+            "api": "AdminShipmentOverviewReportApi",
+            "is_admin": True,
+            "params": ["start_date", "end_date", "account", "username"],
+            "file_name": "admin_shipment_overview_{start_date}-{end_date}.xlsx",
+            "queryset": ShipmentOverviewReportData.get_queryset,
+            "watermark": _shipment_watermark,
+            "create": _create_admin_shipment_overview,
+        },
+    }
+
+    @classmethod
+    def get_report_names(cls) -> list:
+        return list(cls._reports.keys())
+
+    def _get_report(self, report: str, sub_account: SubAccount) -> dict:
+        """
+            Get the report definition for a sub account.
+            :param report: report name
+            :param sub_account: requesting sub account
+            :return: report definition
+        """
+        errors = []
+        definition = self._reports.get(report)
+
+        if not definition or (definition["is_admin"] and not sub_account.is_bbe):
+            errors.append({"report": f"'{report}' is not a report."})
+            raise ViewException(code="3204", message="ReportJob: Report not found.", errors=errors)
+
+        if not API.objects.filter(name=definition["api"], active=True).exists():
+            errors.append({"report": f"'{report}' is not active."})
+            raise ViewException(code="3205", message="ReportJob: Report Api is not active.", errors=errors)
+
+        return definition
+
+    @staticmethod
+    def get_request_key(report: str, sub_account: SubAccount, params: dict) -> str:
+        """
+            Get the job request key: a hash of the report, sub account and filter params.
+            :param report: report name
+            :param sub_account: requesting sub account
+            :param params: report filter params
+            :return: sha256 hex digest
+        """
+        key = json.dumps([report, str(sub_account.subaccount_number), params], sort_keys=True, default=str)
+
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    @staticmethod
+    def get_cache_key(request_key: str, watermark: dict) -> str:
+        """
+            Get the job cache key: a hash of the request key and data watermark.
+            :param request_key: job request key
+            :param watermark: data watermark aggregate
+            :return: sha256 hex digest
+        """
+        key = json.dumps([request_key, watermark], sort_keys=True, default=str)
+
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    @staticmethod
+    def _get_watermark(definition: dict, sub_account: SubAccount, params: dict) -> tuple:
+        """
+            Get the report queryset and its data watermark.
+            :param definition: report definition
+            :param sub_account: requesting sub account
+            :param params: report filter params
+            :return: queryset and watermark aggregate
+        """
+        queryset = definition["queryset"](sub_account=sub_account, params=params)
+
+        return queryset, queryset.order_by().aggregate(**definition["watermark"])
+
+    def submit(self, report: str, sub_account: SubAccount, username: str, params: dict) -> ReportJob:
+        """
+            Get the job for a report request, an identical request reuses the pending or running job and a running
+            job without progress for the stale timeout is queued again. Otherwise the latest completed job is
+            returned while its data watermark matches. A new job is queued once the request commits.
+            :param report: report name
+            :param sub_account: requesting sub account
+            :param username: requesting username
+            :param params: report filter params
+            :return: ReportJob
+        """
+        from api.background_tasks.reports import CeleryReports
+
+        definition = self._get_report(report=report, sub_account=sub_account)
+        params = {key: params[key] for key in definition["params"] if params.get(key) not in (None, "")}
+        request_key = self.get_request_key(report=report, sub_account=sub_account, params=params)
+        now = timezone.now()
+
+        job = ReportJob.objects.filter(
+            request_key=request_key, status__in=[ReportJob.PENDING, ReportJob.RUNNING], expiry_date__gt=now
+        ).order_by("-creation_date").first()
+
+        if job:
+            is_requeued = ReportJob.objects.filter(
+                pk=job.pk, status=ReportJob.RUNNING, modified_date__lte=now - self._stale
+            ).update(status=ReportJob.PENDING, rows=0, modified_date=now)
+
+            if is_requeued:
+                LOGGER.warning(f"ReportJob: {job.job_id} {job.report} stale, queued again.")
+                job.refresh_from_db()
+                transaction.on_commit(lambda: CeleryReports.run_report_job.delay(job_id=str(job.job_id)))
+
+            return job
+
+        completed = ReportJob.objects.filter(
+            request_key=request_key, status=ReportJob.COMPLETE, expiry_date__gt=now
+        ).exclude(file="").order_by("-completed_date").first()
+
+        if completed:
+            _, watermark = self._get_watermark(definition=definition, sub_account=sub_account, params=params)
+
+            if completed.cache_key == self.get_cache_key(request_key=request_key, watermark=watermark):
+                return completed
+
+        job = ReportJob(
+            sub_account=sub_account,
+            username=username,
+            report=report,
+            params=params,
+            request_key=request_key,
+            file_name=definition["file_name"].format(**params),
+            expiry_date=now + self._ttl
+        )
+        job.save()
+
+        transaction.on_commit(lambda: CeleryReports.run_report_job.delay(job_id=str(job.job_id)))
+
+        return job
+
+    def run(self, job_id: str) -> None:
+        """
+            Generate the report file for a pending job, a job claimed by another worker is skipped. The file of a
+            completed job with the same data watermark is reused.
+            :param job_id: report job id
+            :return: None
+        """
+
+        is_claimed = ReportJob.objects.filter(job_id=job_id, status=ReportJob.PENDING).update(
+            status=ReportJob.RUNNING, modified_date=timezone.now()
+        )
+
+        if not is_claimed:
+            return None
+
+        job = ReportJob.objects.select_related("sub_account").get(job_id=job_id)
+        definition = self._reports[job.report]
+
+        try:
+            queryset, watermark = self._get_watermark(
+                definition=definition, sub_account=job.sub_account, params=job.params
+            )
+            job.cache_key = self.get_cache_key(request_key=job.request_key, watermark=watermark)
+            job.total = watermark["rows"]
+            ReportJob.objects.filter(pk=job.pk).update(
+                cache_key=job.cache_key, total=job.total, modified_date=timezone.now()
+            )
+
+            completed = ReportJob.objects.filter(
+                cache_key=job.cache_key, status=ReportJob.COMPLETE, expiry_date__gt=timezone.now()
+            ).exclude(file="").order_by("-completed_date").first()
+
+            if completed:
+                job.file = completed.file.name
+                job.rows = completed.rows
+                job.status = ReportJob.COMPLETE
+                job.completed_date = timezone.now()
+                job.save()
+                return None
+
+            with definition["create"](
+                ReportProgress(job=job, queryset=queryset, step=self._chunk_size), job.params
+            ) as file:
+                job.file.save(job.file_name, file, save=False)
+
+            job.status = ReportJob.COMPLETE
+            job.completed_date = timezone.now()
+            job.save()
+        except Exception as e:
+            LOGGER.critical(f"ReportJob: {job.job_id} {job.report} failed: {str(e)}")
+            job.status = ReportJob.FAILED
+            job.message = str(e)[:MAX_CHAR_LEN]
+            job.save()
+
+        return None
+
+    @staticmethod
+    def get_job(sub_account: SubAccount, job_id: str) -> ReportJob:
+        """
+            Get a report job of the sub account.
+            :param sub_account: requesting sub account
+            :param job_id: report job id
+            :return: ReportJob
+        """
+
+        try:
+            return ReportJob.objects.get(job_id=job_id, sub_account=sub_account)
+        except ObjectDoesNotExist:
+            errors = [{"job_id": f"'{job_id}' not found."}]
+            raise ViewException(code="3206", message="ReportJob: Job not found.", errors=errors)
+
+    @staticmethod
+    def clear_expired() -> int:
+        """
+            Delete expired jobs and their files, a file reused by a job that has not expired is kept.
+            :return: number of jobs deleted
+        """
+        now = timezone.now()
+        jobs = list(ReportJob.objects.filter(expiry_date__lte=now))
+
+        for job in jobs:
+            if job.file and not ReportJob.objects.filter(file=job.file.name, expiry_date__gt=now).exists():
+                job.file.delete(save=False)
+
+        return ReportJob.objects.filter(pk__in=[job.pk for job in jobs]).delete()[0]
@@ -3,11 +3,12 @@
     Description: This file will contain class of functions to create a excel report from passed in data.
     Created: April  26, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 import base64
 import io
+import tempfile
 
 import xlsxwriter
 
@@ -16,7 +17,7 @@ from api.globals.project import LOGGER
 
 class ExcelReport:
 
-    def __init__(self, data: list, headings: list):
+    def __init__(self, data, headings: list):
 
         self.height = 2
         self._data = data
@@ -64,10 +65,9 @@ class ExcelReport:
         """
         start_row = 1
 
-        # Iterate over the data and write it out row by row.
-        for i in range(len(self._data)):
-            for j in range(len(self._data[i])):
-                worksheet.write(i + start_row, j, self._data[i][j])
+        # Iterate over the data and write it out row by row, data may be a list or an iterator of rows.
+        for i, row in enumerate(self._data):
+            worksheet.write_row(i + start_row, 0, row)
 
     def _create_data_section_tracking_leg(self, worksheet):
         """
@@ -152,3 +152,23 @@ class ExcelReport:
         output.seek(0)
 
         return base64.b64encode(output.getvalue()).decode()
+
+    def create_report_file(self):
+        """
+            Create excel report for headers and data into a temporary file. The workbook is written in constant
+            memory mode, each row is flushed to disk once the next row starts, so data may be an iterator of rows
+            and is never held in memory.
+            :return: temporary file positioned at the start, deleted when closed
+        """
+        output = tempfile.TemporaryFile(suffix=".xlsx")
+        workbook = xlsxwriter.Workbook(output, {"constant_memory": True})
+        worksheet = workbook.add_worksheet()
+
+        self._init_style(workbook=workbook)
+        self._create_header(worksheet=worksheet)
+        self._create_data_section(worksheet=worksheet)
+
+        workbook.close()
+        output.seek(0)
+
+        return output
@@ -5,16 +5,16 @@
         - End Date
     Created: June 16, 2022
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
+from datetime import datetime
 from decimal import Decimal
-from django.db.models import QuerySet
-from django.db.models.aggregates import Sum
-from django.db.models.expressions import F
+from django.db.models import Prefetch, QuerySet
+from django.utils.timezone import utc
 
 from api.apis.reports.report_types.excel_report import ExcelReport
-from api.models import Shipment
+from api.models import Leg, Package, Shipment, SubAccount
 
 
 class ShipmentOverviewReportData:
@@ -22,6 +22,7 @@ class ShipmentOverviewReportData:
         Shipment Metric Api
     """
     _zero = Decimal("0.00")
+    _chunk_size = 500
 
     headings = [
         "ID",
@@ -94,6 +95,61 @@ class ShipmentOverviewReportData:
     def __init__(self, is_price_hide: bool = False):
         self.is_price_hide = is_price_hide
 
+    @staticmethod
+    def get_queryset(sub_account: SubAccount, params) -> QuerySet:
+        """
+            Get the shipped shipments for the report filters, shared by the admin shipment overview report.
+            :param sub_account: requesting sub account
+            :param params: report params: start_date, end_date, username and, for BBE, account
+            :return: Shipment QuerySet
+        """
+        start_date = datetime.strptime(params["start_date"], "%Y-%m-%d").replace(tzinfo=utc)
+        end_date = datetime.strptime(params["end_date"], "%Y-%m-%d").replace(tzinfo=utc)
+
+        shipments = Shipment.objects.select_related(
+            "origin__province__country",
+            "destination__province__country",
+            "receiver",
+            "sender",
+            "subaccount__contact"
+        ).prefetch_related(
+            "leg_shipment__carrier",
+            "leg_shipment__origin__province__country",
+            "leg_shipment__destination__province__country",
+            "package_shipment"
+        ).filter(creation_date__range=[start_date, end_date], is_shipped=True)
+
+        if not sub_account.is_bbe:
+            shipments = shipments.filter(subaccount=sub_account)
+        elif 'account' in params:
+            shipments = shipments.filter(subaccount__subaccount_number=params["account"])
+
+        if 'username' in params:
+            shipments = shipments.filter(username=params["username"])
+
+        return shipments
+
+    @staticmethod
+    def _get_shipments(shipments: QuerySet) -> QuerySet:
+        """
+            Replace the shipment prefetches with the lookups the report reads: legs in leg order with their carrier
+            and address provinces, and only the package quantity and weight for the totals.
+            :param shipments: Shipment QuerySet
+            :return: Shipment QuerySet
+        """
+        return shipments.select_related(
+            "sender",
+            "origin__province",
+            "destination__province"
+        ).prefetch_related(None).prefetch_related(
+            Prefetch("leg_shipment", queryset=Leg.objects.select_related(
+                "carrier",
+                "origin__province",
+                "destination__province"
+            ).order_by("pk")),
+            Prefetch("package_shipment", queryset=Package.objects.only("shipment_id", "quantity", "weight"))
+        )
+
     def _create_shipment_data(self, shipment: Shipment) -> list:
         creation_date = shipment.creation_date.strftime("%Y-%m-%d")
 
@@ -103,7 +159,7 @@ class ShipmentOverviewReportData:
         if len(legs) == 1:
             leg_list.append(["", "", "", "", "", "", "", "", "", "", "", "", "", ""])
         elif len(legs) > 1:
-            first_leg = legs.first()
+            first_leg = legs[0]
 
             if first_leg.type == "M":
                 leg_list.append(["", "", "", "", "", "", "", "", "", "", "", "", "", ""])
@@ -146,13 +202,12 @@ class ShipmentOverviewReportData:
                 "-" if self.is_price_hide else leg_pre_tax.quantize(Decimal("0.01"))
             ])
 
-        package_data = shipment.package_shipment.all().aggregate(
-            total_packages=Sum('quantity'),
-            total_weight=Sum(F('quantity') * F('weight'))
-        )
+        total_qty = Decimal("0")
+        total_weight = Decimal("0")
 
-        total_qty = package_data["total_packages"] if package_data.get("total_packages") else Decimal("0")
-        total_weight = package_data["total_weight"] if package_data.get("total_weight") else Decimal("0")
+        for package in shipment.package_shipment.all():
+            total_qty += package.quantity
+            total_weight += package.quantity * package.weight
 
         ret = [
             shipment.shipment_id,
@@ -184,13 +239,18 @@ class ShipmentOverviewReportData:
 
         return ret
 
-    def _get_shipment_overview_data(self, shipments) -> list:
-        ret = []
-
-        for shipment in shipments:
-            ret.append(self._create_shipment_data(shipment=shipment))
+    def _iter_shipment_overview_data(self, shipments: QuerySet):
+        """
+            Yield shipment overview rows, shipments are fetched in chunks with their legs and packages prefetched
+            per chunk.
+            :param shipments: Shipment QuerySet
+            :return: generator of rows
+        """
+        for shipment in self._get_shipments(shipments=shipments).iterator(chunk_size=self._chunk_size):
+            yield self._create_shipment_data(shipment=shipment)
 
-        return ret
+    def _get_shipment_overview_data(self, shipments) -> list:
+        return list(self._iter_shipment_overview_data(shipments=shipments))
 
     def get_shipment_overview(self, shipments: QuerySet, file_name: str) -> dict:
         """
@@ -206,4 +266,15 @@ class ShipmentOverviewReportData:
             "type": "excel",
             "file": sheet,
             "filename": file_name
-        }
\ No newline at end of file
+        }
+
+    def get_shipment_overview_file(self, shipments: QuerySet):
+        """
+            Get Shipment Overview Report as an excel file, rows are streamed from the database into a constant
+            memory workbook.
+            :param shipments: Shipment QuerySet
+            :return: temporary excel file, deleted when closed
+        """
+        data = self._iter_shipment_overview_data(shipments=shipments)
+
+        return ExcelReport(headings=self.headings, data=data).create_report_file()
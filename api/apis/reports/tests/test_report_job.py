@@ -0,0 +1,222 @@
+import datetime
+import shutil
+import tempfile
+from unittest import mock
+
+import openpyxl
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from api.apis.reports.report_job import ReportJobs
+from api.exceptions.project import ViewException
+from api.models import API, Leg, ReportJob, Shipment, SubAccount
+
+
+class ReportJobTests(TestCase):
+    fixtures = [
+        "carriers",
+        "countries",
+        "provinces",
+        "user",
+        "group",
+        "contact",
+        "addresses",
+        "markup",
+        "account",
+        "subaccount",
+        "shipments",
+        "legs",
+    ]
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        settings = override_settings(MEDIA_ROOT=self.media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        for name in ["ShipmentOverviewReportApi", "AdminShipmentOverviewReportApi", "TrackingReport"]:
+            API.objects.create(name=name, active=True)
+
+        self.jobs = ReportJobs()
+        self.sub_account = SubAccount.objects.get(pk=1)
+        self.params = {"start_date": "2026-10-01", "end_date": "2026-10-02"}
+        Shipment.objects.update(creation_date=datetime.datetime(2026, 10, 1, 15, tzinfo=timezone.utc), is_shipped=True)
+
+    def _submit(self, report: str = "shipment_overview") -> ReportJob:
+        return self.jobs.submit(report=report, sub_account=self.sub_account, username="test", params=self.params)
+
+    @staticmethod
+    def _copy(job: ReportJob) -> ReportJob:
+        return ReportJob.objects.create(
+            sub_account=job.sub_account,
+            username=job.username,
+            report=job.report,
+            params=job.params,
+            request_key=job.request_key,
+            file_name=job.file_name,
+            expiry_date=job.expiry_date
+        )
+
+    def test_submit(self):
+        job = self._submit()
+
+        self.assertEqual(job.status, ReportJob.PENDING)
+        self.assertEqual(job.cache_key, "")
+        self.assertEqual(job.file_name, "shipment_overview_2026-10-01-2026-10-02.xlsx")
+        self.assertEqual(job.params, self.params)
+        self.assertGreater(job.expiry_date, timezone.now())
+
+    def test_submit_reuses_pending_job(self):
+        job = self._submit()
+
+        self.assertEqual(self._submit().pk, job.pk)
+
+    def test_submit_requeues_stale_job(self):
+        job = self._submit()
+        ReportJob.objects.filter(pk=job.pk).update(status=ReportJob.RUNNING, rows=10)
+
+        self.assertEqual(self._submit().status, ReportJob.RUNNING)
+
+        ReportJob.objects.filter(pk=job.pk).update(modified_date=timezone.now() - datetime.timedelta(hours=1))
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            requeued = self._submit()
+
+        self.assertEqual(requeued.pk, job.pk)
+        self.assertEqual(requeued.status, ReportJob.PENDING)
+        self.assertEqual(requeued.rows, 0)
+        self.assertEqual(len(callbacks), 1)
+
+    def test_submit_reuses_completed_job_until_data_changes(self):
+        job = self._submit()
+        self.jobs.run(job_id=str(job.job_id))
+        job.refresh_from_db()
+
+        reused = self._submit()
+
+        self.assertEqual(reused.pk, job.pk)
+        self.assertEqual(reused.status, ReportJob.COMPLETE)
+
+        Leg.objects.filter(pk=1).update(latest_status_datetime=timezone.now())
+        tracked = self._submit()
+
+        self.assertNotEqual(tracked.pk, job.pk)
+        self.assertEqual(tracked.status, ReportJob.PENDING)
+
+        self.jobs.run(job_id=str(tracked.job_id))
+        tracked.refresh_from_db()
+
+        self.assertNotEqual(tracked.cache_key, job.cache_key)
+        self.assertNotEqual(tracked.file.name, job.file.name)
+        self.assertEqual(self._submit().pk, tracked.pk)
+
+        shipment = Shipment.objects.first()
+        shipment.save()
+        edited = self._submit()
+
+        self.assertNotEqual(edited.pk, tracked.pk)
+
+    def test_run_reuses_file(self):
+        job = self._submit()
+        self.jobs.run(job_id=str(job.job_id))
+        job.refresh_from_db()
+
+        reused = self._copy(job=job)
+        self.jobs.run(job_id=str(reused.job_id))
+        reused.refresh_from_db()
+
+        self.assertEqual(reused.status, ReportJob.COMPLETE)
+        self.assertEqual(reused.cache_key, job.cache_key)
+        self.assertEqual(reused.file.name, job.file.name)
+
+    def test_submit_skips_failed_and_expired_jobs(self):
+        job = self._submit()
+        ReportJob.objects.filter(pk=job.pk).update(status=ReportJob.FAILED)
+        retry = self._submit()
+
+        self.assertNotEqual(retry.pk, job.pk)
+
+        ReportJob.objects.filter(pk=retry.pk).update(expiry_date=timezone.now())
+
+        self.assertNotEqual(self._submit().pk, retry.pk)
+
+    def test_submit_admin_report(self):
+        with self.assertRaises(ViewException):
+            self._submit(report="admin_shipment_overview")
+
+        SubAccount.objects.filter(pk=self.sub_account.pk).update(is_bbe=True)
+        self.sub_account.refresh_from_db()
+
+        self.assertEqual(self._submit(report="admin_shipment_overview").report, "admin_shipment_overview")
+
+    def test_submit_inactive_report(self):
+        API.objects.filter(name="TrackingReport").update(active=False)
+
+        with self.assertRaises(ViewException):
+            self._submit(report="tracking")
+
+    def test_run(self):
+        job = self._submit()
+        self.jobs.run(job_id=str(job.job_id))
+        job.refresh_from_db()
+
+        self.assertEqual(job.status, ReportJob.COMPLETE)
+        self.assertEqual(job.progress, 100)
+        self.assertEqual(job.rows, job.total)
+
+        with job.file.open("rb") as file:
+            rows = list(openpyxl.load_workbook(file, read_only=True).active.iter_rows(values_only=True))
+
+        self.assertEqual(len(rows), job.total + 1)
+
+    def test_run_base64_report(self):
+        job = self._submit(report="tracking")
+        self.jobs.run(job_id=str(job.job_id))
+        job.refresh_from_db()
+
+        self.assertEqual(job.status, ReportJob.COMPLETE)
+        self.assertEqual(job.rows, job.total)
+        self.assertTrue(job.file.size > 0)
+
+    def test_run_file_save_failed(self):
+        job = self._submit()
+
+        with mock.patch("django.db.models.fields.files.FieldFile.save", side_effect=OSError("Disk full")):
+            self.jobs.run(job_id=str(job.job_id))
+
+        job.refresh_from_db()
+
+        self.assertEqual(job.status, ReportJob.FAILED)
+        self.assertEqual(job.message, "Disk full")
+
+    def test_run_claimed_job(self):
+        job = self._submit()
+        ReportJob.objects.filter(pk=job.pk).update(status=ReportJob.RUNNING)
+        self.jobs.run(job_id=str(job.job_id))
+        job.refresh_from_db()
+
+        self.assertEqual(job.status, ReportJob.RUNNING)
+        self.assertFalse(job.file)
+
+    def test_clear_expired(self):
+        job = self._submit()
+        self.jobs.run(job_id=str(job.job_id))
+        job.refresh_from_db()
+        path = job.file.path
+        ReportJob.objects.filter(pk=job.pk).update(expiry_date=timezone.now() - datetime.timedelta(minutes=1))
+
+        self.assertEqual(ReportJobs.clear_expired(), 1)
+        self.assertFalse(ReportJob.objects.filter(pk=job.pk).exists())
+        self.assertFalse(job.file.storage.exists(path))
+
+    def test_clear_expired_keeps_reused_file(self):
+        job = self._submit()
+        self.jobs.run(job_id=str(job.job_id))
+        reused = self._copy(job=job)
+        self.jobs.run(job_id=str(reused.job_id))
+        reused.refresh_from_db()
+        ReportJob.objects.filter(pk=job.pk).update(expiry_date=timezone.now() - datetime.timedelta(minutes=1))
+
+        self.assertEqual(ReportJobs.clear_expired(), 1)
+        self.assertTrue(reused.file.storage.exists(reused.file.path))
@@ -0,0 +1,80 @@
+import base64
+import io
+from decimal import Decimal
+
+import openpyxl
+from django.test import TestCase
+
+from api.apis.reports.shipment_overview_report import ShipmentOverviewReportData
+from api.models import Leg, Package, Shipment
+
+
+class ShipmentOverviewReportTests(TestCase):
+    fixtures = [
+        "carriers",
+        "countries",
+        "provinces",
+        "user",
+        "group",
+        "contact",
+        "addresses",
+        "markup",
+        "account",
+        "subaccount",
+        "shipments",
+        "legs",
+    ]
+
+    def setUp(self):
+        self.report = ShipmentOverviewReportData()
+        shipment = Shipment.objects.get(pk=1)
+
+        for i, weight in enumerate((Decimal("10.50"), Decimal("2.25"))):
+            Package.objects.create(
+                shipment=shipment,
+                package_id=f"{shipment.shipment_id}-{i}",
+                width=Decimal("10"),
+                length=Decimal("10"),
+                height=Decimal("10"),
+                weight=weight,
+                quantity=2,
+                package_type="BOX",
+                description="Test"
+            )
+
+    @staticmethod
+    def _read(file) -> list:
+        sheet = openpyxl.load_workbook(file, read_only=True).active
+        return [list(row) for row in sheet.iter_rows(values_only=True)]
+
+    def test_file_matches_base64_report(self):
+        shipments = Shipment.objects.order_by("pk")
+
+        report = self.report.get_shipment_overview(shipments=shipments, file_name="test.xlsx")
+        with self.report.get_shipment_overview_file(shipments=shipments) as file:
+            rows = self._read(file=file)
+
+        self.assertEqual(rows, self._read(file=io.BytesIO(base64.b64decode(report["file"]))))
+        self.assertEqual(rows[0], self.report.headings)
+        self.assertEqual(len(rows), Shipment.objects.count() + 1)
+
+    def test_package_totals(self):
+        rows = self.report._get_shipment_overview_data(shipments=Shipment.objects.filter(pk=1))
+
+        self.assertEqual(rows[0][14], Decimal("4.00"))
+        self.assertEqual(rows[0][15], Decimal("25.50"))
+
+    def test_multi_leg_padding(self):
+        Leg.objects.filter(pk=2).update(shipment_id=1, type="D")
+        rows = self.report._get_shipment_overview_data(shipments=Shipment.objects.filter(pk=1))
+
+        self.assertEqual(rows[0][23:37], [""] * 14)
+        self.assertEqual(rows[0][37], Leg.objects.get(pk=1).leg_id)
+        self.assertEqual(rows[0][51], Leg.objects.get(pk=2).leg_id)
+
+    def test_queries_do_not_grow_with_shipments(self):
+        # Shipments with select related lookups, then one leg and one package query per chunk.
+        with self.assertNumQueries(3):
+            rows = self.report._get_shipment_overview_data(shipments=Shipment.objects.all())
+
+        self.assertEqual(len(rows), Shipment.objects.count())
@@ -5,21 +5,24 @@
         - End Date
     Created: July 23, 2020
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
+from datetime import datetime, timedelta
 
 from dateutil.tz import tz
 from django.db.models import QuerySet
+from django.utils.timezone import utc
 
 from api.apis.reports.report_types.excel_report import ExcelReport
-from api.models import TrackingStatus
+from api.models import Shipment, SubAccount, TrackingStatus
 
 
 class TrackingReportData:
     """
         Shipment Metric Api
     """
+    _thirty_days = 30
 
     headings = [
         "Account",
@@ -85,6 +88,44 @@ class TrackingReportData:
         "D: Transit Hours",
     ]
 
+    @classmethod
+    def get_queryset(cls, sub_account: SubAccount, params) -> QuerySet:
+        """
+            Get the shipments for the report filters.
+            :param sub_account: requesting sub account
+            :param params: report params: start_date, end_date and, for BBE, account
+            :return: Shipment QuerySet
+        """
+
+        if 'end_date' in params:
+            end_date = datetime.strptime(params["end_date"], "%Y-%m-%d").replace(tzinfo=utc)
+        else:
+            end_date = datetime.now().replace(tzinfo=utc)
+
+        if 'start_date' in params:
+            start_date = datetime.strptime(params["start_date"], "%Y-%m-%d").replace(tzinfo=utc)
+        else:
+            start_date = end_date - timedelta(days=cls._thirty_days)
+
+        shipments = Shipment.objects.select_related(
+            "origin__province__country",
+            "destination__province__country",
+            "subaccount__contact"
+        ).prefetch_related(
+            "leg_shipment__carrier",
+            "leg_shipment__origin__province__country",
+            "leg_shipment__destination__province__country"
+        ).filter(
+            creation_date__range=[start_date, end_date]
+        )
+
+        if not sub_account.is_bbe:
+            shipments = shipments.filter(subaccount=sub_account)
+        elif 'account' in params:
+            shipments = shipments.filter(subaccount__subaccount_number=params["account"])
+
+        return shipments
+
     def _get_leg_data(self, shipment) -> tuple:
         leg_list = []
         legs = shipment.leg_shipment.all()
@@ -2,8 +2,7 @@ import datetime
 from decimal import Decimal
 from typing import Union, List
 
-import numexpr
-
+from api.apis.services.carrier_options.option_expression import OptionExpression
 from api.apis.services.carrier_options.option_utilities import check_carrier, date_check, min_max_update
 from api.exceptions.services import CarrierOptionException
 from api.general.convert import Convert
@@ -26,14 +25,25 @@ class CarrierOptions:
     @staticmethod
     def get_calculated_option_costs(carrier: Union[Carrier, int], options: list, actual: Decimal, cubic: Decimal,
                                     freight: Decimal, date: datetime.datetime) -> List[dict]:
+        """
+            Get the costs of the chosen carrier options.
+            :param carrier: Carrier or carrier code
+            :param options: chosen option ids
+            :param actual: actual weight
+            :param cubic: cubic volume
+            :param freight: freight cost
+            :param date: rate date
+            :return: list of option costs
+        """
         if not options:
             return []
         carrier = check_carrier(carrier)
         dimensional = float(cubic * carrier.linear_weight)
         actual = float(Convert().kgs_to_lbs(actual))
-        weight = max(dimensional, actual)  # pylint: disable=unused-variable
-        freight = float(freight)  # pylint: disable=unused-variable
-        carrier_options = CarrierOption.objects.filter(carrier=carrier, option_id__in=options)
+        weight = max(dimensional, actual)
+        freight = float(freight)
+        cubic = float(cubic)
+        carrier_options = CarrierOption.objects.select_related("option").filter(carrier=carrier, option_id__in=options)
 
         if not carrier_options:
             raise CarrierOptionException({"carrier_option.carrier.content": "'" + carrier.name + "' has no options"})
@@ -41,7 +51,9 @@ class CarrierOptions:
 
         for option in carrier_options:
             date_check(date, option.start_date, option.end_date)
-            value = Decimal(numexpr.evaluate(option.evaluation_expression).item()).quantize(Decimal("0.01"))
+            value = OptionExpression.evaluate(
+                option=option, actual=actual, cubic=cubic, dimensional=dimensional, weight=weight, freight=freight
+            )
             processed_carrier_options.append({
                 "name": option.option.name,
                 "cost": min_max_update(value, option.minimum_value, option.maximum_value),
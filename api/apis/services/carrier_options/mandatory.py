@@ -1,9 +1,10 @@
 from datetime import datetime
 from decimal import Decimal
+from functools import partial
 from typing import Union
 
-import numexpr
-
+from api.apis.services.carrier_options.option_applicability import OptionApplicability
+from api.apis.services.carrier_options.option_expression import OptionExpression
 from api.apis.services.carrier_options.option_utilities import check_carrier, date_check, min_max_update
 from api.exceptions.services import CarrierOptionException, OptionNotApplicableException
 from api.general.convert import Convert
@@ -27,17 +28,16 @@ class Mandatory:
         if not applies:
             raise OptionNotApplicableException({"option.invalid": "Option does not apply"})
 
-    # pylint:disable=unused-argument
     @staticmethod
-    def _evaluate_expression(option: MandatoryOption, actual: float, dimensional: float, weight: float, freight: float,
-                             date: datetime) -> Decimal:
+    def _evaluate_expression(option: MandatoryOption, actual: float, cubic: float, dimensional: float, weight: float,
+                             freight: float, date: datetime) -> Decimal:
         date_check(date, option.start_date, option.end_date)
-        value = Decimal(numexpr.evaluate(option.evaluation_expression).item()).quantize(Decimal("0.01"))
+        value = OptionExpression.evaluate(
+            option=option, actual=actual, cubic=cubic, dimensional=dimensional, weight=weight, freight=freight
+        )
 
         return min_max_update(value, option.minimum_value, option.maximum_value)
 
-    # pylint:enable=unused-argument
-
     @staticmethod
     def _long_freight(request: dict) -> None:
         for package in request["packages"]:
@@ -75,85 +75,61 @@ class Mandatory:
         if not applies:
             raise OptionNotApplicableException({"option.invalid": "Option does not apply"})
 
-        if API.objects.get(name="NorthernRoadBan").active:
+        reference = request.get("reference")
+
+        if reference:
+            is_active = reference.is_active(api_name="NorthernRoadBan")
+        else:
+            is_active = API.objects.get(name="NorthernRoadBan").active
+
+        if is_active:
             return Decimal("0.00")
         raise OptionNotApplicableException({"option.invalid": "Option does not apply"})
 
-    def _deh_cho(self, request: dict) -> None:
-        if request["destination"]["city"] not in self._destinations:
+    @classmethod
+    def _deh_cho(cls, request: dict) -> None:
+        if request["destination"]["city"] not in cls._destinations:
             raise OptionNotApplicableException({"option.implementation": "Option not supported"})
 
-    def _get_calculated_mandatory_option_cost(self, option: MandatoryOption, request: dict, actual: float,
-                                              dimensional: float, weight: float, freight: float,
-                                              date: datetime) -> dict:
+    @staticmethod
+    def _residential_pickup(request: dict) -> None:
+        if request["origin"].get("has_shipping_bays", True):
+            raise OptionNotApplicableException({"option.invalid": "Option does not apply"})
+
+    @staticmethod
+    def _residential_delivery(request: dict) -> None:
+        if request["destination"].get("has_shipping_bays", True):
+            raise OptionNotApplicableException({"option.invalid": "Option does not apply"})
+
+    @staticmethod
+    def _dangerous_goods(request: dict) -> None:
+        if not request.get("is_dg_shipment", False):
+            raise OptionNotApplicableException({"option.invalid": "Option does not apply"})
+
+    # pylint:disable=unused-argument
+    @staticmethod
+    def _always(request: dict) -> None:
+        return None
+
+    # pylint:enable=unused-argument
+
+    def _get_calculated_mandatory_option_cost(self, option: MandatoryOption, applicability: OptionApplicability,
+                                              actual: float, cubic: float, dimensional: float, weight: float,
+                                              freight: float, date: datetime) -> dict:
         option_name = option.option.name
 
-        if option_name == "AB Carbon Tax":
-            self._ca_province_carbon_tax(province="AB", request=request)
-        elif option_name == "BC Carbon Tax":
-            self._ca_province_carbon_tax(province="BC", request=request)
-        elif option_name == "MB Carbon Tax":
-            self._ca_province_carbon_tax(province="MB", request=request)
-        elif option_name == "NB Carbon Tax":
-            self._ca_province_carbon_tax(province="NB", request=request)
-        elif option_name == "NF Carbon Tax":
-            self._ca_province_carbon_tax(province="NL", request=request)
-        elif option_name == "NT Carbon Tax":
-            self._ca_province_carbon_tax(province="NT", request=request)
-        elif option_name == "NS Carbon Tax":
-            self._ca_province_carbon_tax(province="NS", request=request)
-        elif option_name == "NU Carbon Tax":
-            self._ca_province_carbon_tax(province="NU", request=request)
-        elif option_name == "ON Carbon Tax":
-            self._ca_province_carbon_tax(province="ON", request=request)
-        elif option_name == "PE Carbon Tax":
-            self._ca_province_carbon_tax(province="PE", request=request)
-        elif option_name == "QC Carbon Tax":
-            self._ca_province_carbon_tax(province="QC", request=request)
-        elif option_name == "SK Carbon Tax":
-            self._ca_province_carbon_tax(province="SK", request=request)
-        elif option_name == "YT Carbon Tax":
-            self._ca_province_carbon_tax(province="YT", request=request)
-        elif option_name == "Deh Cho Bridge":
-            self._deh_cho(request)
-        elif option_name == "Long Freight":
-            self._long_freight(request)
-        elif option_name == "Northern Road Ban":
-            self._road_ban(request)
-        elif option_name == "Newfoundland Ferry":
-            self._nl_ship(request)
-        elif option_name == "Residential Pickup" and not request["origin"].get("has_shipping_bays", True):
-            pass
-        elif option_name == "Residential Delivery" and not request["destination"].get("has_shipping_bays", True):
-            pass
-        elif option_name == "Weekend or Holiday Pickup":
-            self._w_or_h_pu(request)
-        elif option_name == "Dangerous Goods" and request.get("is_dg_shipment", False):
-            pass
-        elif option_name == "Fuel Surcharge":
-            pass
-        elif option_name == "Nav Canada":
-            pass
-        elif option_name == "Carbon Tax":
-            pass
-        elif option_name == "Domestic Handling fee":
-            pass
-        elif option_name == "Cargo Screening":
-            pass
-        elif option_name == "Administration Fee":
-            pass
-        elif option_name == "Pickup Charge":
-            pass
-        else:
+        if not applicability.applies(option_name=option_name):
             raise OptionNotApplicableException({"option.invalid": "Option does not apply"})
+
         return {
             "name": option_name,
-            "cost": self._evaluate_expression(option, actual, dimensional, weight, freight, date),
+            "cost": self._evaluate_expression(option, actual, cubic, dimensional, weight, freight, date),
             "percentage": option.percentage
         }
 
     # Keep commented code. Pending future implementation/integration.
-    def _w_or_h_pu(self, request: dict) -> None:
+    @staticmethod
+    def _w_or_h_pu(request: dict) -> None:
         raise OptionNotApplicableException({"option.implementation": "Option not supported"})
         # if request.get("Service", {}).get("Pickup") is not None:
         #     pu_date = datetime.strptime(request["Pickup"]["Date"], "%Y-%m-%d")
@@ -163,7 +139,8 @@ class Mandatory:
         #     return None
         # raise OptionNotApplicableException({"option.invalid": "Option does not apply"})
 
-    def _get_carbon_tax(self, carbon_tax, request, actual, dimensional,weight, freight, date) -> dict:
+    def _get_carbon_tax(self, carbon_tax, request, applicability, actual, cubic, dimensional, weight, freight,
+                        date) -> dict:
         """
             Get carbon tax for an carrier, if multiple carbon tax get the highest percentage.
             :return:
@@ -175,7 +152,7 @@ class Mandatory:
         if len(carbon_tax) == 1:
             try:
                 carbon_cost = self._get_calculated_mandatory_option_cost(
-                    carbon_tax[0], request, actual, dimensional, weight, freight, date
+                    carbon_tax[0], applicability, actual, cubic, dimensional, weight, freight, date
                 )
             except CarrierOptionException:
                 return {}
@@ -193,7 +170,7 @@ class Mandatory:
 
         try:
             carbon_cost = self._get_calculated_mandatory_option_cost(
-                highest, request, actual, dimensional, weight, freight, date
+                highest, applicability, actual, cubic, dimensional, weight, freight, date
             )
         except CarrierOptionException:
             return {}
@@ -203,32 +180,90 @@ class Mandatory:
         return carbon_cost
 
     def get_calculated_option_costs(self, carrier: Union[Carrier, int], request: dict, actual: Decimal, cubic: Decimal,
-                                    freight: Decimal, date: datetime) -> list:
+                                    freight: Decimal, date: datetime,
+                                    applicability: OptionApplicability = None) -> list:
+        """
+            Get the mandatory option costs for a carrier, options that do not apply to the request are filtered out
+            before any cost is evaluated.
+            :param carrier: Carrier or carrier code
+            :param request: mandatory request: origin, destination, packages, is_dg_shipment and reference
+            :param actual: actual weight
+            :param cubic: cubic volume
+            :param freight: freight cost
+            :param date: rate date
+            :param applicability: request applicability, pass the same one for every rate of a request
+            :return: list of option costs
+        """
         carrier = check_carrier(carrier)
         dimensional = float(cubic * carrier.linear_weight)
         actual = float(Convert().kgs_to_lbs(actual))
         weight = max(dimensional, actual)
         freight = float(freight)
+        cubic = float(cubic)
         processed_carrier_options = []
         carbon_tax = []
+        options = []
 
-        for option in MandatoryOption.objects.filter(carrier=carrier):
+        if applicability is None:
+            applicability = OptionApplicability(request=request)
+
+        for option in MandatoryOption.objects.select_related("option").filter(carrier=carrier):
 
             if "Carbon Tax" in option.option.name:
                 carbon_tax.append(option)
-                continue
+            else:
+                options.append(option)
+
+        for option in applicability.filter(options=options):
 
             try:
-                evaluation = self._get_calculated_mandatory_option_cost(option, request, actual, dimensional,
-                                                                        weight, freight, date)
+                evaluation = self._get_calculated_mandatory_option_cost(option, applicability, actual, cubic,
+                                                                        dimensional, weight, freight, date)
             except CarrierOptionException:
                 continue
             processed_carrier_options.append(evaluation)
 
         if carbon_tax:
-            carbon_cost = self._get_carbon_tax(carbon_tax, request, actual, dimensional, weight, freight, date)
+            carbon_cost = self._get_carbon_tax(
+                carbon_tax, request, applicability, actual, cubic, dimensional, weight, freight, date
+            )
 
             if carbon_cost:
                 processed_carrier_options.append(carbon_cost)
 
         return processed_carrier_options
+
+
+_carbon_tax_provinces = {
+    "AB Carbon Tax": "AB",
+    "BC Carbon Tax": "BC",
+    "MB Carbon Tax": "MB",
+    "NB Carbon Tax": "NB",
+    "NF Carbon Tax": "NL",
+    "NT Carbon Tax": "NT",
+    "NS Carbon Tax": "NS",
+    "NU Carbon Tax": "NU",
+    "ON Carbon Tax": "ON",
+    "PE Carbon Tax": "PE",
+    "QC Carbon Tax": "QC",
+    "SK Carbon Tax": "SK",
+    "YT Carbon Tax": "YT",
+}
+
+for _name, _province in _carbon_tax_provinces.items():
+    OptionApplicability.register(option_name=_name, check=partial(Mandatory._ca_province_carbon_tax, _province))
+
+OptionApplicability.register(option_name="Deh Cho Bridge", check=Mandatory._deh_cho)
+OptionApplicability.register(option_name="Long Freight", check=Mandatory._long_freight)
+OptionApplicability.register(option_name="Northern Road Ban", check=Mandatory._road_ban)
+OptionApplicability.register(option_name="Newfoundland Ferry", check=Mandatory._nl_ship)
+OptionApplicability.register(option_name="Residential Pickup", check=Mandatory._residential_pickup)
+OptionApplicability.register(option_name="Residential Delivery", check=Mandatory._residential_delivery)
+OptionApplicability.register(option_name="Weekend or Holiday Pickup", check=Mandatory._w_or_h_pu)
+OptionApplicability.register(option_name="Dangerous Goods", check=Mandatory._dangerous_goods)
+
+for _name in (
+    "Fuel Surcharge", "Nav Canada", "Carbon Tax", "Domestic Handling fee", "Cargo Screening", "Administration Fee",
+    "Pickup Charge"
+):
+    OptionApplicability.register(option_name=_name, check=Mandatory._always)
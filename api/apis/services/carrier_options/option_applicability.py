@@ -0,0 +1,70 @@
+"""
+    Title: Option Applicability
+    Description: This file will contain the registry of option applicability checks keyed by option name. Checks run
+                 once per request against the request origin, destination and packages, so every rate of the request
+                 filters its options with dictionary look ups.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from typing import Callable
+
+from api.exceptions.services import OptionNotApplicableException
+
+
+class OptionApplicability:
+    """
+        Option Applicability Registry
+
+        A check takes the request and raises OptionNotApplicableException when the option does not apply. Options
+        without a registered check get the default passed in by the caller. The mandatory option checks are
+        registered by the mandatory module.
+    """
+
+    _checks = {}
+
+    def __init__(self, request: dict) -> None:
+        self._request = request
+        self._applies = {}
+
+    @classmethod
+    def register(cls, option_name: str, check: Callable[[dict], None]) -> None:
+        """
+            Register the applicability check for an option name.
+            :param option_name: option name
+            :param check: check function, raises OptionNotApplicableException when the option does not apply
+        """
+        cls._checks[option_name] = check
+
+    def applies(self, option_name: str, default: bool = False) -> bool:
+        """
+            Check if an option applies to the request, the check runs once per request.
+            :param option_name: option name
+            :param default: result for options without a registered check
+            :return: True when the option applies
+        """
+        check = self._checks.get(option_name)
+
+        if check is None:
+            return default
+
+        if option_name not in self._applies:
+
+            try:
+                check(self._request)
+            except OptionNotApplicableException:
+                self._applies[option_name] = False
+            else:
+                self._applies[option_name] = True
+
+        return self._applies[option_name]
+
+    def filter(self, options: list, default: bool = False) -> list:
+        """
+            Filter options down to the ones that apply to the request.
+            :param options: list of CarrierOption or MandatoryOption, with the option name loaded
+            :param default: result for options without a registered check
+            :return: list of options that apply
+        """
+        return [option for option in options if self.applies(option_name=option.option.name, default=default)]
@@ -0,0 +1,117 @@
+"""
+    Title: Option Expression
+    Description: This file will contain the compiled evaluation expressions for carrier and mandatory options. Each
+                 option expression is compiled once per expression version and kept in process, rating only runs the
+                 compiled program.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from decimal import Decimal
+from typing import Union
+
+import numexpr
+import numpy
+from numexpr.necompiler import getExprNames
+
+from api.exceptions.services import CarrierOptionException
+from api.models import CarrierOption, MandatoryOption
+
+
+class OptionExpression:
+    """
+        Compiled Option Expression Cache
+
+        Expressions can use actual, cubic, dimensional, weight and freight. Compiled expressions are keyed by option
+        model and id, an edited expression replaces the compiled one on the next evaluation.
+    """
+
+    _sig_fig = Decimal("0.01")
+    _variables = ("actual", "cubic", "dimensional", "weight", "freight")
+
+    # (option model, option id): (expression, input names, compiled expression)
+    _compiled = {}
+
+    @classmethod
+    def _compile(cls, option: Union[CarrierOption, MandatoryOption]) -> tuple:
+        """
+            Get the compiled expression for an option, compile it when new or changed.
+            :param option: CarrierOption or MandatoryOption
+            :return: input names and compiled expression
+        """
+        key = (option._meta.label, option.pk)
+        expression = option.evaluation_expression
+        compiled = cls._compiled.get(key)
+
+        if compiled and compiled[0] == expression:
+            return compiled[1], compiled[2]
+
+        try:
+            names, _ = getExprNames(expression, {})
+        except (KeyError, SyntaxError, TypeError, ValueError) as e:
+            raise CarrierOptionException(
+                {"carrier_option.expression": f"'{option.option.name}' expression is invalid: {str(e)}"}
+            ) from e
+
+        unknown = set(names) - set(cls._variables)
+
+        if unknown:
+            raise CarrierOptionException(
+                {"carrier_option.expression": f"'{option.option.name}' expression has unknown names: {sorted(unknown)}"}
+            )
+
+        try:
+            program = numexpr.NumExpr(expression, signature=[(name, numpy.float64) for name in names])
+        except (KeyError, SyntaxError, TypeError, ValueError) as e:
+            raise CarrierOptionException(
+                {"carrier_option.expression": f"'{option.option.name}' expression is invalid: {str(e)}"}
+            ) from e
+
+        cls._compiled[key] = (expression, names, program)
+
+        return names, program
+
+    @classmethod
+    def evaluate(cls, option: Union[CarrierOption, MandatoryOption], actual: float, cubic: float, dimensional: float,
+                 weight: float, freight: float) -> Decimal:
+        """
+            Evaluate the option expression for one rate.
+            :param option: CarrierOption or MandatoryOption
+            :param actual: actual weight in lbs
+            :param cubic: cubic volume
+            :param dimensional: dimensional weight in lbs
+            :param weight: max of actual and dimensional weight
+            :param freight: freight cost
+            :return: option cost, rounded to cents
+        """
+        names, program = cls._compile(option=option)
+        values = {"actual": actual, "cubic": cubic, "dimensional": dimensional, "weight": weight, "freight": freight}
+        result = program(*[numpy.float64(values[name]) for name in names])
+
+        return Decimal(result.item()).quantize(cls._sig_fig)
+
+    @classmethod
+    def evaluate_many(cls, option: Union[CarrierOption, MandatoryOption], values: list) -> list:
+        """
+            Evaluate the option expression for many rates in one vectorized call.
+            :param option: CarrierOption or MandatoryOption
+            :param values: list of (actual, cubic, dimensional, weight, freight) tuples
+            :return: list of option costs rounded to cents, in the same order
+        """
+
+        if not values:
+            return []
+
+        names, program = cls._compile(option=option)
+        columns = dict(zip(cls._variables, numpy.array(values, dtype=numpy.float64).T))
+        result = numpy.broadcast_to(program(*[columns[name] for name in names]), (len(values),))
+
+        return [Decimal(value).quantize(cls._sig_fig) for value in result.tolist()]
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+            Drop every compiled expression.
+        """
+        cls._compiled = {}
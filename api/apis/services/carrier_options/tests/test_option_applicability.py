@@ -0,0 +1,77 @@
+import datetime
+from decimal import Decimal
+
+from django.test import TestCase
+
+from api.apis.services.carrier_options.mandatory import Mandatory
+from api.apis.services.carrier_options.option_applicability import OptionApplicability
+from api.exceptions.services import OptionNotApplicableException
+from api.models import Carrier, MandatoryOption
+
+
+class OptionApplicabilityTests(TestCase):
+    fixtures = [
+        "api",
+        "carriers",
+        "option_name",
+        "carrier_option",
+        "mandatory_option"
+    ]
+
+    def setUp(self):
+        self.request = {
+            "origin": {"country": "CA", "province": "AB", "city": "Edmonton", "has_shipping_bays": True},
+            "destination": {"country": "CA", "province": "NT", "city": "Yellowknife", "has_shipping_bays": False},
+            "packages": [{"length": Decimal("10"), "width": Decimal("10"), "height": Decimal("10")}],
+            "is_dg_shipment": False,
+        }
+        self.calls = 0
+
+    def tearDown(self):
+        OptionApplicability._checks.pop("Test Option", None)
+
+    def _check(self, request: dict) -> None:
+        self.calls += 1
+        raise OptionNotApplicableException({"option.invalid": "Option does not apply"})
+
+    def test_applies(self):
+        applicability = OptionApplicability(request=self.request)
+        self.assertTrue(applicability.applies(option_name="AB Carbon Tax"))
+        self.assertFalse(applicability.applies(option_name="BC Carbon Tax"))
+        self.assertTrue(applicability.applies(option_name="Deh Cho Bridge"))
+        self.assertTrue(applicability.applies(option_name="Residential Delivery"))
+        self.assertFalse(applicability.applies(option_name="Residential Pickup"))
+        self.assertFalse(applicability.applies(option_name="Dangerous Goods"))
+        self.assertTrue(applicability.applies(option_name="Fuel Surcharge"))
+
+    def test_unregistered_default(self):
+        applicability = OptionApplicability(request=self.request)
+        self.assertFalse(applicability.applies(option_name="Not An Option"))
+        self.assertTrue(applicability.applies(option_name="Not An Option", default=True))
+
+    def test_check_runs_once(self):
+        OptionApplicability.register(option_name="Test Option", check=self._check)
+        applicability = OptionApplicability(request=self.request)
+
+        for _ in range(5):
+            self.assertFalse(applicability.applies(option_name="Test Option"))
+
+        self.assertEqual(self.calls, 1)
+
+    def test_filter(self):
+        options = MandatoryOption.objects.select_related("option").filter(carrier__code=650)
+        applicable = OptionApplicability(request=self.request).filter(options=options)
+        self.assertCountEqual(
+            [option.option.name for option in applicable], ["Residential Delivery", "Deh Cho Bridge"]
+        )
+
+    def test_mandatory_shared_applicability(self):
+        applicability = OptionApplicability(request=self.request)
+        carrier = Carrier.objects.get(code=650)
+
+        for freight in (Decimal("100.00"), Decimal("200.00")):
+            ret = Mandatory().get_calculated_option_costs(
+                carrier, self.request, Decimal("100.00"), Decimal("1.00"), freight, datetime.datetime.today(),
+                applicability=applicability
+            )
+            self.assertCountEqual([option["name"] for option in ret], ["Residential Delivery", "Deh Cho Bridge"])
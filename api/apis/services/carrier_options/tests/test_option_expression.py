@@ -0,0 +1,88 @@
+from decimal import Decimal
+
+from django.test import TestCase
+
+from api.apis.services.carrier_options.option_expression import OptionExpression
+from api.exceptions.services import CarrierOptionException
+from api.models import CarrierOption, MandatoryOption
+
+
+class OptionExpressionTests(TestCase):
+    fixtures = [
+        "api",
+        "carriers",
+        "option_name",
+        "carrier_option",
+        "mandatory_option"
+    ]
+
+    def setUp(self):
+        OptionExpression.clear()
+        self.weight_option = MandatoryOption.objects.get(pk=9)
+        self.where_option = MandatoryOption.objects.get(pk=33)
+        self.flat_option = CarrierOption.objects.get(pk=4)
+
+    def test_evaluate(self):
+        cost = OptionExpression.evaluate(
+            option=self.weight_option, actual=100.0, cubic=10.0, dimensional=200.0, weight=200.0, freight=50.0
+        )
+        self.assertEqual(cost, Decimal("15.00"))
+
+    def test_evaluate_where(self):
+        cost = OptionExpression.evaluate(
+            option=self.where_option, actual=8000.0, cubic=1.0, dimensional=10.0, weight=8000.0, freight=50.0
+        )
+        self.assertEqual(cost, Decimal("43.64"))
+
+    def test_evaluate_constant(self):
+        cost = OptionExpression.evaluate(
+            option=self.flat_option, actual=1.0, cubic=1.0, dimensional=1.0, weight=1.0, freight=1.0
+        )
+        self.assertEqual(cost, Decimal("45.90"))
+
+    def test_compiled_once(self):
+        OptionExpression.evaluate(
+            option=self.weight_option, actual=1.0, cubic=1.0, dimensional=1.0, weight=1.0, freight=1.0
+        )
+        compiled = OptionExpression._compiled[("api.MandatoryOption", 9)]
+        OptionExpression.evaluate(
+            option=self.weight_option, actual=2.0, cubic=2.0, dimensional=2.0, weight=2.0, freight=2.0
+        )
+        self.assertIs(OptionExpression._compiled[("api.MandatoryOption", 9)], compiled)
+
+    def test_recompile_on_change(self):
+        OptionExpression.evaluate(
+            option=self.weight_option, actual=1.0, cubic=1.0, dimensional=1.0, weight=100.0, freight=1.0
+        )
+        self.weight_option.evaluation_expression = "freight * 0.5"
+        cost = OptionExpression.evaluate(
+            option=self.weight_option, actual=1.0, cubic=1.0, dimensional=1.0, weight=100.0, freight=10.0
+        )
+        self.assertEqual(cost, Decimal("5.00"))
+
+    def test_unknown_name(self):
+        self.weight_option.evaluation_expression = "distance * 2"
+
+        with self.assertRaises(CarrierOptionException):
+            OptionExpression.evaluate(
+                option=self.weight_option, actual=1.0, cubic=1.0, dimensional=1.0, weight=1.0, freight=1.0
+            )
+
+    def test_evaluate_cubic(self):
+        self.weight_option.evaluation_expression = "cubic * 2.5"
+        cost = OptionExpression.evaluate(
+            option=self.weight_option, actual=1.0, cubic=4.0, dimensional=1.0, weight=1.0, freight=1.0
+        )
+        self.assertEqual(cost, Decimal("10.00"))
+
+    def test_evaluate_many(self):
+        values = [(1.0, 1.0, 1.0, 100.0, 1.0), (1.0, 1.0, 1.0, 200.0, 1.0), (1.0, 1.0, 1.0, 1000.0, 1.0)]
+        costs = OptionExpression.evaluate_many(option=self.weight_option, values=values)
+        self.assertEqual(costs, [Decimal("7.50"), Decimal("15.00"), Decimal("75.00")])
+
+    def test_evaluate_many_constant(self):
+        costs = OptionExpression.evaluate_many(option=self.flat_option, values=[(1.0, 1.0, 1.0, 1.0, 1.0)] * 3)
+        self.assertEqual(costs, [Decimal("45.90")] * 3)
+
+    def test_evaluate_many_empty(self):
+        self.assertEqual(OptionExpression.evaluate_many(option=self.where_option, values=[]), [])
@@ -1,18 +1,15 @@
 import base64
 import copy
-import io
 import os
 from decimal import Decimal
 
-import gevent
-from PyPDF2 import PdfFileMerger
 from django.core.exceptions import ObjectDoesNotExist
 
 from api.apis.services.dangerous_goods.dangerous_goods_api import DangerousGoodsAPI
 from api.background_tasks.logger import CeleryLogger
-from api.documents.dg_battery import DangerousGoodBattery
 from api.documents.dg_declaration import DangerousGoodDeclaration
 from api.documents.dg_placard import DangerousGoodPlacard
+from api.documents.render_service import DocumentRenderService
 from api.documents.simple_image_overlay import SimpleImageOverlay
 from api.exceptions.project import DangerousGoodsException
 from api.globals.carriers import CAN_POST
@@ -232,7 +229,7 @@ class DangerousGoodsGround(DangerousGoodsAPI):
         if False and self._is_all_excepted_quantity(dangerous_goods):
             for dg in dangerous_goods:
                 img_path = self._create_excepted_quantity_label(dg["class_div"])
-                dg_documents.append(SimpleImageOverlay(img_path).get_pdf())
+                dg_documents.append(("pdf", {"document": SimpleImageOverlay(img_path).get_pdf()}))
 
                 try:
                     os.remove(img_path)
@@ -243,21 +240,16 @@ class DangerousGoodsGround(DangerousGoodsAPI):
                     )
                     continue
         else:
-            threads = []
-
             if not self._is_exempted:
-                dg_dec_thread = gevent.spawn(DangerousGoodDeclaration(self._world_request, dangerous_goods).get_pdf)
-                threads.append(dg_dec_thread)
-                gevent.joinall(threads)
-                dg_documents = [dg_dec_thread.value]
-            else:
-                dg_documents = []
+                dg_documents.append(
+                    ("declaration", DangerousGoodDeclaration.get_params(self._world_request, dangerous_goods))
+                )
 
             if self._is_battery_lithium_ion:
-                dg_documents.append(DangerousGoodBattery(3480).get_pdf())
+                dg_documents.append(("battery", {"un_number": 3480}))
 
             if self._is_battery_lithium_metal:
-                dg_documents.append(DangerousGoodBattery(3090).get_pdf())
+                dg_documents.append(("battery", {"un_number": 3090}))
 
             for dg in dangerous_goods:
                 if dg.get("is_limited", False) and "Limited Quantity" not in self._generic_label_names:
@@ -268,7 +260,7 @@ class DangerousGoodsGround(DangerousGoodsAPI):
 
                 if False and dg.get("excepted_quantity", False):
                     img_path = self._create_excepted_quantity_label(dg["class_div"])
-                    dg_documents.append(SimpleImageOverlay(img_path).get_pdf())
+                    dg_documents.append(("pdf", {"document": SimpleImageOverlay(img_path).get_pdf()}))
 
                     try:
                         os.remove(img_path)
@@ -280,27 +272,15 @@ class DangerousGoodsGround(DangerousGoodsAPI):
                         continue
 
                 if not dg.get("excepted_quantity", False):
-                    dg_documents.append(DangerousGoodPlacard(dg).get_pdf())
+                    dg_documents.append(("placard", DangerousGoodPlacard.get_params(dg)))
 
             for dg_generic_label in DangerousGoodGenericLabel.objects.filter(name__in=self._generic_label_names):
-                dg_documents.append(
-                    SimpleImageOverlay(dg_generic_label.label, dg_generic_label.width,
-                                       dg_generic_label.height).get_pdf()
-                )
-
-        files = [
-            document
-            for document in dg_documents
-        ]
-        m_buffer = io.BytesIO()
-        merger = PdfFileMerger()
-
-        for file in files:
-            merger.append(io.BytesIO(file))
-        merger.write(m_buffer)
-        m_buffer.seek(0)
-        document = {'document': base64.b64encode(m_buffer.read()).decode("ascii"), 'type': self._document_type_dg_docs}
+                dg_documents.append(("image", {
+                    "placard": dg_generic_label.label.path,
+                    "width": dg_generic_label.width,
+                    "height": dg_generic_label.height
+                }))
 
-        m_buffer.close()
+        document = DocumentRenderService().render_merged(documents=dg_documents)
 
-        return document
+        return {'document': base64.b64encode(document).decode("ascii"), 'type': self._document_type_dg_docs}
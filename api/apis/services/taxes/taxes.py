@@ -8,6 +8,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.db import connection
 from django.utils import timezone
 
+from api.apis.rate_v3.reference_snapshot import ReferenceSnapshot
 from api.background_tasks.logger import CeleryLogger
 from api.exceptions.project import RequestError
 from api.globals.project import DEFAULT_TIMEOUT_SECONDS
@@ -19,7 +20,8 @@ class Taxes:
     # TODO - REVIEW INTERNATIONAL TAX, VERY BROKEN FOR NON US AND CA
     _tax_date_cutoff = 12  # 3 months
 
-    def __init__(self, location: dict) -> None:
+    def __init__(self, location: dict, reference: ReferenceSnapshot = None) -> None:
+        self._reference = reference
         self._province = location["province"]
         self._country = location["country"]
         self._postal_code = location["postal_code"]
@@ -73,13 +75,45 @@ class Taxes:
         tax.save()
         return tax
 
+    def _is_active(self) -> bool:
+        """
+            Check if TaxJar is active, from the request reference snapshot when there is one.
+            :return: TaxJar active flag
+        """
+
+        if self._reference:
+            return self._reference.is_active(api_name="TaxJar")
+
+        return API.objects.get(name="TaxJar").active
+
+    def _get_stored_tax(self) -> Tax:
+        """
+            Get the stored tax for the province, from the request reference snapshot when there is one. A province
+            without a tax gets a new expired tax to be updated.
+            :return: Tax
+        """
+
+        if self._reference:
+            return self._reference.get_tax(province=self._province, country=self._country)
+
+        province = Province.objects.get(code=self._province, country__code=self._country)
+
+        try:
+            tax = Tax.objects.get(province=province)
+        except ObjectDoesNotExist:
+            tax = Tax()
+            tax.province = province
+            tax.expiry = timezone.now() - timedelta(days=1)
+
+        return tax
+
     def get_tax_rate(self, amount: Decimal) -> Decimal:
-        if not API.objects.get(name="TaxJar").active:
+        if not self._is_active():
             connection.close()
             return Decimal("0.00")
 
         try:
-            province = Province.objects.get(code=self._province, country__code=self._country)
+            tax = self._get_stored_tax()
         except ObjectDoesNotExist:
             CeleryLogger().l_error.delay(
                 location="taxes.py line: 77",
@@ -88,24 +122,17 @@ class Taxes:
             }))
             return Decimal("0.00")
 
-        try:
-            tax = Tax.objects.get(province=province)
-        except ObjectDoesNotExist:
-            tax = Tax()
-            tax.province = province
-            tax.expiry = timezone.now() - timedelta(days=1)
-
         if self._is_tax_rate_expired(tax.expiry):
             tax = self._update_tax_rate(tax)
         return (tax.tax_rate * amount / Decimal("100.00")).quantize(Decimal("0.01"))
 
     def get_tax(self) -> Tax:
-        if not API.objects.get(name="TaxJar").active:
+        if not self._is_active():
             connection.close()
             raise Exception
 
         try:
-            province = Province.objects.get(code=self._province, country__code=self._country)
+            tax = self._get_stored_tax()
         except ObjectDoesNotExist:
             CeleryLogger().l_error.delay(
                 location="taxes.py line: 77",
@@ -114,13 +141,6 @@ class Taxes:
             }))
             raise Exception
 
-        try:
-            tax = Tax.objects.get(province=province)
-        except ObjectDoesNotExist:
-            tax = Tax()
-            tax.province = province
-            tax.expiry = timezone.now() - timedelta(days=1)
-
         if self._is_tax_rate_expired(tax.expiry):
             tax = self._update_tax_rate(tax)
 
@@ -0,0 +1,163 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import OutputWrapper
+from django.core.management.color import no_style
+from django.test import TestCase
+from django.utils import timezone
+
+from api.apis.carriers.fedex.endpoints.fedex_track_api_v1 import FedExTrack
+from api.apis.track.track import Track
+from api.exceptions.project import TrackException
+from api.globals.carriers import FEDEX, TWO_SHIP_CARRIERS
+from api.models import Leg, Shipment, TrackingStatus
+
+
+class TrackTests(TestCase):
+    fixtures = [
+        "carriers",
+        "countries",
+        "provinces",
+        "user",
+        "group",
+        "contact",
+        "addresses",
+        "markup",
+        "account",
+        "subaccount",
+        "shipments",
+        "legs",
+        "tracking_statuses"
+    ]
+
+    def setUp(self):
+        command = mock.Mock()
+        command.stderr = OutputWrapper(StringIO())
+        command.style = no_style()
+        self.track = Track(command=command)
+        self.leg = Leg.objects.get(pk=1)
+        self.webhook = mock.patch(
+            "api.background_tasks.webhooks.tracking_status_change.CeleryTrackStatusChange.tracking_status_change"
+        ).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_get_interval(self):
+        now = timezone.now()
+        leg = mock.Mock(latest_status_datetime=now - timedelta(hours=2))
+        self.assertEqual(self.track._get_interval(leg=leg, now=now), timedelta(0))
+
+        leg.latest_status_datetime = now - timedelta(days=2)
+        self.assertEqual(self.track._get_interval(leg=leg, now=now), timedelta(hours=2))
+
+        leg.latest_status_datetime = now - timedelta(days=20)
+        self.assertEqual(self.track._get_interval(leg=leg, now=now), timedelta(hours=12))
+
+    def test_get_interval_no_status(self):
+        leg = mock.Mock(latest_status_datetime=Track._no_status_datetime)
+        self.assertEqual(self.track._get_interval(leg=leg, now=timezone.now()), timedelta(0))
+
+    def test_get_due_legs_skips_recently_tracked(self):
+        now = timezone.now()
+        stale = mock.Mock(leg_id="track_test_stale", latest_status_datetime=now - timedelta(days=20))
+        fresh = mock.Mock(leg_id="track_test_fresh", latest_status_datetime=now - timedelta(hours=1))
+        cache.delete_many(["track_leg_last_track_test_stale", "track_leg_last_track_test_fresh"])
+
+        self.assertEqual(self.track._get_due_legs(legs=[stale, fresh]), [stale, fresh])
+        self.assertEqual(self.track._get_due_legs(legs=[stale, fresh]), [stale, fresh])
+
+        self.track._set_tracked(legs=[stale, fresh])
+
+        self.assertEqual(self.track._get_due_legs(legs=[stale, fresh]), [fresh])
+
+    def test_throttle_two_ship_shared(self):
+        first, second = TWO_SHIP_CARRIERS[:2]
+        self.assertIs(self.track._get_throttle(carrier_code=first), self.track._get_throttle(carrier_code=second))
+        self.assertIsNot(self.track._get_throttle(carrier_code=FEDEX), self.track._get_throttle(carrier_code=first))
+
+    def test_save_tracks_delivered(self):
+        status = {"leg": self.leg, "status": "Delivered", "details": "Left at front door."}
+        count = self.track._save_tracks(results=[(self.leg, status)])
+
+        leg = Leg.objects.get(pk=1)
+        self.assertEqual(count, 1)
+        self.assertTrue(leg.is_delivered)
+        self.assertEqual(leg.latest_status, "Delivered")
+        self.assertNotEqual(leg.delivered_date, Track._no_status_datetime)
+        self.assertTrue(Shipment.objects.get(pk=1).is_delivered)
+        self.assertEqual(self.webhook.delay.call_count, 1)
+
+    def test_save_tracks_skips_existing(self):
+        status = {"leg": self.leg, "status": "InTransit", "details": "Arrived at hub."}
+        self.track._save_tracks(results=[(self.leg, status)])
+        count = self.track._save_tracks(results=[(self.leg, status), (self.leg, dict(status))])
+
+        self.assertEqual(count, 0)
+        self.assertEqual(TrackingStatus.objects.filter(leg=self.leg, details="Arrived at hub.").count(), 1)
+        self.assertFalse(Leg.objects.get(pk=1).is_delivered)
+
+    def test_perform_track_batches_fedex(self):
+        legs = [self.leg]
+        api = mock.Mock()
+        api.track_many.return_value = {self.leg.leg_id: {"leg": self.leg, "status": "Pickup", "details": "Picked up."}}
+
+        accounts = ({}, {self.leg.carrier_id: mock.Mock(pk=1)})
+
+        with mock.patch.object(self.track, "_get_due_legs", return_value=legs), \
+                mock.patch.object(self.track, "_get_carrier_accounts", return_value=accounts), \
+                mock.patch("api.apis.track.track.CarrierUtility.get_ship_api", return_value=api):
+            count = self.track._perform_track()
+
+        self.assertEqual(count, 1)
+        api.track_many.assert_called_once()
+        api.track.assert_not_called()
+        self.assertIsNotNone(cache.get(f"track_leg_last_{self.leg.leg_id}"))
+
+    def test_perform_track_failed_call_not_marked_tracked(self):
+        api = mock.Mock()
+        api.track_many.side_effect = TrackException("down")
+        accounts = ({}, {self.leg.carrier_id: mock.Mock(pk=1)})
+        cache.delete(f"track_leg_last_{self.leg.leg_id}")
+
+        with mock.patch.object(self.track, "_get_due_legs", return_value=[self.leg]), \
+                mock.patch.object(self.track, "_get_carrier_accounts", return_value=accounts), \
+                mock.patch("api.apis.track.track.CarrierUtility.get_ship_api", return_value=api):
+            count = self.track._perform_track()
+
+        self.assertEqual(count, 0)
+        api.track_many.assert_called_once()
+        self.assertIsNone(cache.get(f"track_leg_last_{self.leg.leg_id}"))
+
+    def test_backfill_leg_tracking(self):
+        latest = TrackingStatus.objects.filter(leg=self.leg).order_by("updated_datetime", "pk").last()
+        call_command("backfill_leg_tracking", stdout=StringIO())
+        leg = Leg.objects.get(pk=1)
+
+        self.assertEqual(leg.latest_status, latest.status)
+        self.assertEqual(leg.latest_status_datetime, latest.updated_datetime)
+
+
+class FedExTrackManyTests(TestCase):
+
+    def test_track_many_maps_details(self):
+        first = mock.Mock(leg_id="1", tracking_identifier="111")
+        second = mock.Mock(leg_id="2", tracking_identifier="222")
+        details = [{"TrackingNumber": "222"}, {"TrackingNumber": "111"}]
+
+        with mock.patch.object(FedExTrack, "_send", return_value=details) as send, \
+                mock.patch.object(FedExTrack, "_format_detail", side_effect=lambda leg, track_detail: track_detail):
+            ret = FedExTrack().track_many(legs=[first, second], carrier_account=mock.Mock())
+
+        send.assert_called_once()
+        self.assertEqual(ret, {"1": {"TrackingNumber": "111"}, "2": {"TrackingNumber": "222"}})
+
+    def test_track_many_batch_error(self):
+        legs = [mock.Mock(leg_id=str(i), tracking_identifier=str(i)) for i in range(31)]
+
+        with mock.patch.object(FedExTrack, "_send", side_effect=TrackException("down")) as send:
+            ret = FedExTrack().track_many(legs=legs, carrier_account=mock.Mock())
+
+        self.assertEqual(send.call_count, 2)
+        self.assertTrue(all(isinstance(value, TrackException) for value in ret.values()))
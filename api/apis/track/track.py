@@ -1,76 +1,191 @@
 """
     Title: ubbe Auto Track
-    Description: This file will contain functions related to Action Express Api.
+    Description: This file will contain functions related to auto tracking undelivered legs. Legs are grouped by
+                 carrier and carrier account and tracked concurrently with a bounded gevent pool per carrier, FedEx
+                 legs are tracked in batches. Legs are scheduled by how long ago their status last changed and new
+                 statuses are written in bulk.
     Created: June 8, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
+import time
 from datetime import datetime, timedelta
 
+import gevent
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
 from django.db import IntegrityError
-from django.db.models import QuerySet
+from django.db.models import Q, QuerySet
 from django.utils import timezone
+from gevent.lock import RLock
+from gevent.pool import Pool
 
 from api.background_tasks.business_central import CeleryBusinessCentral
 from api.exceptions.project import ViewException, NoTrackingStatus
-from api.globals.carriers import RATE_SHEET_CARRIERS, SEALIFT_CARRIERS, CAN_NORTH
-from api.models import Leg, TrackingStatus, CarrierAccount
+from api.globals.carriers import RATE_SHEET_CARRIERS, SEALIFT_CARRIERS, CAN_NORTH, FEDEX, CAN_POST, PUROLATOR, \
+    DAY_N_ROSS, TWO_SHIP_CARRIERS
+from api.models import Leg, TrackingStatus, CarrierAccount, Shipment
 from api.utilities.carriers import CarrierUtility
+from brain.settings import TWENTY_FOUR_HOURS_CACHE_TTL
+
+
+class CarrierThrottle:
+    """
+        Per carrier concurrency and request spacing for tracking calls.
+    """
+
+    def __init__(self, size: int, interval: float) -> None:
+        self.pool = Pool(size=size)
+        self._interval = interval
+        self._lock = RLock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        """
+            Wait until the carrier can take another request.
+        """
+
+        with self._lock:
+            delay = self._next - time.monotonic()
+
+            if delay > 0:
+                gevent.sleep(delay)
+
+            self._next = time.monotonic() + self._interval
 
 
 class Track:
+    # Carrier: (concurrent requests, minimum seconds between requests)
+    _carrier_limits = {
+        FEDEX: (2, 0.2),
+        CAN_POST: (4, 0.1),
+        PUROLATOR: (4, 0.1),
+        DAY_N_ROSS: (4, 0.1),
+        "2ship": (2, 0.25),
+    }
+    _default_limit = (2, 0.25)
 
-    def __init__(self, command):
+    # Time since the last status change: time between tracking calls
+    _schedule = (
+        (timedelta(days=1), timedelta(0)),
+        (timedelta(days=3), timedelta(hours=2)),
+        (timedelta(days=7), timedelta(hours=6)),
+    )
+    _stale_interval = timedelta(hours=12)
+    _no_status_datetime = datetime(year=1, month=1, day=1, tzinfo=timezone.utc)
+    _last_tracked_key = "track_leg_last_{}"
+
+    def __init__(self, command, is_full: bool = False):
         exclude_carriers = RATE_SHEET_CARRIERS + SEALIFT_CARRIERS
         self._exclude_carriers = list(exclude_carriers)
         self.command = command
+        self._is_full = is_full
+        self._throttles = {}
+
+    def _error(self, leg: Leg, message) -> None:
+        self.command.stderr.write(self.command.style.ERROR(f'Leg {leg.leg_id}: {str(message)}'))
 
     @staticmethod
-    def _save_track(leg: Leg, latest_status: dict) -> None:
+    def _as_aware(value):
+        if isinstance(value, datetime) and timezone.is_naive(value):
+            return timezone.make_aware(value)
+        return value
+
+    def _get_throttle(self, carrier_code: int) -> CarrierThrottle:
         """
-        Save latest tracking status for leg and set leg to delivered. If Job File exists, delivered job task line.
-        :param latest_status: Tracking Status Dict
-        :return: None
+            Get the throttle for a carrier, 2Ship carriers share one throttle.
+            :param carrier_code: carrier code
+            :return: CarrierThrottle
         """
+        key = "2ship" if carrier_code in TWO_SHIP_CARRIERS else carrier_code
 
-        if leg.carrier.code == CAN_NORTH:
-            return
+        if key not in self._throttles:
+            size, interval = self._carrier_limits.get(key, self._default_limit)
+            self._throttles[key] = CarrierThrottle(size=size, interval=interval)
 
-        try:
-            status = TrackingStatus.create(param_dict=latest_status)
-            status.save()
-        except IntegrityError as e:
-            raise ViewException("Tracking already saved.") from e
+        return self._throttles[key]
 
-        if status.status == "Delivered":
-            leg.is_delivered = True
-            leg.is_overdue = False
-            leg.is_pickup_overdue = False
-            leg.save()
+    def _get_interval(self, leg: Leg, now: datetime) -> timedelta:
+        """
+            Get the time between tracking calls for a leg from the age of its last status change.
+            :param leg: Leg
+            :param now: current datetime
+            :return: timedelta
+        """
 
-            if leg.shipment.ff_number:
-                CeleryBusinessCentral().deliver_job_file.delay(data={
-                    "job_number": leg.shipment.ff_number,
-                    "leg_id": leg.leg_id
-                })
+        if leg.latest_status_datetime == self._no_status_datetime:
+            return timedelta(0)
+
+        age = now - leg.latest_status_datetime
+
+        for max_age, interval in self._schedule:
+            if age < max_age:
+                return interval
+
+        return self._stale_interval
+
+    def _get_due_legs(self, legs: list) -> list:
+        """
+            Get the legs that are due to be tracked.
+            :param legs: list of legs
+            :return: list of legs
+        """
+
+        if self._is_full:
+            return legs
+
+        now = timezone.now()
+        keys = {self._last_tracked_key.format(leg.leg_id): leg for leg in legs}
+        last_tracked = cache.get_many(list(keys.keys()))
+        due = []
+
+        for key, leg in keys.items():
+            tracked = last_tracked.get(key)
+
+            if tracked is None or now.timestamp() - tracked >= self._get_interval(leg, now).total_seconds():
+                due.append(leg)
+
+        return due
 
-            leg_count = Leg.objects.filter(shipment=leg.shipment).count()
-            delivered_leg = Leg.objects.filter(shipment=leg.shipment, is_delivered=True).count()
+    def _set_tracked(self, legs: list) -> None:
+        """
+            Mark legs as tracked, only legs the carrier returned a status for so a failed call is tried next run.
+            :param legs: list of legs
+        """
 
-            if leg_count == delivered_leg:
-                leg.shipment.is_delivered = True
-                leg.shipment.save()
+        if not legs:
+            return
+
+        now = timezone.now().timestamp()
+
+        cache.set_many(
+            {self._last_tracked_key.format(leg.leg_id): now for leg in legs}, TWENTY_FOUR_HOURS_CACHE_TTL
+        )
 
     @staticmethod
-    def _get_carrier_account(subaccount, carrier):
+    def _get_carrier_accounts(legs: list) -> tuple:
+        """
+            Get carrier accounts for the legs in one query.
+            :param legs: list of legs
+            :return: tuple of (subaccount, carrier) accounts and default carrier accounts
+        """
+        accounts = {}
+        defaults = {}
+        subaccounts = {leg.shipment.subaccount_id for leg in legs}
+        carriers = {leg.carrier_id for leg in legs}
 
-        try:
-            account = CarrierAccount.objects.get(subaccount=subaccount, carrier=carrier)
-        except Exception:
-            account = CarrierAccount.objects.get(subaccount__is_default=True, carrier=carrier)
+        carrier_accounts = CarrierAccount.objects.select_related("carrier", "subaccount").filter(
+            Q(subaccount__in=subaccounts) | Q(subaccount__is_default=True), carrier__in=carriers
+        )
+
+        for account in carrier_accounts:
+            accounts[(account.subaccount_id, account.carrier_id)] = account
+
+            if account.subaccount.is_default:
+                defaults[account.carrier_id] = account
 
-        return account
+        return accounts, defaults
 
     def _get_all_undelivered_legs(self) -> QuerySet:
         """
@@ -86,9 +201,9 @@ class Track:
             "shipment__subaccount",
             "carrier",
         ).filter(
-            ship_date__range=[past_month, today],
             is_shipped=True,
-            is_delivered=False
+            is_delivered=False,
+            ship_date__range=[past_month, today],
         ).exclude(
             carrier__code__in=self._exclude_carriers
         ).exclude(
@@ -97,58 +212,261 @@ class Track:
 
         return legs
 
-    def _perform_track(self):
+    @staticmethod
+    def _get_api(leg: Leg, account: CarrierAccount):
+        return CarrierUtility.get_ship_api(data={
+            "leg": leg,
+            "carrier_id": leg.carrier.code,
+            "service_code": leg.service_code,
+            "objects": {
+                "sub_account": leg.shipment.subaccount,
+                'carrier_accounts': {
+                    leg.carrier.code: {
+                        'account': account,
+                        "carrier": leg.carrier
+                    }
+                },
+            }
+        })
+
+    def _track_leg(self, leg: Leg, account: CarrierAccount, throttle: CarrierThrottle, results: list) -> None:
+        """
+            Track a single leg.
+            :param leg: Leg
+            :param account: carrier account for the leg
+            :param throttle: carrier throttle
+            :param results: list of (leg, latest status) to add to
         """
 
-        :return:
+        try:
+            api = self._get_api(leg=leg, account=account)
+        except ViewException:
+            return
+
+        throttle.wait()
+
+        try:
+            latest_status = api.track()
+        except ViewException as e:
+            self._error(leg=leg, message=e.message)
+            return
+        except NoTrackingStatus as e:
+            self._error(leg=leg, message=e)
+            return
+        except Exception as e:
+            self._error(leg=leg, message=e)
+            return
+
+        results.append((leg, latest_status))
+
+    def _track_batch(self, legs: list, account: CarrierAccount, throttle: CarrierThrottle, results: list) -> None:
+        """
+            Track the legs of one carrier account with the carrier batch endpoint.
+            :param legs: list of legs
+            :param account: carrier account for the legs
+            :param throttle: carrier throttle
+            :param results: list of (leg, latest status) to add to
         """
 
-        for leg in self._get_all_undelivered_legs():
+        try:
+            api = self._get_api(leg=legs[0], account=account)
+            throttle.wait()
+            statuses = api.track_many(legs=legs, carrier_account=account)
+        except ViewException as e:
+            for leg in legs:
+                self._error(leg=leg, message=e.message)
+            return
+        except Exception as e:
+            for leg in legs:
+                self._error(leg=leg, message=e)
+            return
 
-            account = self._get_carrier_account(
-                subaccount=leg.shipment.subaccount, carrier=leg.carrier
-            )
+        for leg in legs:
+            latest_status = statuses.get(leg.leg_id)
 
-            try:
-                api = CarrierUtility.get_ship_api(data={
-                    "leg": leg,
-                    "carrier_id": leg.carrier.code,
-                    "service_code": leg.service_code,
-                    "objects": {
-                        "sub_account": leg.shipment.subaccount,
-                        'carrier_accounts': {
-                            leg.carrier.code: {
-                                'account': account,
-                                "carrier": leg.carrier
-                            }
-                        },
-                    }
-                })
-            except ViewException:
+            if isinstance(latest_status, ViewException):
+                self._error(leg=leg, message=latest_status.message)
+            elif latest_status:
+                results.append((leg, latest_status))
+
+    def _save_tracks(self, results: list) -> int:
+        """
+        Save the latest tracking statuses in bulk and set delivered legs and shipments. If Job File exists, delivered
+        job task line.
+        :param results: list of (leg, latest status dict)
+        :return: number of statuses saved
+        """
+        statuses = {}
+
+        for leg, latest_status in results:
+
+            if leg.carrier.code == CAN_NORTH:
                 continue
 
+            status = TrackingStatus.create(param_dict=latest_status)
+            status.leg = leg
+
             try:
-                latest_status = api.track()
-            except ViewException as e:
-                self.command.stderr.write(self.command.style.ERROR(f'Leg {leg.leg_id}: {str(e.message)}'))
+                status.clean_fields()
+            except ValidationError as e:
+                self._error(leg=leg, message=e)
                 continue
-            except NoTrackingStatus as e:
-                self.command.stderr.write(self.command.style.ERROR(f'Leg {leg.leg_id}: {str(e)}'))
+
+            status.delivered_datetime = self._as_aware(status.delivered_datetime)
+            status.estimated_delivery_datetime = self._as_aware(status.estimated_delivery_datetime)
+
+            key = (leg.pk, status.delivered_datetime, status.estimated_delivery_datetime, status.status, status.details)
+            statuses[key] = status
+
+        if not statuses:
+            return 0
+
+        existing = set(TrackingStatus.objects.filter(
+            leg__in={key[0] for key in statuses}
+        ).values_list("leg_id", "delivered_datetime", "estimated_delivery_datetime", "status", "details"))
+        new = [status for key, status in statuses.items() if key not in existing]
+
+        try:
+            TrackingStatus.objects.bulk_create(new)
+        except IntegrityError:
+            new = self._save_each(statuses=new)
+
+        from api.background_tasks.webhooks.tracking_status_change import CeleryTrackStatusChange
+
+        for status in new:
+            CeleryTrackStatusChange.tracking_status_change.delay(status=status.pk, leg_id=status.leg.leg_id)
+
+        self._set_tracking_state(statuses=new)
+        self._set_delivered(legs=[status.leg for status in new if status.status == "Delivered"])
+
+        return len(new)
+
+    @staticmethod
+    def _set_tracking_state(statuses: list) -> None:
+        """
+            Set the latest status, latest status time and delivered date of the legs in one bulk update.
+            :param statuses: list of saved statuses
+        """
+        legs = {}
+
+        for status in statuses:
+
+            if status.leg.latest_status_datetime <= status.updated_datetime:
+                status.leg.set_values(status.get_leg_state())
+
+            legs[status.leg.pk] = status.leg
+
+        Leg.objects.bulk_update(
+            list(legs.values()), fields=["latest_status", "latest_status_datetime", "delivered_date"]
+        )
+
+    def _save_each(self, statuses: list) -> list:
+        """
+            Save statuses one at a time when a bulk insert conflicts, skipping statuses that already exist.
+            :param statuses: list of unsaved statuses
+            :return: list of saved statuses
+        """
+        saved = []
+
+        for status in statuses:
+            try:
+                status.save_base()
+            except IntegrityError:
+                self._error(leg=status.leg, message="Tracking already saved.")
                 continue
-            except Exception as e:
-                self.command.stderr.write(self.command.style.ERROR(f'Leg {leg.leg_id}: {str(e)}'))
+            saved.append(status)
+
+        return saved
+
+    @staticmethod
+    def _set_delivered(legs: list) -> None:
+        """
+            Set legs delivered and set shipments delivered when all of their legs are delivered.
+            :param legs: list of delivered legs
+        """
+
+        if not legs:
+            return
+
+        Leg.objects.filter(pk__in=[leg.pk for leg in legs]).update(
+            is_delivered=True, is_overdue=False, is_pickup_overdue=False
+        )
+
+        for leg in legs:
+            leg.is_delivered = True
+            leg.is_overdue = False
+            leg.is_pickup_overdue = False
+
+            if leg.shipment.ff_number:
+                CeleryBusinessCentral().deliver_job_file.delay(data={
+                    "job_number": leg.shipment.ff_number,
+                    "leg_id": leg.leg_id
+                })
+
+        Shipment.objects.filter(
+            pk__in={leg.shipment_id for leg in legs}
+        ).exclude(
+            leg_shipment__is_delivered=False
+        ).update(is_delivered=True)
+
+    @staticmethod
+    def _run_carrier(throttle: CarrierThrottle, tasks: list, results: list) -> None:
+        """
+            Run the tracking calls of one carrier in its pool, carriers fill their pools independently.
+            :param throttle: carrier throttle
+            :param tasks: list of (function, leg kwargs, carrier account)
+            :param results: list of (leg, latest status) to add to
+        """
+
+        for function, kwargs, account in tasks:
+            throttle.pool.spawn(function, account=account, throttle=throttle, results=results, **kwargs)
+
+        throttle.pool.join()
+
+    def _perform_track(self) -> int:
+        """
+        Track the due legs concurrently and save new statuses.
+        :return: number of statuses saved
+        """
+        legs = self._get_due_legs(legs=list(self._get_all_undelivered_legs()))
+        accounts, defaults = self._get_carrier_accounts(legs=legs)
+        groups = {}
+        results = []
+
+        for leg in legs:
+            account = accounts.get((leg.shipment.subaccount_id, leg.carrier_id), defaults.get(leg.carrier_id))
+
+            if not account:
+                self._error(leg=leg, message="No carrier account.")
                 continue
 
-            try:
-                self._save_track(leg=leg, latest_status=latest_status)
-            except Exception as e:
-                self.command.stderr.write(self.command.style.ERROR(f'Leg {leg.leg_id}: {str(e)}'))
+            groups.setdefault((leg.carrier.code, account.pk), (account, []))[1].append(leg)
+
+        tasks = {}
+
+        for (carrier_code, _), (account, group) in groups.items():
+            throttle = self._get_throttle(carrier_code=carrier_code)
+            carrier_tasks = tasks.setdefault(throttle, [])
+
+            if carrier_code == FEDEX:
+                carrier_tasks.append((self._track_batch, {"legs": group}, account))
                 continue
 
+            carrier_tasks.extend((self._track_leg, {"leg": leg}, account) for leg in group)
+
+        gevent.joinall([
+            gevent.spawn(self._run_carrier, throttle=throttle, tasks=carrier_tasks, results=results)
+            for throttle, carrier_tasks in tasks.items()
+        ])
+
+        self._set_tracked(legs=[leg for leg, _ in results])
+
+        return self._save_tracks(results=results)
+
     def track(self):
         """
-
-        :return:
+        Track undelivered legs.
+        :return: number of statuses saved
         """
 
-        self._perform_track()
+        return self._perform_track()
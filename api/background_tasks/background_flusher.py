@@ -0,0 +1,82 @@
+"""
+    Title: Background Flusher
+    Description: This file will contain the flush timer for the in process write behind buffers. When gevent has
+                 patched the process (gunicorn gevent workers, celery -P gevent) the buffer is flushed from a greenlet
+                 on an interval. A process without a running hub, ex: a prefork celery child, never switches to a
+                 spawned greenlet, so the buffer is flushed inline once the interval has passed.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import os
+import time
+from typing import Callable, Union
+
+import gevent
+from gevent import monkey
+
+
+class BackgroundFlusher:
+    """
+        Background Flusher
+
+        The greenlet sleeps for the interval, flushes and stops once the buffer is empty, the next buffered item
+        starts it again.
+    """
+
+    def __init__(self, flush: Callable[[], int], pending: Callable[[], int], interval: float,
+                 after_flush: Union[Callable[[], None], None] = None) -> None:
+        self._flush = flush
+        self._pending = pending
+        self._interval = interval
+        self._after_flush = after_flush
+        self._reset()
+
+    def _reset(self) -> None:
+        """
+            Reset the runner, a forked worker does not inherit the greenlet.
+        """
+        self._pid = os.getpid()
+        self._runner = None
+        self._last_flush = time.monotonic()
+
+    @staticmethod
+    def is_hub_running() -> bool:
+        """
+            Check gevent has patched the process, so a spawned greenlet runs while requests wait on io.
+            :return: bool
+        """
+        return monkey.is_module_patched("threading")
+
+    def _run(self) -> None:
+        """
+            Flush on an interval until the buffer is empty.
+        """
+
+        while self._pending():
+            gevent.sleep(self._interval)
+            self._flush()
+
+            if self._after_flush:
+                self._after_flush()
+
+    def start(self) -> None:
+        """
+            Start the flush greenlet, or flush inline when the interval has passed and no hub is running. Call it
+            after buffering an item.
+        """
+
+        if self._pid != os.getpid():
+            self._reset()
+
+        if self.is_hub_running():
+
+            if self._runner is None or self._runner.dead:
+                self._runner = gevent.spawn(self._run)
+
+            return
+
+        if time.monotonic() - self._last_flush >= self._interval:
+            self._last_flush = time.monotonic()
+            self._flush()
@@ -0,0 +1,146 @@
+"""
+    Title: Log Sink
+    Description: This file will contain the in process log sink. Log lines are kept as log records in a bounded ring
+                 buffer and written to the local logger handlers in batches on an interval, so logging on the rate
+                 path never waits on the broker or on disk. Error and critical lines are written at once. Records for
+                 the email handler are sent to celery as one task per flush.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import logging
+import os
+import sys
+from collections import deque
+from logging.handlers import SMTPHandler
+from typing import Callable, Union
+
+from gevent.lock import RLock
+
+from api.background_tasks.background_flusher import BackgroundFlusher
+
+
+class LogSink:
+    """
+        Bounded Log Sink
+
+        When the buffer is full the oldest record is dropped and counted, the drop count is logged with the next flush.
+        A full batch and any error or critical line are flushed inline.
+    """
+
+    def __init__(self, logger: logging.Logger, remote: Union[Callable[[list], None], None] = None,
+                 capacity: int = 10000, batch_size: int = 500, interval: float = 1.0,
+                 inline_level: int = logging.ERROR) -> None:
+        self._logger = logger
+        self._remote = remote
+        self._capacity = capacity
+        self._batch_size = batch_size
+        self._inline_level = inline_level
+        self._lock = RLock()
+        self._flusher = BackgroundFlusher(flush=self.flush, pending=lambda: len(self._buffer), interval=interval)
+        self._reset()
+
+    def _reset(self) -> None:
+        """
+            Reset the buffer and counters, a forked worker starts with an empty sink.
+        """
+        self._pid = os.getpid()
+        self._buffer = deque(maxlen=self._capacity)
+        self._dropped = 0
+        self._reported = 0
+        self._flushed = 0
+
+    def _write(self, batch: list) -> None:
+        """
+            Write a batch to the local handlers, email handler records are sent to the remote callable.
+            :param batch: list of log records
+        """
+        local = []
+        remote = []
+
+        for handler in self._logger.handlers:
+
+            if isinstance(handler, SMTPHandler):
+                remote.append(handler)
+            else:
+                local.append(handler)
+
+        remote_lines = []
+
+        for record in batch:
+
+            for handler in local:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+
+            if self._remote and any(record.levelno >= handler.level for handler in remote):
+                remote_lines.append(
+                    [record.levelno, record.getMessage(), record.pathname, record.lineno, record.funcName]
+                )
+
+        if remote_lines:
+            self._remote(remote_lines)
+
+    def put(self, level: int, location: str, message: str, stacklevel: int = 1) -> bool:
+        """
+            Add a log line, only error and critical lines wait on the handlers.
+            :param level: logging level
+            :param location: call site, ex: rate.py line: 10
+            :param message: log message
+            :param stacklevel: frames above put of the caller the record reports, like Logger.log
+            :return: False when the line replaced the oldest buffered line
+        """
+
+        if not self._logger.isEnabledFor(level):
+            return True
+
+        if self._pid != os.getpid():
+            self._reset()
+
+        caller = sys._getframe(stacklevel)
+        record = self._logger.makeRecord(
+            self._logger.name, level, caller.f_code.co_filename, caller.f_lineno, f"{location}: {message}", None,
+            None, func=caller.f_code.co_name, extra={"location": location}
+        )
+        is_full = len(self._buffer) == self._capacity
+
+        if is_full:
+            self._dropped += 1
+
+        self._buffer.append(record)
+
+        if level >= self._inline_level or len(self._buffer) >= self._batch_size:
+            self.flush()
+        else:
+            self._flusher.start()
+
+        return not is_full
+
+    def flush(self) -> int:
+        """
+            Write every buffered record in batches.
+            :return: number of records flushed
+        """
+        count = 0
+
+        with self._lock:
+            while self._buffer:
+                batch = [self._buffer.popleft() for _ in range(min(self._batch_size, len(self._buffer)))]
+                self._write(batch=batch)
+                count += len(batch)
+
+            if self._dropped > self._reported:
+                self._logger.warning(f"Log Sink: dropped {self._dropped - self._reported} log lines, buffer full.")
+                self._reported = self._dropped
+
+            self._flushed += count
+
+        return count
+
+    def stats(self) -> dict:
+        """
+            Get the sink counters.
+            :return: dict of buffered, flushed and dropped line counts
+        """
+        return {"buffered": len(self._buffer), "flushed": self._flushed, "dropped": self._dropped}
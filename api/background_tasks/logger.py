@@ -3,35 +3,104 @@
     Description: This file will contain functions for Celery Logger.
     Created: May 5, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
+
+    Notes:
+        - Log lines go to the in process log sink, only email handler records reach celery, one task per flush.
+        - Prefork celery children exit with os._exit, which skips atexit, the sink is flushed after every task and
+          when the child shuts down.
 """
+import atexit
+import logging
+from logging.handlers import SMTPHandler
+
+from celery.signals import task_postrun, worker_process_shutdown
 
+from api.background_tasks.log_sink import LogSink
 from api.globals.project import LOGGER
 from brain.celery import app
 
 
+@app.task(bind=True)
+def l_email_batch(self, lines: list):
+    """
+        Send the email handler records of a log sink flush.
+        :param lines: list of [level, message, pathname, line number, function], lines queued before a deploy only
+                      have [level, message]
+    """
+    handlers = [handler for handler in LOGGER.handlers if isinstance(handler, SMTPHandler)]
+
+    for level, message, *caller in lines:
+        pathname, lineno, func = caller or [__file__, 0, "l_email_batch"]
+        record = LOGGER.makeRecord(LOGGER.name, level, pathname, lineno, message, None, None, func=func)
+
+        for handler in handlers:
+            if level >= handler.level:
+                handler.handle(record)
+
+
+LOG_SINK = LogSink(logger=LOGGER, remote=lambda lines: l_email_batch.delay(lines=lines))
+atexit.register(LOG_SINK.flush)
+
+
+@task_postrun.connect
+def _flush_after_task(**kwargs) -> None:
+    LOG_SINK.flush()
+
+
+@worker_process_shutdown.connect
+def _flush_on_shutdown(**kwargs) -> None:
+    LOG_SINK.flush()
+
+
+class _LogLevel:
+    """
+        Log level handle, keeps the celery task call styles: l_info.delay(...) and l_info(...).
+    """
+
+    def __init__(self, level: int) -> None:
+        self._level = level
+
+    def delay(self, location: str, message: str) -> bool:
+        return LOG_SINK.put(level=self._level, location=str(location), message=str(message), stacklevel=2)
+
+    __call__ = delay
+
+
 class CeleryLogger:
     """
         Log issues in ubbe behind the scenes
     """
 
-    @app.task(bind=True)
-    def l_debug(self, location: str, message: str):
-        LOGGER.debug(str(location) + ": " + str(message))
+    l_debug = _LogLevel(level=logging.DEBUG)
+    l_info = _LogLevel(level=logging.INFO)
+    l_warning = _LogLevel(level=logging.WARNING)
+    l_error = _LogLevel(level=logging.ERROR)
+    l_critical = _LogLevel(level=logging.CRITICAL)
+
+
+# Previous per line tasks, kept so lines queued before a deploy are still written.
+@app.task(bind=True, name="api.background_tasks.logger.l_debug")
+def _l_debug(self, location: str, message: str):
+    LOGGER.debug(str(location) + ": " + str(message))
+
+
+@app.task(bind=True, name="api.background_tasks.logger.l_info")
+def _l_info(self, location: str, message: str):
+    LOGGER.info(str(location) + ": " + str(message))
+
+
+@app.task(bind=True, name="api.background_tasks.logger.l_warning")
+def _l_warning(self, location: str, message: str):
+    LOGGER.warning(str(location) + ": " + str(message))
 
-    @app.task(bind=True)
-    def l_info(self, location: str, message: str):
-        LOGGER.info(str(location) + ": " + str(message))
 
-    @app.task(bind=True)
-    def l_warning(self, location: str, message: str):
-        LOGGER.warning(str(location) + ": " + str(message))
+@app.task(bind=True, name="api.background_tasks.logger.l_error")
+def _l_error(self, location: str, message: str):
+    LOGGER.error(str(location) + ": " + str(message))
 
-    @app.task(bind=True)
-    def l_error(self, location: str, message: str):
-        LOGGER.error(str(location) + ": " + str(message))
 
-    @app.task(bind=True)
-    def l_critical(self, location: str, message: str):
-        LOGGER.critical(str(location) + ": " + str(message))
+@app.task(bind=True, name="api.background_tasks.logger.l_critical")
+def _l_critical(self, location: str, message: str):
+    LOGGER.critical(str(location) + ": " + str(message))
@@ -0,0 +1,36 @@
+"""
+    Title: Celery Metric Rollup
+    Description: This file will contain functions for Celery Metric Rollup.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from django.core.exceptions import ObjectDoesNotExist
+
+from brain.celery import app
+
+
+class CeleryMetricRollup:
+    """
+        Refresh metric rollups behind the scenes.
+    """
+
+    @app.task(bind=True)
+    def refresh_shipment(self, shipment_id: str) -> None:
+        """
+            Rebuild the metric rollups of a shipment's sub account and day after it is shipped or canceled.
+            :param shipment_id: ubbe shipment id
+            :return: None
+        """
+        from api.apis.metric_v3.metric_rollup import MetricRollup
+        from api.models import Shipment
+
+        try:
+            shipment = Shipment.objects.get(shipment_id=shipment_id)
+        except ObjectDoesNotExist as e:
+            from api.background_tasks.logger import CeleryLogger
+            CeleryLogger().l_critical.delay(location="metric_rollup.py: Line: 33", message=str(e))
+            return None
+
+        MetricRollup().refresh_shipment(shipment=shipment)
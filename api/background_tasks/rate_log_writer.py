@@ -0,0 +1,269 @@
+"""
+    Title: Rate Log Writer
+    Description: This file will contain the write behind buffer for rate logs. New rate logs and response updates are
+                 kept in process and a background greenlet writes them with bulk_create and bulk_update, so a quote
+                 does not wait on the rate log table.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import atexit
+import json
+import os
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.utils import timezone
+from gevent.lock import RLock
+
+from api.background_tasks.background_flusher import BackgroundFlusher
+from api.globals.project import LOGGER
+from api.models import RateLog
+
+
+class RateLogWriter:
+    """
+        Rate Log Write Behind Buffer
+
+        Rate logs carry their rate log id from RateLog.create, an update to a log that is still waiting to be created
+        is folded into the insert. A full batch is flushed inline. When a bulk write fails the rate logs are saved one
+        at a time, a rate log that still fails is queued again until it runs out of attempts.
+    """
+
+    _json_fields = ("rate_data", "response_data", "ship_data")
+
+    def __init__(self, batch_size: int = 200, interval: float = 1.0, max_attempts: int = 3) -> None:
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._lock = RLock()
+        self._flusher = BackgroundFlusher(
+            flush=self.flush, pending=self._pending, interval=interval, after_flush=self._close_connection
+        )
+        self._reset()
+
+    def _reset(self) -> None:
+        """
+            Reset the buffers, a forked worker starts empty.
+        """
+        self._pid = os.getpid()
+        self._creates = {}
+        self._updates = {}
+        self._attempts = {}
+
+    def _pending(self) -> int:
+        return len(self._creates) + len(self._updates)
+
+    def _queued(self) -> None:
+        """
+            Flush a full batch inline, otherwise make sure the background flush is running.
+        """
+
+        if self._pending() >= self._batch_size:
+            self.flush()
+        else:
+            self._flusher.start()
+
+    @staticmethod
+    def _close_connection() -> None:
+        """
+            Close the flush greenlet's database connection, it is not closed by a request finishing.
+        """
+
+        if not connection.in_atomic_block:
+            connection.close()
+
+    def _snapshot(self, rate_log: RateLog, fields) -> None:
+        """
+            Serialize the json fields now, later changes to the request or response dicts are not written.
+            :param rate_log: rate log
+            :param fields: field names
+        """
+
+        for field in fields:
+            if field in self._json_fields and getattr(rate_log, field) is not None:
+                setattr(rate_log, field, json.loads(json.dumps(getattr(rate_log, field), cls=DjangoJSONEncoder)))
+
+    def add(self, rate_log: RateLog) -> None:
+        """
+            Queue a new rate log, it is validated here as bulk_create does not call RateLog.save.
+            :param rate_log: unsaved rate log from RateLog.create
+        """
+
+        if self._pid != os.getpid():
+            self._reset()
+
+        self._snapshot(rate_log=rate_log, fields=self._json_fields)
+
+        try:
+            rate_log.clean_fields()
+        except ValidationError as e:
+            LOGGER.error(f"Rate Log Writer: rate log {rate_log.rate_log_id} not queued: {str(e)}")
+            return
+
+        with self._lock:
+            self._creates[rate_log.rate_log_id] = rate_log
+
+        self._queued()
+
+    def update(self, rate_log: RateLog, fields: list) -> None:
+        """
+            Queue a rate log update, merged into the insert when the log has not been written yet.
+            :param rate_log: rate log
+            :param fields: changed field names
+        """
+
+        if self._pid != os.getpid():
+            self._reset()
+
+        self._snapshot(rate_log=rate_log, fields=fields)
+
+        # bulk_update does not call pre_save, set the auto_now field here.
+        rate_log.modified_date = timezone.now()
+
+        with self._lock:
+
+            if self._creates.get(rate_log.rate_log_id) is rate_log:
+                return
+
+            pending = self._updates.get(rate_log.rate_log_id)
+            fields = set(fields) | {"modified_date"} | (pending[1] if pending else set())
+            self._updates[rate_log.rate_log_id] = (rate_log, fields)
+
+        self._queued()
+
+    def flush(self) -> int:
+        """
+            Write the queued rate logs, creates before updates.
+            :return: number of rate logs written
+        """
+
+        with self._lock:
+            creates = list(self._creates.values())
+            updates = list(self._updates.values())
+            self._creates = {}
+            self._updates = {}
+
+            if not creates and not updates:
+                return 0
+
+            try:
+                with transaction.atomic():
+                    RateLog.objects.bulk_create(creates, batch_size=self._batch_size)
+
+                    if updates:
+                        self._bulk_update(updates=updates)
+            except Exception as e:
+                LOGGER.error(
+                    f"Rate Log Writer: bulk write of {len(creates)} creates and {len(updates)} updates failed, saving "
+                    f"one at a time: {str(e)}"
+                )
+                return self._save_each(creates=creates, updates=updates)
+
+            for rate_log in creates:
+                rate_log._state.adding = False
+                self._attempts.pop(rate_log.rate_log_id, None)
+
+            for rate_log, _ in updates:
+                self._attempts.pop(rate_log.rate_log_id, None)
+
+        return len(creates) + len(updates)
+
+    def _save_each(self, creates: list, updates: list) -> int:
+        """
+            Save rate logs one at a time after a failed bulk write, failed rate logs are queued again.
+            :param creates: list of rate logs
+            :param updates: list of (rate log, fields)
+            :return: number of rate logs written
+        """
+        count = 0
+
+        for rate_log, fields in [(rate_log, None) for rate_log in creates] + updates:
+
+            try:
+                with transaction.atomic():
+
+                    if fields is None:
+                        # The bulk insert was rolled back, a primary key it returned is not in the table.
+                        rate_log.pk = None
+                        rate_log.save()
+                    else:
+                        self._resolve_pk(rate_logs=[rate_log])
+
+                        if rate_log.pk is None:
+                            raise RateLog.DoesNotExist(f"{rate_log.rate_log_id} not written yet.")
+
+                        rate_log.save(update_fields=list(fields))
+            except Exception as e:
+                self._retry(rate_log=rate_log, fields=fields, error=str(e))
+                continue
+
+            self._attempts.pop(rate_log.rate_log_id, None)
+            count += 1
+
+        return count
+
+    def _retry(self, rate_log: RateLog, fields, error: str) -> None:
+        """
+            Queue a failed rate log again, or drop it once it runs out of attempts.
+            :param rate_log: rate log
+            :param fields: updated field names, None for a create
+            :param error: save error
+        """
+        attempts = self._attempts.get(rate_log.rate_log_id, 0) + 1
+
+        if attempts >= self._max_attempts:
+            self._attempts.pop(rate_log.rate_log_id, None)
+            LOGGER.critical(
+                f"Rate Log Writer: rate log {rate_log.rate_log_id} dropped after {attempts} attempts: {error}"
+            )
+            return
+
+        self._attempts[rate_log.rate_log_id] = attempts
+
+        if fields is None:
+            self._creates.setdefault(rate_log.rate_log_id, rate_log)
+            return
+
+        pending = self._updates.get(rate_log.rate_log_id)
+        self._updates[rate_log.rate_log_id] = (rate_log, set(fields) | (pending[1] if pending else set()))
+
+    @staticmethod
+    def _resolve_pk(rate_logs: list) -> None:
+        """
+            Load the primary keys the database did not return on insert, by rate log id in one indexed query.
+            :param rate_logs: list of rate logs
+        """
+        missing = [rate_log.rate_log_id for rate_log in rate_logs if rate_log.pk is None]
+
+        if not missing:
+            return
+
+        pks = dict(RateLog.objects.filter(rate_log_id__in=missing).values_list("rate_log_id", "pk"))
+
+        for rate_log in rate_logs:
+            if rate_log.pk is None:
+                rate_log.pk = pks.get(rate_log.rate_log_id)
+
+    def _bulk_update(self, updates: list) -> None:
+        """
+            Update rate logs, grouped by changed fields.
+            :param updates: list of (rate log, fields)
+        """
+        self._resolve_pk(rate_logs=[rate_log for rate_log, _ in updates])
+        by_fields = {}
+
+        for rate_log, fields in updates:
+
+            if rate_log.pk is None:
+                continue
+
+            by_fields.setdefault(tuple(sorted(fields)), []).append(rate_log)
+
+        for fields, rate_logs in by_fields.items():
+            RateLog.objects.bulk_update(rate_logs, fields=list(fields), batch_size=self._batch_size)
+
+
+RATE_LOG_WRITER = RateLogWriter()
+atexit.register(RATE_LOG_WRITER.flush)
@@ -3,11 +3,9 @@
     Description: This file will contain functions for Celery Rate Logging.
     Created: May 5, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
-from django.core.exceptions import ObjectDoesNotExist
-
 from api.globals.project import LOGGER
 from api.models import RateLog, SubAccount
 from brain.celery import app
@@ -28,7 +26,7 @@ class CeleryRateLog:
             :return: None
         """
 
-        if RateLog.objects.filter(rate_data=rate_request).exists():
+        if RateLog.objects.filter(request_hash=RateLog.get_request_hash(rate_data=rate_request)).exists():
             return None
 
         try:
@@ -58,26 +56,24 @@ class CeleryRateLog:
             :param rate_response: ubbe Rate Api Response.
             :return: None
         """
-        rate_log = RateLog.objects.get(rate_log_id=rate_log_id)
-        rate_log.response_data = rate_response
-        rate_log.is_no_rate = False
-        rate_log.save()
+        RateLog.objects.filter(rate_log_id=rate_log_id).update(response_data=rate_response, is_no_rate=False)
 
-    @app.task(bind=True)
+    @app.task(bind=True, max_retries=5, default_retry_delay=5)
     def log_rate_selected_response(self, rate_log_id: str, ship_request: dict, shipment_id: str) -> None:
         """
-            Rate Log for no rates returning.
+            Rate Log for no rates returning. The rate log is written behind by the rate worker, the task is retried
+            until the log exists.
             :param rate_log_id: Log Id
             :param ship_request: ubbe Ship Api Request.
             :param shipment_id: ubbe Shipment id.
             :return: None
         """
 
-        try:
-            rate_log = RateLog.objects.get(rate_log_id=rate_log_id)
-        except ObjectDoesNotExist as e:
-            return
+        if RateLog.objects.filter(rate_log_id=rate_log_id).update(ship_data=ship_request, shipment_id=shipment_id):
+            return None
+
+        if self.request.retries >= self.max_retries:
+            LOGGER.warning(f"Rate Log: '{rate_log_id}' not found, ship data for '{shipment_id}' was not logged.")
+            return None
 
-        rate_log.ship_data = ship_request
-        rate_log.shipment_id = shipment_id
-        rate_log.save()
+        raise self.retry()
@@ -0,0 +1,26 @@
+"""
+    Title: Celery Reports
+    Description: This file will contain functions for Celery Reports.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from brain.celery import app
+
+
+class CeleryReports:
+    """
+        Generate report files behind the scenes.
+    """
+
+    @app.task(bind=True)
+    def run_report_job(self, job_id: str) -> None:
+        """
+            Generate and store the report file of a submitted report job.
+            :param job_id: report job id
+            :return: None
+        """
+        from api.apis.reports.report_job import ReportJobs
+
+        ReportJobs().run(job_id=job_id)
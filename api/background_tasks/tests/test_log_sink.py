@@ -0,0 +1,115 @@
+import logging
+from logging.handlers import SMTPHandler
+from unittest import mock
+
+from django.test import TestCase
+
+from api.background_tasks.log_sink import LogSink
+from api.background_tasks.logger import CeleryLogger, LOG_SINK
+
+
+class ListHandler(logging.Handler):
+
+    def __init__(self, level: int = logging.DEBUG):
+        super().__init__(level=level)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class LogSinkTests(TestCase):
+
+    def setUp(self):
+        # Test settings disable logging.
+        self.disabled = logging.root.manager.disable
+        logging.disable(logging.NOTSET)
+        self.logger = logging.Logger("log_sink_test", level=logging.DEBUG)
+        self.handler = ListHandler()
+        self.mail = SMTPHandler(mailhost="localhost", fromaddr="a@b.com", toaddrs=["c@d.com"], subject="")
+        self.mail.setLevel(logging.ERROR)
+        self.logger.addHandler(self.handler)
+        self.logger.addHandler(self.mail)
+        self.remote = []
+        self.sink = LogSink(logger=self.logger, remote=self.remote.extend, capacity=3, batch_size=10, interval=60)
+
+    def tearDown(self):
+        logging.disable(self.disabled)
+
+    def test_interval_flush_without_hub(self):
+        sink = LogSink(logger=self.logger, capacity=10, batch_size=10, interval=0)
+        sink.put(level=logging.INFO, location="rate.py", message="1")
+
+        self.assertEqual(len(self.handler.records), 1)
+
+    def test_put_buffers(self):
+        self.assertTrue(self.sink.put(level=logging.INFO, location="rate.py line: 1", message="hello"))
+        self.assertEqual(self.handler.records, [])
+        self.assertEqual(self.sink.stats(), {"buffered": 1, "flushed": 0, "dropped": 0})
+
+    def test_flush(self):
+        self.sink.put(level=logging.INFO, location="rate.py line: 1", message="hello")
+        self.sink.put(level=logging.DEBUG, location="rate.py line: 2", message="world")
+
+        self.assertEqual(self.sink.flush(), 2)
+        self.assertEqual(
+            [record.getMessage() for record in self.handler.records], ["rate.py line: 1: hello", "rate.py line: 2: world"]
+        )
+        self.assertEqual(self.handler.records[0].location, "rate.py line: 1")
+        self.assertEqual(self.remote, [])
+
+    def test_remote_email_records(self):
+        self.sink.put(level=logging.WARNING, location="rate.py line: 2", message="careful")
+        self.sink.put(level=logging.CRITICAL, location="rate.py line: 1", message="boom")
+
+        self.assertEqual(len(self.handler.records), 2)
+        self.assertEqual(len(self.remote), 1)
+        self.assertEqual(self.remote[0][:2], [logging.CRITICAL, "rate.py line: 1: boom"])
+        self.assertEqual(self.remote[0][2:], [__file__, self.handler.records[1].lineno, "test_remote_email_records"])
+
+    def test_error_flushed_inline(self):
+        self.sink.put(level=logging.INFO, location="rate.py line: 1", message="hello")
+        self.assertEqual(self.handler.records, [])
+
+        self.sink.put(level=logging.ERROR, location="rate.py line: 2", message="boom")
+        self.assertEqual(len(self.handler.records), 2)
+        self.assertEqual(self.sink.stats()["buffered"], 0)
+
+    def test_caller_location(self):
+        self.sink.put(level=logging.INFO, location="rate.py line: 1", message="hello")
+        self.sink.flush()
+        record = self.handler.records[0]
+
+        self.assertEqual((record.pathname, record.funcName), (__file__, "test_caller_location"))
+
+    def test_dropped(self):
+        for line in range(5):
+            self.sink.put(level=logging.INFO, location="rate.py", message=str(line))
+
+        self.assertFalse(self.sink.put(level=logging.INFO, location="rate.py", message="5"))
+        self.assertEqual(self.sink.stats()["dropped"], 3)
+        self.sink.flush()
+
+        messages = [record.getMessage() for record in self.handler.records]
+        self.assertEqual(messages[:3], ["rate.py: 3", "rate.py: 4", "rate.py: 5"])
+        self.assertEqual(messages[3], "Log Sink: dropped 3 log lines, buffer full.")
+
+    def test_full_batch_flushed_inline(self):
+        sink = LogSink(logger=self.logger, capacity=10, batch_size=2, interval=60)
+        sink.put(level=logging.INFO, location="rate.py", message="1")
+        sink.put(level=logging.INFO, location="rate.py", message="2")
+
+        self.assertEqual(len(self.handler.records), 2)
+
+    def test_celery_logger_compatible(self):
+        with mock.patch.object(LOG_SINK, "_write") as write:
+            LOG_SINK.flush()
+            CeleryLogger().l_info.delay(location="rate.py line: 1", message="hello")
+            CeleryLogger.l_debug(location="rate.py line: 2", message={"rate": 1})
+            LOG_SINK.flush()
+
+        records = [record for call in write.call_args_list for record in call.kwargs["batch"]]
+        self.assertEqual([record.getMessage() for record in records], [
+            "rate.py line: 1: hello", "rate.py line: 2: {'rate': 1}"
+        ])
+        self.assertEqual([record.funcName for record in records], ["test_celery_logger_compatible"] * 2)
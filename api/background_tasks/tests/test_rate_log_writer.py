@@ -0,0 +1,166 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.db import OperationalError
+from django.test import TestCase
+
+from api.background_tasks.rate_log_writer import RateLogWriter
+from api.background_tasks.rate_logging import CeleryRateLog
+from api.models import RateLog, SubAccount
+
+
+class RateLogWriterTests(TestCase):
+    fixtures = [
+        "carriers",
+        "user",
+        "group",
+        "countries",
+        "provinces",
+        "addresses",
+        "contact",
+        "markup",
+        "account",
+        "subaccount",
+    ]
+
+    def setUp(self):
+        self.sub_account = SubAccount.objects.get(pk=1)
+        self.writer = RateLogWriter(batch_size=50, interval=60)
+        self.request = {
+            "account_number": str(self.sub_account.subaccount_number),
+            "origin": {"city": "Edmonton", "province": "AB", "country": "CA"},
+            "destination": {"city": "Inuvik", "province": "NT", "country": "CA"},
+            "packages": [{"weight": Decimal("10.5")}],
+        }
+
+    def _create(self) -> RateLog:
+        return RateLog.create(param_dict={
+            "sub_account": self.sub_account,
+            "rate_data": self.request,
+            "response_data": "{}",
+            "is_no_rate": True
+        })
+
+    def test_create_sets_ids(self):
+        rate_log = self._create()
+        self.assertEqual(len(rate_log.rate_log_id), 36)
+        self.assertEqual(rate_log.request_hash, RateLog.get_request_hash(rate_data=self.request))
+
+    def test_request_hash_key_order(self):
+        reordered = dict(reversed(list(self.request.items())))
+        self.assertEqual(RateLog.get_request_hash(rate_data=reordered), RateLog.get_request_hash(rate_data=self.request))
+
+    def test_update_merged_into_create(self):
+        rate_log = self._create()
+        self.writer.add(rate_log=rate_log)
+        rate_log.response_data = {"rates": [{"total": Decimal("10.00")}]}
+        rate_log.is_no_rate = False
+        self.writer.update(rate_log=rate_log, fields=["response_data", "is_no_rate"])
+
+        self.assertEqual(RateLog.objects.count(), 0)
+
+        # One insert, the test case transaction adds a savepoint around it.
+        with self.assertNumQueries(3):
+            self.assertEqual(self.writer.flush(), 1)
+
+        stored = RateLog.objects.get(rate_log_id=rate_log.rate_log_id)
+        self.assertFalse(stored.is_no_rate)
+        self.assertEqual(stored.response_data, {"rates": [{"total": "10.00"}]})
+
+    def test_update_after_flush(self):
+        rate_logs = [self._create() for _ in range(3)]
+
+        for rate_log in rate_logs:
+            self.writer.add(rate_log=rate_log)
+
+        self.writer.flush()
+
+        for rate_log in rate_logs:
+            rate_log.is_no_rate = False
+            self.writer.update(rate_log=rate_log, fields=["is_no_rate"])
+
+        self.assertEqual(self.writer.flush(), 3)
+        self.assertEqual(RateLog.objects.filter(is_no_rate=False).count(), 3)
+
+    def test_full_batch_flushed_inline(self):
+        writer = RateLogWriter(batch_size=2, interval=60)
+        writer.add(rate_log=self._create())
+        writer.add(rate_log=self._create())
+
+        self.assertEqual(RateLog.objects.count(), 2)
+
+    def test_rate_data_serialized_on_add(self):
+        rate_log = self._create()
+        self.writer.add(rate_log=rate_log)
+        self.request["origin"]["city"] = "Calgary"
+        self.writer.flush()
+
+        stored = RateLog.objects.get(rate_log_id=rate_log.rate_log_id)
+        self.assertEqual(stored.rate_data["origin"]["city"], "Edmonton")
+        self.assertEqual(stored.rate_data["packages"], [{"weight": "10.5"}])
+
+    def test_bulk_failure_saves_one_at_a_time(self):
+        rate_logs = [self._create() for _ in range(2)]
+
+        for rate_log in rate_logs:
+            self.writer.add(rate_log=rate_log)
+
+        with mock.patch.object(RateLog.objects, "bulk_create", side_effect=OperationalError("gone away")):
+            self.assertEqual(self.writer.flush(), 2)
+
+        self.assertEqual(RateLog.objects.count(), 2)
+
+    def test_failed_rows_queued_again(self):
+        writer = RateLogWriter(batch_size=50, interval=60, max_attempts=2)
+        rate_log = self._create()
+        writer.add(rate_log=rate_log)
+
+        with mock.patch.object(RateLog.objects, "bulk_create", side_effect=OperationalError("gone away")), \
+                mock.patch.object(RateLog, "save", side_effect=OperationalError("gone away")):
+            self.assertEqual(writer.flush(), 0)
+            self.assertEqual(writer._pending(), 1)
+
+        self.assertEqual(writer.flush(), 1)
+        self.assertTrue(RateLog.objects.filter(rate_log_id=rate_log.rate_log_id).exists())
+
+        writer.add(rate_log=self._create())
+
+        with mock.patch.object(RateLog.objects, "bulk_create", side_effect=OperationalError("gone away")), \
+                mock.patch.object(RateLog, "save", side_effect=OperationalError("gone away")):
+            writer.flush()
+            writer.flush()
+
+        self.assertEqual(writer._pending(), 0)
+
+    def test_log_rate_dedupe(self):
+        CeleryRateLog.log_rate(rate_request=self.request, rate_response={}, is_no_rate=True)
+        CeleryRateLog.log_rate(rate_request=dict(self.request), rate_response={}, is_no_rate=True)
+
+        self.assertEqual(RateLog.objects.filter(request_hash=RateLog.get_request_hash(self.request)).count(), 1)
+
+    def test_log_rate_selected_response(self):
+        rate_log = self._create()
+        self.writer.add(rate_log=rate_log)
+        self.writer.flush()
+        result = CeleryRateLog.log_rate_selected_response.apply(
+            kwargs={"rate_log_id": str(rate_log.rate_log_id), "ship_request": {"is_ship": True}, "shipment_id": "1"}
+        )
+        rate_log.refresh_from_db()
+
+        self.assertEqual(result.state, "SUCCESS")
+        self.assertEqual(rate_log.ship_data, {"is_ship": True})
+
+    def test_log_rate_selected_response_retried_until_flushed(self):
+        rate_log = self._create()
+        kwargs = {"rate_log_id": str(rate_log.rate_log_id), "ship_request": {"is_ship": True}, "shipment_id": "1"}
+
+        with mock.patch.object(CeleryRateLog.log_rate_selected_response, "retry", side_effect=Exception) as retry:
+            with self.assertRaises(Exception):
+                CeleryRateLog.log_rate_selected_response.apply(kwargs=kwargs, throw=True)
+
+        retry.assert_called_once()
+
+        result = CeleryRateLog.log_rate_selected_response.apply(kwargs=kwargs, retries=5)
+
+        self.assertEqual(result.state, "SUCCESS")
+        self.assertFalse(RateLog.objects.filter(rate_log_id=rate_log.rate_log_id).exists())
@@ -0,0 +1,25 @@
+"""
+    Title: Celery Webhook Dispatch
+    Description: This file will post the queued webhook deliveries behind the scenes.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from brain.celery import app
+
+
+class CeleryWebhooks:
+    """
+        Post queued webhook deliveries behind the scenes.
+    """
+
+    @app.task(bind=True)
+    def dispatch_webhooks(self) -> None:
+        """
+            Post the due webhook deliveries, retries queue the next run.
+            :return: None
+        """
+        from api.utilities.webhook_dispatcher import WebhookDispatcher
+
+        WebhookDispatcher().dispatch()
@@ -4,13 +4,12 @@
         This file will Trigger Webhook post for Tracking status change behind the scenes, if all conditions pass.
     Created: July 14, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
-from django.core.exceptions import ObjectDoesNotExist
-
+from api.cache_lookups.webhook_cache import WebhookCache
 from api.serializers_v3.common.track_serializers import TrackSerializer
-from api.utilities.webhooks import WebHookEvent
+from api.utilities.webhook_dispatcher import WebhookDispatcher
 
 from brain.celery import app
 
@@ -23,30 +22,28 @@ class CeleryTrackStatusChange:
     @app.task(bind=True)
     def tracking_status_change(self, status: int, leg_id: str) -> None:
         """
-            Perform webhook event for tracking status change if the sub account has the webhook setup.
+            Queue the webhook event for tracking status change if the sub account has the webhook setup, events inside
+            the batch window are posted together.
             :param status:
             :return: None
         """
-        from api.models import TrackingStatus, Webhook
+        from api.models import TrackingStatus
 
         event = "TSC"
 
-        statuses = TrackingStatus.objects.select_related(
-            "leg__shipment__subaccount"
-        ).filter(leg__leg_id=leg_id).order_by('-updated_datetime')[:2]
+        latest_status = TrackingStatus.objects.select_related(
+            "leg__shipment"
+        ).filter(leg__leg_id=leg_id).order_by('-updated_datetime').first()
 
-        if statuses.count() < 1:
+        if not latest_status:
             return
 
-        latest_status = statuses[0]
-        sub_account = latest_status.leg.shipment.subaccount
-        data = TrackSerializer(latest_status, many=False).data
-        data["leg_id"] = latest_status.leg_id
+        webhook_id = WebhookCache().get_webhook_id(sub_account_id=latest_status.leg.shipment.subaccount_id, event=event)
 
-        try:
-            webhook = Webhook.objects.get(sub_account=sub_account, event=event)
-        except ObjectDoesNotExist:
+        if not webhook_id:
             return
 
-        wb = WebHookEvent(data=data, sub_account=sub_account, webhook=webhook)
-        wb.send_event()
+        data = TrackSerializer(latest_status, many=False).data
+        data["leg_id"] = latest_status.leg_id
+
+        WebhookDispatcher().enqueue(webhook_id=webhook_id, data=data)
@@ -35,7 +35,8 @@ class APICache:
         return {
             "name": api.name,
             "is_active": api.active,
-            "category": api.category
+            "category": api.category,
+            "rate_cache_ttl": api.rate_cache_ttl
         }
 
     def get_api_cache(self, api_name: str) -> dict:
@@ -43,3 +43,35 @@ class CarrierCache:
             cache.set(look_up, carriers, TWENTY_FOUR_HOURS_CACHE_TTL)
 
         return carriers
+
+    @staticmethod
+    def _get_carrier_rate_cache_ttls(carrier_ids: list) -> dict:
+        """
+            Get the rate cache ttl overrides for a list of carriers.
+            :param carrier_ids: carrier codes
+            :return: carrier code to rate cache ttl, None when the carrier uses the api ttl.
+        """
+
+        return dict(Carrier.objects.filter(code__in=carrier_ids).values_list("code", "rate_cache_ttl"))
+
+    def get_carrier_rate_cache_ttls(self, carrier_ids: list) -> dict:
+        """
+            Get the rate cache ttl overrides for a list of carriers, check cache then DB look up the missing carriers
+            and store.
+            :param carrier_ids: carrier codes
+            :return: carrier code to rate cache ttl, None when the carrier uses the api ttl.
+        """
+
+        look_ups = {f"carrier_rate_cache_ttl_{carrier_id}": carrier_id for carrier_id in carrier_ids}
+        cached = cache.get_many(list(look_ups.keys()))
+        ttls = {look_ups[key]: value["ttl"] for key, value in cached.items()}
+        missing = [carrier_id for carrier_id in carrier_ids if carrier_id not in ttls]
+
+        if missing:
+            found = self._get_carrier_rate_cache_ttls(carrier_ids=missing)
+
+            for carrier_id in missing:
+                ttls[carrier_id] = found.get(carrier_id)
+                cache.set(f"carrier_rate_cache_ttl_{carrier_id}", {"ttl": ttls[carrier_id]}, TWENTY_FOUR_HOURS_CACHE_TTL)
+
+        return ttls
@@ -0,0 +1,110 @@
+"""
+    Title: City Alias Cache Interface
+    Description: This file will contain all functions for resolving carrier and location city aliases from a compiled
+                 alias map instead of one query per city.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from typing import Optional
+
+from django.core.cache import cache
+
+from api.models import CityNameAlias, LocationCityAlias
+from brain.settings import TWENTY_FOUR_HOURS_CACHE_TTL
+
+
+class CityAliasCache:
+    """
+        City Alias Cache Interface
+
+        Every alias is compiled into one map keyed by (lowercase alias, province code, country code, carrier code),
+        location aliases (google distance) use None as the carrier. The map is stored in redis per version and kept
+        in process until the version is bumped by an alias save or delete.
+    """
+
+    _version_key = "city_alias_version"
+    _map_key = "city_alias_map_{}"
+
+    # Process local copy of the alias map: (version, map)
+    _compiled = (None, {})
+
+    @staticmethod
+    def _build_map() -> dict:
+        """
+            Build the alias map from every carrier and location city alias.
+            :return: alias map
+        """
+        alias_map = {
+            (alias.lower(), province, country, carrier): name
+            for alias, province, country, carrier, name in CityNameAlias.objects.values_list(
+                "alias", "province__code", "province__country__code", "carrier__code", "name"
+            )
+        }
+
+        alias_map.update({
+            (alias.lower(), province, country, None): name
+            for alias, province, country, name in LocationCityAlias.objects.values_list(
+                "alias", "province__code", "province__country__code", "name"
+            )
+        })
+
+        return alias_map
+
+    def _get_map(self) -> dict:
+        """
+            Get the alias map for the current version, check process then redis then DB look it up and store.
+            :return: alias map
+        """
+        version = cache.get(self._version_key, 0)
+        compiled_version, alias_map = CityAliasCache._compiled
+
+        if compiled_version == version:
+            return alias_map
+
+        look_up = self._map_key.format(version)
+        alias_map = cache.get(look_up)
+
+        if alias_map is None:
+            alias_map = self._build_map()
+            cache.set(look_up, alias_map, TWENTY_FOUR_HOURS_CACHE_TTL)
+
+        CityAliasCache._compiled = (version, alias_map)
+
+        return alias_map
+
+    def resolve(self, city: str, province: str, country: str, carrier_id: Optional[int] = None) -> str:
+        """
+            Get the city name for a city alias.
+            :param city: city or city alias
+            :param province: province code
+            :param country: country code
+            :param carrier_id: carrier code, None for location aliases
+            :return: City or City Alias Found
+        """
+        return self._get_map().get((city.lower(), province, country, carrier_id), city)
+
+    def resolve_many(self, cities: list) -> list:
+        """
+            Get the city names for a list of city aliases with one alias map look up.
+            :param cities: list of (city, province code, country code, carrier code or None)
+            :return: list of City or City Alias Found, in the same order
+        """
+        alias_map = self._get_map()
+
+        return [
+            alias_map.get((city.lower(), province, country, carrier_id), city)
+            for city, province, country, carrier_id in cities
+        ]
+
+    @classmethod
+    def bump_version(cls) -> None:
+        """
+            Bump the alias map version, every process rebuilds its map on the next look up.
+        """
+
+        try:
+            cache.incr(cls._version_key)
+        except ValueError:
+            cache.set(cls._version_key, 1, None)
@@ -0,0 +1,90 @@
+"""
+    Title: Document Cache Interface
+    Description: This file will contain all functions for getting pre-rendered static documents from cache. Placards,
+                 battery labels and generic labels depend only on their render params, a document is stored under a
+                 hash of the renderer, its template version, the params and the image files it draws.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import hashlib
+import json
+import os
+
+from django.core.cache import cache
+
+from api.documents.dg_battery import DangerousGoodBattery
+from api.documents.dg_placard import DangerousGoodPlacard
+from api.documents.simple_image_overlay import SimpleImageOverlay
+from brain.settings import TWENTY_FOUR_HOURS_CACHE_TTL
+
+
+class DocumentCache:
+    """
+        Document Cache Interface
+    """
+
+    _key = "document_{}_{}"
+
+    # Cached renderer name: template version, bump the document's template_version when its layout changes.
+    _template_versions = {
+        "placard": DangerousGoodPlacard.template_version,
+        "battery": DangerousGoodBattery.template_version,
+        "image": SimpleImageOverlay.template_version,
+    }
+
+    @staticmethod
+    def _get_image(name: str, params: dict) -> str:
+        """
+            Get the image file a document draws from its params.
+            :param name: renderer name
+            :param params: render params
+            :return: image path or empty
+        """
+
+        if name == "placard":
+            return params["world_request"]["placard_img"]["label"]
+
+        if name == "image":
+            return params["placard"]
+
+        return ""
+
+    def is_cached(self, name: str) -> bool:
+        return name in self._template_versions
+
+    def get_key(self, name: str, params: dict) -> str:
+        """
+            Get the cache key of a document, a replaced image file changes its size or modified time.
+            :param name: renderer name
+            :param params: render params
+            :return: cache key
+        """
+        image = self._get_image(name=name, params=params)
+        stamp = []
+
+        if image:
+            stat = os.stat(image)
+            stamp = [stat.st_size, stat.st_mtime_ns]
+
+        content = json.dumps([self._template_versions[name], params, stamp], sort_keys=True, default=str)
+
+        return self._key.format(name, hashlib.sha256(content.encode()).hexdigest())
+
+    @staticmethod
+    def get_documents(keys: list) -> dict:
+        """
+            Get pre-rendered documents.
+            :param keys: list of cache keys
+            :return: dict of cache key to pdf bytes, missing keys are left out
+        """
+        return cache.get_many(keys)
+
+    @staticmethod
+    def set_documents(documents: dict) -> None:
+        """
+            Store rendered documents.
+            :param documents: dict of cache key to pdf bytes
+        """
+        cache.set_many(documents, TWENTY_FOUR_HOURS_CACHE_TTL)
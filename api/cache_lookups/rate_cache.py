@@ -0,0 +1,173 @@
+"""
+    Title: Rate Cache Interface
+    Description: This file will contain all functions for caching carrier rate responses across requests. Identical
+                 quotes within the carrier ttl are served from cache instead of calling the carrier endpoint again.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import hashlib
+from typing import Callable
+
+from django.core.cache import cache
+
+from api.apis.carriers.union.request_view import RequestView
+from api.cache_lookups.api_cache import APICache
+from api.cache_lookups.carrier_cache import CarrierCache
+from brain.settings import CACHE_TTL
+
+
+class RateCache:
+    """
+        Carrier Rate Cache Interface
+
+        Rates are cached per carrier api, sub account and request fingerprint. The fingerprint is a hash of the
+        canonical request key (carrier set, addresses, packages, options and flags), the request objects are left out.
+        Every carrier has a version number in the key, bumping the version invalidates every cached rate for that
+        carrier without having to find the keys.
+    """
+
+    _version_key = "rate_cache_version_{}"
+    _hits_key = "rate_cache_hits_{}"
+    _misses_key = "rate_cache_misses_{}"
+
+    # Carriers cache the rated service codes for the ship call (TST for 15 minutes), cached rates must expire before.
+    _max_ttl = CACHE_TTL - 5 * 60
+
+    def __init__(self, api_name: str, ubbe_request: dict) -> None:
+        self._api_name = api_name
+        self._ubbe_request = ubbe_request
+        self._sub_account = ubbe_request.get("objects", {}).get("sub_account")
+
+        carrier_ids = ubbe_request.get("carrier_id", [])
+
+        if not isinstance(carrier_ids, (list, tuple)):
+            carrier_ids = [carrier_ids]
+
+        self._carrier_ids = sorted(set(carrier_ids))
+
+    @staticmethod
+    def _increment(look_up: str) -> None:
+        """
+            Increment a counter key, create it when it does not exist. Counters do not expire.
+            :param look_up: counter key
+        """
+
+        try:
+            cache.incr(look_up)
+        except ValueError:
+            cache.set(look_up, 1, None)
+
+    def _get_ttl(self) -> int:
+        """
+            Get the rate cache ttl for the request, the shortest ttl of the carriers in the request. The carrier ttl
+            overrides the api ttl when set.
+            :return: ttl in seconds, 0 when rates should not be cached.
+        """
+        api = APICache().get_api_cache(api_name=self._api_name)
+
+        if not api.get("is_active", False):
+            return 0
+
+        api_ttl = api.get("rate_cache_ttl", 0)
+        carrier_ttls = CarrierCache().get_carrier_rate_cache_ttls(carrier_ids=self._carrier_ids)
+        ttls = [api_ttl if ttl is None else ttl for ttl in carrier_ttls.values()] or [api_ttl]
+
+        return min(min(ttls), self._max_ttl)
+
+    def _is_bypass(self) -> bool:
+        """
+            Check if the request should skip the rate cache, BBE internal accounts always get live rates.
+            :return: True to skip the cache
+        """
+        return not self._sub_account or not self._carrier_ids or self._sub_account.is_bbe
+
+    def _get_look_up(self) -> str:
+        """
+            Get the cache key for the request: api, sub account, carrier versions and request fingerprint.
+            :return: cache key
+        """
+        versions = self.get_versions(carrier_ids=self._carrier_ids)
+        version = "-".join(str(versions[carrier_id]) for carrier_id in self._carrier_ids)
+        fingerprint = hashlib.sha256(repr(RequestView.get_key(request=self._ubbe_request)).encode()).hexdigest()
+
+        return f"rate_cache_{self._api_name}_{self._sub_account.subaccount_number}_{version}_{fingerprint}"
+
+    def rate(self, rate: Callable[[], list]) -> list:
+        """
+            Get rates for the request from cache, call the carrier rate function on a miss and store the rates.
+            Empty rate responses (carrier errors, inactive api) are not stored.
+            :param rate: carrier rate function
+            :return: list of rates
+        """
+
+        if self._is_bypass():
+            return rate()
+
+        ttl = self._get_ttl()
+
+        if not ttl:
+            return rate()
+
+        look_up = self._get_look_up()
+        rates = cache.get(look_up)
+
+        if rates is not None:
+            self._increment(look_up=self._hits_key.format(self._api_name))
+            return rates
+
+        self._increment(look_up=self._misses_key.format(self._api_name))
+        rates = rate()
+
+        if rates:
+            cache.set(look_up, rates, ttl)
+
+        return rates
+
+    @classmethod
+    def invalidate(cls, carrier_ids: list) -> None:
+        """
+            Invalidate every cached rate for the carriers by bumping the carrier versions.
+            :param carrier_ids: carrier codes
+        """
+
+        for carrier_id in set(carrier_ids):
+            cls._increment(look_up=cls._version_key.format(carrier_id))
+
+    @classmethod
+    def get_versions(cls, carrier_ids: list) -> dict:
+        """
+            Get the rate data version of the carriers, the version is bumped every time the carrier rate data changes.
+            :param carrier_ids: carrier codes
+            :return: carrier code to version
+        """
+        versions = cache.get_many([cls._version_key.format(carrier_id) for carrier_id in carrier_ids])
+
+        return {carrier_id: versions.get(cls._version_key.format(carrier_id), 0) for carrier_id in carrier_ids}
+
+    @classmethod
+    def get_stats(cls, api_names: list) -> list:
+        """
+            Get the rate cache hit and miss counters for the apis.
+            :param api_names: api names
+            :return: list of counter dictionaries
+        """
+        counters = cache.get_many(
+            [cls._hits_key.format(name) for name in api_names] + [cls._misses_key.format(name) for name in api_names]
+        )
+        stats = []
+
+        for name in api_names:
+            hits = counters.get(cls._hits_key.format(name), 0)
+            misses = counters.get(cls._misses_key.format(name), 0)
+            total = hits + misses
+
+            stats.append({
+                "name": name,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / total, 4) if total else 0
+            })
+
+        return stats
@@ -0,0 +1,169 @@
+"""
+    Title: Reference Cache Interface
+    Description: This file will contain all functions for validating provinces, countries and account package types
+                 from compiled reference maps instead of queries per address and package.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from typing import NamedTuple, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+
+from api.models import Country, PackageType, Province
+from brain.settings import TWENTY_FOUR_HOURS_CACHE_TTL
+
+
+class PackageTypeReference(NamedTuple):
+    """
+        Package type fields used while parsing a rate request.
+    """
+    is_pharma: bool
+    carriers: frozenset
+
+
+class ReferenceCache:
+    """
+        Reference Cache Interface
+
+        Provinces and countries are compiled into one map, package types into one map per account. The maps are
+        stored in redis per version and kept in process until the version is bumped by a province, country or
+        package type change.
+    """
+
+    _version_key = "reference_version"
+    _map_key = "reference_map_{}"
+    _package_types_key = "reference_package_types_{}_{}"
+
+    # Process local copy of the reference map: (version, map)
+    _compiled = (None, {})
+
+    # Process local copy of the package type maps: (version, {account id: map})
+    _compiled_package_types = (None, {})
+
+    @staticmethod
+    def _build_map() -> dict:
+        """
+            Build the province and country map.
+            :return: reference map
+        """
+        return {
+            "countries": frozenset(Country.objects.values_list("code", flat=True)),
+            "provinces": frozenset(Province.objects.values_list("code", "country__code")),
+        }
+
+    @staticmethod
+    def _build_package_types(account_id: int) -> dict:
+        """
+            Build the package type map of an account.
+            :param account_id: account pk
+            :return: package type code: PackageTypeReference
+        """
+        carriers = {}
+
+        for pk, carrier in PackageType.carrier.through.objects.filter(
+            packagetype__account_id=account_id
+        ).values_list("packagetype_id", "carrier__code"):
+            carriers.setdefault(pk, set()).add(carrier)
+
+        return {
+            code: PackageTypeReference(is_pharma=is_pharma, carriers=frozenset(carriers.get(pk, [])))
+            for pk, code, is_pharma in PackageType.objects.filter(account_id=account_id).values_list(
+                "pk", "code", "is_pharma"
+            )
+        }
+
+    def _get_map(self, version: int) -> dict:
+        """
+            Get the reference map for a version, check process then redis then DB look it up and store.
+            :param version: reference version
+            :return: reference map
+        """
+        compiled_version, reference_map = ReferenceCache._compiled
+
+        if compiled_version == version:
+            return reference_map
+
+        look_up = self._map_key.format(version)
+        reference_map = cache.get(look_up)
+
+        if reference_map is None:
+            reference_map = self._build_map()
+            cache.set(look_up, reference_map, TWENTY_FOUR_HOURS_CACHE_TTL)
+
+        ReferenceCache._compiled = (version, reference_map)
+
+        return reference_map
+
+    def is_province(self, province: str, country: str) -> bool:
+        """
+            Check the province exists in the country.
+            :param province: province code
+            :param country: country code
+            :return: bool
+        """
+        return (province, country) in self._get_map(version=cache.get(self._version_key, 0))["provinces"]
+
+    def is_country(self, country: str) -> bool:
+        """
+            Check the country exists.
+            :param country: country code
+            :return: bool
+        """
+        return country in self._get_map(version=cache.get(self._version_key, 0))["countries"]
+
+    def get_package_types(self, account_id: int) -> dict:
+        """
+            Get the package types of an account, check process then redis then DB look it up and store.
+            :param account_id: account pk
+            :return: package type code: PackageTypeReference
+        """
+        version = cache.get(self._version_key, 0)
+        compiled_version, accounts = ReferenceCache._compiled_package_types
+
+        if compiled_version != version:
+            accounts = {}
+            ReferenceCache._compiled_package_types = (version, accounts)
+
+        package_types = accounts.get(account_id)
+
+        if package_types is not None:
+            return package_types
+
+        look_up = self._package_types_key.format(version, account_id)
+        package_types = cache.get(look_up)
+
+        if package_types is None:
+            package_types = self._build_package_types(account_id=account_id)
+            cache.set(look_up, package_types, TWENTY_FOUR_HOURS_CACHE_TTL)
+
+        accounts[account_id] = package_types
+
+        return package_types
+
+    def get_package_type(self, account_id: int, code: str) -> Optional[PackageTypeReference]:
+        """
+            Get an account package type.
+            :param account_id: account pk
+            :param code: package type code, ex: BOX
+            :return: PackageTypeReference or None
+        """
+        return self.get_package_types(account_id=account_id).get(code)
+
+    @classmethod
+    def _incr_version(cls) -> None:
+
+        try:
+            cache.incr(cls._version_key)
+        except ValueError:
+            cache.set(cls._version_key, 1, None)
+
+    @classmethod
+    def bump_version(cls) -> None:
+        """
+            Bump the reference version once the change commits, every process rebuilds its maps on the next look up.
+            Bumping before the commit would let another process store the old rows under the new version.
+        """
+        transaction.on_commit(cls._incr_version)
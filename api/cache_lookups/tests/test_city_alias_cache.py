@@ -0,0 +1,83 @@
+from django.test import TestCase
+
+from api.cache_lookups.city_alias_cache import CityAliasCache
+from api.models import Carrier, CityNameAlias, LocationCityAlias, Province
+
+
+class CityAliasCacheTests(TestCase):
+    fixtures = [
+        "carriers",
+        "countries",
+        "provinces",
+    ]
+
+    def setUp(self):
+        # Aliases from other tests are rolled back, start every test on a fresh map.
+        CityAliasCache.bump_version()
+
+        self._carrier = Carrier.objects.first()
+        self._province = Province.objects.get(code="AB", country__code="CA")
+        CityNameAlias.objects.create(
+            carrier=self._carrier, province=self._province, name="Edmonton", alias="Edmonton International Airport"
+        )
+        LocationCityAlias.objects.create(province=self._province, name="sherwood park", alias="sherwood")
+
+    def test_resolve(self):
+        city = CityAliasCache().resolve(
+            city="EDMONTON international airport", province="AB", country="CA", carrier_id=self._carrier.code
+        )
+        self.assertEqual(city, "Edmonton")
+
+    def test_resolve_no_alias(self):
+        city = CityAliasCache().resolve(city="Calgary", province="AB", country="CA", carrier_id=self._carrier.code)
+        self.assertEqual(city, "Calgary")
+
+    def test_resolve_other_carrier(self):
+        other = Carrier.objects.exclude(code=self._carrier.code).first()
+        city = CityAliasCache().resolve(
+            city="Edmonton International Airport", province="AB", country="CA", carrier_id=other.code
+        )
+        self.assertEqual(city, "Edmonton International Airport")
+
+    def test_resolve_location(self):
+        self.assertEqual(CityAliasCache().resolve(city="sherwood", province="AB", country="CA"), "sherwood park")
+        self.assertEqual(
+            CityAliasCache().resolve(city="sherwood", province="AB", country="CA", carrier_id=self._carrier.code),
+            "sherwood"
+        )
+
+    def test_resolve_many(self):
+        cities = CityAliasCache().resolve_many(cities=[
+            ("Edmonton International Airport", "AB", "CA", self._carrier.code),
+            ("Calgary", "AB", "CA", self._carrier.code),
+            ("sherwood", "AB", "CA", None),
+        ])
+        self.assertEqual(cities, ["Edmonton", "Calgary", "sherwood park"])
+
+    def test_refresh_on_save(self):
+        CityAliasCache().resolve(city="Leduc", province="AB", country="CA", carrier_id=self._carrier.code)
+        CityNameAlias.objects.create(carrier=self._carrier, province=self._province, name="Nisku", alias="Leduc")
+        city = CityAliasCache().resolve(city="Leduc", province="AB", country="CA", carrier_id=self._carrier.code)
+        self.assertEqual(city, "Nisku")
+
+    def test_refresh_on_delete(self):
+        CityAliasCache().resolve(city="sherwood", province="AB", country="CA")
+        LocationCityAlias.objects.get(alias="sherwood").delete()
+        self.assertEqual(CityAliasCache().resolve(city="sherwood", province="AB", country="CA"), "sherwood")
+
+    def test_refresh_on_bulk_update(self):
+        CityAliasCache().resolve(city="sherwood", province="AB", country="CA")
+        LocationCityAlias.objects.filter(alias="sherwood").update(name="strathcona county")
+        self.assertEqual(
+            CityAliasCache().resolve(city="sherwood", province="AB", country="CA"), "strathcona county"
+        )
+
+    def test_refresh_on_bulk_delete(self):
+        CityAliasCache().resolve(city="sherwood", province="AB", country="CA")
+        LocationCityAlias.objects.filter(alias="sherwood").delete()
+        self.assertEqual(CityAliasCache().resolve(city="sherwood", province="AB", country="CA"), "sherwood")
+
+    def test_check_alias(self):
+        alias = CityNameAlias.check_alias("Edmonton International Airport", "AB", "CA", self._carrier.code)
+        self.assertEqual(alias, "Edmonton")
+        self.assertEqual(LocationCityAlias.check_alias("sherwood", "AB", "CA"), "sherwood park")
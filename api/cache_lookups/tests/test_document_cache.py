@@ -0,0 +1,38 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from api.cache_lookups.document_cache import DocumentCache
+from api.documents.render_service import DocumentRenderService
+
+
+class DocumentCacheTests(TestCase):
+
+    def setUp(self):
+        self.image = ("image", {"placard": "assets/dangerous_goods/labels/generic/cargo-aircraft-only.png"})
+        self.battery = ("battery", {"un_number": 3480})
+        self.keys = [DocumentCache().get_key(name=name, params=params) for name, params in [self.image, self.battery]]
+        cache.delete_many(self.keys)
+        self.addCleanup(cache.delete_many, self.keys)
+
+    def test_get_key(self):
+        document_cache = DocumentCache()
+        name, params = self.image
+
+        self.assertEqual(document_cache.get_key(name=name, params=dict(params)), self.keys[0])
+        self.assertNotEqual(document_cache.get_key(name=name, params=dict(params, width=50)), self.keys[0])
+        self.assertNotEqual(document_cache.get_key(name="battery", params={"un_number": 3090}), self.keys[1])
+        self.assertTrue(document_cache.is_cached(name="placard"))
+        self.assertFalse(document_cache.is_cached(name="declaration"))
+
+    def test_render_stores_documents(self):
+        rendered = DocumentRenderService(workers=0).render(documents=[self.image, self.battery, self.image])
+
+        self.assertEqual(rendered[0], rendered[2])
+        self.assertEqual(DocumentCache.get_documents(keys=self.keys), dict(zip(self.keys, rendered[:2])))
+
+    def test_render_reads_cache(self):
+        DocumentCache.set_documents(documents={self.keys[0]: b"%PDF-cached"})
+        rendered = DocumentRenderService(workers=0).render(documents=[self.battery, self.image])
+
+        self.assertEqual(rendered[1], b"%PDF-cached")
+        self.assertTrue(rendered[0].startswith(b"%PDF"))
@@ -0,0 +1,165 @@
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from api.cache_lookups.rate_cache import RateCache
+from api.globals.carriers import YRC
+from api.models import API, Carrier, CarrierMarkup, FuelSurcharge, SubAccount
+
+
+class RateCacheTests(TestCase):
+    fixtures = [
+        "api",
+        "carriers",
+        "countries",
+        "provinces",
+        "addresses",
+        "contact",
+        "user",
+        "group",
+        "markup",
+        "account",
+        "subaccount",
+        "carrier_markups",
+        "fuel_surcharge",
+    ]
+
+    def setUp(self):
+        API.objects.filter(name="YRC").update(rate_cache_ttl=300)
+        Carrier.objects.filter(code=YRC).update(rate_cache_ttl=None)
+        cache.delete_many(["api_active_YRC", f"carrier_rate_cache_ttl_{YRC}"])
+        # Start every test in a fresh cache namespace for the carrier.
+        RateCache.invalidate(carrier_ids=[YRC])
+
+        self._sub_account = SubAccount.objects.get(id=1)
+        self._sub_account.is_bbe = False
+        self.request = {
+            "carrier_id": [YRC],
+            "origin": {"city": "Edmonton", "province": "AB", "country": "CA", "postal_code": "T9E0V6"},
+            "destination": {"city": "Calgary", "province": "AB", "country": "CA", "postal_code": "T2T1T1"},
+            "packages": [{"weight": Decimal("10.00"), "quantity": 1}],
+            "objects": {"sub_account": self._sub_account},
+        }
+        self.calls = 0
+
+    def _rate(self) -> list:
+        self.calls += 1
+        return [{"carrier_id": YRC, "total": Decimal("100.00")}]
+
+    def _empty_rate(self) -> list:
+        self.calls += 1
+        return []
+
+    def test_rate_cached(self):
+        first = RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        second = RateCache(api_name="YRC", ubbe_request=dict(self.request)).rate(rate=self._rate)
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, 1)
+
+    def test_rate_different_request(self):
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        other = dict(self.request)
+        other["packages"] = [{"weight": Decimal("20.00"), "quantity": 1}]
+        RateCache(api_name="YRC", ubbe_request=other).rate(rate=self._rate)
+        self.assertEqual(self.calls, 2)
+
+    def test_rate_decimal_exponent(self):
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        other = dict(self.request)
+        other["packages"] = [{"weight": Decimal("10"), "quantity": 1}]
+        RateCache(api_name="YRC", ubbe_request=other).rate(rate=self._rate)
+        self.assertEqual(self.calls, 1)
+
+    def test_rate_empty_not_cached(self):
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._empty_rate)
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._empty_rate)
+        self.assertEqual(self.calls, 2)
+
+    def test_rate_bypass_bbe(self):
+        self._sub_account.is_bbe = True
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        self.assertEqual(self.calls, 2)
+
+    def test_rate_disabled(self):
+        Carrier.objects.filter(code=YRC).update(rate_cache_ttl=0)
+        cache.delete(f"carrier_rate_cache_ttl_{YRC}")
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        self.assertEqual(self.calls, 2)
+
+    def test_ttl_carrier_override(self):
+        Carrier.objects.filter(code=YRC).update(rate_cache_ttl=60)
+        cache.delete(f"carrier_rate_cache_ttl_{YRC}")
+        self.assertEqual(RateCache(api_name="YRC", ubbe_request=self.request)._get_ttl(), 60)
+
+    def test_ttl_capped(self):
+        API.objects.filter(name="YRC").update(rate_cache_ttl=3600)
+        cache.delete("api_active_YRC")
+        self.assertEqual(RateCache(api_name="YRC", ubbe_request=self.request)._get_ttl(), RateCache._max_ttl)
+
+    def test_invalidate(self):
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        RateCache.invalidate(carrier_ids=[YRC])
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        self.assertEqual(self.calls, 2)
+
+    def test_invalidate_fuel_surcharge_save(self):
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        fuel = FuelSurcharge.objects.filter(carrier__code=YRC).first() or FuelSurcharge(
+            carrier=Carrier.objects.get(code=YRC), updated_date="2026-10-01:2026-10-31",
+            ten_thou_under=Decimal("10.00"), ten_thou_to_fifty_five_thou=Decimal("10.00"),
+            fifty_five_thou_greater=Decimal("10.00")
+        )
+        fuel.save()
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        self.assertEqual(self.calls, 2)
+
+    def test_invalidate_carrier_markup_save(self):
+        markup, _ = CarrierMarkup.objects.get_or_create(
+            markup=self._sub_account.markup, carrier=Carrier.objects.get(code=YRC),
+            defaults={"percentage": Decimal("10.00")}
+        )
+        number = self._sub_account.subaccount_number
+        cache.set(f"{number}_c_markup_{YRC}", Decimal("1.10"))
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        markup.percentage = Decimal("15.00")
+        markup.save()
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        self.assertEqual(self.calls, 2)
+        self.assertIsNone(cache.get(f"{number}_c_markup_{YRC}"))
+
+    def test_invalidate_carrier_markup_bulk_update(self):
+        CarrierMarkup.objects.get_or_create(
+            markup=self._sub_account.markup, carrier=Carrier.objects.get(code=YRC),
+            defaults={"percentage": Decimal("10.00")}
+        )
+        number = self._sub_account.subaccount_number
+        cache.set(f"{number}_c_markup_{YRC}", Decimal("1.10"))
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        CarrierMarkup.objects.filter(carrier__code=YRC).update(percentage=Decimal("15.00"))
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        self.assertEqual(self.calls, 2)
+        self.assertIsNone(cache.get(f"{number}_c_markup_{YRC}"))
+
+    def test_invalidate_fuel_surcharge_bulk_delete(self):
+        FuelSurcharge(
+            carrier=Carrier.objects.get(code=YRC), updated_date="2026-10-01:2026-10-31",
+            ten_thou_under=Decimal("10.00"), ten_thou_to_fifty_five_thou=Decimal("10.00"),
+            fifty_five_thou_greater=Decimal("10.00")
+        ).save()
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        FuelSurcharge.objects.filter(carrier__code=YRC).delete()
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        self.assertEqual(self.calls, 2)
+
+    def test_stats(self):
+        cache.delete_many(["rate_cache_hits_YRC", "rate_cache_misses_YRC"])
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        RateCache(api_name="YRC", ubbe_request=self.request).rate(rate=self._rate)
+        self.assertEqual(
+            RateCache.get_stats(api_names=["YRC"]),
+            [{"name": "YRC", "hits": 2, "misses": 1, "hit_rate": 0.6667}]
+        )
@@ -0,0 +1,61 @@
+from django.test import TestCase
+from rest_framework import serializers
+
+from api.cache_lookups.reference_cache import ReferenceCache
+from api.models import Carrier, PackageType
+from api.serializers_v3.validators.address_validators import ProvinceValidator
+
+
+class ReferenceCacheTests(TestCase):
+    fixtures = [
+        "carriers",
+        "countries",
+        "provinces",
+        "user",
+        "group",
+        "contact",
+        "addresses",
+        "markup",
+        "account",
+        "package_type",
+    ]
+
+    def setUp(self):
+        # Rows from other tests are rolled back, start every test on fresh maps.
+        ReferenceCache._incr_version()
+
+    def test_province_validator(self):
+        ReferenceCache().is_province(province="AB", country="CA")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(ProvinceValidator(province=" ab", country="ca ").valid(), ("AB", "CA"))
+
+            with self.assertRaises(serializers.ValidationError):
+                ProvinceValidator(province="AB", country="US").valid()
+
+        self.assertTrue(ReferenceCache().is_country(country="CA"))
+        self.assertFalse(ReferenceCache().is_country(country="ZZ"))
+
+    def test_get_package_types(self):
+        expected = {
+            code: set(PackageType.objects.get(account_id=1, code=code).carrier.values_list("code", flat=True))
+            for code in PackageType.objects.filter(account_id=1).values_list("code", flat=True)
+        }
+        package_types = ReferenceCache().get_package_types(account_id=1)
+
+        self.assertEqual({code: set(package.carriers) for code, package in package_types.items()}, expected)
+        self.assertTrue(package_types["BOX"].is_pharma)
+
+        with self.assertNumQueries(0):
+            self.assertIsNone(ReferenceCache().get_package_type(account_id=1, code="NOT_A_TYPE"))
+
+    def test_bump_version_on_commit(self):
+        package_type = PackageType.objects.get(account_id=1, code="BOX")
+        carrier = Carrier.objects.exclude(code__in=package_type.carrier.values_list("code", flat=True)).first()
+        ReferenceCache().get_package_types(account_id=1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            package_type.carrier.add(carrier)
+            package_type.save()
+
+        self.assertIn(carrier.code, ReferenceCache().get_package_type(account_id=1, code="BOX").carriers)
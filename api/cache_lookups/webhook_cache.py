@@ -0,0 +1,52 @@
+"""
+    Title: Webhook Cache Interface
+    Description: This file will contain all functions for getting sub account webhooks from cache, a tracking status
+                 change for an account without a webhook then makes no webhook query.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from typing import Optional
+
+from django.core.cache import cache
+
+from api.models import Webhook
+from brain.settings import TWENTY_FOUR_HOURS_CACHE_TTL
+
+
+class WebhookCache:
+    """
+        Webhook Cache Interface
+    """
+
+    _key = "webhook_{}_{}"
+
+    # Stored for a sub account event without a webhook.
+    _no_webhook = 0
+
+    def get_webhook_id(self, sub_account_id: int, event: str) -> Optional[int]:
+        """
+            Get the webhook id of a sub account event, check cache then DB look it up and store.
+            :param sub_account_id: sub account pk
+            :param event: webhook event, ex: TSC
+            :return: webhook pk or None
+        """
+        look_up = self._key.format(sub_account_id, event)
+        webhook_id = cache.get(look_up)
+
+        if webhook_id is None:
+            webhook_id = Webhook.objects.filter(
+                sub_account_id=sub_account_id, event=event
+            ).values_list("pk", flat=True).first() or self._no_webhook
+            cache.set(look_up, webhook_id, TWENTY_FOUR_HOURS_CACHE_TTL)
+
+        return webhook_id or None
+
+    def clear(self, sub_account_id: int, event: str) -> None:
+        """
+            Remove a sub account event from cache, used when a webhook is saved or deleted.
+            :param sub_account_id: sub account pk
+            :param event: webhook event, ex: TSC
+        """
+        cache.delete(self._key.format(sub_account_id, event))
@@ -1,22 +1,28 @@
 import base64
 import io
+import os
 from decimal import Decimal
 from enum import unique, IntEnum
-from typing import Dict, Any, Union, Tuple, List
+from typing import Dict, Any, Union, Tuple, List, NamedTuple
 
-from PyPDF2 import PdfFileReader, PdfFileWriter
+from PyPDF2 import PageObject, PdfFileReader, PdfFileWriter
 from django.core.mail import EmailMessage
 from django.utils.datetime_safe import datetime
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch, cm
 from reportlab.pdfgen import canvas
 
-from api.models import Province, Country, Carrier
+from api.models import Province, Carrier
 from brain.settings import B13A_FILING_EMAIL, EMAIL_HOST_USER
 
-TEMPLATE_FILE = 'api/Documents/b13a_template.pdf'
+TEMPLATE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'b13a_template.pdf')
 FONT_NAME = 'Helvetica'
 FONT_SIZE = 12
+COMMODITIES_FIRST_PAGE = 5
+COMMODITIES_PER_PAGE = 19
+
+# Process local template pages, parsed on the first render. Overlays are merged onto copies of these pages.
+_template_pages = []
 
 
 @unique
@@ -28,8 +34,87 @@ class ModeOfTransportation(IntEnum):
     other = 5
 
 
+class B13AContext(NamedTuple):
+    """
+        Lookup data of a B13A, resolved before rendering so the drawing functions make no queries.
+    """
+    origin_province: str
+    destination_province: str
+    destination_country: str
+    carrier_name: str
+    date: str
+
+
+def get_context(shipping_request: Dict[str, Any]) -> B13AContext:
+    origin = shipping_request['origin']
+    destination = shipping_request['destination']
+    destination_province = Province.objects.select_related('country').get(
+        code=destination['province'], country__code=destination['country']
+    )
+
+    return B13AContext(
+        origin_province=Province.objects.get(code=origin['province'], country__code=origin['country']).name.upper(),
+        destination_province=destination_province.name.upper(),
+        destination_country=destination_province.country.name.upper(),
+        carrier_name=Carrier.objects.get(code=shipping_request['carrier_id']).name.upper(),
+        date=datetime.today().strftime('%Y/%m/%d'),
+    )
+
+
+def get_params(shipping_request: Dict[str, Any], order_number: str, total_shipping_cost: Decimal,
+               tracking_number: str = '', transport_mode: ModeOfTransportation = ModeOfTransportation.air) -> dict:
+    address_fields = ('name', 'address', 'city', 'province', 'country', 'postal_code')
+    request = {
+        'origin': {key: shipping_request['origin'][key] for key in address_fields},
+        'destination': {key: shipping_request['destination'][key] for key in address_fields},
+        'packages': [
+            {key: package[key] for key in ('quantity', 'package_type', 'weight') if key in package}
+            for package in shipping_request['packages']
+        ],
+        'commodities': [
+            {key: commodity[key] for key in ('made_in_country_code', 'description', 'total_weight', 'unit_value')}
+            for commodity in shipping_request['commodities']
+        ],
+    }
+
+    return {
+        'shipping_request': request,
+        'order_number': order_number,
+        'total_shipping_cost': total_shipping_cost,
+        'context': get_context(shipping_request),
+        'tracking_number': tracking_number,
+        'transport_mode': transport_mode,
+    }
+
+
+def get_template_page(page_number: int) -> PageObject:
+    if not _template_pages:
+        with open(TEMPLATE_FILE, 'rb') as template_file:
+            reader = PdfFileReader(io.BytesIO(template_file.read()))
+
+        _template_pages.extend(reader.getPage(i) for i in range(reader.getNumPages()))
+
+    template_page = _template_pages[page_number]
+    page = PageObject(template_page.pdf)
+    page.update(template_page)
+
+    return page
+
+
 def b13a(shipping_request: Dict[str, Any], order_number: str, total_shipping_cost: Decimal, tracking_number: str = '',
-         transport_mode: ModeOfTransportation = ModeOfTransportation.air) -> str:
+         transport_mode: ModeOfTransportation = ModeOfTransportation.air, context: B13AContext = None) -> str:
+    if context is None:
+        context = get_context(shipping_request)
+
+    document = render_b13a(shipping_request, order_number, total_shipping_cost, context, tracking_number,
+                           transport_mode)
+
+    return base64.b64encode(document).decode('ascii')
+
+
+def render_b13a(shipping_request: Dict[str, Any], order_number: str, total_shipping_cost: Decimal,
+                context: B13AContext, tracking_number: str = '',
+                transport_mode: ModeOfTransportation = ModeOfTransportation.air) -> bytes:
     page_one_packet = io.BytesIO()
     page_one_canvas = canvas.Canvas(page_one_packet, pagesize=letter)
 
@@ -45,19 +130,19 @@ def b13a(shipping_request: Dict[str, Any], order_number: str, total_shipping_cos
     # SECTION_TWO
 
     # SECTION_THREE
-    process_section_three(shipping_request, page_one_canvas)
+    process_section_three(shipping_request, context, page_one_canvas)
     # SECTION_THREE
 
     # SECTION_FOUR
-    process_section_four(shipping_request, page_one_canvas)
+    process_section_four(shipping_request, context, page_one_canvas)
     # SECTION_FOUR
 
     # SECTION_FIVE
-    process_section_five(shipping_request, page_one_canvas)
+    process_section_five(context, page_one_canvas)
     # SECTION_FIVE
 
     # SECTION_SIX
-    process_section_six(shipping_request, page_one_canvas)
+    process_section_six(context, page_one_canvas)
     # SECTION_SIX
 
     # SECTION_SEVEN
@@ -75,7 +160,7 @@ def b13a(shipping_request: Dict[str, Any], order_number: str, total_shipping_cos
     # SECTION_TEN
 
     # SECTION_ELEVEN
-    process_section_eleven(page_one_canvas)
+    process_section_eleven(context, page_one_canvas)
     # SECTION_ELEVEN
 
     # SECTION_TWELVE
@@ -115,47 +200,28 @@ def b13a(shipping_request: Dict[str, Any], order_number: str, total_shipping_cos
 
     page_one_canvas.save()
     page_one_packet.seek(0)
-    page_one_new = PdfFileReader(page_one_packet)
-    template_file = open(TEMPLATE_FILE, 'rb')
-    existing_pdf = PdfFileReader(template_file)
+
     output = PdfFileWriter()
-    page_one = existing_pdf.getPage(0)
-    page_one.mergePage(page_one_new.getPage(0))
-    # page_one = page_one_new.getPage(0)
-    # page_one.mergePage(existing_pdf.getPage(0))
+    page_one = get_template_page(0)
+    page_one.mergePage(PdfFileReader(page_one_packet).getPage(0))
     output.addPage(page_one)
 
-    handles = []
     for packet in addl_packets:
-        packet.seek(0)
-
-        new_page = PdfFileReader(packet)
-
-        t = open(TEMPLATE_FILE, 'rb')
-        e = PdfFileReader(t)
-        new_page_two = e.getPage(1)
-        new_page_two.mergePage(new_page.getPage(0))
-        handles.append(t)
+        page = get_template_page(1)
+        page.mergePage(PdfFileReader(packet).getPage(0))
+        output.addPage(page)
 
-        output.addPage(new_page_two)
-
-    page_three = existing_pdf.getPage(2)
-    page_four = existing_pdf.getPage(3)
-    # output.addPage(existing_pdf.getPage(1))
-    output.addPage(page_three)
-    output.addPage(page_four)
+    output.addPage(get_template_page(2))
+    output.addPage(get_template_page(3))
 
     output_stream = io.BytesIO()
     output.write(output_stream)
-    output_stream.seek(0)
-    encoded = base64.b64encode(output_stream.read()).decode('ascii')
-    output_stream.close()
-    template_file.close()
-    for handle in handles:
-        handle.close()
+
+    page_one_packet.close()
     for packet in addl_packets:
         packet.close()
-    return encoded
+
+    return output_stream.getvalue()
 
 
 def notify_b13a_filing(document: str, order_number: str):
@@ -217,7 +283,7 @@ def process_section_two(c: canvas.Canvas) -> None:
     c.drawString(8.75 * cm, 24.9 * cm, 'N')
 
 
-def process_section_three(shipping_request, c: canvas.Canvas) -> None:
+def process_section_three(shipping_request, context: B13AContext, c: canvas.Canvas) -> None:
     origin = shipping_request['origin']
     # Name
     section_three_name = origin['name'].upper()
@@ -250,7 +316,7 @@ def process_section_three(shipping_request, c: canvas.Canvas) -> None:
     c.drawText(section_three_city_text)
 
     # Province
-    section_three_province = Province.objects.get(code=origin['province'], country__code=origin['country']).name.upper()
+    section_three_province = context.origin_province
     section_three_province_font_size = get_font_size(section_three_province, 17.4 * cm - (8.5 / 2 * inch), FONT_SIZE,
                                                      FONT_NAME, c)
     section_three_province_text = c.beginText(
@@ -271,7 +337,7 @@ def process_section_three(shipping_request, c: canvas.Canvas) -> None:
     c.drawText(section_three_postal_text)
 
 
-def process_section_four(shipping_request, c: canvas.Canvas) -> None:
+def process_section_four(shipping_request, context: B13AContext, c: canvas.Canvas) -> None:
     destination = shipping_request['destination']
     # Name
     section_four_name = destination['name'].upper()
@@ -303,9 +369,7 @@ def process_section_four(shipping_request, c: canvas.Canvas) -> None:
     c.drawText(section_four_city_text)
 
     # Province
-    section_four_province = '{}, {}'.format(
-        Province.objects.get(code=destination['province'], country__code=destination['country']).name.upper(),
-        Country.objects.get(code=destination['country']).name.upper())
+    section_four_province = '{}, {}'.format(context.destination_province, context.destination_country)
     section_four_province_font_size = get_font_size(section_four_province, 17.4 * cm - (8.5 / 2 * inch), FONT_SIZE,
                                                     FONT_NAME, c)
     section_four_province_text = c.beginText(
@@ -326,9 +390,8 @@ def process_section_four(shipping_request, c: canvas.Canvas) -> None:
     c.drawText(section_four_postal_text)
 
 
-def process_section_five(shipping_request, c: canvas.Canvas) -> None:
-    destination = shipping_request['destination']
-    section_five = Country.objects.get(code=destination['country']).name.upper()
+def process_section_five(context: B13AContext, c: canvas.Canvas) -> None:
+    section_five = context.destination_country
     section_five_font_size = get_font_size(section_five, (8.5 / 2 * inch) - 0.8 * cm, FONT_SIZE, FONT_NAME, c)
     section_five_text = c.beginText(
         *get_position(0.8 * cm, (8.5 / 2 * inch), 19.9 * cm, section_five, FONT_NAME, section_five_font_size, c))
@@ -337,8 +400,8 @@ def process_section_five(shipping_request, c: canvas.Canvas) -> None:
     c.drawText(section_five_text)
 
 
-def process_section_six(shipping_request, c: canvas.Canvas) -> None:
-    section_six = Carrier.objects.get(code=shipping_request['carrier_id']).name.upper()
+def process_section_six(context: B13AContext, c: canvas.Canvas) -> None:
+    section_six = context.carrier_name
     section_six_font_size = get_font_size(section_six, (8.5 / 2 * inch) - 0.8 * cm, FONT_SIZE, FONT_NAME, c)
     section_six_text = c.beginText(
         *get_position(0.8 * cm, (8.5 / 2 * inch), 18.8 * cm, section_six, FONT_NAME, section_six_font_size, c))
@@ -391,8 +454,8 @@ def process_section_ten(c: canvas.Canvas) -> None:
     c.drawString(8.75 * cm, 24.9 * cm, 'N')
 
 
-def process_section_eleven(c: canvas.Canvas) -> None:
-    section_eleven = datetime.today().strftime('%Y/%m/%d')
+def process_section_eleven(context: B13AContext, c: canvas.Canvas) -> None:
+    section_eleven = context.date
     section_eleven_font_size = get_font_size(section_eleven, 20.9 * cm - (8.5 / 2 * inch), FONT_SIZE, FONT_NAME, c)
     section_eleven_text = c.beginText(
         *get_position((8.5 / 2 * inch), 20.9 * cm, 15.6 * cm, section_eleven, FONT_NAME, section_eleven_font_size, c))
@@ -455,68 +518,11 @@ def process_section_fifteen(c: canvas.Canvas) -> None:
 
 def process_section_sixteen_through_twenty_three(shipping_request, order_number: str, c: canvas.Canvas) \
         -> List[io.BytesIO]:
-    commodities = shipping_request['commodities'][:5]
+    commodities = shipping_request['commodities'][:COMMODITIES_FIRST_PAGE]
 
     y = 11.1 * cm
     for commodity in commodities:
-        # SECTION_SIXTEEN
-        # Country
-        section_sixteen_country = commodity['made_in_country_code']
-        section_sixteen_country_font_size = get_font_size(section_sixteen_country, 2.3 * cm - 0.8 * cm, FONT_SIZE,
-                                                          FONT_NAME, c)
-        section_sixteen_country_text = c.beginText(
-            *get_position(0.8 * cm, 2.3 * cm, y, section_sixteen_country, FONT_NAME, section_sixteen_country_font_size,
-                          c))
-        section_sixteen_country_text.setFont(FONT_NAME, section_sixteen_country_font_size, leading=None)
-        section_sixteen_country_text.textOut(section_sixteen_country)
-        c.drawText(section_sixteen_country_text)
-
-        # Province
-        # section_sixteen_province = commodity['made_in_country_code']
-        # section_sixteen_province_font_size = \
-        # get_font_size(section_sixteen_province, 3.8*cm-2.3*cm, FONT_SIZE, FONT_NAME, c)
-        # section_sixteen_province_text = \
-        # c.beginText(
-        # *get_position(2.3*cm, 3.8*cm, y, section_sixteen_province, FONT_NAME, section_sixteen_province_font_size, c)
-        # )
-        # section_sixteen_province_text.setFont(FONT_NAME, section_sixteen_province_font_size, leading=None)
-        # section_sixteen_province_text.textOut(section_sixteen_province)
-        # c.drawText(section_sixteen_province_text)
-        # SECTION_SIXTEEN
-
-        # SECTION_SEVENTEEN
-        section_seventeen = commodity['description']
-        section_seventeen_font_size = get_font_size(section_seventeen, (8.5 / 2 * inch) - 3.8 * cm, FONT_SIZE,
-                                                    FONT_NAME, c)
-        section_seventeen_text = c.beginText(
-            *get_position(3.8 * cm, (8.5 / 2 * inch), y, section_seventeen, FONT_NAME, section_seventeen_font_size, c))
-        section_seventeen_text.setFont(FONT_NAME, section_seventeen_font_size, leading=None)
-        section_seventeen_text.textOut(section_seventeen)
-        c.drawText(section_seventeen_text)
-        # SECTION_SEVENTEEN
-
-        # SECTION_EIGHTEEN
-        # SECTION_EIGHTEEN
-
-        # SECTION_NINETEEN
-        section_nineteen = '{} KGM'.format(commodity['total_weight'])
-        section_nineteen_font_size = get_font_size(section_nineteen, 17.1 * cm - 14 * cm, FONT_SIZE, FONT_NAME, c)
-        section_nineteen_text = c.beginText(
-            *get_position(14 * cm, 17.1 * cm, y, section_nineteen, FONT_NAME, section_nineteen_font_size, c))
-        section_nineteen_text.setFont(FONT_NAME, section_nineteen_font_size, leading=None)
-        section_nineteen_text.textOut(section_nineteen)
-        c.drawText(section_nineteen_text)
-        # SECTION_NINETEEN
-
-        # SECTION_TWENTY
-        section_twenty = '{:.2f}'.format(float(commodity['unit_value']))
-        section_twenty_font_size = get_font_size(section_twenty, 20.9 * cm - 17.1 * cm, FONT_SIZE, FONT_NAME, c)
-        section_twenty_text = c.beginText(
-            *get_position(17.1 * cm, 20.9 * cm, y, section_twenty, FONT_NAME, section_twenty_font_size, c))
-        section_twenty_text.setFont(FONT_NAME, section_twenty_font_size, leading=None)
-        section_twenty_text.textOut(section_twenty)
-        c.drawText(section_twenty_text)
-        # SECTION_TWENTY
+        process_commodity_row(commodity, y, c)
         y -= 0.6 * cm
 
     # SECTION_TWENTY_THREE
@@ -530,7 +536,68 @@ def process_section_sixteen_through_twenty_three(shipping_request, order_number:
     c.drawText(section_twenty_three_text)
     # SECTION_TWENTY_THREE
 
-    return process_additional_commodities(shipping_request['commodities'][5:], order_number)
+    return process_additional_commodities(shipping_request['commodities'][COMMODITIES_FIRST_PAGE:], order_number)
+
+
+def process_commodity_row(commodity: Dict[str, Any], y: float, c: canvas.Canvas) -> None:
+    # SECTION_SIXTEEN
+    # Country
+    section_sixteen_country = commodity['made_in_country_code']
+    section_sixteen_country_font_size = get_font_size(section_sixteen_country, 2.3 * cm - 0.8 * cm, FONT_SIZE,
+                                                      FONT_NAME, c)
+    section_sixteen_country_text = c.beginText(
+        *get_position(0.8 * cm, 2.3 * cm, y, section_sixteen_country, FONT_NAME, section_sixteen_country_font_size,
+                      c))
+    section_sixteen_country_text.setFont(FONT_NAME, section_sixteen_country_font_size, leading=None)
+    section_sixteen_country_text.textOut(section_sixteen_country)
+    c.drawText(section_sixteen_country_text)
+
+    # Province
+    # section_sixteen_province = commodity['made_in_country_code']
+    # section_sixteen_province_font_size = \
+    # get_font_size(section_sixteen_province, 3.8*cm-2.3*cm, FONT_SIZE, FONT_NAME, c)
+    # section_sixteen_province_text = \
+    # c.beginText(
+    # *get_position(2.3*cm, 3.8*cm, y, section_sixteen_province, FONT_NAME, section_sixteen_province_font_size, c)
+    # )
+    # section_sixteen_province_text.setFont(FONT_NAME, section_sixteen_province_font_size, leading=None)
+    # section_sixteen_province_text.textOut(section_sixteen_province)
+    # c.drawText(section_sixteen_province_text)
+    # SECTION_SIXTEEN
+
+    # SECTION_SEVENTEEN
+    section_seventeen = commodity['description']
+    section_seventeen_font_size = get_font_size(section_seventeen, (8.5 / 2 * inch) - 3.8 * cm, FONT_SIZE,
+                                                FONT_NAME, c)
+    section_seventeen_text = c.beginText(
+        *get_position(3.8 * cm, (8.5 / 2 * inch), y, section_seventeen, FONT_NAME, section_seventeen_font_size, c))
+    section_seventeen_text.setFont(FONT_NAME, section_seventeen_font_size, leading=None)
+    section_seventeen_text.textOut(section_seventeen)
+    c.drawText(section_seventeen_text)
+    # SECTION_SEVENTEEN
+
+    # SECTION_EIGHTEEN
+    # SECTION_EIGHTEEN
+
+    # SECTION_NINETEEN
+    section_nineteen = '{} KGM'.format(commodity['total_weight'])
+    section_nineteen_font_size = get_font_size(section_nineteen, 17.1 * cm - 14 * cm, FONT_SIZE, FONT_NAME, c)
+    section_nineteen_text = c.beginText(
+        *get_position(14 * cm, 17.1 * cm, y, section_nineteen, FONT_NAME, section_nineteen_font_size, c))
+    section_nineteen_text.setFont(FONT_NAME, section_nineteen_font_size, leading=None)
+    section_nineteen_text.textOut(section_nineteen)
+    c.drawText(section_nineteen_text)
+    # SECTION_NINETEEN
+
+    # SECTION_TWENTY
+    section_twenty = '{:.2f}'.format(float(commodity['unit_value']))
+    section_twenty_font_size = get_font_size(section_twenty, 20.9 * cm - 17.1 * cm, FONT_SIZE, FONT_NAME, c)
+    section_twenty_text = c.beginText(
+        *get_position(17.1 * cm, 20.9 * cm, y, section_twenty, FONT_NAME, section_twenty_font_size, c))
+    section_twenty_text.setFont(FONT_NAME, section_twenty_font_size, leading=None)
+    section_twenty_text.textOut(section_twenty)
+    c.drawText(section_twenty_text)
+    # SECTION_TWENTY
 
 
 def process_section_twenty_one(c: canvas.Canvas) -> None:
@@ -582,87 +649,25 @@ def process_section_page_numbers(addl_pages: int, c: canvas.Canvas) -> None:
 
 
 def process_additional_commodities(commodities: List[Dict[str, Any]], order_number: str) -> List[io.BytesIO]:
-    if not commodities:
-        return []
     packets = []
-    canvases = []
-    for _ in range(len(commodities) // 19 + 1):
+    num_pages = (len(commodities) + COMMODITIES_PER_PAGE - 1) // COMMODITIES_PER_PAGE + 1
+
+    for start in range(0, len(commodities), COMMODITIES_PER_PAGE):
         p = io.BytesIO()
         c = canvas.Canvas(p)
-        packets.append(p)
-        canvases.append(c)
-    y = 18.1 * cm
-
-    for i, commodity in enumerate(commodities):
-        canvas_idx = i // 19
-        c = canvases[canvas_idx]
-        if y < 7.3 * cm:
-            y = 18.1 * cm
-        # SECTION_SIXTEEN
-        # Country
-        section_sixteen_country = commodity['made_in_country_code']
-        section_sixteen_country_font_size = get_font_size(section_sixteen_country, 2.3 * cm - 0.8 * cm, FONT_SIZE,
-                                                          FONT_NAME, c)
-        section_sixteen_country_text = c.beginText(
-            *get_position(0.8 * cm, 2.3 * cm, y, section_sixteen_country, FONT_NAME, section_sixteen_country_font_size,
-                          c))
-        section_sixteen_country_text.setFont(FONT_NAME, section_sixteen_country_font_size, leading=None)
-        section_sixteen_country_text.textOut(section_sixteen_country)
-        c.drawText(section_sixteen_country_text)
-
-        # Province
-        # section_sixteen_province = commodity['MadeInCountryCode']
-        # section_sixteen_province_font_size = \
-        # get_font_size(section_sixteen_province, 3.8*cm-2.3*cm, FONT_SIZE, FONT_NAME, c)
-        # section_sixteen_province_text = \
-        # c.beginText(
-        # *get_position(2.3*cm, 3.8*cm, y, section_sixteen_province, FONT_NAME, section_sixteen_province_font_size, c)
-        # )
-        # section_sixteen_province_text.setFont(FONT_NAME, section_sixteen_province_font_size, leading=None)
-        # section_sixteen_province_text.textOut(section_sixteen_province)
-        # c.drawText(section_sixteen_province_text)
-        # SECTION_SIXTEEN
-
-        # SECTION_SEVENTEEN
-        section_seventeen = commodity['description']
-        section_seventeen_font_size = get_font_size(section_seventeen, (8.5 / 2 * inch) - 3.8 * cm, FONT_SIZE,
-                                                    FONT_NAME, c)
-        section_seventeen_text = c.beginText(
-            *get_position(3.8 * cm, (8.5 / 2 * inch), y, section_seventeen, FONT_NAME, section_seventeen_font_size, c))
-        section_seventeen_text.setFont(FONT_NAME, section_seventeen_font_size, leading=None)
-        section_seventeen_text.textOut(section_seventeen)
-        c.drawText(section_seventeen_text)
-        # SECTION_SEVENTEEN
-
-        # SECTION_EIGHTEEN
-        # SECTION_EIGHTEEN
-
-        # SECTION_NINETEEN
-        section_nineteen = '{} KGM'.format(commodity['total_weight'])
-        section_nineteen_font_size = get_font_size(section_nineteen, 17.1 * cm - 14 * cm, FONT_SIZE, FONT_NAME, c)
-        section_nineteen_text = c.beginText(
-            *get_position(14 * cm, 17.1 * cm, y, section_nineteen, FONT_NAME, section_nineteen_font_size, c))
-        section_nineteen_text.setFont(FONT_NAME, section_nineteen_font_size, leading=None)
-        section_nineteen_text.textOut(section_nineteen)
-        c.drawText(section_nineteen_text)
-        # SECTION_NINETEEN
-
-        # SECTION_TWENTY
-        section_twenty = '{:.2f}'.format(float(commodity['unit_value']))
-        section_twenty_font_size = get_font_size(section_twenty, 20.9 * cm - 17.1 * cm, FONT_SIZE, FONT_NAME, c)
-        section_twenty_text = c.beginText(
-            *get_position(17.1 * cm, 20.9 * cm, y, section_twenty, FONT_NAME, section_twenty_font_size, c))
-        section_twenty_text.setFont(FONT_NAME, section_twenty_font_size, leading=None)
-        section_twenty_text.textOut(section_twenty)
-        c.drawText(section_twenty_text)
-        # SECTION_TWENTY
-        y -= 0.6 * cm
+        y = 18.1 * cm
+        total_weight = 0
+        total_value = 0
+
+        for commodity in commodities[start:start + COMMODITIES_PER_PAGE]:
+            process_commodity_row(commodity, y, c)
+            total_weight += float(commodity['total_weight'])
+            total_value += float(commodity['unit_value'])
+            y -= 0.6 * cm
 
-    num_pages = len(canvases) + 1
-    for i, c in enumerate(canvases):
         # SECTION_PAGE_NUMBER
         # This page
-        section_page_number = str(i + 2)
+        section_page_number = str(len(packets) + 2)
         section_page_number_font_size = get_font_size(section_page_number, 18 * cm - 16.3 * cm, FONT_SIZE, FONT_NAME, c)
         section_page_number_text = c.beginText(
             *get_position(16.3 * cm, 18 * cm, 25.05 * cm, section_page_number, FONT_NAME, section_page_number_font_size,
@@ -694,8 +699,7 @@ def process_additional_commodities(commodities: List[Dict[str, Any]], order_numb
         # SECTION_FOURTEEN
 
         # SECTION_TWENTY_TWO
-        section_twenty_two = '{:.2f} KGM'.format(
-            sum(float(commodity['total_weight']) for commodity in commodities[19 * i:19 * (i + 1)]))
+        section_twenty_two = '{:.2f} KGM'.format(total_weight)
         section_twenty_two_font_size = get_font_size(section_twenty_two, 14 * cm - (8.5 / 2 * inch), FONT_SIZE,
                                                      FONT_NAME, c)
         section_twenty_two_text = c.beginText(
@@ -707,8 +711,7 @@ def process_additional_commodities(commodities: List[Dict[str, Any]], order_numb
         # SECTION_TWENTY_TWO
 
         # SECTION_TWENTY_THREE
-        section_twenty_three = '{:.2f}'.format(
-            sum(float(commodity['unit_value']) for commodity in commodities[19 * i:19 * (i + 1)]))
+        section_twenty_three = '{:.2f}'.format(total_value)
         section_twenty_three_font_size = get_font_size(section_twenty_three, 20.9 * cm - 17.1 * cm, FONT_SIZE,
                                                        FONT_NAME, c)
         section_twenty_three_text = c.beginText(
@@ -719,8 +722,8 @@ def process_additional_commodities(commodities: List[Dict[str, Any]], order_numb
         c.drawText(section_twenty_three_text)
         # SECTION_TWENTY_THREE
 
-    for c in canvases:
         c.save()
-    for p in packets:
         p.seek(0)
+        packets.append(p)
+
     return packets
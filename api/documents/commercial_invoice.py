@@ -37,6 +37,9 @@ class CommercialInvoice:
     legal_font_size = 8
     sig_fig = Decimal("0.01")
 
+    _address_fields = ("company_name", "name", "address", "city", "province", "postal_code", "country", "phone")
+    _commodity_fields = ("description", "made_in_country_code", "quantity", "total_weight", "unit_value")
+
     def __init__(self, shipdata: dict, order_number: str) -> None:
         self._order_number = order_number
         self.buffer = BytesIO()
@@ -46,6 +49,30 @@ class CommercialInvoice:
         self.base64 = self.base64.decode("ascii")
         self.buffer.close()
 
+    @classmethod
+    def get_params(cls, shipdata: dict, order_number: str) -> dict:
+        """
+            Get the render params as plain dicts for the document render service.
+            :param shipdata: ship request
+            :param order_number: order number
+            :return: dict of shipdata and order_number
+        """
+        data = {
+            key: shipdata[key]
+            for key in ("reference_one", "reference_two", "AWB", "tracking_number", "special_instructions")
+            if key in shipdata
+        }
+
+        for address in ("origin", "destination", "broker"):
+            if address in shipdata:
+                data[address] = {key: shipdata[address][key] for key in cls._address_fields if key in shipdata[address]}
+
+        data["commodities"] = [
+            {key: commodity[key] for key in cls._commodity_fields} for commodity in shipdata["commodities"]
+        ]
+
+        return {"shipdata": data, "order_number": order_number}
+
     def _generate(self, shipdata: dict):
         doc = SimpleDocTemplate(self.buffer, rightMargin=0.5 * cm, leftMargin=0.5 * cm, topMargin=1.5 * cm,
                                 bottomMargin=1.5 * cm)
@@ -10,6 +10,7 @@ class DangerousGoodBattery:
     extension = ".pdf"
     _lithium_ion = (3480, 3481)
     _lithium_metal = (3090, 3091)
+    template_version = 1
 
     def __init__(self, un_number: int) -> None:
         self._un_number = un_number
@@ -32,36 +32,97 @@ class DangerousGoodDeclaration:
     two_places = Decimal("0.01")
     banner = Image("assets/dangerous_goods/declaration/banner.png")
 
-    def __init__(self, world_request: dict, dg_details: list) -> None:
+    _address_fields = ("company_name", "address", "city", "province", "postal_code", "phone", "base")
+    _dg_fields = (
+        "class_div", "dg_quantity", "excepted_quantity", "is_gross", "is_limited", "is_neq", "is_passenger_aircraft",
+        "measure_unit", "neq", "nos", "packing_group_str", "packing_instruction", "packing_type_str",
+        "proper_shipping_name", "quantity", "subrisks_str", "un_number", "weight"
+    )
+
+    def __init__(self, world_request: dict, dg_details: list, context: dict = None) -> None:
         self._dg_details = dg_details
-        self._is_air = Carrier.objects.filter(code__in=(int(world_request["carrier_id"]),), mode="AI").exists()
+
+        if context is None:
+            context = self.get_context(world_request=world_request, dg_details=dg_details)
+
+        self._is_air = context["is_air"]
+        self._carrier_name = context["carrier_name"]
+        self._origin_airbase = context["origin_airbase"]
+        self._destination_airbase = context["destination_airbase"]
+        world_request["is_passenger_aircraft"] = context["is_passenger_aircraft"]
+
+        self.buffer = BytesIO()
+        self.declaration = self._generate(world_request)
+        self.buffer.seek(0)
+        self.base64 = base64.b64encode(self.buffer.read()).decode("ascii")
+        self.buffer.close()
+
+    @staticmethod
+    def get_context(world_request: dict, dg_details: list) -> dict:
+        """
+            Resolve the carrier and airports of the declaration, the render itself makes no queries.
+            :param world_request: ship request
+            :param dg_details: dangerous good packages
+            :return: dict of is_air, carrier_name, origin_airbase, destination_airbase and is_passenger_aircraft
+        """
+        carrier = Carrier.objects.get(code=int(world_request["carrier_id"]))
+        context = {
+            "is_air": carrier.mode == "AI",
+            "carrier_name": carrier.name,
+            "origin_airbase": None,
+            "destination_airbase": None,
+            "is_passenger_aircraft": False
+        }
         world_request["is_passenger_aircraft"] = False
 
-        if self._is_air:
+        if context["is_air"]:
             try:
-                self._origin_airbase = Airport.objects.get(code=world_request["origin"]["base"])
+                airport = Airport.objects.get(code=world_request["origin"]["base"])
+                context["origin_airbase"] = {"name": airport.name, "code": airport.code}
             except ObjectDoesNotExist:
                 msg = "origin airport code " + world_request["origin"]["base"] + " does not exist"
                 CeleryLogger().l_critical.delay(location="dg_declaration.py line: 44", message=msg)
                 raise ShipException({"api.documentation.error": msg})
 
             try:
-                self._destination_airbase = Airport.objects.get(code=world_request["destination"]["base"])
+                airport = Airport.objects.get(code=world_request["destination"]["base"])
+                context["destination_airbase"] = {"name": airport.name, "code": airport.code}
             except ObjectDoesNotExist:
                 msg = "destination airport code " + world_request["destination"]["base"] + " does not exist"
                 CeleryLogger().l_critical.delay(location="dg_declaration.py line: 51", message=msg)
                 raise ShipException({"api.documentation.error": msg})
 
-            for package in self._dg_details:
+            for package in dg_details:
                 if package["is_passenger_aircraft"]:
+                    context["is_passenger_aircraft"] = True
                     world_request["is_passenger_aircraft"] = True
                     break
 
-        self.buffer = BytesIO()
-        self.declaration = self._generate(world_request)
-        self.buffer.seek(0)
-        self.base64 = base64.b64encode(self.buffer.read()).decode("ascii")
-        self.buffer.close()
+        return context
+
+    @classmethod
+    def get_params(cls, world_request: dict, dg_details: list) -> dict:
+        """
+            Get the render params as plain dicts for the document render service.
+            :param world_request: ship request
+            :param dg_details: dangerous good packages
+            :return: dict of world_request, dg_details and context
+        """
+        context = cls.get_context(world_request=world_request, dg_details=dg_details)
+        request = {
+            key: world_request[key] for key in ("carrier_id", "awb", "tracking_number") if key in world_request
+        }
+
+        for address in ("origin", "destination"):
+            request[address] = {
+                key: world_request[address][key] for key in cls._address_fields if key in world_request[address]
+            }
+
+        return {
+            "world_request": request,
+            "dg_details": [{key: dg[key] for key in cls._dg_fields if key in dg} for dg in dg_details],
+            "context": context
+        }
 
     class _CartesianCoordinate:
 
@@ -107,7 +168,7 @@ class DangerousGoodDeclaration:
                     [
                         Spacer(width=0, height=0.25 * cm),
                         Paragraph(
-                            "{} {}".format(Carrier.objects.get(code=world_request["carrier_id"]).name,
+                            "{} {}".format(self._carrier_name,
                                            world_request["awb"]),
                             styles["Left"])
                     ],
@@ -144,7 +205,7 @@ class DangerousGoodDeclaration:
                     [
                         Spacer(width=0, height=0.25 * cm),
                         Paragraph(
-                            "{} {}".format(Carrier.objects.get(code=world_request["carrier_id"]).name,
+                            "{} {}".format(self._carrier_name,
                                            world_request["tracking_number"]),
                             styles["Left"])
                     ],
@@ -341,7 +402,7 @@ class DangerousGoodDeclaration:
                         Paragraph("Airport of Departure", styles["Left"])
                     ],
                     [
-                        Paragraph("{} ({})".format(self._origin_airbase.name, self._origin_airbase.code),
+                        Paragraph("{} ({})".format(self._origin_airbase["name"], self._origin_airbase["code"]),
                                   styles["Left"])
                     ]
                 ]
@@ -368,8 +429,8 @@ class DangerousGoodDeclaration:
                 airport_destination_data = [
                     [
                         Paragraph(
-                            "Airport of destination: {} ({})".format(self._destination_airbase.name,
-                                                                     self._destination_airbase.code), styles["Left"])
+                            "Airport of destination: {} ({})".format(self._destination_airbase["name"],
+                                                                     self._destination_airbase["code"]), styles["Left"])
                     ]
                 ]
 
@@ -43,20 +43,44 @@ class DangerousGoodPlacard:
     extension = ".pdf"
     fontname = "Helvetica"
     default_font_size = 9
+    template_version = 1
 
     def __init__(self, world_request: dict, width: int = 142, height: int = 142) -> None:
         self._width = width
         self._height = height
         self.filename = "DG-" + world_request["class_div"] + world_request["subrisks_str"]
         self._dg_label = world_request["placard_img"]
-        self._color = get_color(self._dg_label.background_rgb)
-        self._font_color = get_color(self._dg_label.font_rgb)
+        self._color = get_color(self._dg_label["background_rgb"])
+        self._font_color = get_color(self._dg_label["font_rgb"])
         self._buffer = BytesIO()
         self.placard = self._generate(world_request)
         self._buffer.seek(0)
         self.base64 = base64.b64encode(self._buffer.read()).decode("ascii")
         self._buffer.close()
 
+    @staticmethod
+    def get_params(dangerous_good: dict) -> dict:
+        """
+            Get the render params as plain dicts for the document render service.
+            :param dangerous_good: dangerous good package with the placard image model
+            :return: dict of world_request
+        """
+        placard = dangerous_good["placard_img"]
+
+        return {
+            "world_request": {
+                "class_div": dangerous_good["class_div"],
+                "subrisks_str": dangerous_good["subrisks_str"],
+                "proper_shipping_name": dangerous_good["proper_shipping_name"],
+                "un_number": dangerous_good["un_number"],
+                "placard_img": {
+                    "label": placard.label.path,
+                    "background_rgb": placard.background_rgb,
+                    "font_rgb": placard.font_rgb
+                }
+            }
+        }
+
     class _CartesianCoordinate:
 
         def __init__(self, x: int, y: int) -> None:
@@ -71,7 +95,7 @@ class DangerousGoodPlacard:
         doc = SimpleDocTemplate(self._buffer)
         story = []
         styles = self.generate_styles()
-        story.append(Image(self._dg_label.label, width=self._width * mm, height=self._height * mm))
+        story.append(Image(self._dg_label["label"], width=self._width * mm, height=self._height * mm))
 
         data = [
             [
@@ -0,0 +1,231 @@
+"""
+    Title: Document Render Service
+    Description: This file will contain the document render service. Reportlab renders and PdfFileMerger merges are
+                 CPU bound, under gevent they run serially and hold the hub for every other request on the worker.
+                 Documents are rendered in a process pool from plain dicts (see each document's get_params), the
+                 request greenlet waits on a hub thread so other greenlets keep running. Static documents are taken
+                 from the document cache, only misses are rendered.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
+"""
+import base64
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import gevent
+from PyPDF2 import PdfFileMerger
+
+from api.cache_lookups.document_cache import DocumentCache
+from api.globals.project import LOGGER
+from brain.settings import DOCUMENT_RENDER_WORKERS
+
+
+def _init_worker() -> None:
+    """
+        Set up Django in a render process, the document modules import the models.
+    """
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "brain.settings")
+    django.setup()
+
+
+def render_declaration(params: dict) -> bytes:
+    from api.documents.dg_declaration import DangerousGoodDeclaration
+
+    return DangerousGoodDeclaration(**params).get_pdf()
+
+
+def render_placard(params: dict) -> bytes:
+    from api.documents.dg_placard import DangerousGoodPlacard
+
+    return DangerousGoodPlacard(**params).get_pdf()
+
+
+def render_battery(params: dict) -> bytes:
+    from api.documents.dg_battery import DangerousGoodBattery
+
+    return DangerousGoodBattery(**params).get_pdf()
+
+
+def render_image(params: dict) -> bytes:
+    from api.documents.simple_image_overlay import SimpleImageOverlay
+
+    return SimpleImageOverlay(**params).get_pdf()
+
+
+def render_commercial_invoice(params: dict) -> bytes:
+    from api.documents.commercial_invoice import CommercialInvoice
+
+    return CommercialInvoice(**params).get_pdf()
+
+
+def render_b13a(params: dict) -> bytes:
+    from api.documents import b13a
+
+    return b13a.render_b13a(**params)
+
+
+def render_pdf(params: dict) -> bytes:
+    """
+        Pass through a document that is already rendered.
+    """
+    return params["document"]
+
+
+def merge_documents(documents: list) -> bytes:
+    """
+        Merge pdf documents in order.
+        :param documents: list of pdf bytes
+        :return: merged pdf bytes
+    """
+    buffer = io.BytesIO()
+    merger = PdfFileMerger()
+
+    for document in documents:
+        merger.append(io.BytesIO(document))
+
+    merger.write(buffer)
+    merger.close()
+
+    return buffer.getvalue()
+
+
+class DocumentRenderService:
+    """
+        Render documents in a process pool, a document is a (renderer name, params dict) pair. The pool is created
+        per process on first use, no workers renders in the calling process.
+    """
+
+    _renderers = {
+        "declaration": render_declaration,
+        "placard": render_placard,
+        "battery": render_battery,
+        "image": render_image,
+        "commercial_invoice": render_commercial_invoice,
+        "b13a": render_b13a,
+        "pdf": render_pdf,
+    }
+
+    _pool = None
+    _pool_pid = None
+
+    def __init__(self, workers: int = DOCUMENT_RENDER_WORKERS) -> None:
+        self._workers = workers
+        self._cache = DocumentCache()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """
+            Get the process pool, a forked worker creates its own.
+            :return: ProcessPoolExecutor
+        """
+        cls = DocumentRenderService
+
+        if cls._pool is None or cls._pool_pid != os.getpid():
+            cls._pool = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            )
+            cls._pool_pid = os.getpid()
+
+        return cls._pool
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+            Stop the render processes of this process.
+        """
+
+        if cls._pool is not None and cls._pool_pid == os.getpid():
+            cls._pool.shutdown(wait=True)
+
+        cls._pool = None
+        cls._pool_pid = None
+
+    @staticmethod
+    def _wait(futures: list) -> list:
+        """
+            Wait for the results on a hub thread, only the calling greenlet blocks.
+            :param futures: list of Future
+            :return: list of results in order
+        """
+        return gevent.get_hub().threadpool.apply(lambda: [future.result() for future in futures])
+
+    def _run(self, calls: list) -> list:
+        """
+            Run (function, argument) calls in the pool, inline without workers or when the pool has broken.
+            :param calls: list of (function, argument)
+            :return: list of results in order
+        """
+
+        if self._workers > 0:
+            try:
+                pool = self._get_pool()
+                return self._wait(futures=[pool.submit(function, argument) for function, argument in calls])
+            except BrokenProcessPool as e:
+                LOGGER.critical(f"DocumentRenderService: process pool broken, rendering inline: {str(e)}")
+                DocumentRenderService._pool = None
+
+        return [function(argument) for function, argument in calls]
+
+    def render(self, documents: list) -> list:
+        """
+            Render documents, cached documents are read from the cache and a repeated one is rendered once.
+            :param documents: list of (renderer name, params dict)
+            :return: list of pdf bytes in order
+        """
+        keys = [
+            self._cache.get_key(name=name, params=params) if self._cache.is_cached(name=name) else None
+            for name, params in documents
+        ]
+        cached = self._cache.get_documents(keys=[key for key in keys if key])
+        calls = []
+
+        # Render slot (cache key or document index): rendered pdf, in call order.
+        slots = {}
+
+        for index, (key, (name, params)) in enumerate(zip(keys, documents)):
+            slot = key or index
+
+            if key in cached or slot in slots:
+                continue
+
+            slots[slot] = None
+            calls.append((self._renderers[name], params))
+
+        slots = dict(zip(slots.keys(), self._run(calls=calls))) if calls else {}
+        rendered = {slot: document for slot, document in slots.items() if isinstance(slot, str)}
+
+        if rendered:
+            self._cache.set_documents(documents=rendered)
+
+        cached.update(rendered)
+
+        return [cached[key] if key else slots[index] for index, key in enumerate(keys)]
+
+    def render_base_64(self, name: str, params: dict) -> str:
+        """
+            Render one document.
+            :param name: renderer name
+            :param params: params dict
+            :return: base64 pdf
+        """
+        document = self.render(documents=[(name, params)])[0]
+
+        return base64.b64encode(document).decode("ascii")
+
+    def render_merged(self, documents: list) -> bytes:
+        """
+            Render documents and merge them into one pdf, the merge runs in the pool as well.
+            :param documents: list of (renderer name, params dict)
+            :return: merged pdf bytes
+        """
+        rendered = self.render(documents=documents)
+
+        return self._run(calls=[(merge_documents, rendered)])[0]
@@ -8,6 +8,7 @@ from reportlab.platypus import SimpleDocTemplate, Image
 class SimpleImageOverlay:
     filename = "Generic Placard"
     extension = ".pdf"
+    template_version = 1
 
     def __init__(self, placard, width: int = 100, height: int = 100):
         self._placard = placard
@@ -0,0 +1,98 @@
+import io
+from decimal import Decimal
+
+from PyPDF2 import PdfFileReader
+from django.test import TestCase
+
+from api.documents import b13a
+from api.documents.render_service import DocumentRenderService
+
+
+class B13ATests(TestCase):
+    fixtures = [
+        "carriers",
+        "countries",
+        "provinces",
+    ]
+
+    def setUp(self):
+        self.shipping_request = {
+            "carrier_id": 2,
+            "origin": {
+                "name": "BBE Expediting",
+                "address": "1759 35 Ave E",
+                "city": "Edmonton International Airport",
+                "province": "AB",
+                "country": "CA",
+                "postal_code": "T9E0V6",
+            },
+            "destination": {
+                "name": "Receiving",
+                "address": "1 Main St",
+                "city": "Kansas City",
+                "province": "MO",
+                "country": "US",
+                "postal_code": "64105",
+            },
+            "packages": [{"quantity": 2, "package_type": "BOX", "weight": Decimal("10.0")}],
+            "commodities": [],
+        }
+
+    def _commodities(self, count: int) -> list:
+        return [
+            {
+                "made_in_country_code": "CA",
+                "description": f"Commodity {i}",
+                "total_weight": Decimal("1.5"),
+                "unit_value": Decimal("10.00"),
+            }
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _pages(document: bytes) -> PdfFileReader:
+        return PdfFileReader(io.BytesIO(document))
+
+    def test_get_context(self):
+        context = b13a.get_context(self.shipping_request)
+
+        self.assertEqual(context.origin_province, "ALBERTA")
+        self.assertEqual(context.destination_province, "MISSOURI")
+        self.assertEqual(context.destination_country, "UNITED STATES")
+        self.assertEqual(context.carrier_name, "FEDEX")
+
+    def test_render_no_queries(self):
+        self.shipping_request["commodities"] = self._commodities(count=3)
+        context = b13a.get_context(self.shipping_request)
+
+        with self.assertNumQueries(0):
+            document = b13a.render_b13a(self.shipping_request, "ub1234567890", Decimal("100"), context, "TRACK1")
+
+        reader = self._pages(document)
+        self.assertEqual(reader.getNumPages(), 3)
+        self.assertIn("MISSOURI, UNITED STATES", reader.getPage(0).extract_text())
+
+    def test_additional_commodity_pages(self):
+        # 5 on the first page, 19 per additional page.
+        for count, pages in [(24, 4), (25, 5), (43, 5), (44, 6)]:
+            self.shipping_request["commodities"] = self._commodities(count=count)
+            document = b13a.render_b13a(
+                self.shipping_request, "ub1234567890", Decimal("100"), b13a.get_context(self.shipping_request)
+            )
+            reader = self._pages(document)
+
+            self.assertEqual(reader.getNumPages(), pages)
+            self.assertIn(f"Commodity {count - 1}", reader.getPage(pages - 3).extract_text())
+
+        self.assertIn("Commodity 23", reader.getPage(1).extract_text())
+        self.assertNotIn("Commodity 24", reader.getPage(1).extract_text())
+        self.assertIn("Commodity 24", reader.getPage(2).extract_text())
+
+    def test_render_service(self):
+        self.shipping_request["commodities"] = self._commodities(count=6)
+        params = b13a.get_params(self.shipping_request, "ub1234567890", Decimal("100"), "TRACK1")
+        document = DocumentRenderService(workers=0).render(documents=[("b13a", params)])[0]
+
+        self.assertNotIn("carrier_id", params["shipping_request"])
+        self.assertEqual(self._pages(document).getNumPages(), 4)
+        self.assertEqual(b13a.b13a(self.shipping_request, "ub1234567890", Decimal("100"))[:4], "JVBE")
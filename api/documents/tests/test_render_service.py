@@ -0,0 +1,120 @@
+import io
+import pickle
+from decimal import Decimal
+
+from PyPDF2 import PdfFileReader
+from django.test import TestCase
+
+from api.documents.commercial_invoice import CommercialInvoice
+from api.documents.dg_declaration import DangerousGoodDeclaration
+from api.documents.render_service import DocumentRenderService
+
+
+class DocumentRenderServiceTests(TestCase):
+    fixtures = [
+        "carriers",
+        "airports",
+    ]
+
+    def setUp(self):
+        address = {
+            "company_name": "BBE Expediting",
+            "address": "1759 35 Ave E",
+            "city": "Edmonton International Airport",
+            "province": "AB",
+            "postal_code": "T9E0V6",
+            "country": "CA",
+            "phone": "7809326245",
+        }
+        self.world_request = {
+            "carrier_id": 708,
+            "awb": "123-45678901",
+            "origin": dict(address, base="YEG"),
+            "destination": dict(address, base="YZF", city="Yellowknife", province="NT", postal_code="X1A0A1"),
+            "packages": [],
+        }
+        self.dangerous_goods = [
+            {
+                "un_number": 1263,
+                "proper_shipping_name": "Paint",
+                "class_div": "3",
+                "subrisks_str": "",
+                "packing_group_str": "II",
+                "packing_type_str": "Fibreboard Box",
+                "packing_instruction": "353",
+                "measure_unit": "L",
+                "quantity": 2,
+                "dg_quantity": Decimal("5.00"),
+                "weight": Decimal("12.00"),
+                "is_gross": False,
+                "is_limited": False,
+                "is_neq": False,
+                "is_passenger_aircraft": True,
+                "specialty_label": object(),
+            }
+        ]
+
+    @staticmethod
+    def _pages(document: bytes) -> int:
+        return PdfFileReader(io.BytesIO(document)).getNumPages()
+
+    def test_declaration_params_are_plain(self):
+        params = DangerousGoodDeclaration.get_params(self.world_request, self.dangerous_goods)
+
+        self.assertEqual(params, pickle.loads(pickle.dumps(params)))
+        self.assertNotIn("specialty_label", params["dg_details"][0])
+        self.assertNotIn("packages", params["world_request"])
+        self.assertEqual(params["context"], {
+            "is_air": True,
+            "carrier_name": "Canadian North",
+            "origin_airbase": {"name": "Edmonton International Airport", "code": "YEG"},
+            "destination_airbase": {"name": "Yellowknife", "code": "YZF"},
+            "is_passenger_aircraft": True,
+        })
+        self.assertTrue(self.world_request["is_passenger_aircraft"])
+
+    def test_commercial_invoice_params(self):
+        shipdata = {
+            "origin": dict(self.world_request["origin"], name="Shipping"),
+            "destination": dict(self.world_request["destination"], name="Receiving"),
+            "commodities": [
+                {
+                    "description": "Paint",
+                    "made_in_country_code": "CA",
+                    "quantity": 2,
+                    "total_weight": Decimal("12.00"),
+                    "unit_value": Decimal("10.00"),
+                    "package": object(),
+                }
+            ],
+            "carrier": object(),
+        }
+        params = CommercialInvoice.get_params(shipdata=shipdata, order_number="ub1234567890")
+
+        self.assertEqual(params, pickle.loads(pickle.dumps(params)))
+        self.assertEqual(["origin", "destination", "commodities"], list(params["shipdata"].keys()))
+        self.assertNotIn("base", params["shipdata"]["origin"])
+        self.assertNotIn("package", params["shipdata"]["commodities"][0])
+
+    def test_render_merged_inline(self):
+        documents = [
+            ("declaration", DangerousGoodDeclaration.get_params(self.world_request, self.dangerous_goods)),
+            ("battery", {"un_number": 3480}),
+            ("image", {"placard": "assets/dangerous_goods/labels/generic/cargo-aircraft-only.png"}),
+        ]
+        rendered = DocumentRenderService(workers=0).render(documents=documents)
+        merged = DocumentRenderService(workers=0).render_merged(documents=documents)
+
+        self.assertEqual(sum(self._pages(document) for document in rendered), self._pages(merged))
+
+    def test_render_process_pool(self):
+        self.addCleanup(DocumentRenderService.shutdown)
+        documents = [
+            ("declaration", DangerousGoodDeclaration.get_params(self.world_request, self.dangerous_goods)),
+            ("battery", {"un_number": 3090}),
+        ]
+        inline = DocumentRenderService(workers=0).render(documents=documents)
+        pooled = DocumentRenderService(workers=1).render(documents=documents)
+
+        self.assertEqual([self._pages(document) for document in inline], [self._pages(d) for d in pooled])
+        self.assertTrue(pooled[0].startswith(b"%PDF"))
@@ -150,6 +150,16 @@ MAX_PICKUP_DAYS_IN_FUTURE = 1444
 
 DEFAULT_TIMEOUT_SECONDS = 60
 WEBHOOK_TIMEOUT_SECONDS = 10
+WEBHOOK_BATCH_SECONDS = 5
+WEBHOOK_BATCH_SIZE = 100
+WEBHOOK_MAX_ATTEMPTS = 8
+WEBHOOK_RETRY_SECONDS = 30
+WEBHOOK_MAX_RETRY_SECONDS = 6 * 60 * 60
+WEBHOOK_SUBSCRIBER_CONCURRENCY = 4
+WEBHOOK_DISPATCH_CONCURRENCY = 50
+RATE_DEADLINE_SECONDS = 25
+RATE_CARRIER_TIMEOUT_SECONDS = 20
+RATE_DEADLINE_GRACE_SECONDS = 2
 
 BAD_REQUEST = 400
 UNAUTHORIZED = 401
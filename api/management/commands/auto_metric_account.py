@@ -5,6 +5,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.core.management import BaseCommand
 from django.db.models import QuerySet, Sum, F, Count
 
+from api.apis.metric_v3.metric_rollup import MetricRollup
 from api.models import Shipment, Leg, SubAccount, MetricAccount, Package, RateLog, MetricGoals
 
 
@@ -249,3 +250,6 @@ class Command(BaseCommand):
                 if ship_goal and str(account.subaccount_number) not in exclude_from_goals:
                     ship_goal.current += new_daily.shipments
                     ship_goal.save()
+
+        # Ship and cancel refresh the day as they happen, rebuild yesterday for costs updated after shipping.
+        MetricRollup().refresh_days(start=metric_day.date(), end=metric_day.date())
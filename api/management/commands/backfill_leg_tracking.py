@@ -0,0 +1,89 @@
+"""
+    Title: Backfill Leg Tracking State
+    Description: This file will backfill the leg tracking state (latest status, latest status time and delivered date)
+                 from the tracking status history. Run it once after the leg tracking state columns are added, legs
+                 are processed in primary key batches.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from datetime import datetime
+
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from api.models import Leg, TrackingStatus
+
+
+class Command(BaseCommand):
+    help = "Backfill the leg latest status, latest status time and delivered date from the tracking status history."
+
+    _default_datetime = datetime(year=1, month=1, day=1, tzinfo=timezone.utc)
+    _fields = ["latest_status", "latest_status_datetime", "delivered_date"]
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000, help="Number of legs per batch.")
+        parser.add_argument(
+            "--all", action="store_true", help="Backfill every leg, not only legs without a tracking state."
+        )
+
+    def _backfill(self, legs: list) -> None:
+        """
+            Set the tracking state of a batch of legs from their statuses.
+            :param legs: list of legs
+        """
+        statuses = TrackingStatus.objects.filter(
+            leg_id__in=[leg.pk for leg in legs]
+        ).only(
+            "leg_id", "status", "updated_datetime", "delivered_datetime"
+        ).order_by("leg_id", "updated_datetime", "pk")
+        latest = {}
+        delivered = {}
+
+        for status in statuses:
+            latest[status.leg_id] = status
+
+            if status.delivered_datetime != self._default_datetime:
+                delivered[status.leg_id] = max(delivered.get(status.leg_id, status.delivered_datetime),
+                                               status.delivered_datetime)
+
+        for leg in legs:
+            status = latest.get(leg.pk)
+
+            if not status:
+                continue
+
+            state = status.get_leg_state()
+
+            if leg.pk in delivered:
+                state["delivered_date"] = delivered[leg.pk]
+
+            if leg.delivered_date != self._default_datetime:
+                state.pop("delivered_date", None)
+
+            leg.set_values(state)
+
+        Leg.objects.bulk_update(legs, fields=self._fields)
+
+    def handle(self, *args, **options) -> None:
+        legs = Leg.objects.only("pk", *self._fields).order_by("pk")
+
+        if not options["all"]:
+            legs = legs.filter(latest_status_datetime=self._default_datetime)
+
+        last_pk = 0
+        count = 0
+
+        while True:
+            batch = list(legs.filter(pk__gt=last_pk)[:options["batch_size"]])
+
+            if not batch:
+                break
+
+            self._backfill(legs=batch)
+            last_pk = batch[-1].pk
+            count += len(batch)
+            self.stdout.write(f"Backfilled {count} legs.")
+
+        self.stdout.write(self.style.SUCCESS(f"Leg tracking state backfill complete: {count} legs."))
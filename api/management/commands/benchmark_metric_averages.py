@@ -0,0 +1,128 @@
+"""
+    Title: Metric Averages Benchmark
+    Description: This file will benchmark the metric averages on synthetic legs, comparing the old per row Python
+                 loop with scipy and numpy calls per list against the sorted array single pass. The database fetch is
+                 not included, rows are generated in memory: Decimal rows for the old loop, the float rows the cost
+                 annotation returns for the new path.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import random
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+
+import numpy
+from django.core.management import BaseCommand
+from scipy import stats
+
+from api.apis.metric_v3.metric_averages_v3 import GetMetricAverages
+
+
+class Command(BaseCommand):
+    help = "Benchmark metric averages on synthetic legs: per row Python loop vs sorted array single pass."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--legs", type=int, default=500000, help="Number of synthetic legs.")
+        parser.add_argument("--runs", type=int, default=3, help="Number of timed runs, the best is reported.")
+        parser.add_argument("--seed", type=int, default=7, help="Random seed.")
+
+    @staticmethod
+    def _build_legs(count: int, seed: int) -> list:
+        """
+            Build synthetic legs with the fields the averages read.
+            :param count: number of legs
+            :param seed: random seed
+            :return: list of leg like objects
+        """
+        rand = random.Random(seed)
+        legs = []
+
+        for _ in range(count):
+            cost = Decimal(rand.randint(2000, 500000)) / 100
+            legs.append(SimpleNamespace(
+                cost=cost,
+                tax=(cost * Decimal("0.05")).quantize(Decimal("0.01")),
+                markup=Decimal(rand.choice([0, 10, 15, 20, 25])),
+                is_dangerous_good=rand.random() < 0.1,
+                is_delivered=rand.random() < 0.8,
+            ))
+
+        return legs
+
+    @staticmethod
+    def _legacy(legs: list) -> list:
+        """
+            The previous averages: a Python float per row and scipy mode, numpy mean and median per list.
+            :param legs: synthetic legs
+            :return: list of (mode count, mean, median)
+        """
+        cost_list = []
+        dg_list = []
+        delivered_list = []
+
+        for item in legs:
+            cost_list.append(float((item.cost - item.tax) * ((item.markup / 100) + 1)))
+
+            if item.is_dangerous_good:
+                dg_list.append(float((item.cost - item.tax) * ((item.markup / 100) + 1)))
+
+            if item.is_delivered:
+                delivered_list.append(float((item.cost - item.tax) * ((item.markup / 100) + 1)))
+
+        ret = []
+
+        for data in (cost_list, dg_list, delivered_list):
+            mode = stats.mode(data, keepdims=True)
+            ret.append((str(mode.count[0]), str(round(numpy.mean(data), 2)), str(round(numpy.median(data), 2))))
+
+        return ret
+
+    @staticmethod
+    def _vectorized(metric: GetMetricAverages, rows: list) -> list:
+        """
+            The array averages on the rows the cost annotation returns.
+            :param metric: GetMetricAverages
+            :param rows: list of (cost, is dangerous good, is delivered)
+            :return: list of (mode count, mean, median)
+        """
+        values = numpy.array(rows, dtype=float).reshape(-1, 3)
+        costs = numpy.round(values[:, 0], metric._float_precision)
+        order = numpy.argsort(costs, kind="stable")
+        costs, is_dg, is_delivered = costs[order], values[order, 1] > 0, values[order, 2] > 0
+
+        return [metric._get_stats(values=data) for data in (costs, costs[is_dg], costs[is_delivered])]
+
+    @staticmethod
+    def _best(function, runs: int) -> tuple:
+        timings = []
+        result = None
+
+        for _ in range(runs):
+            start = time.perf_counter()
+            result = function()
+            timings.append(time.perf_counter() - start)
+
+        return min(timings), result
+
+    def handle(self, *args, **options) -> None:
+        legs = self._build_legs(count=options["legs"], seed=options["seed"])
+        rows = [
+            (float((leg.cost - leg.tax) * (leg.markup / 100 + 1)), leg.is_dangerous_good, leg.is_delivered)
+            for leg in legs
+        ]
+        metric = GetMetricAverages()
+
+        legacy_time, legacy = self._best(lambda: self._legacy(legs=legs), runs=options["runs"])
+        vector_time, vector = self._best(lambda: self._vectorized(metric=metric, rows=rows), runs=options["runs"])
+
+        self.stdout.write(f"Legs: {options['legs']}")
+        self.stdout.write(f"Per row loop:  {legacy_time * 1000:10.1f}ms")
+        self.stdout.write(f"Single pass:   {vector_time * 1000:10.1f}ms ({legacy_time / vector_time:.1f}x)")
+
+        if legacy == vector:
+            self.stdout.write(self.style.SUCCESS("Results match."))
+        else:
+            self.stderr.write(self.style.ERROR(f"Results differ: {legacy} != {vector}"))
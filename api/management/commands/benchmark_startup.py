@@ -0,0 +1,78 @@
+"""
+    Title: Startup Benchmark
+    Description: This file will benchmark worker start up by importing api.urls in a fresh interpreter with
+                 python -X importtime. Reports the wall time of each run and the slowest modules of the last run.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.core.management import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Benchmark worker start up: import api.urls with python -X importtime and report the slowest modules."
+
+    _script = "import django; django.setup(); import api.urls"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--runs", type=int, default=3, help="Number of fresh interpreters to time.")
+        parser.add_argument("--top", type=int, default=25, help="Number of modules to report.")
+        parser.add_argument("--prefix", type=str, default="", help="Only report modules starting with, ex: api.")
+
+    @staticmethod
+    def _parse(output: str) -> list:
+        """
+            Parse the importtime report.
+            :param output: interpreter stderr
+            :return: list of (module, self us, cumulative us)
+        """
+        modules = []
+
+        for line in output.splitlines():
+
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+
+            self_us, cumulative_us, module = line[len("import time:"):].split("|")
+            modules.append((module.strip(), int(self_us), int(cumulative_us)))
+
+        return modules
+
+    def handle(self, *args, **options) -> None:
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get("DJANGO_SETTINGS_MODULE", "brain.settings"))
+        timings = []
+        modules = []
+
+        for _ in range(options["runs"]):
+            start = time.perf_counter()
+            process = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", self._script], env=env, capture_output=True, text=True
+            )
+            timings.append(time.perf_counter() - start)
+
+            if process.returncode != 0:
+                self.stderr.write(self.style.ERROR(process.stderr.splitlines()[-1]))
+                return
+
+            modules = self._parse(output=process.stderr)
+
+        urls = next((module for module in modules if module[0] == "api.urls"), None)
+        self.stdout.write(
+            f"Wall: median {statistics.median(timings):.3f}s, min {min(timings):.3f}s over {len(timings)} runs"
+        )
+
+        if urls:
+            self.stdout.write(f"api.urls cumulative import: {urls[2] / 1000:.1f}ms")
+
+        self.stdout.write(f"{'Self (ms)':>10} {'Cumulative (ms)':>16}  Module")
+        selected = [module for module in modules if module[0].startswith(options["prefix"])]
+
+        for module, self_us, cumulative_us in sorted(selected, key=lambda m: m[2], reverse=True)[:options["top"]]:
+            self.stdout.write(f"{self_us / 1000:>10.1f} {cumulative_us / 1000:>16.1f}  {module}")
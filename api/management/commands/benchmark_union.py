@@ -0,0 +1,135 @@
+"""
+    Title: Union Split Benchmark
+    Description: This file will benchmark splitting a rate request per carrier group, comparing the old deep copy per
+                 carrier group against the request views used by Union. Reports latency and allocations per quote.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import copy
+import time
+import tracemalloc
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.management import BaseCommand
+
+from api.apis.carriers.union.api_union_v2 import Union
+from api.models import SubAccount
+from api.utilities.carriers import CarrierUtility
+
+
+class Command(BaseCommand):
+    help = "Benchmark Union request splitting: deep copy per carrier group vs request views."
+
+    # Carrier groups built by the old Union split, one deep copy each.
+    _legacy_groups = 18
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--iterations", type=int, default=200, help="Number of splits to time.")
+        parser.add_argument(
+            "--carriers", type=int, nargs="+", default=[708, 650, 20, 123], help="Requested carrier ids."
+        )
+        parser.add_argument(
+            "--quote_calls", type=int, default=1,
+            help="Union calls per quote, ex: MultiModalAirRate makes three per airbase combination."
+        )
+
+    @staticmethod
+    def _build_request(carriers: list) -> dict:
+        """
+            Build a representative rate request with the ORM objects attached.
+            :param carriers: requested carrier ids
+            :return: rate request
+        """
+        sub_account = SubAccount.objects.filter(is_default=True).first() or SubAccount.objects.first()
+        user = User.objects.first()
+        carrier_list = list(carriers)
+
+        return {
+            "carrier_id": carrier_list,
+            "origin": {
+                "address": "1759 35 Ave E", "city": "Edmonton International Airport", "company_name": "BBE",
+                "country": "CA", "postal_code": "T9E0V6", "province": "AB"
+            },
+            "destination": {
+                "address": "140 Thad Johnson Road", "city": "Inuvik", "company_name": "Personal",
+                "country": "CA", "postal_code": "X0E0T0", "province": "NT"
+            },
+            "packages": [
+                {
+                    "length": Decimal("48"), "width": Decimal("40"), "height": Decimal("36"),
+                    "weight": Decimal("250"), "quantity": 1, "package_type": "SKID", "description": "Parts"
+                }
+                for _ in range(5)
+            ],
+            "pickup": {"date": "2026-10-20", "start_time": "10:00", "end_time": "16:00"},
+            "carrier_options": [],
+            "is_dangerous_goods": False,
+            "total_weight_imperial": Decimal("2750"),
+            "total_volume_imperial": Decimal("200"),
+            "objects": {
+                "sub_account": sub_account,
+                "user": user,
+                "carrier_accounts": CarrierUtility().get_carrier_accounts(
+                    sub_account=sub_account, carrier_list=carrier_list
+                ) if sub_account else {},
+            },
+        }
+
+    def _legacy_split(self, request: dict) -> list:
+        """
+            Old Union split, a full deep copy of the request for every carrier group.
+            :param request: rate request
+            :return: list of copied requests
+        """
+        return [copy.deepcopy(request) for _ in range(self._legacy_groups)]
+
+    @staticmethod
+    def _measure(func, iterations: int) -> tuple:
+        """
+            Measure average latency and allocations for a split function.
+            :param func: split function
+            :param iterations: number of iterations
+            :return: average ms, allocated KiB per call, allocated blocks per call
+        """
+        start = time.perf_counter()
+
+        for _ in range(iterations):
+            func()
+
+        elapsed = (time.perf_counter() - start) / iterations * 1000
+
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        kept = [func() for _ in range(iterations)]
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        stats = after.compare_to(before, "filename")
+        size = sum(stat.size_diff for stat in stats) / iterations / 1024
+        blocks = sum(stat.count_diff for stat in stats) / iterations
+        del kept
+
+        return elapsed, size, blocks
+
+    def handle(self, *args, **options) -> None:
+        iterations = options["iterations"]
+        quote_calls = options["quote_calls"]
+        request = self._build_request(carriers=options["carriers"])
+        union = Union(gobox_request=request)
+
+        legacy = self._measure(func=lambda: self._legacy_split(request=request), iterations=iterations)
+        views = self._measure(func=union._split, iterations=iterations)
+
+        self.stdout.write(f"Carriers: {request['carrier_id']} | Union calls per quote: {quote_calls}")
+        self.stdout.write(f"{'Split':<12}{'ms/quote':>12}{'KiB/quote':>14}{'blocks/quote':>16}")
+
+        for name, (elapsed, size, blocks) in (("deepcopy", legacy), ("views", views)):
+            self.stdout.write(
+                f"{name:<12}{elapsed * quote_calls:>12.3f}{size * quote_calls:>14.1f}{blocks * quote_calls:>16.0f}"
+            )
+
+        if views[0]:
+            self.stdout.write(self.style.SUCCESS(f"Speed up: {legacy[0] / views[0]:.1f}x"))
@@ -0,0 +1,19 @@
+"""
+    Title: Clear Report Jobs
+    Description: This file will delete expired report jobs and their stored report files. Run it daily.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from django.core.management import BaseCommand
+
+from api.apis.reports.report_job import ReportJobs
+
+
+class Command(BaseCommand):
+    help = "Delete expired report jobs and their report files."
+
+    def handle(self, *args, **options) -> None:
+        count = ReportJobs.clear_expired()
+        self.stdout.write(self.style.SUCCESS(f"Expired report jobs deleted: {count}."))
@@ -0,0 +1,37 @@
+"""
+    Title: Refresh Metric Rollups
+    Description: This file will rebuild the daily metric leg rollups for a date range. Use it to backfill the rollups
+                 or to rebuild days after legs are re-costed in bulk.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import datetime
+
+from django.core.management import BaseCommand
+
+from api.apis.metric_v3.metric_rollup import MetricRollup
+
+
+class Command(BaseCommand):
+    help = "Rebuild the daily metric leg rollups for a date range, ex: --start 2025-01-01 --end 2025-12-31."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--start", type=str, help="First day, '%%Y-%%m-%%d'. Defaults to --days ago.")
+        parser.add_argument("--end", type=str, help="Last day, '%%Y-%%m-%%d'. Defaults to today.")
+        parser.add_argument("--days", type=int, default=1, help="Days back from --end when --start is not given.")
+
+    def handle(self, *args, **options) -> None:
+        end = datetime.date.today()
+
+        if options["end"]:
+            end = datetime.datetime.strptime(options["end"], "%Y-%m-%d").date()
+
+        if options["start"]:
+            start = datetime.datetime.strptime(options["start"], "%Y-%m-%d").date()
+        else:
+            start = end - datetime.timedelta(days=options["days"])
+
+        count = MetricRollup().refresh_days(start=start, end=end)
+        self.stdout.write(self.style.SUCCESS(f"Metric rollups rebuilt from {start} to {end}: {count} rows."))
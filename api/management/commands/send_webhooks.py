@@ -0,0 +1,29 @@
+"""
+    Title: Send Webhooks
+    Description: This file will post due webhook deliveries, including deliveries left sending by a stopped worker.
+                 Run it every few minutes as a sweep behind the queued dispatch runs.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from django.core.management import BaseCommand
+
+from api.utilities.webhook_dispatcher import WebhookDispatcher
+
+
+class Command(BaseCommand):
+    help = "Post due webhook deliveries from the outbox."
+
+    def handle(self, *args, **options) -> None:
+        dispatcher = WebhookDispatcher()
+        total = 0
+
+        while True:
+            count = dispatcher.dispatch(schedule=False)
+            total += count
+
+            if not count:
+                break
+
+        self.stdout.write(self.style.SUCCESS(f"Webhook deliveries posted: {total}."))
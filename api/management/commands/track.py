@@ -101,8 +101,13 @@ class Command(BaseCommand):
 
         LOGGER.info("Leg Tracking Complete")
 
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--full", action="store_true", help="Track every undelivered leg, ignoring the last status schedule."
+        )
+
     def handle(self, *args, **options) -> None:
 
         # self._old_track()
 
-        Track(command=self).track()
+        Track(command=self, is_full=options["full"]).track()
@@ -0,0 +1,38 @@
+"""
+    Title: Warm SOAP Clients
+    Description: This file will parse the SOAP carrier WSDL documents into the SOAP client pool and print the pool
+                 health check. With --remote the remote WSDL and XSD files are fetched into the on disk WSDL cache,
+                 run it before the workers start so every worker on the host reuses them.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from django.core.management import BaseCommand
+
+from api.apis.carriers.soap_client_pool import SoapClientPool
+
+
+class Command(BaseCommand):
+    help = "Parse the SOAP carrier WSDL documents into the client pool and report the pool health."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--remote", action="store_true", help="Fetch the remote WSDLs into the on disk WSDL cache."
+        )
+
+    def handle(self, *args, **options) -> None:
+        errors = SoapClientPool.warm_up(remote=options["remote"])
+
+        for wsdl, error in errors.items():
+            self.stderr.write(self.style.ERROR(f"{wsdl}: {error}"))
+
+        health = SoapClientPool.health_check()
+
+        for document in health["documents"]:
+            self.stdout.write(f"{document['carrier']} {document['wsdl']}: {', '.join(document['services'])}")
+
+        if health["is_healthy"] and not errors:
+            self.stdout.write(self.style.SUCCESS(f"SOAP client pool ready: {len(health['documents'])} documents."))
+        else:
+            self.stderr.write(self.style.ERROR("SOAP client pool is not healthy."))
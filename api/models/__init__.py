@@ -95,6 +95,9 @@ from api.models.rs_probill_number import ProBillNumber
 from api.models.ubbe_ml_regressors import UbbeMlRegressors
 from api.models.ubbe_rate_log import RateLog
 from api.models.metric_daily_account import MetricAccount
+from api.models.metric_leg_rollup import MetricLegRollup
+from api.models.report_job import ReportJob
+from api.models.webhook_outbox import WebhookOutbox
 
 from api.models.temp_user_permission import UserTier
 
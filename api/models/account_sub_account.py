@@ -3,8 +3,8 @@
     Description: This file will contain functions for SubAccount Model.
     Created: February 5, 2019
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 import secrets
 import uuid
@@ -37,6 +37,7 @@ class SubAccount(BaseTable):
     )
 
     creation_date = DateTimeField(auto_now_add=True, editable=True, help_text="Date account was created.")
+    modified_date = DateTimeField(auto_now=True, null=True, blank=True, help_text="Date account was last saved.")
     system = CharField(
         max_length=LETTER_MAPPING_LEN * 2, choices=_SYSTEM, default="UB", help_text="System Account belongs to."
     )
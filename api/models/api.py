@@ -7,7 +7,7 @@
     Edited Date:
 """
 
-from django.db.models.fields import CharField, BooleanField
+from django.db.models.fields import CharField, BooleanField, PositiveIntegerField
 
 from api.globals.project import DEFAULT_CHAR_LEN, LETTER_MAPPING_LEN, API_API_CATEGORY
 from api.models.base_table import BaseTable
@@ -18,6 +18,11 @@ class API(BaseTable):
     name = CharField(max_length=DEFAULT_CHAR_LEN, unique=True)
     active = BooleanField(default=True)
     category = CharField(max_length=LETTER_MAPPING_LEN * 2, choices=API_API_CATEGORY, default="NA")
+    rate_cache_ttl = PositiveIntegerField(
+        default=0,
+        help_text="Seconds to cache carrier rate responses, 0 turns the rate cache off. Must stay shorter than the "
+                  "carrier quote cache (15 minutes) as the ship calls look up the rated service codes."
+    )
 
     class Meta:
         ordering = ["name"]
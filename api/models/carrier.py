@@ -10,7 +10,8 @@
 from decimal import Decimal
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models.fields import CharField, DecimalField, BooleanField, EmailField, PositiveSmallIntegerField
+from django.db.models.fields import CharField, DecimalField, BooleanField, EmailField, PositiveSmallIntegerField, \
+    PositiveIntegerField
 
 from api.globals.project import DEFAULT_CHAR_LEN, PERCENTAGE_PRECISION, BASE_TEN, WEIGHT_PRECISION, MAX_WEIGHT_DIGITS, \
     LETTER_MAPPING_LEN, PRICE_PRECISION
@@ -71,6 +72,12 @@ class Carrier(BaseTable):
     is_bbe_only = BooleanField(default=True, help_text="Is the carrier to be shown to BBE only?")
     is_allowed_account = BooleanField(default=True, help_text="Is the carrier allowed to be shown to accounts?")
     is_allowed_public = BooleanField(default=True, help_text="Is the carrier allowed to be shown to public?")
+    rate_cache_ttl = PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Seconds to cache rate responses for the carrier, overrides the carrier api rate cache ttl. "
+                  "Leave blank to use the api ttl, 0 turns the rate cache off for the carrier."
+    )
 
     class Meta:
         verbose_name = "Carrier"
@@ -3,10 +3,11 @@
     Description: This file will contain functions for CarrierMarkup Model.
     Created: February 5, 2019
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 
+from django.core.cache import cache
 from django.db.models.deletion import CASCADE
 from django.db.models.fields import DecimalField
 from django.db.models.fields.related import ForeignKey
@@ -14,6 +15,35 @@ from django.db.models.fields.related import ForeignKey
 from api.globals.project import PERCENTAGE_PRECISION, MAX_PERCENTAGE_DIGITS
 from api.models import Markup, Carrier
 from api.models.base_table import BaseTable
+from api.models.rate_cache_queryset import RateCacheQuerySet
+
+
+class CarrierMarkupQuerySet(RateCacheQuerySet):
+    """
+        CarrierMarkup QuerySet, a bulk change also drops the cached markup multipliers of the markups' sub accounts.
+    """
+
+    # Override
+    def _collect(self) -> list:
+        """
+            Get the markups and carriers of the rows.
+            :return: list of (markup id, carrier code)
+        """
+        return list(self.order_by().values_list("markup_id", "carrier__code").distinct())
+
+    # Override
+    def _invalidate(self, collected: list) -> None:
+        from api.cache_lookups.rate_cache import RateCache
+        from api.models import SubAccount
+
+        keys = []
+
+        for markup_id, carrier_id in collected:
+            numbers = SubAccount.objects.filter(markup_id=markup_id).values_list("subaccount_number", flat=True)
+            keys.extend(f"{str(number)}_c_markup_{carrier_id}" for number in numbers)
+
+        cache.delete_many(keys)
+        RateCache.invalidate(carrier_ids=[carrier_id for _, carrier_id in collected])
 
 
 class CarrierMarkup(BaseTable):
@@ -25,6 +55,8 @@ class CarrierMarkup(BaseTable):
     carrier = ForeignKey(Carrier, on_delete=CASCADE, related_name='carrier_markup_carrier')
     percentage = DecimalField(decimal_places=PERCENTAGE_PRECISION, max_digits=MAX_PERCENTAGE_DIGITS)
 
+    objects = CarrierMarkupQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Carrier Markup"
         verbose_name_plural = "Carrier - Carrier Markup"
@@ -45,6 +77,27 @@ class CarrierMarkup(BaseTable):
             carrier_markup.carrier = param_dict.get("carrier")
         return carrier_markup
 
+    def _invalidate_rates(self) -> None:
+        """
+            Invalidate cached rates and the cached markup multiplier of every sub account using the markup.
+        """
+        from api.cache_lookups.rate_cache import RateCache
+        from api.models import SubAccount
+
+        numbers = SubAccount.objects.filter(markup=self.markup).values_list("subaccount_number", flat=True)
+        cache.delete_many([f"{str(number)}_c_markup_{self.carrier.code}" for number in numbers])
+        RateCache.invalidate(carrier_ids=[self.carrier.code])
+
+    # Override
+    def save(self, *args, **kwargs) -> None:
+        super().save(*args, **kwargs)
+        self._invalidate_rates()
+
+    # Override
+    def delete(self, *args, **kwargs):
+        self._invalidate_rates()
+        return super().delete(*args, **kwargs)
+
     # Override
     def __repr__(self) -> str:
         return f"{self.carrier.name}, {self.markup.name}: {str(self.percentage)}%"
@@ -3,11 +3,11 @@
     Description: This file will contain functions for CityNameAlias Model.
     Created: February 5, 2019
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 
-from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.core.exceptions import ValidationError
 from django.db.models.deletion import CASCADE
 from django.db.models.fields import CharField
 from django.db.models.fields.related import ForeignKey
@@ -15,6 +15,20 @@ from django.db.models.fields.related import ForeignKey
 from api.globals.project import DEFAULT_CHAR_LEN
 from api.models import Province, Carrier
 from api.models.base_table import BaseTable
+from api.models.rate_cache_queryset import RateCacheQuerySet
+
+
+class CityNameAliasQuerySet(RateCacheQuerySet):
+    """
+        CityNameAlias QuerySet, a bulk change also bumps the city alias version.
+    """
+
+    # Override
+    def _invalidate(self, collected: list) -> None:
+        from api.cache_lookups.city_alias_cache import CityAliasCache
+
+        CityAliasCache.bump_version()
+        super()._invalidate(collected=collected)
 
 
 class CityNameAlias(BaseTable):
@@ -27,6 +41,8 @@ class CityNameAlias(BaseTable):
     name = CharField(max_length=DEFAULT_CHAR_LEN, help_text="The city proper name")
     alias = CharField(max_length=DEFAULT_CHAR_LEN, help_text="The non standard name for the associated city")
 
+    objects = CityNameAliasQuerySet.as_manager()
+
     class Meta:
         verbose_name = "City Name Alias"
         verbose_name_plural = "Carrier - City Name Aliases"
@@ -42,16 +58,11 @@ class CityNameAlias(BaseTable):
             :param country_code: str - Country Code
             :return: City or City Alias Found
         """
+        from api.cache_lookups.city_alias_cache import CityAliasCache
 
-        try:
-            return CityNameAlias.objects.get(
-                alias=alias,
-                province__code=province_code,
-                province__country__code=country_code,
-                carrier__code=carrier_id,
-            ).name
-        except ObjectDoesNotExist:
-            return alias
+        return CityAliasCache().resolve(
+            city=alias, province=province_code, country=country_code, carrier_id=carrier_id
+        )
 
     # Override
     def clean(self) -> None:
@@ -64,6 +75,22 @@ class CityNameAlias(BaseTable):
         self.clean()
         self.validate_unique()
         super().save(*args, **kwargs)
+        from api.cache_lookups.city_alias_cache import CityAliasCache
+        from api.cache_lookups.rate_cache import RateCache
+
+        CityAliasCache.bump_version()
+        RateCache.invalidate(carrier_ids=[self.carrier.code])
+
+    # Override
+    def delete(self, *args, **kwargs):
+        from api.cache_lookups.city_alias_cache import CityAliasCache
+        from api.cache_lookups.rate_cache import RateCache
+
+        deleted = super().delete(*args, **kwargs)
+        CityAliasCache.bump_version()
+        RateCache.invalidate(carrier_ids=[self.carrier.code])
+
+        return deleted
 
     # Override
     def __repr__(self) -> str:
@@ -3,8 +3,8 @@
     Description: This file will contain functions for FuelSurcharge Model.
     Created: February 5, 2019
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 
 from decimal import Decimal
@@ -18,6 +18,7 @@ from api.globals.project import DEFAULT_CHAR_LEN, PERCENTAGE_PRECISION, MAX_PERC
     BASE_TEN
 from api.models import Carrier
 from api.models.base_table import BaseTable
+from api.models.rate_cache_queryset import RateCacheQuerySet
 
 
 class FuelSurcharge(BaseTable):
@@ -59,6 +60,8 @@ class FuelSurcharge(BaseTable):
         help_text="This field is measured in pounds (lbs)"
     )
 
+    objects = RateCacheQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Fuel Surcharge"
         verbose_name_plural = "Fuel Surcharges"
@@ -107,6 +110,16 @@ class FuelSurcharge(BaseTable):
 
         self.clean_fields()
         super().save(*args, **kwargs)
+        from api.cache_lookups.rate_cache import RateCache
+
+        RateCache.invalidate(carrier_ids=[self.carrier.code])
+
+    # Override
+    def delete(self, *args, **kwargs):
+        from api.cache_lookups.rate_cache import RateCache
+
+        RateCache.invalidate(carrier_ids=[self.carrier.code])
+        return super().delete(*args, **kwargs)
 
     # Override
     def __repr__(self) -> str:
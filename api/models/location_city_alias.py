@@ -5,10 +5,11 @@
         api, as we want to try and eliminate all unnecessary calls to the api.
     Created: March 2, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
-from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.core.exceptions import ValidationError
+from django.db.models import QuerySet
 from django.db.models.deletion import CASCADE
 from django.db.models.fields import CharField
 from django.db.models.fields.related import ForeignKey
@@ -20,11 +21,41 @@ from api.models.base_table import BaseTable
 # TODO - Remove once a better solution is thought of, maybe Purolator City Postal Code Validation Check instead.
 
 
+class LocationCityAliasQuerySet(QuerySet):
+    """
+        LocationCityAlias QuerySet, a bulk change bumps the city alias version.
+    """
+
+    # Override
+    def update(self, **kwargs) -> int:
+        from api.cache_lookups.city_alias_cache import CityAliasCache
+
+        rows = super().update(**kwargs)
+
+        if rows:
+            CityAliasCache.bump_version()
+
+        return rows
+
+    # Override
+    def delete(self) -> tuple:
+        from api.cache_lookups.city_alias_cache import CityAliasCache
+
+        deleted = super().delete()
+
+        if deleted[0]:
+            CityAliasCache.bump_version()
+
+        return deleted
+
+
 class LocationCityAlias(BaseTable):
     province = ForeignKey(Province, on_delete=CASCADE, related_name="location_city_alias_province")
     name = CharField(max_length=DEFAULT_CHAR_LEN, help_text="The city proper name")
     alias = CharField(max_length=DEFAULT_CHAR_LEN, help_text="The non standard name for the associated city")
 
+    objects = LocationCityAliasQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Location City Alias"
         verbose_name_plural = "Location City Aliases"
@@ -53,15 +84,9 @@ class LocationCityAlias(BaseTable):
             :param country_code: str - Country Code
             :return: City or City Alias Found
         """
+        from api.cache_lookups.city_alias_cache import CityAliasCache
 
-        try:
-            return LocationCityAlias.objects.get(
-                alias=alias,
-                province__code=province_code,
-                province__country__code=country_code,
-            ).name
-        except ObjectDoesNotExist:
-            return alias
+        return CityAliasCache().resolve(city=alias, province=province_code, country=country_code)
 
     # Override
     def clean(self) -> None:
@@ -76,6 +101,18 @@ class LocationCityAlias(BaseTable):
         self.name.lower()
         self.alias.lower()
         super().save(*args, **kwargs)
+        from api.cache_lookups.city_alias_cache import CityAliasCache
+
+        CityAliasCache.bump_version()
+
+    # Override
+    def delete(self, *args, **kwargs):
+        from api.cache_lookups.city_alias_cache import CityAliasCache
+
+        deleted = super().delete(*args, **kwargs)
+        CityAliasCache.bump_version()
+
+        return deleted
 
     # Override
     def __repr__(self) -> str:
@@ -0,0 +1,65 @@
+"""
+    Title: Metric Leg Rollup Model
+    Description: This file will contain the daily leg rollup model. A row holds the leg counts, sums and a revenue
+                 quantile sketch of one sub account for one day, carrier, service and route, the metric apis read
+                 rollups instead of scanning legs.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from decimal import Decimal
+
+from django.db.models import BooleanField, CharField, DateField, DecimalField, ForeignKey, Index, IntegerField, \
+    JSONField, PROTECT
+
+from api.globals.project import DEFAULT_CHAR_LEN, PRICE_PRECISION, MAX_PRICE_DIGITS
+from api.models import SubAccount, Carrier
+from api.models.base_table import BaseTable
+
+
+class MetricLegRollup(BaseTable):
+    """
+        Database table to hold daily leg metrics for a sub account by carrier, service and route.
+    """
+
+    sub_account = ForeignKey(SubAccount, on_delete=PROTECT, help_text="Shipment sub account.")
+    day = DateField(help_text="Shipment creation day (UTC).")
+    bc_customer_code = CharField(max_length=DEFAULT_CHAR_LEN, blank=True, default="", help_text="Shipment BC code.")
+    is_managed = BooleanField(default=False, help_text="Shipments made by BBE users on behalf of the account.")
+    carrier = ForeignKey(Carrier, on_delete=PROTECT, help_text="Leg carrier.")
+    service_code = CharField(max_length=DEFAULT_CHAR_LEN, help_text="Leg service code.")
+    service_name = CharField(max_length=DEFAULT_CHAR_LEN, blank=True, default="", help_text="Leg service name.")
+    origin_province = CharField(max_length=DEFAULT_CHAR_LEN, help_text="Origin province code.")
+    origin_city = CharField(max_length=DEFAULT_CHAR_LEN, help_text="Origin city.")
+    destination_province = CharField(max_length=DEFAULT_CHAR_LEN, help_text="Destination province code.")
+    destination_city = CharField(max_length=DEFAULT_CHAR_LEN, help_text="Destination city.")
+
+    legs = IntegerField(default=0, help_text="Number of legs.")
+    dg_legs = IntegerField(default=0, help_text="Number of dangerous good legs.")
+    delivered_legs = IntegerField(default=0, help_text="Number of delivered legs.")
+    transit_days = IntegerField(default=0, help_text="Sum of leg transit days, unknown transit days excluded.")
+    transit_legs = IntegerField(default=0, help_text="Number of legs with known transit days.")
+    revenue = DecimalField(
+        default=Decimal("0"), decimal_places=PRICE_PRECISION, max_digits=MAX_PRICE_DIGITS, help_text="Leg revenue."
+    )
+    expense = DecimalField(
+        default=Decimal("0"), decimal_places=PRICE_PRECISION, max_digits=MAX_PRICE_DIGITS, help_text="Leg expense."
+    )
+    revenue_sketch = JSONField(default=dict, help_text="Leg revenue quantile sketch: bucket to leg count.")
+
+    class Meta:
+        verbose_name = "Metric Leg Rollup"
+        verbose_name_plural = "Metric - Leg Rollups"
+        indexes = [
+            Index(fields=["sub_account", "day"], name="metric_rollup_account_idx"),
+            Index(fields=["bc_customer_code", "is_managed", "day"], name="metric_rollup_managed_idx"),
+        ]
+
+    # Override
+    def __repr__(self) -> str:
+        return f"< MetricLegRollup ({self.sub_account_id}, {self.day}: {self.legs}) >"
+
+    # Override
+    def __str__(self) -> str:
+        return f"{self.sub_account_id}, {self.day}: {self.legs}"
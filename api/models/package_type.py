@@ -3,8 +3,8 @@
     Description: This file will contain views that only relate to Package Type Model.
     Created: Jan 25, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 from decimal import Decimal
 
@@ -76,6 +76,18 @@ class PackageType(BaseTable):
 
         self.clean_fields()
         super().save(*args, **kwargs)
+        from api.cache_lookups.reference_cache import ReferenceCache
+
+        ReferenceCache.bump_version()
+
+    # Override
+    def delete(self, *args, **kwargs):
+        from api.cache_lookups.reference_cache import ReferenceCache
+
+        deleted = super().delete(*args, **kwargs)
+        ReferenceCache.bump_version()
+
+        return deleted
 
     # Override
     def __repr__(self) -> str:
@@ -3,8 +3,8 @@
     Description: This file will contain functions for Province Model.
     Created: February 5, 2019
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 import re
 
@@ -48,6 +48,18 @@ class Province(BaseTable):
         self.code = re.sub(STRICT_STRING_REGEX, '', self.code).upper()
         self.clean_fields()
         super().save(*args, **kwargs)
+        from api.cache_lookups.reference_cache import ReferenceCache
+
+        ReferenceCache.bump_version()
+
+    # Override
+    def delete(self, *args, **kwargs):
+        from api.cache_lookups.reference_cache import ReferenceCache
+
+        deleted = super().delete(*args, **kwargs)
+        ReferenceCache.bump_version()
+
+        return deleted
 
     # Override
     def __repr__(self) -> str:
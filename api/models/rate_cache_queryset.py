@@ -0,0 +1,55 @@
+"""
+    Title: Rate Cache QuerySet
+    Description: This file will contain the queryset for rate data models. Bulk updates and deletes, ex: admin delete
+                 selected, do not call the model save or delete, so the queryset invalidates the cached rates of the
+                 carriers it changed.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from django.db.models import QuerySet
+
+
+class RateCacheQuerySet(QuerySet):
+    """
+        Rate data QuerySet, set carrier_path to the carrier code lookup of the model.
+    """
+
+    carrier_path = "carrier__code"
+
+    def _collect(self) -> list:
+        """
+            Get what the invalidation needs before the rows change.
+            :return: carrier codes of the rows
+        """
+        return list(self.order_by().values_list(self.carrier_path, flat=True).distinct())
+
+    def _invalidate(self, collected: list) -> None:
+        """
+            Invalidate the cached rates of the changed rows.
+            :param collected: result of _collect
+        """
+        from api.cache_lookups.rate_cache import RateCache
+
+        RateCache.invalidate(carrier_ids=collected)
+
+    # Override
+    def update(self, **kwargs) -> int:
+        collected = self._collect()
+        rows = super().update(**kwargs)
+
+        if rows:
+            self._invalidate(collected=collected)
+
+        return rows
+
+    # Override
+    def delete(self) -> tuple:
+        collected = self._collect()
+        deleted = super().delete()
+
+        if deleted[0]:
+            self._invalidate(collected=collected)
+
+        return deleted
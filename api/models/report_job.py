@@ -0,0 +1,89 @@
+"""
+    Title: Report Job Model
+    Description: This file will contain the report job model. A job is a report generated in the background, it
+                 holds the report params, progress and the stored report file. The request key is a hash of the
+                 report and params, a pending or running job is reused for identical requests. The cache key adds the
+                 data watermark read by the worker, a completed job and its file are reused while the data is
+                 unchanged. The modified date is kept current while a job runs so a stopped worker can be detected.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import uuid
+
+from django.db.models import CASCADE, CharField, DateTimeField, FileField, ForeignKey, Index, IntegerField, \
+    JSONField, UUIDField
+
+from api.globals.project import DEFAULT_CHAR_LEN, LETTER_MAPPING_LEN, MAX_CHAR_LEN
+from api.models import SubAccount
+from api.models.base_table import BaseTable
+
+
+class ReportJob(BaseTable):
+    """
+        Database table to hold background report jobs and their files.
+    """
+
+    PENDING = "PE"
+    RUNNING = "RU"
+    COMPLETE = "CO"
+    FAILED = "FA"
+
+    _STATUSES = (
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (COMPLETE, "Complete"),
+        (FAILED, "Failed"),
+    )
+
+    job_id = UUIDField(default=uuid.uuid4, unique=True, editable=False, help_text="Report job id.")
+    sub_account = ForeignKey(SubAccount, on_delete=CASCADE, related_name="report_job_sub_account")
+    username = CharField(max_length=DEFAULT_CHAR_LEN, blank=True, default="", help_text="Requesting username.")
+    report = CharField(max_length=DEFAULT_CHAR_LEN, help_text="Report name, ex: tracking.")
+    params = JSONField(default=dict, blank=True, help_text="Report filter params.")
+    request_key = CharField(max_length=DEFAULT_CHAR_LEN, help_text="Hash of the report and params.")
+    cache_key = CharField(
+        max_length=DEFAULT_CHAR_LEN, blank=True, default="", help_text="Hash of the request key and data watermark."
+    )
+    status = CharField(max_length=LETTER_MAPPING_LEN * 2, choices=_STATUSES, default=PENDING)
+    rows = IntegerField(default=0, help_text="Number of rows read.")
+    total = IntegerField(default=0, help_text="Number of rows to read.")
+    file = FileField(upload_to='reports/%Y/%m/%d/', blank=True, help_text="Report file.")
+    file_name = CharField(max_length=MAX_CHAR_LEN, help_text="Report download file name.")
+    message = CharField(max_length=MAX_CHAR_LEN, blank=True, default="", help_text="Failure message.")
+    creation_date = DateTimeField(auto_now_add=True, help_text="Date the job was submitted.")
+    modified_date = DateTimeField(auto_now=True, help_text="Date the job status or progress was last saved.")
+    completed_date = DateTimeField(null=True, blank=True, help_text="Date the report file was stored.")
+    expiry_date = DateTimeField(help_text="Date the job is no longer reused, the file is removed after.")
+
+    class Meta:
+        verbose_name = "Report Job"
+        verbose_name_plural = "Report - Jobs"
+        indexes = [
+            Index(fields=["request_key", "status"], name="report_job_request_idx"),
+            Index(fields=["cache_key", "expiry_date"], name="report_job_cache_idx"),
+        ]
+
+    @property
+    def progress(self) -> int:
+        """
+            Get the job progress as a percent, a running job stays below 100 until the file is stored.
+            :return: percent
+        """
+
+        if self.status == self.COMPLETE:
+            return 100
+
+        if not self.total:
+            return 0
+
+        return min(int(self.rows * 100 / self.total), 99)
+
+    # Override
+    def __repr__(self) -> str:
+        return f"< ReportJob ({self.job_id}, {self.report}: {self.status}) >"
+
+    # Override
+    def __str__(self) -> str:
+        return f"{self.job_id}, {self.report}: {self.status}"
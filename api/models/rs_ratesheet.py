@@ -3,8 +3,8 @@
     Description: This file will contain functions for RateSheet Model.
     Created: February 6, 2019
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 
 import re
@@ -20,6 +20,7 @@ from api.globals.project import DEFAULT_CHAR_LEN, PRICE_PRECISION, LETTER_MAPPIN
     DEFAULT_STRING_REGEX, BASE_TEN, CURRENCY_CODE_LEN
 from api.models import Province, Carrier, SubAccount
 from api.models.base_table import BaseTable
+from api.models.rate_cache_queryset import RateCacheQuerySet
 
 
 class RateSheet(BaseTable):
@@ -82,6 +83,8 @@ class RateSheet(BaseTable):
         help_text="A string representing a custom freight forwarding day availability"
     )
 
+    objects = RateCacheQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Rate Sheet"
         verbose_name_plural = "RS: Rate Sheets"
@@ -127,6 +130,16 @@ class RateSheet(BaseTable):
         ).delete()
 
         super().save(*args, **kwargs)
+        from api.cache_lookups.rate_cache import RateCache
+
+        RateCache.invalidate(carrier_ids=[self.carrier.code])
+
+    # Override
+    def delete(self, *args, **kwargs):
+        from api.cache_lookups.rate_cache import RateCache
+
+        RateCache.invalidate(carrier_ids=[self.carrier.code])
+        return super().delete(*args, **kwargs)
 
     # Override
     def __repr__(self) -> str:
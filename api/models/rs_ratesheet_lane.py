@@ -3,8 +3,8 @@
     Description: This file will contain functions for RateSheetLane Model.
     Created: February 6, 2019
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 
 from decimal import Decimal
@@ -17,6 +17,15 @@ from api.globals.project import PRICE_PRECISION, MAX_PRICE_DIGITS, BASE_TEN, WEI
     MAX_WEIGHT_BREAK_DIGITS
 from api.models import RateSheet
 from api.models.base_table import BaseTable
+from api.models.rate_cache_queryset import RateCacheQuerySet
+
+
+class RateSheetLaneQuerySet(RateCacheQuerySet):
+    """
+        RateSheetLane QuerySet
+    """
+
+    carrier_path = "rate_sheet__carrier__code"
 
 
 class RateSheetLane(BaseTable):
@@ -35,6 +44,8 @@ class RateSheetLane(BaseTable):
     )
     cost = DecimalField(max_digits=MAX_PRICE_DIGITS, decimal_places=PRICE_PRECISION)
 
+    objects = RateSheetLaneQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Lane"
         verbose_name_plural = "RS: RateSheet Lanes"
@@ -48,6 +59,16 @@ class RateSheetLane(BaseTable):
 
         self.clean_fields()
         super().save(*args, **kwargs)
+        from api.cache_lookups.rate_cache import RateCache
+
+        RateCache.invalidate(carrier_ids=[self.rate_sheet.carrier.code])
+
+    # Override
+    def delete(self, *args, **kwargs):
+        from api.cache_lookups.rate_cache import RateCache
+
+        RateCache.invalidate(carrier_ids=[self.rate_sheet.carrier.code])
+        return super().delete(*args, **kwargs)
 
     # Override
     def __repr__(self) -> str:
@@ -3,8 +3,8 @@
     Description: This file will contain functions for Shipment Model.
     Created: February 5, 2019
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 import random
 from datetime import datetime
@@ -45,6 +45,7 @@ class Shipment(BaseTable):
         max_length=DEFAULT_CHAR_LEN, default="", help_text="BC Customer Name", null=True, blank=True
     )
     creation_date = DateTimeField(auto_now_add=True, editable=True)
+    modified_date = DateTimeField(auto_now=True, null=True, blank=True, help_text="Date the shipment was last saved.")
     shipment_id = CharField(
         max_length=SHIPMENT_IDENTIFIER_LEN,
         unique=True,
@@ -3,8 +3,8 @@
     Description: This file will contain functions for Leg Model.
     Created: February 5, 2019
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 from datetime import datetime, timedelta, time
 
@@ -13,9 +13,8 @@ from dateutil import relativedelta
 from decimal import Decimal
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import QuerySet
+from django.db.models import Index, QuerySet
 from django.db.models.deletion import PROTECT, CASCADE
-from django.db.models.expressions import Subquery
 from django.db.models.fields import DateTimeField, DecimalField, CharField, BooleanField, SmallIntegerField
 from django.db.models.fields.related import ForeignKey
 from django.utils import timezone
@@ -47,6 +46,7 @@ class Leg(BaseTable):
 
     shipment = ForeignKey("Shipment", on_delete=CASCADE, related_name='leg_shipment')
     ship_date = DateTimeField(auto_now_add=True, editable=True)
+    modified_date = DateTimeField(auto_now=True, null=True, blank=True, help_text="Date the leg was last saved.")
     leg_id = CharField(
         max_length=LEG_IDENTIFIER_LEN, unique=True, help_text="The internal GO leg identifier for any type of leg"
     )
@@ -145,9 +145,20 @@ class Leg(BaseTable):
     is_pickup_overdue = BooleanField(default=False, help_text="Is leg overdue for pickup?")
     is_overdue = BooleanField(default=False, help_text="Is the leg overdue for delivery?")
 
+    latest_status = CharField(
+        max_length=DEFAULT_CHAR_LEN, blank=True, default="", help_text="The status of the latest tracking status."
+    )
+    latest_status_datetime = DateTimeField(
+        default=datetime(year=1, month=1, day=1, tzinfo=timezone.utc),
+        help_text="The datetime of the latest tracking status."
+    )
+
     class Meta:
         verbose_name = "Shipment Leg"
         verbose_name_plural = "Shipment - Legs"
+        indexes = [
+            Index(fields=["is_shipped", "is_delivered", "ship_date", "carrier"], name="leg_tracking_idx"),
+        ]
 
     def _origin_city(self):
         return f"{self.origin.city} - {self.origin.province.code}, {self.origin.province.country.code}"
@@ -217,17 +228,12 @@ class Leg(BaseTable):
             "destination",
             "shipment"
         ).filter(
-            ship_date__range=[past_month, today],
             is_shipped=True,
-            is_delivered=False
+            is_delivered=False,
+            ship_date__range=[past_month, today],
+            delivered_date=datetime(year=1, month=1, day=1, tzinfo=timezone.utc)
         ).exclude(
             carrier__code__in=exclude_carriers
-        ).exclude(
-            pk__in=Subquery(
-                TrackingStatus.objects.exclude(
-                    delivered_datetime=datetime(year=1, month=1, day=1, tzinfo=timezone.utc)
-                ).distinct().values("leg_id")
-            )
         )
 
         return legs
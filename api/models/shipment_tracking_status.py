@@ -3,8 +3,8 @@
     Description: This file will contain functions for TrackingStatus Model.
     Created: February 5, 2019
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 
 from datetime import datetime
@@ -22,6 +22,7 @@ class TrackingStatus(BaseTable):
     """
         TrackingStatus Model
     """
+    _default_datetime = datetime(year=1, month=1, day=1, tzinfo=timezone.utc)
 
     leg = ForeignKey("Leg", on_delete=CASCADE, related_name='tracking_status_leg')
     status = CharField(
@@ -62,9 +63,37 @@ class TrackingStatus(BaseTable):
             status.leg = param_dict.get("leg")
         return status
 
+    def get_leg_state(self) -> dict:
+        """
+            Get the leg tracking state fields for this status.
+            :return: dict of leg field values
+        """
+        state = {"latest_status": self.status, "latest_status_datetime": self.updated_datetime}
+
+        if self.delivered_datetime != self._default_datetime:
+            state["delivered_date"] = self.delivered_datetime
+        elif self.status == "Delivered":
+            state["delivered_date"] = self.updated_datetime
+
+        return state
+
+    def set_leg_state(self) -> None:
+        """
+            Set the leg tracking state to this status when it is the latest status of the leg.
+        """
+        from api.models import Leg
+
+        state = self.get_leg_state()
+
+        if self.leg.latest_status_datetime <= self.updated_datetime:
+            self.leg.set_values(state)
+
+        Leg.objects.filter(pk=self.leg_id, latest_status_datetime__lte=self.updated_datetime).update(**state)
+
     def save(self, *args, **kwargs) -> None:
         self.clean_fields()
         super().save(*args, **kwargs)
+        self.set_leg_state()
         from api.background_tasks.webhooks.tracking_status_change import CeleryTrackStatusChange
 
         CeleryTrackStatusChange.tracking_status_change.delay(status=self.pk, leg_id=self.leg.leg_id)
@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from unittest import mock
 from unittest.mock import Mock
 
@@ -74,3 +75,22 @@ class TrackingStatusTests(TestCase):
         expected = "GO7091160198D: TEST"
         record = TrackingStatus(**self.tracking_status_json_full)
         self.assertEqual(expected, str(record))
+
+    @mock.patch("api.background_tasks.webhooks.tracking_status_change.CeleryTrackStatusChange.tracking_status_change")
+    def test_save_sets_leg_state(self, webhook):
+        record = TrackingStatus.create(self.tracking_status_json_full)
+        record.save()
+        leg = Leg.objects.get(pk=1)
+
+        self.assertEqual(leg.latest_status, "TEST")
+        self.assertEqual(leg.latest_status_datetime, record.updated_datetime)
+        self.assertEqual(leg.delivered_date, record.delivered_datetime)
+        self.assertEqual(self.leg.latest_status, "TEST")
+
+    @mock.patch("api.background_tasks.webhooks.tracking_status_change.CeleryTrackStatusChange.tracking_status_change")
+    def test_save_older_keeps_leg_state(self, webhook):
+        TrackingStatus.create(self.tracking_status_json_full).save()
+        older = dict(self.tracking_status_json_full, status="Older", updated_datetime=datetime(2018, 1, 1, tzinfo=timezone.utc))
+        TrackingStatus.create(older).save()
+
+        self.assertEqual(Leg.objects.get(pk=1).latest_status, "TEST")
@@ -3,11 +3,14 @@
     Description: This file will contain functions for Rate Log Model.
     Created: April 23, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
+import hashlib
+import json
 import uuid
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import JSONField, BooleanField
 from django.db.models.deletion import PROTECT
 from django.db.models.fields import DateTimeField, CharField
@@ -21,11 +24,20 @@ from api.models.base_table import BaseTable
 class RateLog(BaseTable):
 
     rate_date = DateTimeField(auto_now_add=True, editable=True, help_text="Date of rate request.")
+    modified_date = DateTimeField(auto_now=True, null=True, blank=True, help_text="Date the rate log was last saved.")
 
     rate_log_id = CharField(
         max_length=DEFAULT_KEY_LENGTH,
+        db_index=True,
         help_text="Rate Log UUID to tie Rate to Ship.",
     )
+    request_hash = CharField(
+        max_length=64,
+        db_index=True,
+        default="",
+        blank=True,
+        help_text="SHA-256 of the rate request, used to find duplicate requests.",
+    )
     shipment_id = CharField(
         max_length=SHIPMENT_IDENTIFIER_LEN,
         help_text="The internal GO shipping identifier for the shipment",
@@ -34,19 +46,32 @@ class RateLog(BaseTable):
         blank=True
     )
     sub_account = ForeignKey(SubAccount, on_delete=PROTECT, help_text="Account for rate request.")
-    rate_data = JSONField(default=dict, help_text="Rate Request Data.")
+    rate_data = JSONField(default=dict, encoder=DjangoJSONEncoder, help_text="Rate Request Data.")
     ship_data = JSONField(default=dict, help_text="Rate Request Data.", null=True, blank=True)
-    response_data = JSONField(default=dict, help_text="Rate Response Data.", null=True, blank=True)
+    response_data = JSONField(
+        default=dict, encoder=DjangoJSONEncoder, help_text="Rate Response Data.", null=True, blank=True
+    )
     is_no_rate = BooleanField(default=False, help_text="Does the rate log have rates returned.")
 
     class Meta:
         verbose_name = "Rate Log"
         verbose_name_plural = "Rate Logs"
 
+    @staticmethod
+    def get_request_hash(rate_data: dict) -> str:
+        """
+            Hash a rate request, key order does not change the hash.
+            :param rate_data: rate request
+            :return: SHA-256 hex digest
+        """
+        data = json.dumps(rate_data, sort_keys=True, cls=DjangoJSONEncoder)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
     @classmethod
     def create(cls, param_dict: dict = None):
         """
-            Create RateLog from passed in param dict
+            Create RateLog from passed in param dict, the rate log id and request hash are set here so the log can
+            be written later without a look up.
             :param param_dict: dict - Dictionary of keys
             :return: RateLog Object
         """
@@ -55,18 +80,19 @@ class RateLog(BaseTable):
         if param_dict is not None:
             obj.set_values(param_dict)
             obj.sub_account = param_dict.get('sub_account')
+
+        obj.rate_log_id = str(uuid.uuid4())
+        obj.request_hash = cls.get_request_hash(rate_data=obj.rate_data)
         return obj
 
     # Override
     def save(self, *args, **kwargs) -> None:
 
         if not self.rate_log_id:
-            rate_log_id = uuid.uuid4()
-
-            while RateLog.objects.filter(rate_log_id=rate_log_id).exists():
-                rate_log_id = uuid.uuid4()
+            self.rate_log_id = str(uuid.uuid4())
 
-            self.rate_log_id = str(rate_log_id)
+        if not self.request_hash:
+            self.request_hash = self.get_request_hash(rate_data=self.rate_data)
 
         self.clean_fields()
         self.validate_unique()
@@ -3,8 +3,8 @@
     Description: This file will contain functions for webhooks Model.
     Created: July 12, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 
 from django.db.models.deletion import PROTECT
@@ -29,13 +29,37 @@ class Webhook(BaseTable):
 
     sub_account = ForeignKey(SubAccount, on_delete=PROTECT, help_text="The account the webhook belongs to.")
     event = CharField(max_length=LETTER_MAPPING_LEN * 3, choices=_EVENTS, help_text="The webhook event to perform.")
-    url = URLField(max_length=MAX_CHAR_LEN,help_text="The url to post the event data to.")
+    url = URLField(
+        max_length=MAX_CHAR_LEN,
+        help_text="The url to post the event data to, a batch of events is posted as a json list."
+    )
     data_format = CharField(max_length=LETTER_MAPPING_LEN * 3, choices=_FORMAT, help_text="Data Format")
 
     class Meta:
         verbose_name = "Webhook"
         verbose_name_plural = "Webhook's"
 
+    # Override
+    def save(self, *args, **kwargs) -> None:
+        from api.cache_lookups.webhook_cache import WebhookCache
+
+        previous = Webhook.objects.filter(pk=self.pk).values_list("sub_account_id", "event").first()
+        super().save(*args, **kwargs)
+
+        if previous:
+            WebhookCache().clear(*previous)
+
+        WebhookCache().clear(sub_account_id=self.sub_account_id, event=self.event)
+
+    # Override
+    def delete(self, *args, **kwargs):
+        from api.cache_lookups.webhook_cache import WebhookCache
+
+        deleted = super().delete(*args, **kwargs)
+        WebhookCache().clear(sub_account_id=self.sub_account_id, event=self.event)
+
+        return deleted
+
     # Override
     def __repr__(self) -> str:
         return f"< Webhook ({repr(self.sub_account)}: {self.event}, {self.url}, {self.data_format}) >"
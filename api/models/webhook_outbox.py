@@ -0,0 +1,62 @@
+"""
+    Title: Webhook Outbox Model
+    Description: This file will contain the webhook outbox model. A row is one signed post to a subscriber, events for
+                 the same webhook inside the batch window are appended to the pending row and posted together. Failed
+                 posts stay pending with an exponential backoff until the attempts run out.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import CASCADE, CharField, DateTimeField, ForeignKey, Index, IntegerField, JSONField, \
+    UUIDField
+
+from api.globals.project import LETTER_MAPPING_LEN, MAX_CHAR_LEN
+from api.models import Webhook
+from api.models.base_table import BaseTable
+
+
+class WebhookOutbox(BaseTable):
+    """
+        Database table to hold webhook deliveries until the subscriber accepts them.
+    """
+
+    PENDING = "PE"
+    SENDING = "SE"
+    DELIVERED = "DE"
+    FAILED = "FA"
+
+    _STATUSES = (
+        (PENDING, "Pending"),
+        (SENDING, "Sending"),
+        (DELIVERED, "Delivered"),
+        (FAILED, "Failed"),
+    )
+
+    webhook = ForeignKey(Webhook, on_delete=CASCADE, related_name="webhook_outbox_webhook")
+    data = JSONField(default=list, blank=True, encoder=DjangoJSONEncoder, help_text="Events to post, in order.")
+    size = IntegerField(default=0, help_text="Number of events.")
+    status = CharField(max_length=LETTER_MAPPING_LEN * 2, choices=_STATUSES, default=PENDING)
+    attempts = IntegerField(default=0, help_text="Number of posts made.")
+    next_attempt = DateTimeField(help_text="Date the post is due, a sending claim expires at this date.")
+    claim = UUIDField(null=True, blank=True, help_text="Dispatch run that claimed the delivery.")
+    last_error = CharField(max_length=MAX_CHAR_LEN, blank=True, default="", help_text="Last post error.")
+    creation_date = DateTimeField(auto_now_add=True, help_text="Date the first event was added.")
+    delivered_date = DateTimeField(null=True, blank=True, help_text="Date the subscriber accepted the post.")
+
+    class Meta:
+        verbose_name = "Webhook Outbox"
+        verbose_name_plural = "Webhook - Outbox"
+        indexes = [
+            Index(fields=["status", "next_attempt"], name="webhook_outbox_due_idx"),
+            Index(fields=["webhook", "status"], name="webhook_outbox_batch_idx"),
+        ]
+
+    # Override
+    def __repr__(self) -> str:
+        return f"< WebhookOutbox ({self.webhook_id}: {self.size} events, {self.status}) >"
+
+    # Override
+    def __str__(self) -> str:
+        return f"{self.webhook_id}: {self.size} events, {self.status}"
@@ -6,11 +6,12 @@ from decimal import Decimal
 
 from django.core.exceptions import ObjectDoesNotExist
 
+from api.cache_lookups.reference_cache import ReferenceCache
 from api.exceptions.project import ViewException
 from api.general.convert import Convert
 from api.globals.carriers import AIR_CARRIERS, COURIERS_CARRIERS, LTL_CARRIERS, FTL_CARRIERS, SEALIFT_CARRIERS, \
     CAN_NORTH, CAN_POST, FEDEX, PUROLATOR, WESTJET, PUROLATOR_FREIGHT, BUFFALO_AIRWAYS
-from api.models import SubAccount, PackageType, DangerousGood, Carrier, CarrierOption
+from api.models import SubAccount, DangerousGood, Carrier, CarrierOption
 from api.parse_requests.parse_request import ParseRequest
 
 
@@ -154,20 +155,17 @@ class ParseRateRequest(ParseRequest):
         total_weight = Decimal("0.00")
         total_volume = Decimal("0.00")
         total_quantity = Decimal("0.0")
+        account_package_types = ReferenceCache().get_package_types(account_id=self._sub_account.client_account_id)
 
         for package in self._ubbe_request["packages"]:
             self._convert_package(package=package)
+            package_types = account_package_types.get(package["package_type"])
 
-            try:
-                package_types = PackageType.objects.get(
-                    code=package["package_type"],
-                    account__user__username=self._sub_account.client_account.user.username
-                )
-            except ObjectDoesNotExist:
+            if not package_types:
                 errors = [{"package_type": package["package_type"]}]
                 raise ViewException(code="501", message="Package Type not found for account.", errors=errors)
 
-            self._package_carriers.append(set(package_types.carrier.values_list("code", flat=True)))
+            self._package_carriers.append(set(package_types.carriers))
 
             if package_types.is_pharma:
                 self._ubbe_request["is_pharma"] = package_types.is_pharma
@@ -4,11 +4,12 @@ from decimal import Decimal
 from django.contrib.auth.models import User
 from django.core.exceptions import ObjectDoesNotExist
 
+from api.cache_lookups.reference_cache import ReferenceCache
 from api.exceptions.project import ViewException
 from api.general.convert import Convert
 from api.globals.carriers import FEDEX, PUROLATOR, CAN_NORTH, CAN_POST, WESTJET, PUROLATOR_FREIGHT, SEALIFT_CARRIERS, \
     FTL_CARRIERS, COURIERS_CARRIERS, LTL_CARRIERS, AIR_CARRIERS, BUFFALO_AIRWAYS
-from api.models import DangerousGood, Carrier, PackageType, SubAccount, CarrierOption
+from api.models import DangerousGood, Carrier, SubAccount, CarrierOption
 from api.process_json.process_json import ProcessJson
 
 
@@ -149,19 +150,17 @@ class ProcessRateJson(ProcessJson):
         total_weight = Decimal("0.00")
         total_volume = Decimal("0.00")
         total_quantity = Decimal("0.0")
+        account_package_types = ReferenceCache().get_package_types(account_id=self._sub_account.client_account_id)
 
         for package in self._gobox_request["packages"]:
             self._convert_package(package=package)
+            package_types = account_package_types.get(package["package_type"])
 
-            try:
-                package_types = PackageType.objects.get(
-                    code=package["package_type"], account__user__username=self._sub_account.client_account.user.username
-                )
-            except ObjectDoesNotExist:
+            if not package_types:
                 errors = [{"package_type": package["package_type"]}]
                 raise ViewException(code="501", message="Package Type not found for account.", errors=errors)
 
-            self._package_carriers.append(set(package_types.carrier.values_list("code", flat=True)))
+            self._package_carriers.append(set(package_types.carriers))
 
             if package_types.is_pharma:
                 self._gobox_request["is_pharma"] = package_types.is_pharma
@@ -3,13 +3,14 @@
     Description: This file will contain all functions for Package Type serializers.
     Created: Jan 25, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
 from rest_framework import serializers
 
+from api.cache_lookups.reference_cache import ReferenceCache
 from api.exceptions.project import ViewException
 from api.models import PackageType, Account
 
@@ -81,5 +82,6 @@ class PackageTypeSerializer(serializers.ModelSerializer):
         instance.set_values(validated_data)
         instance.save()
         instance.carrier.set(carriers)
+        ReferenceCache.bump_version()
 
         return instance
@@ -20,7 +20,8 @@ class PrivateApiSerializer(serializers.ModelSerializer):
             'id',
             'name',
             'active',
-            'category'
+            'category',
+            'rate_cache_ttl'
         ]
         extra_kwargs = {
             'name': {'validators': []},
@@ -41,7 +41,8 @@ class PrivateCarrierSerializer(serializers.ModelSerializer):
             'type_name',
             'is_kilogram',
             'is_dangerous_good',
-            'is_pharma'
+            'is_pharma',
+            'rate_cache_ttl'
         ]
         extra_kwargs = {
             'name': {'validators': []},
@@ -64,7 +65,8 @@ class PrivateCreateCarrierSerializer(serializers.ModelSerializer):
             'type',
             'is_kilogram',
             'is_dangerous_good',
-            'is_pharma'
+            'is_pharma',
+            'rate_cache_ttl'
         ]
 
     @transaction.atomic
@@ -0,0 +1,90 @@
+"""
+    Title: Report Job Serializers
+    Description: This file will contain all functions for report job serializers.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from rest_framework import serializers
+
+from api.apis.reports.report_job import ReportJobs
+from api.models import ReportJob
+
+
+class ReportJobSerializer(serializers.ModelSerializer):
+
+    progress = serializers.IntegerField(
+        read_only=True,
+        help_text="Percent of rows read, 100 once the file is ready."
+    )
+
+    class Meta:
+        model = ReportJob
+        fields = [
+            'job_id',
+            'report',
+            'params',
+            'status',
+            'progress',
+            'rows',
+            'total',
+            'file_name',
+            'message',
+            'creation_date',
+            'completed_date',
+            'expiry_date',
+        ]
+
+
+class CreateReportJobSerializer(serializers.Serializer):
+
+    report = serializers.ChoiceField(
+        choices=ReportJobs.get_report_names(),
+        help_text="Report name. Ex: tracking."
+    )
+
+    start_date = serializers.DateField(
+        format="%Y-%m-%d",
+        help_text="Start date YYYY-mm-dd."
+    )
+
+    end_date = serializers.DateField(
+        format="%Y-%m-%d",
+        help_text="End date YYYY-mm-dd."
+    )
+
+    account = serializers.UUIDField(
+        required=False,
+        help_text="BBE only: Sub Account Number."
+    )
+
+    username = serializers.CharField(
+        required=False,
+        help_text="Shipment overview reports: shipments made by the username."
+    )
+
+    is_no_rate = serializers.BooleanField(
+        required=False,
+        help_text="Quote history reports: only quotes with or without rates."
+    )
+
+    mode = serializers.ChoiceField(
+        choices=["AI", "CO", "LT", "FT", "SE", "NA"],
+        default="NA",
+        help_text="Quote history report: Air (AI), Courier (CO), LTL (LT), FTL (FT), Sealift (SE), NA."
+    )
+
+    def validate(self, attrs: dict) -> dict:
+        """
+            Format the params the way the report querysets read them: dates as YYYY-mm-dd and the account as text.
+            :param attrs: validated data
+            :return: validated data
+        """
+        attrs["start_date"] = attrs["start_date"].strftime("%Y-%m-%d")
+        attrs["end_date"] = attrs["end_date"].strftime("%Y-%m-%d")
+
+        if "account" in attrs:
+            attrs["account"] = str(attrs["account"])
+
+        return attrs
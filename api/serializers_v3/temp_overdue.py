@@ -74,10 +74,16 @@ class LegOverdueSerializer(serializers.ModelSerializer):
             'estimated_delivery_date',
             'updated_est_delivery_date',
             'delivered_date',
+            'latest_status',
+            'latest_status_datetime',
             'is_pickup_overdue',
             'is_overdue'
         ]
 
     def get_tracking_status(self, obj):
-        ordered_queryset = obj.tracking_status_leg.all().order_by("updated_datetime")
+        ordered_queryset = getattr(obj, "ordered_tracking_statuses", None)
+
+        if ordered_queryset is None:
+            ordered_queryset = obj.tracking_status_leg.all().order_by("updated_datetime")
+
         return TrackSerializer(ordered_queryset, many=True, context=self.context).data
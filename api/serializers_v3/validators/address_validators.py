@@ -3,15 +3,15 @@
     Description: This file will contain functions for address validating.
     Created: November 18, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 import re
 
 from rest_framework import serializers
 
+from api.cache_lookups.reference_cache import ReferenceCache
 from api.globals.project import POSTAL_CODE_REGEX
-from api.models import Province
 
 
 class PostalCodeValidator:
@@ -47,7 +47,7 @@ class ProvinceValidator:
         province = self.province.strip().upper()
         country = self.country.strip().upper()
 
-        if not Province.objects.filter(code=province, country__code=country).exists():
+        if not ReferenceCache().is_province(province=province, country=country):
             message = f"The combination of 'province': '{province}' and 'country': '{country}' are invalid."
             raise serializers.ValidationError({'province': [message]})
 
@@ -21,6 +21,7 @@ from api.views_v3.admin_apis import api_apis
 from api.views_v3.admin_apis import api_permissions_api
 from api.views_v3.admin_apis import distance_api
 from api.views_v3.admin_apis import middle_api
+from api.views_v3.admin_apis import rate_cache_api
 from api.views_v3.carrier_apis import airbase_api
 from api.views_v3.carrier_apis import bill_of_lading_api
 from api.views_v3.carrier_apis import carrier_api
@@ -71,6 +72,7 @@ from api.views_v3.report_apis import quote_history_report_api, shipment_overview
 from api.views_v3.report_apis import report_api
 from api.views_v3.report_apis import account_report_api
 from api.views_v3.report_apis import admin_shipment_overview_report_api
+from api.views_v3.report_apis import report_job_api
 from api.views_v3.sea_apis import port_api
 from api.views_v3.sea_apis import sailing_date_api
 from api.views_v3.shipment_apis import search_shipments_api
@@ -239,6 +241,7 @@ urlpatterns = [
     # Admin Apis
     path('api', api_apis.ApiApi.as_view(), name='ApiApiV3'),
     path('api/<int:pk>', api_apis.ApiDetailApi.as_view(), name='ApiDetailApiV3'),
+    path('api/rate_cache', rate_cache_api.RateCacheApi.as_view(), name='RateCacheApiV3'),
 
     path('api_permission', api_permissions_api.ApiPermissionsApi.as_view(), name='ApiPermissionsApiV3'),
     path('api_permission/<int:pk>', api_permissions_api.ApiPermissionsDetailApi.as_view(), name='ApiPermissionsDetailApiV3'),
@@ -323,6 +326,9 @@ urlpatterns = [
     path('reports/shipment_overview', shipment_overview_report_api.ShipmentOverviewReportApi.as_view(), name='ShipmentOverviewReportApiV3'),
     path('reports/shipment_overview/admin', admin_shipment_overview_report_api.AdminShipmentOverviewReportApi.as_view(), name='AdminShipmentOverviewReportApiV3'),
     path('reports/tracking', report_api.TrackingReportApi.as_view(), name='TrackingReportApiV3'),
+    path('reports/jobs', report_job_api.ReportJobApi.as_view(), name='ReportJobApiV3'),
+    path('reports/jobs/<uuid:job_id>', report_job_api.ReportJobDetailApi.as_view(), name='ReportJobDetailApiV3'),
+    path('reports/jobs/<uuid:job_id>/file', report_job_api.ReportJobFileApi.as_view(), name='ReportJobFileApiV3'),
 
 ]
 
@@ -0,0 +1,171 @@
+import datetime
+import hashlib
+import hmac
+from unittest import mock
+
+import requests
+import simplejson as json
+from django.test import TestCase
+from django.utils import timezone
+
+from api.background_tasks.webhooks.tracking_status_change import CeleryTrackStatusChange
+from api.cache_lookups.webhook_cache import WebhookCache
+from api.globals.project import WEBHOOK_BATCH_SIZE, WEBHOOK_MAX_ATTEMPTS, WEBHOOK_RETRY_SECONDS, \
+    WEBHOOK_SUBSCRIBER_CONCURRENCY, WEBHOOK_TIMEOUT_SECONDS
+from api.models import Leg, SubAccount, Webhook, WebhookOutbox
+from api.utilities.webhook_dispatcher import WebhookDispatcher
+
+
+class WebhookDispatcherTests(TestCase):
+    fixtures = [
+        "carriers",
+        "countries",
+        "provinces",
+        "user",
+        "group",
+        "contact",
+        "addresses",
+        "markup",
+        "account",
+        "subaccount",
+        "shipments",
+        "legs",
+        "tracking_statuses"
+    ]
+
+    def setUp(self):
+        self.sub_account = SubAccount.objects.get(pk=1)
+        self.webhook = Webhook(sub_account=self.sub_account, event="TSC", url="https://hooks.example.com/track")
+        self.webhook.data_format = "JSO"
+        self.webhook.save()
+        self.addCleanup(WebhookCache().clear, self.sub_account.pk, "TSC")
+
+        self.session = mock.Mock()
+        self.session.post.return_value.raise_for_status.return_value = None
+        patcher = mock.patch.object(WebhookDispatcher, "get_session", return_value=self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _make_due(self) -> None:
+        WebhookOutbox.objects.update(next_attempt=timezone.now() - datetime.timedelta(seconds=1))
+
+    def test_enqueue_batches_window(self):
+        dispatcher = WebhookDispatcher()
+
+        first = dispatcher.enqueue(webhook_id=self.webhook.pk, data={"id": 1})
+        second = dispatcher.enqueue(webhook_id=self.webhook.pk, data={"id": 2})
+        self.assertEqual(first.pk, second.pk)
+
+        self._make_due()
+        third = dispatcher.enqueue(webhook_id=self.webhook.pk, data={"id": 3})
+        self.assertNotEqual(first.pk, third.pk)
+
+        first.refresh_from_db()
+        self.assertEqual(first.data, [{"id": 1}, {"id": 2}])
+        self.assertEqual(first.size, 2)
+
+    def test_enqueue_batch_size(self):
+        WebhookOutbox(
+            webhook=self.webhook, data=[{}] * WEBHOOK_BATCH_SIZE, size=WEBHOOK_BATCH_SIZE,
+            next_attempt=timezone.now() + datetime.timedelta(seconds=60)
+        ).save()
+        outbox = WebhookDispatcher().enqueue(webhook_id=self.webhook.pk, data={"id": 1})
+
+        self.assertEqual(outbox.size, 1)
+
+    def test_dispatch_signed_payload(self):
+        dispatcher = WebhookDispatcher()
+        outbox = dispatcher.enqueue(webhook_id=self.webhook.pk, data={"id": 1})
+        dispatcher.enqueue(webhook_id=self.webhook.pk, data={"id": 2})
+        self.assertEqual(dispatcher.dispatch(schedule=False), 0)
+
+        self._make_due()
+        self.assertEqual(dispatcher.dispatch(schedule=False), 1)
+
+        kwargs = self.session.post.call_args.kwargs
+        signature = hmac.new(
+            str(self.sub_account.webhook_key).encode('utf-8'), msg=kwargs["data"], digestmod=hashlib.sha3_512
+        ).hexdigest()
+
+        self.assertEqual(kwargs["url"], self.webhook.url)
+        self.assertEqual(json.loads(kwargs["data"]), [{"id": 1}, {"id": 2}])
+        self.assertEqual(kwargs["headers"]["X-UBBE-HMAC"], signature)
+
+        outbox.refresh_from_db()
+        self.assertEqual(outbox.status, WebhookOutbox.DELIVERED)
+        self.assertEqual(outbox.attempts, 1)
+        self.assertIsNotNone(outbox.delivered_date)
+
+    def test_dispatch_retry_backoff(self):
+        self.session.post.side_effect = requests.Timeout("Read timed out.")
+        dispatcher = WebhookDispatcher()
+        outbox = dispatcher.enqueue(webhook_id=self.webhook.pk, data={"id": 1})
+
+        for attempt in range(1, WEBHOOK_MAX_ATTEMPTS + 1):
+            self._make_due()
+            before = timezone.now()
+            dispatcher.dispatch(schedule=False)
+            outbox.refresh_from_db()
+
+            self.assertEqual(outbox.attempts, attempt)
+            self.assertEqual(outbox.last_error, "Read timed out.")
+
+            if attempt < WEBHOOK_MAX_ATTEMPTS:
+                self.assertEqual(outbox.status, WebhookOutbox.PENDING)
+                self.assertGreaterEqual(
+                    outbox.next_attempt, before + datetime.timedelta(seconds=WEBHOOK_RETRY_SECONDS * 2 ** (attempt - 1))
+                )
+
+        self.assertEqual(outbox.status, WebhookOutbox.FAILED)
+        self._make_due()
+        self.assertEqual(dispatcher.dispatch(schedule=False), 0)
+
+    def test_dispatch_expired_claim(self):
+        outbox = WebhookDispatcher().enqueue(webhook_id=self.webhook.pk, data={"id": 1})
+        WebhookOutbox.objects.update(status=WebhookOutbox.SENDING)
+        self._make_due()
+
+        self.assertEqual(WebhookDispatcher().dispatch(schedule=False), 1)
+        outbox.refresh_from_db()
+        self.assertEqual(outbox.status, WebhookOutbox.DELIVERED)
+
+    def _add_outboxes(self, count: int, status: str, seconds: int) -> None:
+        for _ in range(count):
+            WebhookOutbox(
+                webhook=self.webhook, data=[{}], size=1, status=status,
+                next_attempt=timezone.now() + datetime.timedelta(seconds=seconds)
+            ).save()
+
+    def test_dispatch_subscriber_limit(self):
+        # One delivery is leased by another run, the limit is shared with it.
+        self._add_outboxes(count=1, status=WebhookOutbox.SENDING, seconds=60)
+        self._add_outboxes(count=WEBHOOK_SUBSCRIBER_CONCURRENCY + 2, status=WebhookOutbox.PENDING, seconds=-1)
+
+        with mock.patch.object(WebhookDispatcher, "_schedule") as schedule:
+            self.assertEqual(WebhookDispatcher().dispatch(), WEBHOOK_SUBSCRIBER_CONCURRENCY - 1)
+
+        schedule.assert_called_once_with(countdown=0)
+        self.assertEqual(WebhookOutbox.objects.filter(status=WebhookOutbox.PENDING).count(), 3)
+
+    def test_dispatch_subscriber_full(self):
+        self._add_outboxes(count=WEBHOOK_SUBSCRIBER_CONCURRENCY, status=WebhookOutbox.SENDING, seconds=60)
+        self._add_outboxes(count=1, status=WebhookOutbox.PENDING, seconds=-1)
+
+        with mock.patch.object(WebhookDispatcher, "_schedule") as schedule:
+            self.assertEqual(WebhookDispatcher().dispatch(), 0)
+
+        schedule.assert_called_once_with(countdown=WEBHOOK_TIMEOUT_SECONDS)
+        self.session.post.assert_not_called()
+
+    def test_tracking_status_change(self):
+        leg = Leg.objects.select_related("shipment").get(pk=1)
+        WebhookCache().clear(sub_account_id=leg.shipment.subaccount_id, event="TSC")
+        self.webhook.sub_account = leg.shipment.subaccount
+        self.webhook.save()
+
+        CeleryTrackStatusChange.tracking_status_change(status=1, leg_id=leg.leg_id)
+        outbox = WebhookOutbox.objects.get(webhook=self.webhook)
+        self.assertEqual(outbox.data[0]["leg_id"], leg.pk)
+
+        self.webhook.delete()
+        self.assertIsNone(WebhookCache().get_webhook_id(sub_account_id=leg.shipment.subaccount_id, event="TSC"))
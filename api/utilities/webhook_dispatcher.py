@@ -0,0 +1,302 @@
+"""
+    Title: Webhook Dispatcher
+    Description:
+        The class will queue webhook events in the outbox and post them to the subscribers. Events for the same webhook
+        inside the batch window are posted together as one signed payload: a JSON list of the events, a delivery
+        holding one event is posted as the single event object. Subscribers receiving batches must accept both. Posts
+        run in a gevent pool over keep alive sessions per endpoint, with a concurrency limit per subscriber across
+        every dispatch run. A failed post is retried with an exponential backoff until the attempts run out.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+import datetime
+import uuid
+from typing import Union
+from urllib.parse import urlsplit
+
+import requests
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+from gevent.lock import RLock
+from gevent.pool import Pool
+from requests.adapters import HTTPAdapter
+
+from api.globals.project import LOGGER, MAX_CHAR_LEN, WEBHOOK_BATCH_SECONDS, WEBHOOK_BATCH_SIZE, \
+    WEBHOOK_DISPATCH_CONCURRENCY, WEBHOOK_MAX_ATTEMPTS, WEBHOOK_MAX_RETRY_SECONDS, WEBHOOK_RETRY_SECONDS, \
+    WEBHOOK_SUBSCRIBER_CONCURRENCY, WEBHOOK_TIMEOUT_SECONDS
+from api.models import Webhook, WebhookOutbox
+from api.utilities.webhooks import WebHookEvent
+
+
+class WebhookDispatcher:
+    """
+        Webhook Dispatcher
+
+        A dispatch run claims due deliveries with a lease, a delivery left sending by a stopped worker is claimed again
+        once its lease expires. A subscriber never has more than WEBHOOK_SUBSCRIBER_CONCURRENCY leased deliveries, so
+        concurrent runs share the limit. Posts only overlap when the worker runs gevent, ex: celery -P gevent.
+    """
+
+    _lease_seconds = WEBHOOK_TIMEOUT_SECONDS * 3
+
+    _lock = RLock()
+
+    # scheme://host: keep alive session
+    _sessions = {}
+
+    @classmethod
+    def get_session(cls, url: str) -> requests.Session:
+        """
+            Get the keep alive session for a webhook endpoint.
+            :param url: webhook url
+            :return: session
+        """
+        split = urlsplit(url)
+        key = f"{split.scheme}://{split.netloc}"
+        session = cls._sessions.get(key)
+
+        if session is not None:
+            return session
+
+        with cls._lock:
+            session = cls._sessions.get(key)
+
+            if session is None:
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=WEBHOOK_SUBSCRIBER_CONCURRENCY)
+                session = requests.Session()
+                session.mount(f"{split.scheme}://", adapter)
+                cls._sessions[key] = session
+
+        return session
+
+    @staticmethod
+    def get_retry_seconds(attempts: int) -> int:
+        """
+            Get the backoff after a failed post.
+            :param attempts: number of posts made
+            :return: seconds until the next post
+        """
+        return min(WEBHOOK_RETRY_SECONDS * 2 ** (attempts - 1), WEBHOOK_MAX_RETRY_SECONDS)
+
+    @staticmethod
+    def get_payload(outbox: WebhookOutbox) -> Union[list, dict]:
+        """
+            Get the post body of a delivery. A single event is posted on its own as before batching, a batch is
+            posted as a list of events in the order they were queued.
+            :param outbox: delivery
+            :return: event or list of events
+        """
+
+        if outbox.size == 1:
+            return outbox.data[0]
+
+        return outbox.data
+
+    @staticmethod
+    def _schedule(countdown: int) -> None:
+        """
+            Queue a dispatch run.
+            :param countdown: seconds to wait
+        """
+        from api.background_tasks.webhooks.dispatch import CeleryWebhooks
+
+        CeleryWebhooks.dispatch_webhooks.apply_async(countdown=max(countdown, 0))
+
+    def enqueue(self, webhook_id: int, data: dict) -> WebhookOutbox:
+        """
+            Add an event to the webhook's open batch, or open a batch and queue its dispatch at the end of the window.
+            :param webhook_id: webhook pk
+            :param data: event data
+            :return: delivery holding the event
+        """
+        now = timezone.now()
+
+        with transaction.atomic():
+            outbox = WebhookOutbox.objects.select_for_update().filter(
+                webhook_id=webhook_id,
+                status=WebhookOutbox.PENDING,
+                attempts=0,
+                next_attempt__gt=now,
+                size__lt=WEBHOOK_BATCH_SIZE
+            ).order_by("next_attempt").first()
+
+            if outbox:
+                outbox.data.append(data)
+                outbox.size += 1
+                outbox.save(update_fields=["data", "size"])
+                return outbox
+
+            outbox = WebhookOutbox(
+                webhook_id=webhook_id,
+                data=[data],
+                size=1,
+                next_attempt=now + datetime.timedelta(seconds=WEBHOOK_BATCH_SECONDS)
+            )
+            outbox.save()
+
+            transaction.on_commit(lambda: self._schedule(countdown=WEBHOOK_BATCH_SECONDS))
+
+        return outbox
+
+    @staticmethod
+    def _get_sending(now: datetime.datetime, sub_account_ids: Union[list, None] = None) -> dict:
+        """
+            Count the leased deliveries per subscriber.
+            :param now: run time, an expired lease is not counted
+            :param sub_account_ids: subscribers to count, defaults to every subscriber
+            :return: sub account pk: leased deliveries
+        """
+        sending = WebhookOutbox.objects.filter(status=WebhookOutbox.SENDING, next_attempt__gt=now)
+
+        if sub_account_ids is not None:
+            sending = sending.filter(webhook__sub_account_id__in=sub_account_ids)
+
+        return dict(
+            sending.order_by().values("webhook__sub_account_id").annotate(
+                count=Count("pk")
+            ).values_list("webhook__sub_account_id", "count")
+        )
+
+    def _claim(self, limit: int) -> tuple:
+        """
+            Claim due deliveries for this run, up to the free concurrency of each subscriber. The subscribers' webhook
+            rows are locked while counting and claiming, so concurrent runs cannot both take the same free slots.
+            :param limit: max deliveries
+            :return: (claim, list of deliveries, True when due deliveries were held back by the concurrency limit)
+        """
+        claim = uuid.uuid4()
+        now = timezone.now()
+        due = dict(status__in=[WebhookOutbox.PENDING, WebhookOutbox.SENDING], next_attempt__lte=now)
+        full = [
+            pk for pk, count in self._get_sending(now=now).items() if count >= WEBHOOK_SUBSCRIBER_CONCURRENCY
+        ]
+
+        candidates = list(
+            WebhookOutbox.objects.filter(**due).exclude(webhook__sub_account_id__in=full).order_by(
+                "next_attempt"
+            ).values_list("pk", "webhook__sub_account_id")[:limit]
+        )
+        held = bool(full) and WebhookOutbox.objects.filter(**due, webhook__sub_account_id__in=full).exists()
+
+        if not candidates:
+            return claim, [], held
+
+        sub_account_ids = sorted({sub_account_id for _, sub_account_id in candidates})
+
+        with transaction.atomic():
+            list(
+                Webhook.objects.select_for_update().filter(sub_account_id__in=sub_account_ids).order_by(
+                    "pk"
+                ).values_list("pk", flat=True)
+            )
+            sending = self._get_sending(now=now, sub_account_ids=sub_account_ids)
+            ids = []
+
+            for pk, sub_account_id in candidates:
+
+                if sending.get(sub_account_id, 0) >= WEBHOOK_SUBSCRIBER_CONCURRENCY:
+                    held = True
+                    continue
+
+                sending[sub_account_id] = sending.get(sub_account_id, 0) + 1
+                ids.append(pk)
+
+            WebhookOutbox.objects.filter(pk__in=ids, **due).update(
+                status=WebhookOutbox.SENDING,
+                claim=claim,
+                next_attempt=now + datetime.timedelta(seconds=self._lease_seconds)
+            )
+
+        outboxes = WebhookOutbox.objects.select_related("webhook__sub_account").filter(
+            claim=claim, status=WebhookOutbox.SENDING
+        )
+
+        return claim, list(outboxes), held
+
+    def _deliver(self, outbox: WebhookOutbox) -> str:
+        """
+            Post a delivery to its subscriber.
+            :param outbox: delivery
+            :return: error or empty on success
+        """
+        webhook = outbox.webhook
+
+        try:
+            WebHookEvent(
+                data=self.get_payload(outbox=outbox), sub_account=webhook.sub_account, webhook=webhook
+            ).send_event(session=self.get_session(url=webhook.url))
+        except requests.RequestException as e:
+            return str(e)[:MAX_CHAR_LEN] or e.__class__.__name__
+
+        return ""
+
+    def _record(self, claim: uuid.UUID, outbox: WebhookOutbox, error: str) -> Union[int, None]:
+        """
+            Store the post result, a run that lost its claim leaves the delivery alone.
+            :param claim: run claim
+            :param outbox: delivery
+            :param error: post error or empty
+            :return: seconds until the retry or None
+        """
+        now = timezone.now()
+        claimed = WebhookOutbox.objects.filter(pk=outbox.pk, claim=claim)
+        attempts = outbox.attempts + 1
+
+        if not error:
+            claimed.update(status=WebhookOutbox.DELIVERED, attempts=attempts, delivered_date=now, last_error="")
+            return None
+
+        if attempts >= WEBHOOK_MAX_ATTEMPTS:
+            LOGGER.error(f"Webhook {outbox.webhook_id} delivery {outbox.pk} failed after {attempts} posts: {error}")
+            claimed.update(status=WebhookOutbox.FAILED, attempts=attempts, last_error=error)
+            return None
+
+        retry = self.get_retry_seconds(attempts=attempts)
+        claimed.update(
+            status=WebhookOutbox.PENDING,
+            attempts=attempts,
+            last_error=error,
+            next_attempt=now + datetime.timedelta(seconds=retry)
+        )
+
+        return retry
+
+    def dispatch(self, limit: int = WEBHOOK_BATCH_SIZE * 10, schedule: bool = True) -> int:
+        """
+            Post due deliveries and store the results.
+            :param limit: max deliveries for the run
+            :param schedule: queue the next run for retries or remaining deliveries
+            :return: number of deliveries posted
+        """
+        claim, outboxes, held = self._claim(limit=limit)
+
+        if not outboxes:
+
+            # Another run holds the subscribers' slots, check again once its posts have timed out.
+            if schedule and held:
+                self._schedule(countdown=WEBHOOK_TIMEOUT_SECONDS)
+
+            return 0
+
+        pool = Pool(WEBHOOK_DISPATCH_CONCURRENCY)
+        greenlets = [pool.spawn(self._deliver, outbox) for outbox in outboxes]
+        pool.join()
+
+        retries = []
+
+        for outbox, greenlet in zip(outboxes, greenlets):
+            error = greenlet.value if greenlet.successful() else repr(greenlet.exception)[:MAX_CHAR_LEN]
+            retry = self._record(claim=claim, outbox=outbox, error=error)
+
+            if retry is not None:
+                retries.append(retry)
+
+        if schedule and (held or len(outboxes) >= limit):
+            self._schedule(countdown=0)
+        elif schedule and retries:
+            self._schedule(countdown=min(retries))
+
+        return len(outboxes)
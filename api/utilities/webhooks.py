@@ -5,8 +5,8 @@
         hmac signature, account number, and topic. The last part is to post the details to the registared url.
     Created: July 13, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 
 import copy
@@ -17,10 +17,6 @@ import requests
 import simplejson as json
 from typing import Union
 
-from django.db import connection
-
-from api.background_tasks.logger import CeleryLogger
-from api.exceptions.project import RequestError
 from api.globals.project import WEBHOOK_TIMEOUT_SECONDS
 from api.models import SubAccount, Webhook
 
@@ -32,13 +28,21 @@ class WebHookEvent:
         self._webhook = webhook
         self._sub_account = sub_account
 
-    def create_hmac(self) -> str:
+    def get_body(self) -> str:
+        """
+            Get the json body to post, the hmac is made from the same body.
+            :return: json string
+        """
+        return json.dumps(self._data)
+
+    def create_hmac(self, body: str = None) -> str:
         """
             Create hmac for webhook event for Keyed-Hashing Message Authentication.
+            :param body: json body, defaults to the event data
             :return: hmac
         """
 
-        data_str = json.dumps(self._data)
+        data_str = self.get_body() if body is None else body
 
         signature = hmac.new(
             str(self._sub_account.webhook_key).encode('utf-8'),
@@ -56,39 +60,23 @@ class WebHookEvent:
         """
 
         return {
+            "Content-Type": "application/json",
             "X-UBBE-TOPIC": self._webhook.get_event_display().replace(" ", ""),
             "X-UBBE-ACCOUNT": str(self._sub_account.subaccount_number),
             "X-UBBE-HMAC": signature,
         }
 
-    def send_event(self) -> None:
+    def send_event(self, session: requests.Session = None) -> None:
         """
-            Perform webhook event post for a given event.
-            :return:
+            Perform webhook event post for a given event, the subscriber must accept it with a 2xx status.
+            :param session: pooled session for the webhook url, defaults to a new connection
+            :return: None
+            :raises requests.RequestException: timeout, connection error or a non 2xx status
         """
-        signature = self.create_hmac()
-        headers = self.get_headers(signature=signature)
-
-        try:
-            response = requests.post(
-                url=self._webhook.url, json=self._data, headers=headers, timeout=WEBHOOK_TIMEOUT_SECONDS
-            )
-        except requests.Timeout:
-            connection.close()
-            # Request took to long to response: 10 seconds.
-            return None
-        except requests.RequestException:
-            connection.close()
-
-            CeleryLogger().l_info.delay(
-                location="webhook.py line: 79",
-                message=f"Webhook data: {self._webhook.event} - {self._data}"
-            )
-
-            raise RequestError(None, self._data)
-
-        if response.ok:
-            # Webhooks should return status 200 for success.
-            return None
+        body = self.get_body()
+        headers = self.get_headers(signature=self.create_hmac(body=body))
 
-        return None
+        response = (session or requests).post(
+            url=self._webhook.url, data=body.encode('utf-8'), headers=headers, timeout=WEBHOOK_TIMEOUT_SECONDS
+        )
+        response.raise_for_status()
@@ -0,0 +1,46 @@
+"""
+    Title: Rate Cache api views
+    Description: This file will contain all functions for the carrier rate cache api functions.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework.views import APIView
+
+from api.cache_lookups.rate_cache import RateCache
+from api.mixins.view_mixins import UbbeMixin
+from api.models import API
+from api.utilities.utilities import Utility
+
+
+class RateCacheApi(UbbeMixin, APIView):
+    """
+        Get the carrier rate cache hit and miss counters.
+    """
+
+    @swagger_auto_schema(
+        operation_id='Get Rate Cache Stats',
+        operation_description='Get the rate cache hit and miss counters for each carrier api along with the '
+                              'configured rate cache ttl.',
+        responses={
+            '200': openapi.Response('Get Rate Cache Stats'),
+            '400': "Bad Request",
+            '500': "Internal Server Error"
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        """
+            Get rate cache hit and miss counters for the carrier apis.
+            :return: Json list of rate cache stats.
+        """
+
+        apis = dict(API.objects.filter(category="CA").values_list("name", "rate_cache_ttl"))
+        stats = RateCache.get_stats(api_names=list(apis.keys()))
+
+        for stat in stats:
+            stat["rate_cache_ttl"] = apis[stat["name"]]
+
+        return Utility.json_response(data=stats)
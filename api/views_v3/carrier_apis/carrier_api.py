@@ -253,5 +253,6 @@ class CarrierDetailApi(UbbeMixin, RetrieveUpdateDestroyAPIView):
         cache.delete(f'{self._cache_lookup_key_individual}{self.kwargs["code"]}')
         cache.delete(f"carrier_list_mode_{carrier.mode}")
         cache.delete(f"carrier_list_mode_{previous_mode}")
+        cache.delete(f"carrier_rate_cache_ttl_{carrier.code}")
 
         return Utility.json_response(data=serializer.data)
@@ -3,8 +3,8 @@
     Description: This file will contain all functions for province serializers.
     Created: November 12, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
 from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
@@ -13,9 +13,10 @@ from drf_yasg.utils import swagger_auto_schema
 from rest_framework.generics import RetrieveUpdateDestroyAPIView
 from rest_framework.views import APIView
 
+from api.cache_lookups.reference_cache import ReferenceCache
 from api.exceptions.project import ViewException
 from api.mixins.view_mixins import UbbeMixin
-from api.models import Province, Country
+from api.models import Province
 from api.serializers_v3.common.province_serializer import ProvinceSerializer, ProvinceDetailSerializer
 from api.utilities.utilities import Utility
 from brain.settings import TWENTY_FOUR_HOURS_CACHE_TTL
@@ -58,7 +59,7 @@ class GetProvinces(UbbeMixin, APIView):
                 code="1500", message="Province: Missing 'country' parameter.", errors=errors
             )
 
-        if not Country.objects.filter(code=country).exists():
+        if not ReferenceCache().is_country(country=country):
             errors.append({"province": "'country' does not exist."})
             return Utility.json_error_response(
                 code="1501", message="Province: 'country' does not exist.", errors=errors
@@ -10,6 +10,8 @@ import copy
 
 import gevent
 from django.db import connection
+from django.http import StreamingHttpResponse
+from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
 from rest_framework.views import APIView
@@ -20,7 +22,9 @@ from api.apis.multi_modal.join_rates import JoinRate
 from api.apis.multi_modal.mc_ground_rate import MultiCarrierGroundRate
 from api.apis.multi_modal.mm_air_rate import MultiModalAirRate
 from api.apis.multi_modal.mm_sealift_rate import MultiModalSealiftRate
+from api.apis.multi_modal.rate_memo import RateMemo
 from api.apis.rate_v3.rate import RateV3
+from api.apis.rate_v3.reference_snapshot import ReferenceSnapshot
 from api.background_tasks.logger import CeleryLogger
 from api.background_tasks.rate_logging import CeleryRateLog
 from api.exceptions.project import ViewException
@@ -49,8 +53,17 @@ class RateV3Api(UbbeMixin, APIView):
 
     @swagger_auto_schema(
         request_body=RateRequestSerializer,
+        manual_parameters=[
+            openapi.Parameter(
+                'stream',
+                openapi.IN_QUERY,
+                description="Stream rates as json lines as each carrier answers, the last line is the full response.",
+                type=openapi.TYPE_BOOLEAN
+            ),
+        ],
         operation_id='Rate Shipment',
-        operation_description='Get rates for the requested data and carriers.',
+        operation_description='Get rates for the requested data and carriers. Carriers that do not answer before '
+                              'the rate deadline are listed in late_carriers.',
         responses={
             '200': "Rates",
             '400': "Bad Request",
@@ -71,13 +84,26 @@ class RateV3Api(UbbeMixin, APIView):
                 code="2", message="Invalid values in request.", errors=serializer.errors
             )
 
+        rate = RateV3(
+            ubbe_request=serializer.validated_data,
+            log_data=log_data,
+            sub_account=self._sub_account,
+            user=request.user
+        )
+
+        if request.query_params.get("stream", "false").lower() == "true":
+
+            try:
+                lines = rate.stream()
+            except ViewException as e:
+                connection.close()
+                return Utility.json_error_response(code=e.code, message=e.message, errors=e.errors)
+
+            connection.close()
+            return StreamingHttpResponse(lines, content_type="application/x-ndjson")
+
         try:
-            rates = RateV3(
-                ubbe_request=serializer.validated_data,
-                log_data=log_data,
-                sub_account=self._sub_account,
-                user=request.user
-            ).rate()
+            rates = rate.rate()
         except ViewException as e:
             connection.close()
             return Utility.json_error_response(code=e.code, message=e.message, errors=e.errors)
@@ -154,7 +180,11 @@ class RateApi(UbbeMixin, APIView):
             "ltl_list": CarrierUtility().get_ltl(),
             "ftl_list": CarrierUtility().get_ftl(),
             "courier_list": CarrierUtility().get_courier(),
-            "sealift_list": CarrierUtility().get_sealift()
+            "sealift_list": CarrierUtility().get_sealift(),
+            "rate_memo": RateMemo(),
+            "reference": ReferenceSnapshot(
+                carrier_ids=validated["carrier_id"], locations=[validated["origin"], validated["destination"]]
+            )
         }
 
         ground_api = GroundRate(gobox_request=validated)
@@ -312,7 +342,11 @@ class RateUbbeApi(UbbeMixin, APIView):
             "ltl_list": CarrierUtility().get_ltl(),
             "ftl_list": CarrierUtility().get_ftl(),
             "courier_list": CarrierUtility().get_courier(),
-            "sealift_list": CarrierUtility().get_sealift()
+            "sealift_list": CarrierUtility().get_sealift(),
+            "rate_memo": RateMemo(),
+            "reference": ReferenceSnapshot(
+                carrier_ids=validated["carrier_id"], locations=[validated["origin"], validated["destination"]]
+            )
         }
 
         ground_api = GroundRate(gobox_request=validated)
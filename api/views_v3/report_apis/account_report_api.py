@@ -3,13 +3,10 @@
     Description: This file will contain functions to account reports.
     Created: June 15, 2022
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
-from datetime import datetime, timedelta
-
 from django.db import connection
-from django.utils.timezone import utc
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework.views import APIView
@@ -17,7 +14,7 @@ from rest_framework.views import APIView
 from api.apis.reports.account_report import AccountReport
 from api.exceptions.project import ViewException
 from api.mixins.view_mixins import UbbeMixin
-from api.models import API, SubAccount
+from api.models import API
 
 from api.utilities.utilities import Utility
 
@@ -30,20 +27,10 @@ class AccountReportApi(UbbeMixin, APIView):
 
     def get_queryset(self):
         """
-            Get initial carrier markup history queryset and apply query params to the queryset.
+            Get the report queryset for the query params.
             :return:
         """
-        start_date = datetime.strptime(self.request.query_params["start_date"], "%Y-%m-%d").replace(tzinfo=utc)
-        end_date = datetime.strptime(self.request.query_params["end_date"], "%Y-%m-%d").replace(tzinfo=utc)
-
-        accounts = SubAccount.objects.select_related(
-            "contact",
-            "address__province__country",
-            "tier",
-            "markup"
-        ).filter(creation_date__range=[start_date, end_date])
-
-        return accounts
+        return AccountReport.get_queryset(sub_account=self._sub_account, params=self.request.query_params)
 
     @swagger_auto_schema(
         manual_parameters=[
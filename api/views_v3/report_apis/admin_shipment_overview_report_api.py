@@ -3,21 +3,19 @@
     Description: This file will contain functions to account reports.
     Created: August 10, 2022
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
-from datetime import datetime
-
 from django.db import connection
-from django.utils.timezone import utc
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework.views import APIView
 
 from api.apis.reports.admin_shipment_overview_report import AdminShipmentOverviewReport
+from api.apis.reports.shipment_overview_report import ShipmentOverviewReportData
 from api.exceptions.project import ViewException
 from api.mixins.view_mixins import UbbeMixin
-from api.models import API, Shipment
+from api.models import API
 
 from api.utilities.utilities import Utility
 
@@ -30,36 +28,10 @@ class AdminShipmentOverviewReportApi(UbbeMixin, APIView):
 
     def get_queryset(self):
         """
-            Get initial carrier markup history queryset and apply query params to the queryset.
+            Get the report queryset for the query params.
             :return:
         """
-        start_date = datetime.strptime(self.request.query_params["start_date"], "%Y-%m-%d").replace(tzinfo=utc)
-        end_date = datetime.strptime(self.request.query_params["end_date"], "%Y-%m-%d").replace(tzinfo=utc)
-
-        shipments = Shipment.objects.select_related(
-            "origin__province__country",
-            "destination__province__country",
-            "receiver",
-            "sender",
-            "subaccount__contact"
-        ).prefetch_related(
-            "leg_shipment__carrier",
-            "leg_shipment__origin__province__country",
-            "leg_shipment__destination__province__country",
-            "package_shipment"
-        ).filter(creation_date__range=[start_date, end_date], is_shipped=True)
-
-        if self._sub_account.is_bbe and 'account' in self.request.query_params:
-            shipments = shipments.filter(subaccount__subaccount_number=self.request.query_params["account"])
-        elif self._sub_account.is_bbe:
-            pass
-        else:
-            shipments = shipments.filter(subaccount=self._sub_account)
-
-        if 'username' in self.request.query_params:
-            shipments = shipments.filter(username=self.request.query_params["username"])
-
-        return shipments
+        return ShipmentOverviewReportData.get_queryset(sub_account=self._sub_account, params=self.request.query_params)
 
     @swagger_auto_schema(
         manual_parameters=[
@@ -3,13 +3,10 @@
     Description: This file will contain all functions for carrier serializers.
     Created: November 19, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
-from datetime import datetime, timedelta
-
 from django.db import connection
-from django.utils.timezone import utc
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework.generics import ListAPIView
@@ -18,7 +15,7 @@ from api.apis.reports.quote_history_by_leg_report import QuoteHistoryByLegReport
 from api.apis.reports.quote_history_report import QuoteHistoryReport
 from api.exceptions.project import ViewException
 from api.mixins.view_mixins import UbbeMixin
-from api.models import RateLog, API
+from api.models import API
 
 # TODO - Should this be cached or not.
 from api.utilities.utilities import Utility
@@ -32,37 +29,10 @@ class QuoteHistoryByLegReportApi(UbbeMixin, ListAPIView):
 
     def get_queryset(self):
         """
-            Get initial carrier markup history queryset and apply query params to the queryset.
+            Get the report queryset for the query params.
             :return:
         """
-
-        if 'end_date' in self.request.query_params:
-            end_date = datetime.strptime(self.request.query_params["end_date"], "%Y-%m-%d").replace(tzinfo=utc)
-        else:
-            end_date = datetime.now().replace(tzinfo=utc)
-
-        if 'start_date' in self.request.query_params:
-            start_date = datetime.strptime(self.request.query_params["start_date"], "%Y-%m-%d").replace(tzinfo=utc)
-        else:
-            start_date = end_date - timedelta(days=self._thirty_days)
-
-        if self._sub_account.is_bbe:
-            logs = RateLog.objects.select_related("sub_account__contact").filter(
-                rate_date__range=[start_date, end_date]
-            )
-        else:
-            logs = RateLog.objects.select_related("sub_account__contact").filter(
-                rate_date__range=[start_date, end_date],
-                sub_account=self._sub_account
-            )
-
-        if self._sub_account.is_bbe and 'account' in self.request.query_params:
-            logs = logs.filter(sub_account__subaccount_number=self.request.query_params["account"])
-
-        if 'is_no_rate' in self.request.query_params:
-            logs = logs.filter(is_no_rate=self.request.query_params["is_no_rate"])
-
-        return logs.order_by('-rate_date')
+        return QuoteHistoryReport.get_queryset(sub_account=self._sub_account, params=self.request.query_params)
 
     @swagger_auto_schema(
         manual_parameters=[
@@ -133,37 +103,10 @@ class QuoteHistoryReportApi(UbbeMixin, ListAPIView):
 
     def get_queryset(self):
         """
-            Get initial carrier markup history queryset and apply query params to the queryset.
+            Get the report queryset for the query params.
             :return:
         """
-
-        if 'end_date' in self.request.query_params:
-            end_date = datetime.strptime(self.request.query_params["end_date"], "%Y-%m-%d").replace(tzinfo=utc)
-        else:
-            end_date = datetime.now().replace(tzinfo=utc)
-
-        if 'start_date' in self.request.query_params:
-            start_date = datetime.strptime(self.request.query_params["start_date"], "%Y-%m-%d").replace(tzinfo=utc)
-        else:
-            start_date = end_date - timedelta(days=self._thirty_days)
-
-        if self._sub_account.is_bbe:
-            logs = RateLog.objects.select_related("sub_account__contact").filter(
-                rate_date__range=[start_date, end_date]
-            )
-        else:
-            logs = RateLog.objects.select_related("sub_account__contact").filter(
-                rate_date__range=[start_date, end_date],
-                sub_account=self._sub_account
-            )
-
-        if self._sub_account.is_bbe and 'account' in self.request.query_params:
-            logs = logs.filter(sub_account__subaccount_number=self.request.query_params["account"])
-
-        if 'is_no_rate' in self.request.query_params:
-            logs = logs.filter(is_no_rate=self.request.query_params["is_no_rate"])
-
-        return logs.order_by('-rate_date')
+        return QuoteHistoryReport.get_queryset(sub_account=self._sub_account, params=self.request.query_params)
 
     @swagger_auto_schema(
         manual_parameters=[
@@ -3,14 +3,12 @@
     Description: This file will contain functions to produce reports.
     Created: November 22, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
-from datetime import datetime, timedelta
 from uuid import UUID
 
 from django.db import connection
-from django.utils.timezone import utc
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework.views import APIView
@@ -18,7 +16,7 @@ from rest_framework.views import APIView
 from api.apis.reports.tracking_report import TrackingReportData
 from api.exceptions.project import ViewException
 from api.mixins.view_mixins import UbbeMixin
-from api.models import API, Shipment
+from api.models import API
 
 # TODO - Should this be cached or not.
 from api.utilities.utilities import Utility
@@ -32,50 +30,10 @@ class TrackingReportApi(UbbeMixin, APIView):
 
     def get_queryset(self):
         """
-            Get initial carrier markup history queryset and apply query params to the queryset.
+            Get the report queryset for the query params.
             :return:
         """
-
-        if 'end_date' in self.request.query_params:
-            end_date = datetime.strptime(self.request.query_params["end_date"], "%Y-%m-%d").replace(tzinfo=utc)
-        else:
-            end_date = datetime.now().replace(tzinfo=utc)
-
-        if 'start_date' in self.request.query_params:
-            start_date = datetime.strptime(self.request.query_params["start_date"], "%Y-%m-%d").replace(tzinfo=utc)
-        else:
-            start_date = end_date - timedelta(days=self._thirty_days)
-
-        if self._sub_account.is_bbe:
-            shipments = Shipment.objects.select_related(
-                "origin__province__country",
-                "destination__province__country",
-                "subaccount__contact"
-            ).prefetch_related(
-                "leg_shipment__carrier",
-                "leg_shipment__origin__province__country",
-                "leg_shipment__destination__province__country"
-            ).filter(
-                creation_date__range=[start_date, end_date]
-            )
-        else:
-            shipments = Shipment.objects.select_related(
-                "origin__province__country",
-                "destination__province__country",
-                "subaccount__contact"
-            ).prefetch_related(
-                "leg_shipment__carrier",
-                "leg_shipment__origin__province__country",
-                "leg_shipment__destination__province__country"
-            ).filter(
-                creation_date__range=[start_date, end_date],
-                subaccount=self._sub_account,
-            )
-
-        if self._sub_account.is_bbe and 'account' in self.request.query_params:
-            shipments = shipments.filter(subaccount__subaccount_number=self.request.query_params["account"])
-
-        return shipments
+        return TrackingReportData.get_queryset(sub_account=self._sub_account, params=self.request.query_params)
 
     @swagger_auto_schema(
         manual_parameters=[
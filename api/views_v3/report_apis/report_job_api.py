@@ -0,0 +1,134 @@
+"""
+    Title: Report Job apis
+    Description: This file will contain functions to submit background report jobs, poll their progress and download
+                 the report file.
+    Created: October 17, 2026
+    Author: Carmichael
+    Edited By:
+    Edited Date:
+"""
+from django.db import connection
+from django.http import FileResponse
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework.views import APIView
+
+from api.apis.reports.report_job import ReportJobs
+from api.exceptions.project import ViewException
+from api.mixins.view_mixins import UbbeMixin
+from api.models import ReportJob
+from api.serializers_v3.private.reports.report_job_serializers import CreateReportJobSerializer, ReportJobSerializer
+from api.utilities.utilities import Utility
+
+
+class ReportJobApi(UbbeMixin, APIView):
+    http_method_names = ['post']
+
+    @swagger_auto_schema(
+        request_body=CreateReportJobSerializer,
+        operation_id='Create Report Job',
+        operation_description='Submit a report to be generated in the background. An identical request on unchanged '
+                              'data returns the existing job.',
+        responses={
+            '200': openapi.Response('Create Report Job', ReportJobSerializer),
+            '400': "Bad Request",
+            '500': "Internal Server Error"
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        """
+            Submit a report job.
+            :param request: request
+            :return: json of the report job.
+        """
+        serializer = CreateReportJobSerializer(data=request.data, many=False)
+
+        if not serializer.is_valid():
+            return Utility.json_error_response(
+                code="3207", message="ReportJob: Invalid values.", errors=serializer.errors
+            )
+
+        params = dict(serializer.validated_data)
+
+        try:
+            job = ReportJobs().submit(
+                report=params.pop("report"),
+                sub_account=self._sub_account,
+                username=request.user.username,
+                params=params
+            )
+        except ViewException as e:
+            connection.close()
+            return Utility.json_error_response(code=e.code, message=e.message, errors=e.errors)
+
+        return Utility.json_response(data=ReportJobSerializer(instance=job, many=False).data)
+
+
+class ReportJobDetailApi(UbbeMixin, APIView):
+    http_method_names = ['get']
+
+    @swagger_auto_schema(
+        operation_id='Get Report Job',
+        operation_description='Get the status and progress of a report job.',
+        responses={
+            '200': openapi.Response('Get Report Job', ReportJobSerializer),
+            '400': "Bad Request",
+            '500': "Internal Server Error"
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        """
+            Get a report job.
+            :param request: request
+            :return: json of the report job.
+        """
+
+        try:
+            job = ReportJobs.get_job(sub_account=self._sub_account, job_id=self.kwargs["job_id"])
+        except ViewException as e:
+            connection.close()
+            return Utility.json_error_response(code=e.code, message=e.message, errors=e.errors)
+
+        return Utility.json_response(data=ReportJobSerializer(instance=job, many=False).data)
+
+
+class ReportJobFileApi(UbbeMixin, APIView):
+    http_method_names = ['get']
+
+    @swagger_auto_schema(
+        operation_id='Get Report Job File',
+        operation_description='Download the excel file of a completed report job.',
+        responses={
+            '200': 'excel sheet',
+            '400': "Bad Request",
+            '500': "Internal Server Error"
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        """
+            Get the report file of a completed report job.
+            :param request: request
+            :return: report file.
+        """
+
+        try:
+            job = ReportJobs.get_job(sub_account=self._sub_account, job_id=self.kwargs["job_id"])
+        except ViewException as e:
+            connection.close()
+            return Utility.json_error_response(code=e.code, message=e.message, errors=e.errors)
+
+        if job.status != ReportJob.COMPLETE:
+            connection.close()
+            return Utility.json_error_response(
+                code="3208",
+                message="ReportJob: Report is not ready.",
+                errors=[{"job_id": f"'{job.job_id}' is {job.get_status_display()}."}]
+            )
+
+        connection.close()
+        return FileResponse(
+            job.file.open("rb"),
+            as_attachment=True,
+            filename=job.file_name,
+            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        )
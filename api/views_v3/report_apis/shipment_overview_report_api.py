@@ -3,13 +3,11 @@
     Description: This file will contain functions to account reports.
     Created: June 16, 2022
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
-from datetime import datetime
-
 from django.db import connection
-from django.utils.timezone import utc
+from django.http import FileResponse
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework.views import APIView
@@ -17,7 +15,7 @@ from rest_framework.views import APIView
 from api.apis.reports.shipment_overview_report import ShipmentOverviewReportData
 from api.exceptions.project import ViewException
 from api.mixins.view_mixins import UbbeMixin
-from api.models import API, Shipment
+from api.models import API
 
 from api.utilities.utilities import Utility
 
@@ -30,36 +28,10 @@ class ShipmentOverviewReportApi(UbbeMixin, APIView):
 
     def get_queryset(self):
         """
-            Get initial carrier markup history queryset and apply query params to the queryset.
+            Get the report queryset for the query params.
             :return:
         """
-        start_date = datetime.strptime(self.request.query_params["start_date"], "%Y-%m-%d").replace(tzinfo=utc)
-        end_date = datetime.strptime(self.request.query_params["end_date"], "%Y-%m-%d").replace(tzinfo=utc)
-
-        shipments = Shipment.objects.select_related(
-            "origin__province__country",
-            "destination__province__country",
-            "receiver",
-            "sender",
-            "subaccount__contact"
-        ).prefetch_related(
-            "leg_shipment__carrier",
-            "leg_shipment__origin__province__country",
-            "leg_shipment__destination__province__country",
-            "package_shipment"
-        ).filter(creation_date__range=[start_date, end_date], is_shipped=True)
-
-        if self._sub_account.is_bbe and 'account' in self.request.query_params:
-            shipments = shipments.filter(subaccount__subaccount_number=self.request.query_params["account"])
-        elif self._sub_account.is_bbe:
-            pass
-        else:
-            shipments = shipments.filter(subaccount=self._sub_account)
-
-        if 'username' in self.request.query_params:
-            shipments = shipments.filter(username=self.request.query_params["username"])
-
-        return shipments
+        return ShipmentOverviewReportData.get_queryset(sub_account=self._sub_account, params=self.request.query_params)
 
     @swagger_auto_schema(
         manual_parameters=[
@@ -68,6 +40,10 @@ class ShipmentOverviewReportApi(UbbeMixin, APIView):
             ),
             openapi.Parameter(
                 'end_date', openapi.IN_QUERY, description="YYYY-mm-dd", type=openapi.TYPE_STRING, required=True
+            ),
+            openapi.Parameter(
+                'stream', openapi.IN_QUERY, description="true: return the excel file instead of base64 json",
+                type=openapi.TYPE_STRING, required=False
             )
         ],
         operation_id='Get Shipment Overview Report',
@@ -100,11 +76,31 @@ class ShipmentOverviewReportApi(UbbeMixin, APIView):
             )
 
         shipments = self.get_queryset()
+        file_name = f'shipment_overview_{start_date}-{end_date}.xlsx'
+
+        if request.query_params.get("stream", "false").lower() == "true":
+
+            try:
+                report_file = ShipmentOverviewReportData().get_shipment_overview_file(shipments=shipments)
+            except ViewException as e:
+                connection.close()
+                errors.append({"account": e.message})
+                return Utility.json_error_response(
+                    code="3202", message="ShipmentOverviewReport: failed to create.", errors=errors
+                )
+
+            connection.close()
+            return FileResponse(
+                report_file,
+                as_attachment=True,
+                filename=file_name,
+                content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )
 
         try:
             shipment_overview_report = ShipmentOverviewReportData().get_shipment_overview(
                 shipments=shipments,
-                file_name=f'shipment_overview_{start_date}-{end_date}.xlsx'
+                file_name=file_name
             )
         except ViewException as e:
             connection.close()
@@ -3,17 +3,17 @@
     Description: This file will contain all functions for Tracking Api views
     Created: Jan 11, 2021
     Author: Carmichael
-    Edited By:
-    Edited Date:
+    Edited By: Carmichael
+    Edited Date: October 17, 2026
 """
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
 from rest_framework.views import APIView
 
 from api.mixins.view_mixins import UbbeMixin
-from api.models import Leg
+from api.models import Leg, TrackingStatus
 from api.serializers_v3.temp_overdue import LegOverdueSerializer
 from api.utilities.utilities import Utility
 
@@ -63,27 +63,25 @@ class LegOverdueApi(UbbeMixin, APIView):
                 code="6500", message="Overdue: Only one parameter allowed.", errors=errors
             )
 
+        overdue_legs = Leg.objects.select_related(
+            "carrier",
+            "origin__province__country",
+            "destination__province__country",
+            "shipment__subaccount__contact"
+        ).prefetch_related(
+            Prefetch(
+                "tracking_status_leg",
+                queryset=TrackingStatus.objects.order_by("updated_datetime"),
+                to_attr="ordered_tracking_statuses"
+            )
+        ).filter(is_shipped=True, is_delivered=False)
+
         if is_pickup_overdue:
-            overdue_legs = Leg.objects.select_related(
-                "carrier",
-                "origin__province__country",
-                "destination__province__country",
-                "shipment__subaccount__contact"
-            ).filter(is_pickup_overdue=True, is_shipped=True)
+            overdue_legs = overdue_legs.filter(is_pickup_overdue=True)
         elif is_overdue:
-            overdue_legs = Leg.objects.select_related(
-                "carrier",
-                "origin__province__country",
-                "destination__province__country",
-                "shipment__subaccount__contact"
-            ).filter(is_overdue=True, is_shipped=True)
+            overdue_legs = overdue_legs.filter(is_overdue=True)
         else:
-            overdue_legs = Leg.objects.select_related(
-                "carrier",
-                "origin__province__country",
-                "destination__province__country",
-                "shipment__subaccount__contact"
-            ).filter(Q(is_pickup_overdue=True) | Q(is_overdue=True), is_shipped=True)
+            overdue_legs = overdue_legs.filter(Q(is_pickup_overdue=True) | Q(is_overdue=True))
 
         if 'username' in self.request.query_params:
             overdue_legs = overdue_legs.filter(shipment__username=self.request.query_params["username"])
@@ -12,7 +12,10 @@ app = Celery('brain', include=[
     'api.background_tasks.logger',
     'api.background_tasks.emails',
     'api.background_tasks.business_central',
-    'api.background_tasks.webhooks.tracking_status_change'
+    'api.background_tasks.metric_rollup',
+    'api.background_tasks.reports',
+    'api.background_tasks.webhooks.tracking_status_change',
+    'api.background_tasks.webhooks.dispatch'
 ])
 
 # Using a string here means the worker will not have to
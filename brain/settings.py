@@ -1,6 +1,7 @@
 import logging
 import os
 import sys
+import tempfile
 
 _DJANGO_SECRET_KEY = os.environ['APIDJANGOKEY']
 DATA_KEY = os.environ['APIDATAKEY']
@@ -264,6 +265,15 @@ ONE_HOUR_CACHE_TTL = 60 * 60
 FIVE_HOURS_CACHE_TTL = 5 * 60 * 60
 TWENTY_FOUR_HOURS_CACHE_TTL = 24 * 60 * 60
 
+# SOAP WSDL cache, fetched WSDL and XSD files are shared by the workers on a host.
+SOAP_WSDL_CACHE = os.environ.get('APISOAPWSDLCACHE', os.path.join(tempfile.gettempdir(), 'ubbe_wsdl_cache.db'))
+
+# Parse the SOAP carrier WSDLs when the wsgi application loads, before gunicorn forks with --preload.
+SOAP_PREFORK_WARM_UP = os.environ.get('APISOAPPREFORKWARMUP', 'false').lower() == 'true'
+
+# Document render processes per worker, reportlab renders and pdf merges run off the gevent hub. 0 renders inline.
+DOCUMENT_RENDER_WORKERS = int(os.environ.get('APIDOCUMENTRENDERWORKERS', '2'))
+
 # Celery application definition
 BROKER_URL = 'redis://localhost:6379'
 CELERY_RESULT_BACKEND = 'redis://localhost:6379'
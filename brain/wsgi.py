@@ -9,8 +9,15 @@ https://docs.djangoproject.com/en/2.0/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "brain.settings")
 
 application = get_wsgi_application()
+
+# Parse the SOAP carrier WSDLs before gunicorn forks (--preload), workers share the parsed documents.
+if settings.SOAP_PREFORK_WARM_UP:
+    from api.apis.carriers.soap_client_pool import SoapClientPool
+
+    SoapClientPool.warm_up()
@@ -5,7 +5,8 @@ import sys
 
 from gevent import monkey
 
-monkey.patch_all(thread=False, socket=False)
+# The track command fans carrier calls out over greenlets, which needs a cooperative socket.
+monkey.patch_all(thread=False, socket=sys.argv[1:2] == ["track"])
 
 if __name__ == "__main__":
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "brain.settings")